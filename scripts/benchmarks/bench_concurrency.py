@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark de concurrence : latence de /api/episodes pendant une charge /api/search.
+
+Mesure si une recherche lente bloque la boucle d'événements d'uvicorn : on
+interroge /api/episodes en continu pendant que plusieurs clients martèlent
+/api/search, puis on compare les percentiles (p50/p95/p99) avec une mesure
+de référence sans charge.
+
+Le backend doit tourner (ex: ./scripts/start-dev.sh) sur une base réelle.
+
+Usage:
+    python scripts/benchmarks/bench_concurrency.py
+    python scripts/benchmarks/bench_concurrency.py --url http://localhost:8000 \\
+        --duration 20 --search-clients 8 --query "roman"
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentile par rang le plus proche (values en millisecondes)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def probe_episodes(
+    client: httpx.AsyncClient, stop_at: float, interval: float
+) -> list[float]:
+    """Interroge /api/episodes en boucle et retourne les latences (ms)."""
+    latencies: list[float] = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        response = await client.get("/api/episodes")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def search_load(client: httpx.AsyncClient, stop_at: float, query: str) -> int:
+    """Envoie des recherches en continu jusqu'à stop_at, retourne le nombre."""
+    count = 0
+    while time.perf_counter() < stop_at:
+        response = await client.get("/api/search", params={"q": query, "limit": 10})
+        response.raise_for_status()
+        count += 1
+    return count
+
+
+async def run_phase(
+    url: str, duration: float, search_clients: int, query: str, interval: float
+) -> tuple[list[float], int]:
+    """Exécute une phase de mesure (avec ou sans charge de recherche)."""
+    async with httpx.AsyncClient(base_url=url, timeout=120) as client:
+        stop_at = time.perf_counter() + duration
+        probe = asyncio.create_task(probe_episodes(client, stop_at, interval))
+        loaders = [
+            asyncio.create_task(search_load(client, stop_at, query))
+            for _ in range(search_clients)
+        ]
+        latencies = await probe
+        searches = sum(await asyncio.gather(*loaders))
+    return latencies, searches
+
+
+def print_report(label: str, latencies: list[float], searches: int) -> None:
+    """Affiche les percentiles d'une phase."""
+    print(f"\n📊 {label}")
+    print(f"   requêtes /api/episodes : {len(latencies)}")
+    print(f"   requêtes /api/search   : {searches}")
+    if latencies:
+        print(f"   p50 : {percentile(latencies, 50):8.1f} ms")
+        print(f"   p95 : {percentile(latencies, 95):8.1f} ms")
+        print(f"   p99 : {percentile(latencies, 99):8.1f} ms")
+        print(f"   max : {max(latencies):8.1f} ms")
+        print(f"   moy : {statistics.mean(latencies):8.1f} ms")
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    """Phase de référence puis phase sous charge."""
+    print(f"🎯 Cible : {args.url}")
+
+    baseline, _ = await run_phase(args.url, args.duration, 0, args.query, args.interval)
+    print_report("Référence (sans charge)", baseline, 0)
+
+    loaded, searches = await run_phase(
+        args.url, args.duration, args.search_clients, args.query, args.interval
+    )
+    print_report(
+        f"Sous charge ({args.search_clients} clients /api/search?q={args.query})",
+        loaded,
+        searches,
+    )
+
+    if baseline and loaded:
+        ratio = percentile(loaded, 99) / max(percentile(baseline, 99), 0.001)
+        print(f"\n⏱️  p99 sous charge / p99 référence : x{ratio:.1f}")
+    return 0
+
+
+def main() -> int:
+    """Point d'entrée CLI."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--search-clients", type=int, default=4)
+    parser.add_argument("--query", default="roman")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.05,
+        help="pause entre deux sondes /api/episodes (secondes)",
+    )
+    return asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
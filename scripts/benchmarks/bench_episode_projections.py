@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark des profils de projection des épisodes pour /api/emissions.
+
+/api/emissions lit un épisode par émission pour construire son résumé
+(Episode.to_summary_dict()). Ce script rejoue ces lectures avec chaque profil
+de projection (full = comportement avant projection, summary = après) et
+mesure le volume BSON transféré depuis MongoDB ainsi que la latence.
+
+Optionnellement (--url), mesure aussi la latence HTTP et la taille de la
+réponse de /api/emissions sur un backend en cours d'exécution.
+
+Usage:
+    python scripts/benchmarks/bench_episode_projections.py
+    python scripts/benchmarks/bench_episode_projections.py --runs 5 \\
+        --url http://localhost:8000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+import bson
+import httpx
+
+from back_office_lmelp.models.episode import EPISODE_PROJECTIONS
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+def bench_profile(
+    service: MongoDBService, episode_ids: list, profile: str, runs: int
+) -> tuple[int, list[float]]:
+    """Lit tous les épisodes avec un profil, retourne (octets, latences ms)."""
+    assert service.episodes_collection is not None
+    projection = EPISODE_PROJECTIONS[profile]
+    total_bytes = 0
+    latencies: list[float] = []
+    for run in range(runs):
+        start = time.perf_counter()
+        run_bytes = 0
+        for episode_id in episode_ids:
+            episode = service.episodes_collection.find_one(
+                {"_id": episode_id}, projection
+            )
+            if episode:
+                run_bytes += len(bson.encode(episode))
+        latencies.append((time.perf_counter() - start) * 1000)
+        if run == 0:
+            total_bytes = run_bytes
+    return total_bytes, latencies
+
+
+def bench_http(url: str, runs: int) -> tuple[int, list[float]]:
+    """Mesure /api/emissions sur un backend démarré."""
+    latencies: list[float] = []
+    size = 0
+    with httpx.Client(base_url=url, timeout=300) as client:
+        for _ in range(runs):
+            start = time.perf_counter()
+            response = client.get("/api/emissions")
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+            size = len(response.content)
+    return size, latencies
+
+
+def print_row(label: str, size: int, latencies: list[float]) -> None:
+    """Affiche une ligne de résultats."""
+    print(
+        f"   {label:<10} {size / 1024:>10.1f} Ko  "
+        f"médiane {statistics.median(latencies):>8.1f} ms  "
+        f"min {min(latencies):>8.1f} ms"
+    )
+
+
+def main() -> int:
+    """Point d'entrée CLI."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="backend à interroger pour la mesure HTTP (ex: http://localhost:8000)",
+    )
+    args = parser.parse_args()
+
+    service = MongoDBService()
+    if not service.connect():
+        print("❌ Connexion MongoDB impossible")
+        return 1
+
+    try:
+        episode_ids = [e["episode_id"] for e in service.get_all_emissions()]
+        print(f"📊 {len(episode_ids)} émissions → lectures d'épisodes par profil")
+
+        results = {
+            profile: bench_profile(service, episode_ids, profile, args.runs)
+            for profile in ("full", "detail", "summary")
+        }
+        for profile, (size, latencies) in results.items():
+            print_row(profile, size, latencies)
+
+        full_size = results["full"][0]
+        summary_size = results["summary"][0]
+        if summary_size:
+            print(f"\n📉 full / summary : x{full_size / summary_size:.1f} octets")
+    finally:
+        service.disconnect()
+
+    if args.url:
+        size, latencies = bench_http(args.url, args.runs)
+        print(f"\n🌐 GET {args.url}/api/emissions")
+        print_row("http", size, latencies)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
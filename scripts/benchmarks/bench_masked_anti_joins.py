@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Benchmark des listes $nin d'épisodes masqués contre les anti-jointures.
+
+Crée une base synthétique (10 000 épisodes par défaut) puis compare, pour
+chaque statistique, l'ancienne requête (liste Python des IDs d'épisodes
+masqués ou avec avis renvoyée en $nin) et la nouvelle (copie
+avis_critiques.episode_masked, anti-jointure $lookup + $match vide) :
+
+- get_statistics : avis critiques des épisodes visibles
+- get_statistics_from_cache : avis critiques analysés
+- /api/episodes-sans-avis-critiques
+- _count_avis_critiques_without_analysis
+
+La base synthétique est supprimée à la fin (sauf --keep).
+
+Usage:
+    python scripts/benchmarks/bench_masked_anti_joins.py
+    python scripts/benchmarks/bench_masked_anti_joins.py --episodes 20000 \\
+        --runs 5 --mongo-url mongodb://localhost:27017
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.database import Database
+
+from back_office_lmelp.services.livres_auteurs_cache_service import (
+    LivresAuteursCacheService,
+)
+from back_office_lmelp.services.mongodb_service import (
+    VISIBLE_AVIS_CRITIQUES_FILTER,
+    MongoDBService,
+    episodes_without_avis_critiques_stages,
+)
+from back_office_lmelp.services.stats_service import StatsService
+from back_office_lmelp.utils.mongo_indexes import reconcile_indexes
+
+
+def populate(db: Database, num_episodes: int, seed: int) -> None:
+    """Crée épisodes, avis critiques, cache et émissions synthétiques."""
+    rng = random.Random(seed)
+    start_date = datetime(2000, 1, 1)
+    episodes, avis_critiques, cache, emissions = [], [], [], []
+    for i in range(num_episodes):
+        episode_id = ObjectId()
+        masked = rng.random() < 0.05
+        episodes.append(
+            {
+                "_id": episode_id,
+                "titre": f"Épisode {i}",
+                "date": start_date + timedelta(days=7 * i),
+                "masked": masked,
+                "transcription": "transcription " * rng.randint(50, 200),
+            }
+        )
+        if rng.random() < 0.8:
+            avis_id = ObjectId()
+            avis_critiques.append(
+                {
+                    "_id": avis_id,
+                    "episode_oid": str(episode_id),
+                    "episode_masked": masked,
+                    "summary": "résumé",
+                }
+            )
+            if rng.random() < 0.85:
+                cache.append(
+                    {
+                        "avis_critique_id": avis_id,
+                        "episode_oid": str(episode_id),
+                        "auteur": f"Auteur {i}",
+                        "titre": f"Livre {i}",
+                        "status": "mongo",
+                    }
+                )
+            if rng.random() < 0.9:
+                emissions.append({"episode_id": episode_id})
+
+    db.episodes.insert_many(episodes)
+    db.avis_critiques.insert_many(avis_critiques)
+    db.livresauteurs_cache.insert_many(cache)
+    db.emissions.insert_many(emissions)
+    reconcile_indexes(db)
+
+
+def _service(db: Database) -> MongoDBService:
+    """MongoDBService branché sur la base synthétique."""
+    service = MongoDBService()
+    service.db = db
+    service.episodes_collection = db.episodes
+    service.avis_critiques_collection = db.avis_critiques
+    return service
+
+
+def _masked_oids(db: Database) -> list[str]:
+    return [str(ep["_id"]) for ep in db.episodes.find({"masked": True}, {"_id": 1})]
+
+
+def _visible_count_nin(db: Database) -> Any:
+    return db.avis_critiques.count_documents(
+        {"episode_oid": {"$nin": _masked_oids(db)}}
+    )
+
+
+def _visible_count_flag(db: Database) -> Any:
+    return db.avis_critiques.count_documents(VISIBLE_AVIS_CRITIQUES_FILTER)
+
+
+def _analyzed_nin(db: Database) -> Any:
+    return len(
+        db.livresauteurs_cache.distinct(
+            "avis_critique_id", {"episode_oid": {"$nin": _masked_oids(db)}}
+        )
+    )
+
+
+def _analyzed_anti_join(db: Database) -> Any:
+    cache_service = LivresAuteursCacheService()
+    cache_service.mongodb_service = _service(db)
+    return cache_service._count_analyzed_avis_critiques()[1]
+
+
+def _sans_avis_nin(db: Database) -> Any:
+    with_avis = {
+        avis["episode_oid"] for avis in db.avis_critiques.find({}, {"episode_oid": 1})
+    }
+    return len(
+        list(
+            db.episodes.find(
+                {
+                    "transcription": {"$exists": True, "$nin": [None, ""]},
+                    "masked": {"$ne": True},
+                    "_id": {"$nin": [ObjectId(eid) for eid in with_avis]},
+                },
+                {"titre": 1, "date": 1, "transcription": 1},
+            ).sort([("date", -1)])
+        )
+    )
+
+
+def _sans_avis_anti_join(db: Database) -> Any:
+    return len(
+        list(
+            db.episodes.aggregate(
+                [
+                    {
+                        "$match": {
+                            "transcription": {"$exists": True, "$nin": [None, ""]},
+                            "masked": {"$ne": True},
+                        }
+                    },
+                    *episodes_without_avis_critiques_stages(),
+                    {"$sort": {"date": -1}},
+                    {
+                        "$project": {
+                            "titre": 1,
+                            "date": 1,
+                            "transcription_length": {"$strLenCP": "$transcription"},
+                        }
+                    },
+                ]
+            )
+        )
+    )
+
+
+def _without_analysis_sets(db: Database) -> Any:
+    non_masked = {
+        ep["_id"]
+        for ep in db.episodes.find(
+            {"$or": [{"masked": False}, {"masked": {"$exists": False}}]}, {"_id": 1}
+        )
+    }
+    with_avis = {ObjectId(e) for e in db.avis_critiques.distinct("episode_oid")}
+    analyzed = {ObjectId(e) for e in db.livresauteurs_cache.distinct("episode_oid")}
+    return len(with_avis & non_masked) - len(analyzed & non_masked)
+
+
+def _without_analysis_anti_join(db: Database) -> Any:
+    stats_service = StatsService()
+    stats_service.mongodb_service = _service(db)
+    return stats_service._count_avis_critiques_without_analysis()
+
+
+BENCHMARKS: list[tuple[str, Callable[[Database], Any], Callable[[Database], Any]]] = [
+    ("avis critiques visibles", _visible_count_nin, _visible_count_flag),
+    ("avis critiques analysés", _analyzed_nin, _analyzed_anti_join),
+    ("épisodes sans avis critique", _sans_avis_nin, _sans_avis_anti_join),
+    ("épisodes sans analyse", _without_analysis_sets, _without_analysis_anti_join),
+]
+
+
+def timed(
+    query: Callable[[Database], Any], db: Database, runs: int
+) -> tuple[Any, float]:
+    """Exécute une requête runs fois, retourne (résultat, médiane en ms)."""
+    latencies = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = query(db)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(latencies)
+
+
+def main() -> int:
+    """Point d'entrée CLI."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--episodes", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mongo-url", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="lmelp_bench_anti_joins")
+    parser.add_argument(
+        "--keep", action="store_true", help="conserver la base synthétique"
+    )
+    args = parser.parse_args()
+    if "bench" not in args.db:
+        print("❌ --db doit contenir 'bench' (la base est supprimée)")
+        return 1
+
+    client: MongoClient = MongoClient(args.mongo_url)
+    db = client[args.db]
+    try:
+        client.drop_database(args.db)
+        print(f"🧪 Base synthétique {args.db} : {args.episodes} épisodes")
+        populate(db, args.episodes, args.seed)
+
+        print(f"\n   {'statistique':<30} {'$nin':>10} {'anti-join':>10}  résultats")
+        for label, old_query, new_query in BENCHMARKS:
+            old_result, old_ms = timed(old_query, db, args.runs)
+            new_result, new_ms = timed(new_query, db, args.runs)
+            print(
+                f"   {label:<30} {old_ms:>8.1f}ms {new_ms:>8.1f}ms  "
+                f"{old_result} / {new_result}"
+            )
+    finally:
+        if not args.keep:
+            client.drop_database(args.db)
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,19 +19,24 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+import asyncio
+import json
 import os
 import re
 import socket
+import time
 from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, suppress
 from datetime import UTC, datetime
 from typing import Any
 
+import pymongo
 from bson import ObjectId
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 from rapidfuzz import fuzz
 from thefuzz import process
 
@@ -40,6 +45,12 @@ from .models.critique import Critique
 from .models.emission import Emission
 from .models.episode import Episode
 from .services.annas_archive_url_service import AnnasArchiveUrlService
+from .services.async_mongodb_service import async_mongodb_service
+from .services.avis_batch_extraction_service import (
+    AVIS_BATCH_MAX_WORKERS,
+    matching_stats_from_avis,
+    reextract_all_avis,
+)
 from .services.avis_critiques_generation_service import (
     avis_critiques_generation_service,
 )
@@ -50,11 +61,24 @@ from .services.books_extraction_service import books_extraction_service
 from .services.calibre_matching_service import CalibreMatchingService
 from .services.calibre_service import calibre_service
 from .services.collections_management_service import collections_management_service
-from .services.critiques_extraction_service import critiques_extraction_service
+from .services.critiques_extraction_service import (
+    CritiqueIndex,
+    critiques_extraction_service,
+)
+from .services.critiques_status_service import (
+    critiques_status_for_summary,
+    get_critiques_status_by_episode,
+    rematch_critiques_status,
+)
 from .services.duplicate_books_service import DuplicateBooksService
+from .services.emission_badge_service import get_emission_badges
+from .services.emission_conversion_service import emission_conversion_service
 from .services.fixture_updater import FixtureUpdaterService
 from .services.livres_auteurs_cache_service import livres_auteurs_cache_service
-from .services.mongodb_service import mongodb_service
+from .services.mongodb_service import (
+    episodes_without_avis_critiques_stages,
+    mongodb_service,
+)
 from .services.radiofrance_service import RadioFranceService
 from .services.recommendation_service import RecommendationService
 from .settings import settings
@@ -73,7 +97,10 @@ recommendation_service = RecommendationService(
     mongodb_service,
 )
 from .services.stats_service import stats_service
+from .services.stats_snapshot_service import compute_etag
 from .utils.build_info import get_build_info, get_changelog
+from .utils.join_keys import to_object_id
+from .utils.keyset_pagination import InvalidCursorError, decode_cursor, encode_cursor
 from .utils.memory_guard import memory_guard
 from .utils.port_discovery import PortDiscovery
 
@@ -286,6 +313,15 @@ class MergeBatchRequest(BaseModel):
     skip_list: list[str] = []
 
 
+class AvisBatchExtractionRequest(BaseModel):
+    """Modèle pour la ré-extraction groupée des avis."""
+
+    emission_ids: list[str] | None = None  # Toutes les émissions si None
+    dry_run: bool = False
+    # Validé avant le début du flux SSE (pas de ProcessPoolExecutor invalide)
+    max_workers: int | None = Field(None, ge=1, le=AVIS_BATCH_MAX_WORKERS)
+
+
 class MergeDuplicateAuthorsRequest(BaseModel):
     """Modèle pour fusionner un groupe d'auteurs en doublon (Issue #178)."""
 
@@ -301,9 +337,76 @@ class MergeCritiquesRequest(BaseModel):
     target_nom: str
 
 
+async def _run_emissions_auto_convert(interval_sec: float) -> None:
+    """
+    Lance la conversion incrémentale des épisodes en émissions.
+
+    Exécutée au démarrage puis toutes les interval_sec secondes
+    (une seule fois si interval_sec <= 0). Chaque passage périodique complète
+    d'abord les clés de jointure typées des documents écrits depuis par le
+    pipeline lmelp (le démarrage s'en charge pour le premier passage).
+    """
+    from .utils.migrate_typed_join_fields import backfill_typed_join_fields
+
+    while True:
+        try:
+            result = await asyncio.to_thread(
+                emission_conversion_service.convert_new_avis_critiques
+            )
+            if result["errors"]:
+                logger.warning(f"Auto-conversion émissions: {result['errors']}")
+        except Exception as e:
+            logger.error(f"Erreur auto-conversion émissions: {e}")
+        if interval_sec <= 0:
+            return
+        await asyncio.sleep(interval_sec)
+        try:
+            if mongodb_service.db is not None:
+                await asyncio.to_thread(backfill_typed_join_fields, mongodb_service.db)
+        except Exception as e:
+            logger.error(f"Erreur rattrapage des clés de jointure typées: {e}")
+
+
+async def _run_episode_search_index_sync(interval_sec: float) -> None:
+    """
+    Charge l'index de recherche des épisodes puis le synchronise avec MongoDB.
+
+    Exécutée au démarrage (chargement du fichier puis synchronisation) puis
+    toutes les interval_sec secondes (une seule fois si interval_sec <= 0).
+    L'index est sauvegardé après chaque synchronisation qui l'a modifié.
+    """
+    from .services.episode_search_index import episode_search_index
+
+    index_path = settings.episode_search_index_path
+    try:
+        if await asyncio.to_thread(episode_search_index.load, index_path):
+            print(f"Index de recherche des épisodes chargé depuis {index_path}")
+    except Exception as e:
+        logger.error(f"Erreur chargement index de recherche des épisodes: {e}")
+    while True:
+        try:
+            if mongodb_service.episodes_collection is not None:
+                report = await asyncio.to_thread(
+                    episode_search_index.sync, mongodb_service.episodes_collection
+                )
+                if report["indexed"] or report["removed"]:
+                    print(
+                        f"Index de recherche des épisodes: {report['indexed']} "
+                        f"réindexés, {report['removed']} retirés"
+                    )
+                    await asyncio.to_thread(episode_search_index.save, index_path)
+        except Exception as e:
+            logger.error(f"Erreur synchronisation index de recherche des épisodes: {e}")
+        if interval_sec <= 0:
+            return
+        await asyncio.sleep(interval_sec)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Gestion du cycle de vie de l'application."""
+    auto_convert_task: asyncio.Task[None] | None = None
+    search_index_task: asyncio.Task[None] | None = None
     try:
         # Afficher les informations de démarrage (Issue #136)
         from .utils.startup_logging import log_startup_info
@@ -313,8 +416,128 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Démarrage
         if not mongodb_service.connect():
             raise Exception("Impossible de se connecter à MongoDB")
+        # Client Motor pour les endpoints non bloquants (les scripts gardent pymongo)
+        if not await async_mongodb_service.connect():
+            raise Exception("Impossible de se connecter à MongoDB (async)")
         print("Connexion MongoDB établie")
 
+        # Créer les index déclarés manquants (non bloquant en cas d'échec)
+        try:
+            from .utils.mongo_indexes import reconcile_indexes
+
+            if mongodb_service.db is not None:
+                index_report = await asyncio.to_thread(
+                    reconcile_indexes, mongodb_service.db
+                )
+                print(
+                    f"Index MongoDB: {len(index_report['created'])} créés, "
+                    f"{len(index_report['existing'])} existants, "
+                    f"{len(index_report['dropped'])} retirés, "
+                    f"{len(index_report['errors'])} erreurs"
+                )
+                for conflict in index_report["conflicts"]:
+                    print(f"⚠️ Index MongoDB en conflit: {conflict}")
+        except Exception as e:
+            print(f"Impossible de réconcilier les index MongoDB: {e}")
+
+        # Clés de jointure typées (avis, cache, avis critiques) : rattrape les
+        # documents écrits hors de l'application (pipeline lmelp)
+        try:
+            from .utils.migrate_typed_join_fields import backfill_typed_join_fields
+
+            if mongodb_service.db is not None:
+                join_report = await asyncio.to_thread(
+                    backfill_typed_join_fields, mongodb_service.db
+                )
+                print(
+                    f"Clés de jointure typées: {sum(join_report.values())} "
+                    "documents complétés"
+                )
+        except Exception as e:
+            print(f"Impossible de compléter les clés de jointure typées: {e}")
+
+        # Champs de recherche normalisés (auteurs, livres, éditeurs) : même
+        # rattrapage pour les documents écrits par les scripts
+        try:
+            from .utils.migrate_search_fields import backfill_search_fields
+
+            if mongodb_service.db is not None:
+                search_report = await asyncio.to_thread(
+                    backfill_search_fields, mongodb_service.db
+                )
+                print(
+                    f"Champs de recherche: {sum(search_report.values())} "
+                    "documents complétés"
+                )
+        except Exception as e:
+            print(f"Impossible de compléter les champs de recherche: {e}")
+
+        # editeurs.nom_normalise : complète les éditeurs écrits par les scripts.
+        # Les doublons normalisés sont seulement signalés : la fusion (qui
+        # repointe des livres et supprime des éditeurs) reste à la migration
+        try:
+            from .utils.migrate_editeurs_nom_normalise import backfill_nom_normalise
+
+            editeurs_report = await asyncio.to_thread(
+                backfill_nom_normalise, mongodb_service
+            )
+            if editeurs_report["updated"]:
+                print(f"Éditeurs: {editeurs_report['updated']} nom_normalise complétés")
+            if editeurs_report["duplicates"]:
+                print(
+                    f"⚠️ Éditeurs: {editeurs_report['duplicates']} doublons non "
+                    "fusionnés (python -m "
+                    "back_office_lmelp.utils.migrate_editeurs_nom_normalise)"
+                )
+        except Exception as e:
+            print(f"Impossible de compléter nom_normalise des éditeurs: {e}")
+
+        # avis_critiques.episode_masked : rattrape les avis écrits hors de
+        # l'application (pipeline lmelp) depuis le dernier démarrage
+        try:
+            synced = await asyncio.to_thread(mongodb_service.sync_episode_masked_flags)
+            if synced:
+                print(f"episode_masked: {synced} avis critiques resynchronisés")
+        except Exception as e:
+            print(f"Impossible de resynchroniser episode_masked: {e}")
+
+        # Palmarès matérialisé : maintenu à chaque écriture d'avis, reconstruit
+        # seulement s'il est vide (première mise en service) ou sur demande
+        # (PALMARES_REBUILD_ON_STARTUP, rattrapage des écritures externes)
+        try:
+            from .services.palmares_service import PALMARES_COLLECTION
+
+            palmares_count = await asyncio.to_thread(
+                mongodb_service.get_collection(
+                    PALMARES_COLLECTION
+                ).estimated_document_count
+            )
+            if settings.palmares_rebuild_on_startup or palmares_count == 0:
+                palmares_report = await asyncio.to_thread(
+                    mongodb_service.rebuild_palmares
+                )
+                print(f"Palmarès: {palmares_report['rebuilt']} livres classés")
+        except Exception as e:
+            print(f"Impossible de reconstruire le palmarès: {e}")
+
+        # Statistiques par livre (notes, émissions, tags Calibre) : même règle,
+        # reconstruction forcée par LIVRE_STATS_REBUILD_ON_STARTUP
+        try:
+            from .services.livre_stats_service import LIVRE_STATS_COLLECTION
+
+            livre_stats_count = await asyncio.to_thread(
+                mongodb_service.get_collection(
+                    LIVRE_STATS_COLLECTION
+                ).estimated_document_count
+            )
+            if settings.livre_stats_rebuild_on_startup or livre_stats_count == 0:
+                stats_report = await asyncio.to_thread(
+                    mongodb_service.rebuild_livre_stats
+                )
+                print(f"Statistiques livres: {stats_report['rebuilt']} livres")
+        except Exception as e:
+            print(f"Impossible de reconstruire les statistiques livres: {e}")
+
         # Attach a persistent disk cache for Babelio lookups so restarts benefit
         try:
             cache_enabled = os.environ.get("BABELIO_CACHE_ENABLED", "1").lower() in (
@@ -337,6 +560,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             print(f"Unable to attach Babelio disk cache: {e}")
 
+        # Conversion incrémentale épisodes → émissions, hors chemin de lecture
+        auto_convert_task = asyncio.create_task(
+            _run_emissions_auto_convert(settings.emissions_auto_convert_interval_sec)
+        )
+
+        # Index de recherche des épisodes : construit en tâche de fond
+        # (search_episodes garde le regex MongoDB tant qu'il n'est pas prêt)
+        search_index_task = asyncio.create_task(
+            _run_episode_search_index_sync(
+                settings.episode_search_index_sync_interval_sec
+            )
+        )
+
         yield
 
     except Exception as e:
@@ -344,8 +580,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         raise
     finally:
         # Arrêt garanti même en cas d'erreur
+        for task in (auto_convert_task, search_index_task):
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        _shutdown_search_executor()
         try:
             mongodb_service.disconnect()
+            async_mongodb_service.disconnect()
             print("Connexion MongoDB fermée")
         except Exception as e:
             print(f"Erreur lors de la fermeture: {e}")
@@ -492,7 +735,7 @@ async def get_episodes() -> list[dict[str, Any]]:
         print(f"⚠️ {memory_check}")
 
     try:
-        episodes_data = mongodb_service.get_all_episodes()
+        episodes_data = await async_mongodb_service.get_all_episodes()
         episodes = [Episode(data).to_summary_dict() for data in episodes_data]
         return episodes
     except Exception as e:
@@ -513,7 +756,9 @@ async def get_all_episodes_including_masked() -> list[dict[str, Any]]:
         print(f"⚠️ {memory_check}")
 
     try:
-        episodes_data = mongodb_service.get_all_episodes(include_masked=True)
+        episodes_data = await async_mongodb_service.get_all_episodes(
+            include_masked=True
+        )
         episodes = [Episode(data).to_summary_dict() for data in episodes_data]
         return episodes
     except Exception as e:
@@ -531,7 +776,7 @@ async def get_episode(episode_id: str) -> dict[str, Any]:
         print(f"⚠️ {memory_check}")
 
     try:
-        episode_data = mongodb_service.get_episode_by_id(episode_id)
+        episode_data = await async_mongodb_service.get_episode_by_id(episode_id)
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -594,7 +839,7 @@ async def update_episode_description(
         description_corrigee = (await request.body()).decode("utf-8")
 
         # Vérifier que l'épisode existe
-        episode_data = mongodb_service.get_episode_by_id(episode_id)
+        episode_data = mongodb_service.get_episode_by_id(episode_id, profile="summary")
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -627,7 +872,7 @@ async def update_episode_title(episode_id: str, request: Request) -> dict[str, s
         titre_corrige = (await request.body()).decode("utf-8")
 
         # Vérifier que l'épisode existe
-        episode_data = mongodb_service.get_episode_by_id(episode_id)
+        episode_data = mongodb_service.get_episode_by_id(episode_id, profile="summary")
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -670,7 +915,7 @@ async def fetch_episode_page_url(episode_id: str) -> dict[str, Any]:
 
     try:
         # Vérifier que l'épisode existe
-        episode_data = mongodb_service.get_episode_by_id(episode_id)
+        episode_data = mongodb_service.get_episode_by_id(episode_id, profile="summary")
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -768,7 +1013,7 @@ async def update_episode_masked(episode_id: str, request: Request) -> dict[str,
             )
 
         # Vérifier que l'épisode existe
-        episode_data = mongodb_service.get_episode_by_id(episode_id)
+        episode_data = mongodb_service.get_episode_by_id(episode_id, profile="summary")
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -777,6 +1022,15 @@ async def update_episode_masked(episode_id: str, request: Request) -> dict[str,
         if not success:
             raise HTTPException(status_code=400, detail="Échec de la mise à jour")
 
+        # Un épisode démasqué n'est pas repris par la conversion incrémentale
+        if not masked:
+            try:
+                await asyncio.to_thread(
+                    emission_conversion_service.convert_episode, episode_id
+                )
+            except Exception as e:
+                logger.warning(f"Auto-conversion impossible pour {episode_id}: {e}")
+
         action = "masqué" if masked else "rendu visible"
         return {"message": f"Épisode {action} avec succès"}
     except HTTPException:
@@ -785,9 +1039,25 @@ async def update_episode_masked(episode_id: str, request: Request) -> dict[str,
         raise HTTPException(status_code=500, detail=f"Erreur serveur: {e!s}") from e
 
 
+def _etag_response(request: Request, data: dict[str, Any]) -> Response:
+    """
+    Sert des statistiques avec un ETag (304 si le client a déjà ce contenu).
+
+    Cache-Control: no-cache impose au navigateur de revalider chaque appel
+    (If-None-Match) : un polling du tableau de bord sans changement ne
+    retransfère pas le JSON.
+    """
+    etag = compute_etag(data)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=data, headers=headers)
+
+
 @app.get("/api/statistics", response_model=dict[str, Any])
-async def get_statistics() -> dict[str, Any]:
-    """Récupère les statistiques de l'application."""
+async def get_statistics(request: Request) -> Response:
+    """Récupère les statistiques de l'application (ETag / 304)."""
     # Vérification mémoire
     memory_check = memory_guard.check_memory_limit()
     if memory_check:
@@ -796,10 +1066,10 @@ async def get_statistics() -> dict[str, Any]:
         print(f"⚠️ {memory_check}")
 
     try:
-        stats_data = mongodb_service.get_statistics()
+        stats_data = await async_mongodb_service.get_statistics()
 
         # Transformer les clés pour correspondre au format frontend
-        return {
+        data = {
             "totalEpisodes": stats_data["total_episodes"],
             "maskedEpisodes": stats_data["masked_episodes_count"],
             "episodesWithCorrectedTitles": stats_data["episodes_with_corrected_titles"],
@@ -811,6 +1081,7 @@ async def get_statistics() -> dict[str, Any]:
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur serveur: {e!s}") from e
+    return _etag_response(request, data)
 
 
 # ========== ENDPOINTS CALIBRE ==========
@@ -1159,54 +1430,45 @@ async def get_episodes_with_reviews() -> list[dict[str, Any]]:
         print(f"⚠️ {memory_check}")
 
     try:
-        # Récupérer tous les avis critiques pour obtenir les episode_oid uniques
-        avis_critiques = mongodb_service.get_all_critical_reviews()
+        # Nombre de requêtes constant, indépendant du nombre d'épisodes :
+        # 1. avis critiques (projection), indexés par episode_oid
+        avis_critique_ids = mongodb_service.get_avis_critique_ids_by_episode()
+        episode_oids = list(avis_critique_ids)
+
+        # 2. épisodes correspondants en un seul $in projeté
+        episodes_by_id = mongodb_service.get_episodes_by_ids(
+            episode_oids, profile="summary"
+        )
 
-        # Extraire les episode_oid uniques
-        unique_episode_oids = list(
-            {avis["episode_oid"] for avis in avis_critiques if avis.get("episode_oid")}
+        # 3. flags de cache par épisode en une seule agrégation $group
+        cache_flags = livres_auteurs_cache_service.get_cache_flags_by_episode_oids(
+            episode_oids
         )
 
-        # Récupérer les détails des épisodes correspondants avec avis_critique_id
         episodes_with_reviews = []
-        for episode_oid in unique_episode_oids:
-            episode_data = mongodb_service.get_episode_by_id(episode_oid)
-            if episode_data:
-                episode = Episode(episode_data)
-
-                # Issue #107: Filtrer les épisodes masqués
-                if episode.masked:
-                    continue
-
-                episode_dict = episode.to_summary_dict()
-
-                # Ajouter l'avis_critique_id correspondant à cet épisode
-                avis_critique = next(
-                    (
-                        avis
-                        for avis in avis_critiques
-                        if avis["episode_oid"] == episode_oid
-                    ),
-                    None,
-                )
-                if avis_critique:
-                    episode_dict["avis_critique_id"] = str(avis_critique["_id"])
+        for episode_oid in episode_oids:
+            episode_data = episodes_by_id.get(episode_oid)
+            if not episode_data:
+                continue
 
-                # Ajouter le flag has_cached_books pour indiquer si l'épisode a déjà été affiché
-                # (présence de livres dans livresauteurs_cache)
-                cached_books = livres_auteurs_cache_service.get_books_by_episode_oid(
-                    episode_oid
-                )
-                episode_dict["has_cached_books"] = len(cached_books) > 0
+            episode = Episode(episode_data)
 
-                # Ajouter le flag has_incomplete_books pour identifier les épisodes avec livres non validés
-                # (au moins un livre avec status != 'mongo')
-                has_incomplete = any(
-                    book.get("status") != "mongo" for book in cached_books
-                )
-                episode_dict["has_incomplete_books"] = has_incomplete
+            # Issue #107: Filtrer les épisodes masqués
+            if episode.masked:
+                continue
+
+            episode_dict = episode.to_summary_dict()
+            episode_dict["avis_critique_id"] = avis_critique_ids[episode_oid]
+
+            # has_cached_books : l'épisode a déjà été affiché (livres en cache)
+            # has_incomplete_books : au moins un livre avec status != 'mongo'
+            flags = cache_flags.get(episode_oid, {})
+            episode_dict["has_cached_books"] = flags.get("has_cached_books", False)
+            episode_dict["has_incomplete_books"] = flags.get(
+                "has_incomplete_books", False
+            )
 
-                episodes_with_reviews.append(episode_dict)
+            episodes_with_reviews.append(episode_dict)
 
         # Trier par date décroissante
         episodes_with_reviews.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -1220,90 +1482,14 @@ async def get_episodes_with_reviews() -> list[dict[str, Any]]:
 # ========== EMISSIONS ENDPOINTS (Issue #154) ==========
 
 
-def _calculate_emission_badge_status(
-    emission_id: str, episode_id: str, mongodb_service: Any
-) -> str:
-    """
-    Calcule le statut du badge (pastille) d'une émission.
-
-    Logique :
-    - "perfect" (🟢) : avis extraits, # livres mongo == # livres summary,
-                       tous matchés, toutes notes présentes
-    - "count_mismatch" (🔴) : avis extraits, # livres mongo != # livres summary
-                              OU au moins une note manquante
-    - "unmatched" (🟡) : avis extraits, comptes égaux, toutes notes présentes,
-                         mais ≥ 1 livre non matché
-    - "no_avis" (⚪) : avis pas encore extraits
-
-    Args:
-        emission_id: ID de l'émission
-        episode_id: ID de l'épisode
-        mongodb_service: Service MongoDB
-
-    Returns:
-        Statut du badge ("perfect", "count_mismatch", "unmatched", "no_avis")
-    """
-    if mongodb_service.avis_collection is None:
-        return "no_avis"
-
-    # Compter les avis extraits pour cette émission
-    avis_count = mongodb_service.avis_collection.count_documents(
-        {"emission_oid": emission_id}
-    )
-
-    # Si pas d'avis extraits
-    if avis_count == 0:
-        return "no_avis"
-
-    # Récupérer les stats de matching (comme dans /api/avis/by-emission)
-    avis_list = list(
-        mongodb_service.avis_collection.find({"emission_oid": emission_id})
-    )
-
-    # Compter livres uniques par titre (dans le summary)
-    unique_titles: set[str] = set()
-    unmatched_count = 0
-    missing_notes_count = 0
-
-    for avis in avis_list:
-        titre = avis.get("livre_titre_extrait", "")
-        if titre:
-            unique_titles.add(titre)
-            # Compter les non matchés
-            if avis.get("livre_oid") is None:
-                unmatched_count += 1
-            # Compter les notes manquantes
-            if avis.get("note") is None:
-                missing_notes_count += 1
-
-    livres_summary = len(unique_titles)
-
-    # Compter livres MongoDB pour cet épisode
-    livres_mongo_count = 0
-    if mongodb_service.livres_collection is not None:
-        livres_mongo_count = mongodb_service.livres_collection.count_documents(
-            {"episodes": str(episode_id)}
-        )
-
-    # Déterminer le statut
-    # 🔴 Écart de comptage OU au moins une note manquante
-    if livres_summary != livres_mongo_count or missing_notes_count > 0:
-        return "count_mismatch"
-
-    # 🟡 Comptes égaux mais au moins un livre non matché (et toutes notes présentes)
-    if unmatched_count > 0:
-        return "unmatched"
-
-    # 🟢 Parfait : comptes égaux, tous matchés, toutes notes présentes
-    return "perfect"
-
-
 @app.get("/api/emissions", response_model=list[dict[str, Any]])
 async def get_all_emissions() -> list[dict[str, Any]]:
     """
-    Récupère toutes les émissions.
-    Déclenche l'auto-conversion à chaque chargement pour convertir
-    les nouveaux épisodes avec avis critiques.
+    Récupère toutes les émissions (lecture seule).
+
+    La conversion des nouveaux épisodes avec avis critiques est incrémentale
+    et se fait hors du chemin de lecture (tâche périodique du lifespan,
+    sauvegarde d'un avis critique, ou POST /api/emissions/auto-convert).
 
     Returns:
         Liste des émissions avec données enrichies (episode, avis_critique)
@@ -1316,35 +1502,36 @@ async def get_all_emissions() -> list[dict[str, Any]]:
         print(f"⚠️ {memory_check}")
 
     try:
-        # Auto-conversion systématique à chaque chargement
-        logger.info("Déclenchement auto-conversion des nouveaux épisodes")
-        await auto_convert_episodes_to_emissions()
-
-        # Récupérer toutes les émissions (y compris nouvellement créées)
+        # Récupérer toutes les émissions
         emissions = mongodb_service.get_all_emissions()
 
+        # Charger épisodes, avis critiques et badges matérialisés par lots
+        # (nombre de requêtes constant, indépendant du nombre d'émissions)
+        episodes_by_id = mongodb_service.get_episodes_by_ids(
+            [str(emission["episode_id"]) for emission in emissions],
+            profile="summary",
+        )
+        existing_avis_critique_ids = mongodb_service.get_existing_avis_critique_ids(
+            [str(emission["avis_critique_id"]) for emission in emissions]
+        )
+        badges = get_emission_badges(mongodb_service, emissions)
+
         # Enrichir avec données episode, avis_critique et statut badge
         enriched_emissions = []
         for emission in emissions:
-            episode_data = mongodb_service.get_episode_by_id(
-                str(emission["episode_id"])
-            )
-            avis_data = mongodb_service.get_avis_critique_by_id(
-                str(emission["avis_critique_id"])
-            )
+            episode_data = episodes_by_id.get(str(emission["episode_id"]))
 
             emission_dict = Emission(emission).to_dict()
             emission_dict["episode"] = (
                 Episode(episode_data).to_summary_dict() if episode_data else None
             )
-            emission_dict["has_avis_critique"] = avis_data is not None
-
-            # Calculer le statut du badge (pastille) pour l'émission
-            # Basé sur l'extraction et le matching des avis
-            emission_dict["badge_status"] = _calculate_emission_badge_status(
-                str(emission["_id"]), str(emission["episode_id"]), mongodb_service
+            emission_dict["has_avis_critique"] = (
+                str(emission["avis_critique_id"]) in existing_avis_critique_ids
             )
 
+            # Statut du badge (pastille), basé sur l'extraction et le matching des avis
+            emission_dict["badge_status"] = badges.get(str(emission["_id"]), "no_avis")
+
             enriched_emissions.append(emission_dict)
 
         return enriched_emissions
@@ -1357,7 +1544,10 @@ async def get_all_emissions() -> list[dict[str, Any]]:
 @app.post("/api/emissions/auto-convert", response_model=dict[str, Any])
 async def auto_convert_episodes_to_emissions() -> dict[str, Any]:
     """
-    Convertit automatiquement tous les épisodes (avec avis critiques) en émissions.
+    Convertit tous les épisodes (avec avis critiques) en émissions.
+
+    Conversion complète, utilisée en rattrapage manuel : la conversion
+    courante est incrémentale (watermark, voir emission_conversion_service).
 
     Logique :
     1. Récupérer tous les avis_critiques
@@ -1375,72 +1565,7 @@ async def auto_convert_episodes_to_emissions() -> dict[str, Any]:
         print(f"⚠️ {memory_check}")
 
     try:
-        created_count = 0
-        skipped_count = 0
-        errors = []
-
-        # 1. Récupérer tous les avis_critiques
-        all_avis = mongodb_service.get_all_critical_reviews()
-
-        for avis in all_avis:
-            try:
-                episode_oid = avis.get("episode_oid")
-                if not episode_oid:
-                    continue
-
-                # 2. Vérifier si émission existe déjà
-                existing = mongodb_service.get_emission_by_episode_id(episode_oid)
-                if existing:
-                    skipped_count += 1
-                    continue
-
-                # 3. Récupérer données épisode
-                episode_data = mongodb_service.get_episode_by_id(episode_oid)
-                if not episode_data:
-                    errors.append(f"Épisode {episode_oid} non trouvé")
-                    continue
-
-                episode = Episode(episode_data)
-
-                # 3b. Skip épisodes masqués
-                if episode.masked:
-                    skipped_count += 1
-                    continue
-
-                # 4. Détecter animateur_id
-                critiques = mongodb_service.get_critiques_by_episode(episode_oid)
-                animateur_id = None
-                for critique in critiques:
-                    if critique.get("animateur", False):
-                        animateur_id = critique["id"]
-                        break  # Prendre le premier animateur trouvé
-
-                # 5. Créer émission
-                emission_data = Emission.for_mongodb_insert(
-                    {
-                        "episode_id": episode_oid,
-                        "avis_critique_id": str(avis["_id"]),
-                        "date": episode.date,
-                        "duree": episode.duree,
-                        "animateur_id": animateur_id,
-                        "avis_ids": [],  # Vide pour l'instant (future issue)
-                    }
-                )
-
-                mongodb_service.create_emission(emission_data)
-                created_count += 1
-
-            except Exception as e:
-                errors.append(f"Erreur pour avis {avis.get('_id')}: {e!s}")
-
-        return {
-            "success": True,
-            "created": created_count,
-            "skipped": skipped_count,
-            "total_processed": len(all_avis),
-            "errors": errors,
-        }
-
+        return await asyncio.to_thread(emission_conversion_service.convert_all)
     except Exception as e:
         logger.error(f"Erreur auto_convert_episodes_to_emissions: {e}")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -1545,7 +1670,9 @@ async def get_emission_details(emission_id: str) -> dict[str, Any]:
         emission = Emission(emission_data)
 
         # 2. Récupérer épisode
-        episode_data = mongodb_service.get_episode_by_id(emission.episode_id)
+        episode_data = mongodb_service.get_episode_by_id(
+            emission.episode_id, profile="detail"
+        )
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode associé non trouvé")
 
@@ -1668,17 +1795,18 @@ async def set_validation_results(request: ValidationResultsRequest) -> dict[str,
         print(f"⚠️ {memory_check}")
 
     try:
-        books_processed = 0
+        from bson import ObjectId
 
-        for book_result in request.books:
-            # Convertir le statut de validation frontend vers statut cache unifié
-            if book_result.validation_status == "verified":
-                cache_status = "verified"
-            elif book_result.validation_status == "suggestion":
-                cache_status = "suggested"
-            else:  # not_found
-                cache_status = "not_found"
+        from .utils.summary_updater import replace_book_in_summary
+
+        # Convertir le statut de validation frontend vers statut cache unifié
+        cache_statuses = {
+            "verified": "verified",
+            "suggestion": "suggested",
+        }
 
+        books_data = []
+        for book_result in request.books:
             # Préparer les données pour le cache
             book_data = {
                 "episode_oid": request.episode_oid,
@@ -1686,7 +1814,9 @@ async def set_validation_results(request: ValidationResultsRequest) -> dict[str,
                 "titre": book_result.titre,
                 "editeur": book_result.editeur,
                 "programme": book_result.programme,
-                "status": cache_status,
+                "status": cache_statuses.get(
+                    book_result.validation_status, "not_found"
+                ),
             }
 
             # Ajouter les suggestions si disponibles
@@ -1701,149 +1831,197 @@ async def set_validation_results(request: ValidationResultsRequest) -> dict[str,
             if book_result.babelio_publisher:
                 book_data["babelio_publisher"] = book_result.babelio_publisher
 
-            # Créer l'entrée cache
-            from bson import ObjectId
+            books_data.append(book_data)
 
-            avis_critique_id = ObjectId(request.avis_critique_id)
-            cache_entry_id = livres_auteurs_cache_service.create_cache_entry(
-                avis_critique_id, book_data
+        # Créer les entrées cache (une recherche + un bulk_write)
+        avis_critique_id = ObjectId(request.avis_critique_id)
+        cache_entry_ids = livres_auteurs_cache_service.create_cache_entries(
+            avis_critique_id, books_data
+        )
+
+        items: list[dict[str, Any]] = [
+            {
+                "auteur": book_result.auteur,
+                "titre": book_result.titre,
+                "status": book_data["status"],
+                "cache_id": str(cache_entry_id),
+            }
+            for book_result, book_data, cache_entry_id in zip(
+                request.books, books_data, cache_entry_ids, strict=True
             )
+        ]
 
-            # Auto-processing pour les livres verified
-            if cache_status == "verified":
-                try:
-                    # Utiliser le nom validé (suggested_author si disponible, sinon auteur original)
-                    validated_author = (
-                        book_result.suggested_author or book_result.auteur
+        # Auto-processing pour les livres verified
+        verified = [
+            index
+            for index, book_data in enumerate(books_data)
+            if book_data["status"] == "verified"
+        ]
+        authors: dict[str, dict[str, Any]] = {}
+        book_outcomes: list[dict[str, Any]] = []
+        if verified:
+            try:
+                # Utiliser le nom validé (suggested_author si disponible, sinon auteur original)
+                validated = {
+                    index: (
+                        request.books[index].suggested_author
+                        or request.books[index].auteur,
+                        request.books[index].suggested_title
+                        or request.books[index].titre,
                     )
-                    validated_title = book_result.suggested_title or book_result.titre
+                    for index in verified
+                }
 
-                    # Créer auteur en base
-                    author_id = mongodb_service.create_author_if_not_exists(
-                        validated_author
-                    )
+                # Créer les auteurs en base (un $in + un bulk_write)
+                authors = mongodb_service.create_authors_if_not_exist(
+                    [author for author, _ in validated.values()]
+                )
 
-                    # Créer livre en base
-                    # Issue #85: Utiliser babelio_publisher si disponible (source plus fiable)
-                    editeur_value = book_result.babelio_publisher or book_result.editeur
-                    book_data_for_mongo = {
-                        "titre": validated_title,
-                        "auteur_id": author_id,
-                        "editeur": editeur_value,
-                        "url_babelio": book_result.babelio_url or None,
-                        "episodes": [request.episode_oid],
-                        "avis_critiques": [request.avis_critique_id],
-                    }
-                    book_id = mongodb_service.create_book_if_not_exists(
-                        book_data_for_mongo
-                    )
+                # Créer les livres en base (un $in + un bulk_write)
+                # Issue #85: Utiliser babelio_publisher si disponible (source plus fiable)
+                book_outcomes = mongodb_service.create_books_if_not_exist(
+                    [
+                        {
+                            "titre": validated[index][1],
+                            "auteur_id": authors[validated[index][0]]["author_id"],
+                            "editeur": request.books[index].babelio_publisher
+                            or request.books[index].editeur,
+                            "url_babelio": request.books[index].babelio_url or None,
+                            "episodes": [request.episode_oid],
+                            "avis_critiques": [request.avis_critique_id],
+                        }
+                        for index in verified
+                    ]
+                )
+            except Exception as auto_processing_error:
+                # Ne pas faire échouer l'endpoint si l'auto-processing échoue
+                print(f"⚠️ Erreur auto-processing: {auto_processing_error}")
+                for index in verified:
+                    items[index]["error"] = str(auto_processing_error)
+                verified = []
+
+        processed: list[dict[str, Any]] = []
+        publisher_corrections = []
+        for index, outcome in zip(verified, book_outcomes, strict=True):
+            book_result = request.books[index]
+            validated_author, validated_title = validated[index]
+            author_id = authors[validated_author]["author_id"]
+            book_id = outcome["book_id"]
+            items[index].update(
+                {
+                    "author_id": str(author_id),
+                    "book_id": str(book_id),
+                    "author_created": authors[validated_author]["created"],
+                    "book_created": outcome["created"],
+                }
+            )
 
-                    # Mettre à jour url_babelio et titre sur le livre (même s'il existait déjà)
-                    update_fields: dict[str, Any] = {}
-                    if book_result.babelio_url:
-                        update_fields["url_babelio"] = book_result.babelio_url
-                    if (
-                        book_result.suggested_title
-                        and book_result.suggested_title != book_result.titre
-                    ):
-                        update_fields["titre"] = validated_title
-                    if update_fields:
-                        mongodb_service.update_livre_from_refresh(
-                            str(book_id), update_fields
-                        )
+            try:
+                # Mettre à jour url_babelio et titre sur le livre (même s'il existait déjà)
+                update_fields: dict[str, Any] = {}
+                if book_result.babelio_url:
+                    update_fields["url_babelio"] = book_result.babelio_url
+                if (
+                    book_result.suggested_title
+                    and book_result.suggested_title != book_result.titre
+                ):
+                    update_fields["titre"] = validated_title
+                if update_fields:
+                    mongodb_service.update_livre_from_refresh(
+                        str(book_id), update_fields
+                    )
 
-                    # Télécharger la couverture si url_babelio disponible et pas encore de couverture
-                    if book_result.babelio_url and book_id:
-                        existing_livre = mongodb_service.get_livre_with_episodes(
-                            str(book_id)
-                        )
-                        if existing_livre and not existing_livre.get("url_cover"):
-                            cover_url = (
-                                await babelio_service.fetch_cover_url_from_babelio_page(
-                                    book_result.babelio_url,
-                                    expected_title=validated_title,
-                                )
+                # Télécharger la couverture si url_babelio disponible et pas encore de couverture
+                if book_result.babelio_url and book_id:
+                    existing_livre = mongodb_service.get_livre_with_episodes(
+                        str(book_id)
+                    )
+                    if existing_livre and not existing_livre.get("url_cover"):
+                        cover_url = (
+                            await babelio_service.fetch_cover_url_from_babelio_page(
+                                book_result.babelio_url,
+                                expected_title=validated_title,
                             )
-                            if cover_url and not cover_url.startswith("TITLE_MISMATCH"):
-                                mongodb_service.update_livre_from_refresh(
-                                    str(book_id), {"url_cover": cover_url}
-                                )
-                                logger.info(
-                                    f"🖼️ Couverture téléchargée pour {validated_title}: {cover_url}"
-                                )
-
-                    # Récupérer l'URL auteur depuis la page livre (cache hit — page déjà scrapée)
-                    if book_result.babelio_url and author_id:
-                        author_url = await babelio_service.fetch_author_url_from_page(
-                            book_result.babelio_url
                         )
-                        if author_url:
-                            mongodb_service.update_auteur_name_and_url(
-                                str(author_id), url_babelio=author_url
+                        if cover_url and not cover_url.startswith("TITLE_MISMATCH"):
+                            mongodb_service.update_livre_from_refresh(
+                                str(book_id), {"url_cover": cover_url}
+                            )
+                            logger.info(
+                                f"🖼️ Couverture téléchargée pour {validated_title}: {cover_url}"
                             )
-                            logger.info(f"👤 URL auteur mise à jour: {author_url}")
-
-                    # Issue #85: Passer babelio_publisher en metadata pour écraser editeur dans le cache
-                    # C'est la source la plus fiable (enrichissement Babelio)
-                    cache_metadata = {}
-                    if book_result.babelio_publisher:
-                        cache_metadata["babelio_publisher"] = (
-                            book_result.babelio_publisher
-                        )
 
-                    # Marquer comme traité (mongo) avec metadata pour override cache editeur
-                    livres_auteurs_cache_service.mark_as_processed(
-                        cache_entry_id, author_id, book_id, metadata=cache_metadata
+                # Récupérer l'URL auteur depuis la page livre (cache hit — page déjà scrapée)
+                if book_result.babelio_url and author_id:
+                    author_url = await babelio_service.fetch_author_url_from_page(
+                        book_result.babelio_url
                     )
+                    if author_url:
+                        mongodb_service.update_auteur_name_and_url(
+                            str(author_id), url_babelio=author_url
+                        )
+                        logger.info(f"👤 URL auteur mise à jour: {author_url}")
+            except Exception as auto_processing_error:
+                # Ne pas faire échouer l'endpoint si l'enrichissement échoue
+                print(
+                    f"⚠️ Erreur auto-processing pour {book_result.auteur}: {auto_processing_error}"
+                )
+                items[index]["error"] = str(auto_processing_error)
+
+            # Issue #85: Passer babelio_publisher en metadata pour écraser editeur dans le cache
+            # C'est la source la plus fiable (enrichissement Babelio)
+            cache_metadata = {}
+            if book_result.babelio_publisher:
+                cache_metadata["babelio_publisher"] = book_result.babelio_publisher
+            processed.append(
+                {
+                    "cache_id": cache_entry_ids[index],
+                    "author_id": author_id,
+                    "book_id": book_id,
+                    "metadata": cache_metadata,
+                }
+            )
+
+            if (
+                book_result.babelio_publisher
+                and book_result.babelio_publisher != book_result.editeur
+            ):
+                publisher_corrections.append(book_result)
+
+        # Marquer comme traités (mongo), un bulk_write
+        if processed:
+            livres_auteurs_cache_service.mark_batch_as_processed(processed)
 
-                    # Issue #85: Mettre à jour l'avis_critique avec le nouvel éditeur enrichi par Babelio
-                    # Mettre à jour le summary markdown pour remplacer l'ancien éditeur par le nouvel
-                    if (
-                        book_result.babelio_publisher
-                        and book_result.babelio_publisher != book_result.editeur
-                    ):
+        # Issue #85: Mettre à jour le summary markdown de l'avis critique pour
+        # remplacer les anciens éditeurs par ceux enrichis par Babelio (une écriture)
+        if publisher_corrections:
+            try:
+                avis_critique = mongodb_service.get_avis_critique_by_id(
+                    request.avis_critique_id
+                )
+                if avis_critique:
+                    updated_summary = avis_critique.get("summary", "")
+                    for book_result in publisher_corrections:
                         print(
                             f"📝 [Issue #85] Updating avis_critique {request.avis_critique_id} with Babelio publisher={book_result.babelio_publisher}"
                         )
-
-                        # Récupérer l'avis critique actuel pour accéder au summary
-                        avis_critique = mongodb_service.get_avis_critique_by_id(
-                            request.avis_critique_id
+                        updated_summary = replace_book_in_summary(
+                            summary=updated_summary,
+                            original_author=book_result.auteur,
+                            original_title=book_result.titre,
+                            corrected_author=book_result.auteur,  # Pas de changement d'auteur
+                            corrected_title=book_result.titre,  # Pas de changement de titre
+                            original_publisher=book_result.editeur,
+                            corrected_publisher=book_result.babelio_publisher,
                         )
-                        if avis_critique:
-                            # Importer la fonction pour mettre à jour le summary
-                            from .utils.summary_updater import replace_book_in_summary
-
-                            # Mettre à jour le summary markdown avec le nouvel éditeur
-                            original_summary = avis_critique.get("summary", "")
-                            updated_summary = replace_book_in_summary(
-                                summary=original_summary,
-                                original_author=book_result.auteur,
-                                original_title=book_result.titre,
-                                corrected_author=book_result.auteur,  # Pas de changement d'auteur
-                                corrected_title=book_result.titre,  # Pas de changement de titre
-                                original_publisher=book_result.editeur,
-                                corrected_publisher=book_result.babelio_publisher,
-                            )
-
-                            # Mettre à jour l'avis_critique avec le summary mis à jour
-                            mongodb_service.update_avis_critique(
-                                request.avis_critique_id,
-                                {
-                                    "summary": updated_summary,
-                                },
-                            )
-                            print("   ✅ Summary updated in avis_critique")
-
-                except Exception as auto_processing_error:
-                    # Ne pas faire échouer l'endpoint si l'auto-processing échoue
-                    print(
-                        f"⚠️ Erreur auto-processing pour {book_result.auteur}: {auto_processing_error}"
+                    mongodb_service.update_avis_critique(
+                        request.avis_critique_id, {"summary": updated_summary}
                     )
+                    print("   ✅ Summary updated in avis_critique")
+            except Exception as summary_error:
+                print(f"⚠️ Erreur mise à jour du summary: {summary_error}")
 
-            books_processed += 1
-
-        return {"success": True, "books_processed": books_processed}
+        return {"success": True, "books_processed": len(items), "items": items}
 
     except HTTPException:
         raise
@@ -1912,7 +2090,9 @@ async def fuzzy_search_episode(request: FuzzySearchRequest) -> dict[str, Any]:
 
     try:
         # Récupérer l'épisode
-        episode_data = mongodb_service.get_episode_by_id(request.episode_id)
+        episode_data = mongodb_service.get_episode_by_id(
+            request.episode_id, profile="detail"
+        )
         if not episode_data:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -2036,6 +2216,98 @@ async def fuzzy_search_episode(request: FuzzySearchRequest) -> dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Erreur serveur: {e!s}") from e
 
 
+# Pool dédié aux recherches par entité : bornées à ce pool, les recherches
+# lentes ne saturent pas l'exécuteur par défaut (asyncio.to_thread) partagé
+# avec les autres endpoints. Créé au premier usage, arrêté avec l'application.
+_search_executor: ThreadPoolExecutor | None = None
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Pool des recherches par entité (recréé après un arrêt de l'application)."""
+    global _search_executor
+    if _search_executor is None:
+        _search_executor = ThreadPoolExecutor(
+            max_workers=10, thread_name_prefix="search"
+        )
+    return _search_executor
+
+
+def _shutdown_search_executor() -> None:
+    """Arrête le pool des recherches sans attendre (recherches en file annulées)."""
+    global _search_executor
+    if _search_executor is not None:
+        _search_executor.shutdown(wait=False, cancel_futures=True)
+        _search_executor = None
+
+
+def _run_search_before_deadline(
+    deadline: float | None, search: Any, *args: Any
+) -> dict[str, Any]:
+    """
+    Exécute une recherche, ses requêtes MongoDB bornées par l'échéance.
+
+    pymongo.timeout() transmet le temps restant au serveur (maxTimeMS) : une
+    recherche abandonnée côté asyncio est aussi interrompue par MongoDB, au
+    lieu d'occuper le thread et le serveur jusqu'à la fin de la requête.
+
+    Args:
+        deadline: Échéance (time.monotonic()), None pour aucun délai
+        search: Méthode de recherche de mongodb_service
+        *args: Arguments de la méthode de recherche
+
+    Returns:
+        Résultat de la recherche
+    """
+    if deadline is None:
+        return dict(search(*args))
+    with pymongo.timeout(max(deadline - time.monotonic(), 0.001)):
+        return dict(search(*args))
+
+
+async def _search_entity_with_timeout(
+    entity: str, search: Any, *args: Any
+) -> dict[str, Any]:
+    """
+    Lance la recherche d'une entité dans un thread, bornée par un délai.
+
+    Les recherches (pymongo synchrone + extraction de contexte en Python)
+    tournent dans le pool _search_executor pour ne pas bloquer la boucle
+    d'événements ; lancées en parallèle, une entité lente ne retarde pas les
+    autres. Une recherche encore en file d'attente au délai dépassé est
+    annulée sans être exécutée, une recherche en cours est interrompue par
+    MongoDB à la même échéance.
+
+    Args:
+        entity: Nom de l'entité (clé de la liste de résultats)
+        search: Méthode de recherche de mongodb_service
+        *args: Arguments de la méthode de recherche
+
+    Returns:
+        Résultat de la recherche avec "timed_out" à False, ou section vide
+        avec "timed_out" à True si le délai settings.search_entity_timeout_sec
+        est dépassé
+    """
+    timeout = settings.search_entity_timeout_sec
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+    try:
+        loop = asyncio.get_running_loop()
+        result = await asyncio.wait_for(
+            loop.run_in_executor(
+                _get_search_executor(),
+                _run_search_before_deadline,
+                deadline,
+                search,
+                *args,
+            ),
+            timeout or None,
+        )
+    except TimeoutError:
+        print(f"⚠️ Recherche {entity} interrompue après {timeout}s")
+        return {entity: [], "total_count": 0, "timed_out": True}
+    result["timed_out"] = False
+    return result
+
+
 @app.get("/api/search", response_model=dict[str, Any])
 async def search_text(q: str, limit: int = 10) -> dict[str, Any]:
     """Recherche textuelle multi-entités avec support de recherche floue."""
@@ -2059,26 +2331,38 @@ async def search_text(q: str, limit: int = 10) -> dict[str, Any]:
         )
 
     try:
-        # Recherche dans les épisodes
-        episodes_search_result = mongodb_service.search_episodes(q, limit)
+        # Épisodes, collections dédiées auteurs/livres/éditeurs et émissions
+        # (via collection avis - titres/auteurs/éditeurs) en parallèle
+        (
+            episodes_search_result,
+            auteurs_search_result,
+            livres_search_result,
+            editeurs_search_result,
+            emissions_search_result,
+        ) = await asyncio.gather(
+            _search_entity_with_timeout(
+                "episodes", mongodb_service.search_episodes, q, limit
+            ),
+            _search_entity_with_timeout(
+                "auteurs", mongodb_service.search_auteurs, q, limit
+            ),
+            _search_entity_with_timeout(
+                "livres", mongodb_service.search_livres, q, limit
+            ),
+            _search_entity_with_timeout(
+                "editeurs", mongodb_service.search_editeurs, q, limit
+            ),
+            _search_entity_with_timeout(
+                "emissions", mongodb_service.search_emissions, q, limit
+            ),
+        )
         episodes_list = episodes_search_result.get("episodes", [])
         episodes_total_count = episodes_search_result.get("total_count", 0)
-
-        # Recherche dans les collections dédiées auteurs et livres
-        auteurs_search_result = mongodb_service.search_auteurs(q, limit)
         auteurs_list = auteurs_search_result.get("auteurs", [])
         auteurs_total_count = auteurs_search_result.get("total_count", 0)
-
-        livres_search_result = mongodb_service.search_livres(q, limit)
         livres_list = livres_search_result.get("livres", [])
         livres_total_count = livres_search_result.get("total_count", 0)
-
-        # Recherche dans les éditeurs
-        editeurs_search_result = mongodb_service.search_editeurs(q, limit)
         editeurs_list = editeurs_search_result.get("editeurs", [])
-
-        # Recherche dans les émissions (via collection avis - titres/auteurs/éditeurs)
-        emissions_search_result = mongodb_service.search_emissions(q, limit)
         emissions_list = emissions_search_result.get("emissions", [])
         emissions_total_count = emissions_search_result.get("total_count", 0)
 
@@ -2088,9 +2372,12 @@ async def search_text(q: str, limit: int = 10) -> dict[str, Any]:
             "results": {
                 "auteurs": auteurs_list,
                 "auteurs_total_count": auteurs_total_count,
+                "auteurs_timed_out": auteurs_search_result["timed_out"],
                 "livres": livres_list,
                 "livres_total_count": livres_total_count,
+                "livres_timed_out": livres_search_result["timed_out"],
                 "editeurs": editeurs_list,
+                "editeurs_timed_out": editeurs_search_result["timed_out"],
                 "episodes": [
                     {
                         "titre": episode.get("titre_corrige")
@@ -2101,12 +2388,14 @@ async def search_text(q: str, limit: int = 10) -> dict[str, Any]:
                         "score": episode.get("score", 0),
                         "match_type": episode.get("match_type", "none"),
                         "search_context": episode.get("search_context", ""),
+                        "search_highlights": episode.get("search_highlights", []),
                         "_id": episode.get("_id", ""),
                         "emission_date": episode.get("emission_date"),
                     }
                     for episode in episodes_list
                 ],
                 "episodes_total_count": episodes_total_count,
+                "episodes_timed_out": episodes_search_result["timed_out"],
                 "emissions": [
                     {
                         "_id": emission.get("_id", ""),
@@ -2116,6 +2405,7 @@ async def search_text(q: str, limit: int = 10) -> dict[str, Any]:
                     for emission in emissions_list
                 ],
                 "emissions_total_count": emissions_total_count,
+                "emissions_timed_out": emissions_search_result["timed_out"],
             },
         }
 
@@ -2131,6 +2421,7 @@ async def advanced_search(
     entities: str | None = None,
     page: int = 1,
     limit: int = 20,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     Recherche avancée avec filtres par entités et pagination.
@@ -2141,6 +2432,9 @@ async def advanced_search(
                  Si None, recherche dans toutes les entités
         page: Numéro de page (commence à 1)
         limit: Nombre de résultats par page (max 100)
+        cursor: Curseur de la page précédente (pagination.next_cursor). Si
+                fourni, remplace l'offset calculé depuis page : une page
+                profonde coûte autant que la première
 
     Returns:
         Résultats de recherche avec pagination et compteurs totaux
@@ -2184,28 +2478,97 @@ async def advanced_search(
                 f"Entités valides: {', '.join(valid_entities)}",
             )
 
+    # Curseur combiné : {entité: [next_cursor, total_count]} (None = épuisée)
+    entity_cursors: dict[str, Any] = {}
+    if cursor:
+        try:
+            entity_cursors = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        # Chaque entrée : [curseur de l'entité (str ou None), total_count (int)]
+        if not isinstance(entity_cursors, dict) or not all(
+            isinstance(entry, list)
+            and len(entry) == 2
+            and (entry[0] is None or isinstance(entry[0], str))
+            and isinstance(entry[1], int)
+            for entry in entity_cursors.values()
+        ):
+            raise HTTPException(
+                status_code=400, detail="Curseur de pagination invalide"
+            )
+
     try:
         # Calculer l'offset pour la pagination
         offset = (page - 1) * limit
 
+        async def search_entity(entity: str, search: Any) -> dict[str, Any]:
+            """Lance la recherche d'une entité, par curseur si disponible."""
+            if entity not in entity_cursors:
+                return await _search_entity_with_timeout(
+                    entity, search, q, limit, offset
+                )
+            entity_cursor, total_count = entity_cursors[entity]
+            if entity_cursor is None:
+                # Entité épuisée aux pages précédentes : pas de requête
+                return {entity: [], "total_count": total_count, "timed_out": False}
+            return await _search_entity_with_timeout(
+                entity, search, q, limit, 0, entity_cursor
+            )
+
+        next_cursors: dict[str, Any] = {}
+
         # Initialiser les résultats
-        results: dict[str, Any] = {
-            "auteurs": [],
-            "auteurs_total_count": 0,
-            "livres": [],
-            "livres_total_count": 0,
-            "editeurs": [],
-            "editeurs_total_count": 0,
-            "episodes": [],
-            "episodes_total_count": 0,
-            "emissions": [],
-            "emissions_total_count": 0,
+        results: dict[str, Any] = {}
+        for entity in ("auteurs", "livres", "editeurs", "episodes", "emissions"):
+            results[entity] = []
+            results[f"{entity}_total_count"] = 0
+            results[f"{entity}_timed_out"] = False
+
+        # Rechercher dans les entités demandées avec offset et limit, en
+        # parallèle (chacune dans un thread, bornée par un délai)
+        searches = {
+            "episodes": mongodb_service.search_episodes,
+            "auteurs": mongodb_service.search_auteurs,
+            "livres": mongodb_service.search_livres,
+            "editeurs": mongodb_service.search_editeurs,
+            "emissions": mongodb_service.search_emissions,
         }
+        entity_names = [entity for entity in searches if entity in requested_entities]
+        entity_results = dict(
+            zip(
+                entity_names,
+                await asyncio.gather(
+                    *(
+                        search_entity(entity, searches[entity])
+                        for entity in entity_names
+                    )
+                ),
+                strict=True,
+            )
+        )
 
-        # Rechercher dans les entités demandées avec offset et limit
-        if "episodes" in requested_entities:
-            episodes_search_result = mongodb_service.search_episodes(q, limit, offset)
-            episodes_list = episodes_search_result.get("episodes", [])
+        for entity, search_result in entity_results.items():
+            if search_result["timed_out"]:
+                # Section vide : curseur reçu conservé pour la page suivante
+                results[f"{entity}_timed_out"] = True
+                if entity in entity_cursors:
+                    next_cursors[entity] = entity_cursors[entity]
+                continue
+            # total_count peut n'être qu'une estimation (rang infixe non lu) :
+            # au moins le total déjà connu et ce qui a été servi, plus un s'il
+            # reste des résultats, pour que total_pages couvre la page suivante
+            has_more = search_result.get(
+                "has_more", search_result.get("next_cursor") is not None
+            )
+            total_count = max(
+                search_result.get("total_count", 0),
+                entity_cursors[entity][1] if entity in entity_cursors else 0,
+                offset + len(search_result.get(entity, [])) + int(has_more),
+            )
+            next_cursors[entity] = [search_result.get("next_cursor"), total_count]
+            results[f"{entity}_total_count"] = total_count
+
+        if "episodes" in entity_results:
             results["episodes"] = [
                 {
                     "titre": episode.get("titre_corrige") or episode.get("titre", ""),
@@ -2215,47 +2578,26 @@ async def advanced_search(
                     "score": episode.get("score", 0),
                     "match_type": episode.get("match_type", "none"),
                     "search_context": episode.get("search_context", ""),
+                    "search_highlights": episode.get("search_highlights", []),
                     "_id": episode.get("_id", ""),
                     "emission_date": episode.get("emission_date"),
                 }
-                for episode in episodes_list
+                for episode in entity_results["episodes"].get("episodes", [])
             ]
-            results["episodes_total_count"] = episodes_search_result.get(
-                "total_count", 0
-            )
 
-        if "auteurs" in requested_entities:
-            auteurs_search_result = mongodb_service.search_auteurs(q, limit, offset)
-            results["auteurs"] = auteurs_search_result.get("auteurs", [])
-            results["auteurs_total_count"] = auteurs_search_result.get("total_count", 0)
-
-        if "livres" in requested_entities:
-            livres_search_result = mongodb_service.search_livres(q, limit, offset)
-            results["livres"] = livres_search_result.get("livres", [])
-            results["livres_total_count"] = livres_search_result.get("total_count", 0)
-
-        if "editeurs" in requested_entities:
-            # Recherche dans la collection editeurs
-            editeurs_search_result = mongodb_service.search_editeurs(q, limit, offset)
-            results["editeurs"] = editeurs_search_result.get("editeurs", [])
-            results["editeurs_total_count"] = editeurs_search_result.get(
-                "total_count", 0
-            )
+        for entity in ("auteurs", "livres", "editeurs"):
+            if entity in entity_results:
+                results[entity] = entity_results[entity].get(entity, [])
 
-        if "emissions" in requested_entities:
-            # Recherche dans les émissions (via collection avis - titres/auteurs/éditeurs)
-            emissions_search_result = mongodb_service.search_emissions(q, limit, offset)
+        if "emissions" in entity_results:
             results["emissions"] = [
                 {
                     "_id": emission.get("_id", ""),
                     "emission_date": emission.get("emission_date"),
                     "search_context": emission.get("search_context", ""),
                 }
-                for emission in emissions_search_result.get("emissions", [])
+                for emission in entity_results["emissions"].get("emissions", [])
             ]
-            results["emissions_total_count"] = emissions_search_result.get(
-                "total_count", 0
-            )
 
         # Calculer le nombre total de pages (basé sur la plus grande collection)
         max_total = max(
@@ -2267,16 +2609,25 @@ async def advanced_search(
         )
         total_pages = (max_total + limit - 1) // limit if max_total > 0 else 1
 
+        has_next = any(entity_next[0] for entity_next in next_cursors.values())
+
         response = {
             "query": q,
             "results": results,
-            "pagination": {"page": page, "limit": limit, "total_pages": total_pages},
+            "pagination": {
+                "page": page,
+                "limit": limit,
+                "total_pages": total_pages,
+                "next_cursor": encode_cursor(next_cursors) if has_next else None,
+            },
         }
 
         return response
 
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur serveur: {e!s}") from e
 
@@ -2747,7 +3098,7 @@ async def get_critique_detail(critique_id: str) -> dict[str, Any]:
 
 
 @app.get("/api/livres-auteurs/statistics", response_model=dict[str, Any])
-async def get_livres_auteurs_statistics() -> dict[str, Any]:
+async def get_livres_auteurs_statistics(request: Request) -> Response:
     """Récupère les statistiques pour la page livres-auteurs (Issue #124: includes Babelio metrics)."""
     # Vérification mémoire
     memory_check = memory_guard.check_memory_limit()
@@ -2759,9 +3110,9 @@ async def get_livres_auteurs_statistics() -> dict[str, Any]:
     try:
         # Utiliser stats_service qui contient toutes les métriques, y compris Babelio (Issue #124)
         stats = stats_service.get_cache_statistics()
-        return stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur serveur: {e!s}") from e
+    return _etag_response(request, stats)
 
 
 @app.post("/api/livres-auteurs/auto-process-verified", response_model=dict[str, Any])
@@ -2995,12 +3346,13 @@ async def merge_duplicate_authors_group(
 
 
 @app.get("/api/stats", response_model=dict[str, Any])
-async def get_cache_statistics() -> dict[str, Any] | JSONResponse:
-    """Récupère les statistiques de base du cache livres/auteurs."""
+async def get_cache_statistics(request: Request) -> Response:
+    """Récupère les statistiques de base du cache livres/auteurs (ETag / 304)."""
     try:
-        return stats_service.get_cache_statistics()
+        stats = stats_service.get_cache_statistics()
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
+    return _etag_response(request, stats)
 
 
 @app.get("/api/stats/detailed", response_model=list[dict[str, Any]])
@@ -3047,18 +3399,26 @@ async def get_validation_status_breakdown() -> list[dict[str, Any]] | JSONRespon
 
 # Endpoint Palmarès (Issue #195, enrichissement Calibre Issue #199)
 @app.get("/api/palmares", response_model=dict[str, Any])
-async def get_palmares(page: int = 1, limit: int = 30) -> dict[str, Any] | JSONResponse:
+async def get_palmares(
+    page: int = 1, limit: int = 30, cursor: str | None = None
+) -> dict[str, Any] | JSONResponse:
     """Get books ranked by average rating (descending).
 
     Returns paginated list of books with at least 2 reviews,
     sorted by average rating. Enriched with Calibre data when available.
+    Pass the returned next_cursor as cursor to read the following page
+    without offset (page is then only echoed back).
     """
     try:
-        result = mongodb_service.get_palmares(page=page, limit=limit)
+        result = await asyncio.to_thread(
+            mongodb_service.get_palmares, page=page, limit=limit, cursor=cursor
+        )
         calibre_index = calibre_matching_service.get_calibre_index()
         for item in result["items"]:
             calibre_matching_service.enrich_palmares_item(item, calibre_index)
         return result
+    except InvalidCursorError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
     except Exception as e:
         logger.error(f"Error getting palmares: {e}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -3692,14 +4052,16 @@ async def get_detected_critiques(episode_id: str) -> JSONResponse:
             summary
         )
 
-        # Récupérer tous les critiques existants
-        existing_critiques = list(mongodb_service.critiques_collection.find({}))
+        # Index des critiques existants (construit une fois, invalidé à l'écriture)
+        critique_index = critiques_extraction_service.get_critique_index(
+            mongodb_service.critiques_collection
+        )
 
         # Pour chaque nom détecté, chercher une correspondance
         results = []
         for detected_name in detected_names:
-            match = critiques_extraction_service.find_matching_critique(
-                detected_name, existing_critiques
+            match = critiques_extraction_service.match_critique(
+                detected_name, critique_index
             )
 
             if match:
@@ -3777,47 +4139,20 @@ async def get_critiques_manquants_count() -> JSONResponse:
             )
         )
 
-        # Compter combien d'épisodes ont au moins un critique "new" (manquant)
-        episodes_with_missing_critiques = 0
-
-        # Récupérer tous les critiques existants une seule fois
-        existing_critiques = list(mongodb_service.critiques_collection.find({}))
-
-        for episode_data in episodes_data:
-            # Filtrer les épisodes masqués
-            episode = Episode(episode_data)
-            if episode.masked:
-                continue
-
-            episode_id = str(episode_data["_id"])
-
-            # Récupérer l'avis critique
-            avis_critique = mongodb_service.avis_critiques_collection.find_one(
-                {"episode_oid": episode_id}
-            )
-
-            if not avis_critique:
-                continue
-
-            # Extraire les critiques détectés
-            summary = avis_critique.get("summary", "")
-            detected_names = (
-                critiques_extraction_service.extract_critiques_from_summary(summary)
-            )
-
-            # Vérifier si au moins un critique est "new" (manquant)
-            has_missing = False
-            for detected_name in detected_names:
-                match = critiques_extraction_service.find_matching_critique(
-                    detected_name, existing_critiques
-                )
-                if not match:
-                    # Ce critique est "new" (manquant)
-                    has_missing = True
-                    break
+        # Compteurs précalculés par avis critique (pas de reparsing des summaries)
+        visible_episode_oids = [
+            str(episode_data["_id"])
+            for episode_data in episodes_data
+            if not Episode(episode_data).masked
+        ]
+        critiques_status = get_critiques_status_by_episode(
+            mongodb_service, visible_episode_oids
+        )
 
-            if has_missing:
-                episodes_with_missing_critiques += 1
+        # Compter combien d'épisodes ont au moins un critique "new" (manquant)
+        episodes_with_missing_critiques = sum(
+            1 for status in critiques_status.values() if status["new"] > 0
+        )
 
         return JSONResponse(content={"count": episodes_with_missing_critiques})
 
@@ -3864,6 +4199,16 @@ async def get_episodes_with_avis_critiques() -> JSONResponse:
             )
         )
 
+        # Compteurs de critiques précalculés (une requête pour tous les épisodes)
+        critiques_status = (
+            get_critiques_status_by_episode(
+                mongodb_service,
+                [str(episode_data["_id"]) for episode_data in episodes],
+            )
+            if mongodb_service.critiques_collection is not None
+            else {}
+        )
+
         # Convertir en format JSON compatible avec EpisodeDropdown
         # (même structure que /api/episodes-with-reviews)
         episodes_json = []
@@ -3887,37 +4232,9 @@ async def get_episodes_with_avis_critiques() -> JSONResponse:
             # - 🟢 Vert: TOUS les critiques ont été créés
             # - ⚪ Gris: AUCUN critique n'a été créé
             # - 🔴 Rouge: CERTAINS critiques créés ET CERTAINS "new"
-            num_new_critiques = 0
-            num_existing_critiques = 0
-
-            avis_critique = mongodb_service.avis_critiques_collection.find_one(
-                {"episode_oid": episode_oid}
-            )
-            if (
-                avis_critique
-                and avis_critique.get("summary")
-                and mongodb_service.critiques_collection is not None
-            ):
-                # Extraire les critiques détectés
-                detected_critiques = (
-                    critiques_extraction_service.extract_critiques_from_summary(
-                        avis_critique["summary"]
-                    )
-                )
-                if detected_critiques:
-                    # Récupérer les critiques existants
-                    existing_critiques = list(
-                        mongodb_service.critiques_collection.find()
-                    )
-                    # Compter les critiques "new" vs existants
-                    for detected_name in detected_critiques:
-                        match = critiques_extraction_service.find_matching_critique(
-                            detected_name, existing_critiques
-                        )
-                        if match:
-                            num_existing_critiques += 1
-                        else:
-                            num_new_critiques += 1
+            status = critiques_status.get(episode_oid, {})
+            num_new_critiques = status.get("new", 0)
+            num_existing_critiques = status.get("existing", 0)
 
             total_critiques = num_new_critiques + num_existing_critiques
 
@@ -3975,25 +4292,30 @@ async def get_episodes_sans_avis_critiques() -> JSONResponse:
                 status_code=500, detail="Service MongoDB non disponible"
             )
 
-        # 1. Get episode IDs that have avis_critiques
-        avis_critiques = list(
-            mongodb_service.avis_critiques_collection.find({}, {"episode_oid": 1})
-        )
-        episode_ids_with_avis = {avis["episode_oid"] for avis in avis_critiques}
-
-        # 2. Find episodes with transcription but not in the set
-        # Issue #107: Exclure les épisodes masqués
+        # 1-2. Épisodes visibles avec transcription, sans avis critique
+        # (anti-jointure côté serveur ; la transcription n'est pas transférée,
+        # seule sa longueur)
         episodes = list(
-            mongodb_service.episodes_collection.find(
-                {
-                    "transcription": {"$exists": True, "$nin": [None, ""]},
-                    "masked": {"$ne": True},  # Exclure les épisodes masqués
-                    "_id": {
-                        "$nin": [ObjectId(eid) for eid in episode_ids_with_avis if eid]
+            mongodb_service.episodes_collection.aggregate(
+                [
+                    {
+                        "$match": {
+                            "transcription": {"$exists": True, "$nin": [None, ""]},
+                            "masked": {"$ne": True},  # Issue #107
+                        }
                     },
-                },
-                {"titre": 1, "date": 1, "transcription": 1, "episode_page_url": 1},
-            ).sort([("date", -1)])
+                    *episodes_without_avis_critiques_stages(),
+                    {"$sort": {"date": -1}},
+                    {
+                        "$project": {
+                            "titre": 1,
+                            "date": 1,
+                            "episode_page_url": 1,
+                            "transcription_length": {"$strLenCP": "$transcription"},
+                        }
+                    },
+                ]
+            )
         )
 
         # 3. Format response
@@ -4004,7 +4326,7 @@ async def get_episodes_sans_avis_critiques() -> JSONResponse:
                     "id": str(ep["_id"]),
                     "titre": ep.get("titre", ""),
                     "date": ep.get("date").isoformat() if ep.get("date") else None,
-                    "transcription_length": len(ep.get("transcription", "")),
+                    "transcription_length": ep.get("transcription_length", 0),
                     "has_episode_page_url": bool(ep.get("episode_page_url")),
                     "episode_page_url": ep.get(
                         "episode_page_url"
@@ -4073,7 +4395,7 @@ async def get_episodes_with_summaries() -> JSONResponse:
                     "id": str(ep["_id"]),
                     "titre": ep.get("titre", ""),
                     "date": ep.get("date").isoformat() if ep.get("date") else None,
-                    "transcription_length": len(ep.get("transcription", "")),
+                    "transcription_length": ep.get("transcription_length", 0),
                     "has_episode_page_url": bool(ep.get("episode_page_url")),
                     "episode_page_url": ep.get("episode_page_url"),
                     "has_summary": True,  # All episodes in this endpoint have summaries
@@ -4323,7 +4645,9 @@ async def save_avis_critiques(request: SaveAvisCritiquesRequest) -> JSONResponse
             )
 
         # Récupérer les infos de l'épisode pour episode_title et episode_date
-        episode = mongodb_service.get_episode_by_id(request.episode_id)
+        episode = mongodb_service.get_episode_by_id(
+            request.episode_id, profile="summary"
+        )
         if not episode:
             raise HTTPException(status_code=404, detail="Épisode non trouvé")
 
@@ -4346,6 +4670,8 @@ async def save_avis_critiques(request: SaveAvisCritiquesRequest) -> JSONResponse
 
         avis_data = {
             "episode_oid": request.episode_id,
+            # Clé de jointure typée (utils/join_keys.py)
+            "episode_id": to_object_id(request.episode_id),
             "episode_title": episode_title,
             "episode_date": episode_date,
             "summary": request.summary,
@@ -4353,6 +4679,10 @@ async def save_avis_critiques(request: SaveAvisCritiquesRequest) -> JSONResponse
             "summary_origin": "llm_generation_phase2",
             "metadata_source": metadata_clean,
             "updated_at": datetime.now(UTC),
+            # Copie de episodes.masked (statistiques sans $nin)
+            "episode_masked": bool(episode.get("masked", False)),
+            # Critiques détectés et compteurs new/existants (critiques-manquants)
+            **critiques_status_for_summary(mongodb_service, request.summary),
         }
 
         if existing:
@@ -4385,6 +4715,16 @@ async def save_avis_critiques(request: SaveAvisCritiquesRequest) -> JSONResponse
                 f"Impossible de vider le cache livresauteurs pour {request.episode_id}: {cache_err}"
             )
 
+        # Créer l'émission du nouvel avis critique (conversion incrémentale)
+        try:
+            await asyncio.to_thread(
+                emission_conversion_service.convert_new_avis_critiques
+            )
+        except Exception as convert_err:
+            logger.warning(
+                f"Auto-conversion en émission impossible pour {request.episode_id}: {convert_err}"
+            )
+
         return JSONResponse(content={"success": True, "avis_critique_id": avis_id})
 
     except HTTPException:
@@ -4447,6 +4787,8 @@ async def create_critique(request: Request) -> JSONResponse:
                 },
             )
 
+            rematch_critiques_status(mongodb_service)
+
             # Récupérer le critique mis à jour
             updated_critique = mongodb_service.critiques_collection.find_one(
                 {"_id": existing["_id"]}
@@ -4478,6 +4820,7 @@ async def create_critique(request: Request) -> JSONResponse:
 
         # Insérer dans MongoDB
         result = mongodb_service.critiques_collection.insert_one(critique_data)
+        rematch_critiques_status(mongodb_service)
 
         # Récupérer le critique créé
         created_critique = mongodb_service.critiques_collection.find_one(
@@ -4552,6 +4895,8 @@ async def add_variante(critique_id: str, request: Request) -> JSONResponse:
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Critique non trouvé")
 
+        rematch_critiques_status(mongodb_service)
+
         return JSONResponse(content=critique.to_dict())
 
     except HTTPException:
@@ -4644,22 +4989,22 @@ async def create_emission(request: Request) -> JSONResponse:
 
 
 def _resolve_critique_enrichment(
-    avis: dict[str, Any], existing_critiques: list[dict[str, Any]] | None
+    avis: dict[str, Any], critique_index: CritiqueIndex | None
 ) -> tuple[str | None, str | None]:
     """Résout critique_oid/critique_nom pour un avis, avec fallback variante.
 
     Si critique_oid est déjà présent, il est utilisé tel quel (le nom est
     résolu séparément via critiques_collection.find_one par l'appelant).
-    Sinon, si critique_nom_extrait est renseigné et que la liste des
+    Sinon, si critique_nom_extrait est renseigné et que l'index des
     critiques existants est disponible, retente le matching à la volée
     (Issue #256: reflète les variantes ajoutées après la sauvegarde de l'avis).
     """
     critique_oid = avis.get("critique_oid")
-    if critique_oid or not avis.get("critique_nom_extrait") or not existing_critiques:
+    if critique_oid or not avis.get("critique_nom_extrait") or not critique_index:
         return critique_oid, None
 
-    match = critiques_extraction_service.find_matching_critique(
-        avis["critique_nom_extrait"], existing_critiques
+    match = critiques_extraction_service.match_critique(
+        avis["critique_nom_extrait"], critique_index
     )
     if match:
         return match["id"], match["nom"]
@@ -4685,8 +5030,10 @@ async def get_avis_by_emission(emission_id: str) -> JSONResponse:
 
         avis_list = mongodb_service.get_avis_by_emission(emission_id)
 
-        existing_critiques = (
-            list(mongodb_service.critiques_collection.find({}))
+        critique_index = (
+            critiques_extraction_service.get_critique_index(
+                mongodb_service.critiques_collection
+            )
             if mongodb_service.critiques_collection is not None
             else None
         )
@@ -4751,7 +5098,7 @@ async def get_avis_by_emission(emission_id: str) -> JSONResponse:
                     enriched["critique_nom"] = critique.get("nom", "")
             elif not critique_oid:
                 resolved_oid, resolved_nom = _resolve_critique_enrichment(
-                    avis, existing_critiques
+                    avis, critique_index
                 )
                 if resolved_oid:
                     enriched["critique_oid"] = resolved_oid
@@ -4759,15 +5106,6 @@ async def get_avis_by_emission(emission_id: str) -> JSONResponse:
 
             enriched_avis.append(enriched)
 
-        # Calculer les statistiques de matching à partir des avis
-        # Compter les livres uniques par phase de match
-        unique_titles: dict[str, int | None] = {}  # titre -> match_phase
-        for avis in avis_list:
-            titre = avis.get("livre_titre_extrait", "")
-            if titre and titre not in unique_titles:
-                # Utiliser match_phase sauvegardé dans l'avis
-                unique_titles[titre] = avis.get("match_phase")
-
         # Compter les livres Mongo liés à l'émission
         livres_mongo_count = 0
         emission = None
@@ -4782,15 +5120,8 @@ async def get_avis_by_emission(emission_id: str) -> JSONResponse:
                     {"episodes": str(episode_id)}
                 )
 
-        matching_stats = {
-            "livres_summary": len(unique_titles),
-            "livres_mongo": livres_mongo_count,
-            "match_phase1": sum(1 for p in unique_titles.values() if p == 1),
-            "match_phase2": sum(1 for p in unique_titles.values() if p == 2),
-            "match_phase3": sum(1 for p in unique_titles.values() if p == 3),
-            "match_phase4": sum(1 for p in unique_titles.values() if p == 4),
-            "unmatched": sum(1 for p in unique_titles.values() if p is None),
-        }
+        # Statistiques de matching : livres uniques par match_phase sauvegardé
+        matching_stats = matching_stats_from_avis(avis_list, livres_mongo_count)
 
         return JSONResponse(
             content={"avis": enriched_avis, "matching_stats": matching_stats}
@@ -4807,14 +5138,15 @@ async def extract_avis_from_emission(emission_id: str) -> JSONResponse:
     """
     Extrait les avis structurés depuis le summary d'une émission.
 
-    Cette opération est idempotente : les anciens avis sont supprimés
-    avant la ré-extraction.
+    Cette opération est idempotente : la nouvelle extraction est comparée
+    aux avis en base (clé stable émission/section/titre/critique) et seuls
+    les avis ajoutés, modifiés ou disparus sont écrits.
 
     Args:
         emission_id: L'ID de l'émission
 
     Returns:
-        Résultat de l'extraction avec nombre d'avis créés
+        Résultat de l'extraction avec le nombre d'avis par type d'écriture
     """
     from back_office_lmelp.models.avis import Avis
     from back_office_lmelp.services.avis_extraction_service import AvisExtractionService
@@ -4901,6 +5233,7 @@ async def extract_avis_from_emission(emission_id: str) -> JSONResponse:
                 # 4b. Mettre à jour les livres dont episodes[] ne contient pas cet épisode
                 # Cela corrige la navigation future
                 if mongodb_service.livres_collection is not None:
+                    episodes_repaired = False
                     for livre_cache in livres_from_cache:
                         livre_id = livre_cache["_id"]
                         # Vérifier si l'episode_id est déjà dans episodes[]
@@ -4915,6 +5248,13 @@ async def extract_avis_from_emission(emission_id: str) -> JSONResponse:
                                     {"_id": ObjectId(livre_id)},
                                     {"$addToSet": {"episodes": str(episode_id)}},
                                 )
+                                episodes_repaired = True
+                    # Nombre de livres de l'épisode modifié : badge à recalculer
+                    # même si les avis ne changent pas
+                    if episodes_repaired:
+                        mongodb_service.refresh_emission_badges_for_episodes(
+                            [str(episode_id)]
+                        )
             except HTTPException:
                 # Si validation episode_oid échoue, fallback sur ancienne méthode
                 if mongodb_service.livres_collection is not None:
@@ -4934,14 +5274,14 @@ async def extract_avis_from_emission(emission_id: str) -> JSONResponse:
             extracted_avis, livres, critiques
         )
 
-        # 7. Supprimer les anciens avis de cette émission
-        deleted_count = mongodb_service.delete_avis_by_emission(emission_id)
-
-        # 8. Préparer et sauvegarder les nouveaux avis
+        # 7. Appliquer la différence avec les avis en base (clé stable par avis) :
+        # seuls les avis nouveaux, modifiés ou disparus sont écrits
         avis_to_save = [Avis.for_mongodb_insert(avis) for avis in resolved_avis]
-        saved_ids = mongodb_service.save_avis_batch(avis_to_save)
+        sync_counts = mongodb_service.sync_avis_for_emissions(
+            {emission_id: avis_to_save}
+        )
 
-        # 9. Collecter les avis non matchés (livre_oid is None)
+        # 8. Collecter les avis non matchés (livre_oid is None)
         unmatched_avis = [
             {
                 "livre_titre_extrait": a.get("livre_titre_extrait"),
@@ -4959,9 +5299,18 @@ async def extract_avis_from_emission(emission_id: str) -> JSONResponse:
 
         return JSONResponse(
             content={
-                "message": f"{len(saved_ids)} avis extraits et sauvegardés",
-                "extracted_count": len(saved_ids),
-                "deleted_count": deleted_count,
+                "message": (
+                    f"{len(avis_to_save)} avis extraits : "
+                    f"{sync_counts['inserted']} ajoutés, "
+                    f"{sync_counts['updated']} modifiés, "
+                    f"{sync_counts['deleted']} supprimés, "
+                    f"{sync_counts['unchanged']} inchangés"
+                ),
+                "extracted_count": len(avis_to_save),
+                "inserted_count": sync_counts["inserted"],
+                "updated_count": sync_counts["updated"],
+                "deleted_count": sync_counts["deleted"],
+                "unchanged_count": sync_counts["unchanged"],
                 "unresolved_livres": sum(
                     1 for a in resolved_avis if a.get("livre_oid") is None
                 ),
@@ -4979,6 +5328,38 @@ async def extract_avis_from_emission(emission_id: str) -> JSONResponse:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@app.post("/api/avis/extract-batch")
+async def extract_avis_batch(request: AvisBatchExtractionRequest) -> StreamingResponse:
+    """
+    Ré-extrait les avis de toutes les émissions (ou d'une sélection).
+
+    Parsing et matching en processus parallèles, écritures groupées par lot.
+    La progression est diffusée en Server-Sent Events ; en dry_run, rien n'est
+    écrit et chaque émission rapporte l'écart des statistiques de matching.
+    """
+    if mongodb_service.db is None:
+        raise HTTPException(status_code=500, detail="Service MongoDB non disponible")
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        """Générateur d'événements Server-Sent Events."""
+        async for event in reextract_all_avis(
+            mongodb_service,
+            emission_ids=request.emission_ids,
+            dry_run=request.dry_run,
+            max_workers=request.max_workers,
+        ):
+            yield f"data: {json.dumps(event, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 @app.get("/api/avis/by-critique/{critique_id}")
 async def get_avis_by_critique(critique_id: str) -> JSONResponse:
     """
@@ -5037,8 +5418,10 @@ async def get_avis_by_livre(livre_id: str) -> JSONResponse:
 
         avis_list = mongodb_service.get_avis_by_livre(livre_id)
 
-        existing_critiques = (
-            list(mongodb_service.critiques_collection.find({}))
+        critique_index = (
+            critiques_extraction_service.get_critique_index(
+                mongodb_service.critiques_collection
+            )
             if mongodb_service.critiques_collection is not None
             else None
         )
@@ -5065,7 +5448,7 @@ async def get_avis_by_livre(livre_id: str) -> JSONResponse:
                     enriched["critique_nom"] = critique.get("nom", "")
             elif not critique_oid:
                 resolved_oid, resolved_nom = _resolve_critique_enrichment(
-                    avis, existing_critiques
+                    avis, critique_index
                 )
                 if resolved_oid:
                     enriched["critique_oid"] = resolved_oid
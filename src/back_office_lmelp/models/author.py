@@ -5,6 +5,8 @@ from typing import Any
 
 from bson import ObjectId
 
+from ..utils.search_keys import search_shadow_fields
+
 
 class Author:
     """Modèle représentant un auteur."""
@@ -47,6 +49,8 @@ class Author:
         now = datetime.now()
         return {
             "nom": data["nom"],
+            # Champs de recherche : nom_normalise, nom_mots
+            **search_shadow_fields("auteurs", {"nom": data["nom"]}),
             "url_babelio": data.get("url_babelio"),
             "livres": data.get("livres", []),
             "created_at": now,
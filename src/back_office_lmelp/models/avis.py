@@ -3,6 +3,98 @@
 from datetime import datetime
 from typing import Any
 
+from ..utils.join_keys import typed_join_fields
+from ..utils.text_utils import normalize_for_matching
+
+
+# Champs produits par l'extraction, comparés lors d'une ré-extraction
+EXTRACTED_FIELDS = (
+    "livre_oid",
+    "critique_oid",
+    "livre_id",
+    "critique_id",
+    "commentaire",
+    "note",
+    "section",
+    "livre_titre_extrait",
+    "auteur_nom_extrait",
+    "editeur_extrait",
+    "critique_nom_extrait",
+    "match_phase",
+)
+
+AvisKey = tuple[str, str, str, str, int]
+
+
+def avis_keys(avis_list: list[dict[str, Any]]) -> list[AvisKey]:
+    """
+    Clés stables des avis : (émission, section, titre normalisé, critique normalisé, rang).
+
+    Le rang départage les avis de même clé (ex. critique cité deux fois pour
+    un livre) : 0 pour le premier, 1 pour le suivant...
+
+    Args:
+        avis_list: Avis extraits ou en base
+
+    Returns:
+        Clés, dans l'ordre de avis_list
+    """
+    seen: dict[tuple[str, str, str, str], int] = {}
+    keys = []
+    for avis in avis_list:
+        base = (
+            str(avis.get("emission_oid", "")),
+            avis.get("section") or "programme",
+            normalize_for_matching(avis.get("livre_titre_extrait") or "").strip(),
+            normalize_for_matching(avis.get("critique_nom_extrait") or "").strip(),
+        )
+        rank = seen.get(base, 0)
+        seen[base] = rank + 1
+        keys.append((*base, rank))
+    return keys
+
+
+def diff_avis(
+    stored: list[dict[str, Any]], extracted: list[dict[str, Any]]
+) -> dict[str, list[Any]]:
+    """
+    Différence entre les avis en base et une nouvelle extraction.
+
+    Args:
+        stored: Avis en base (avec _id)
+        extracted: Nouveaux avis (format for_mongodb_insert)
+
+    Returns:
+        Dict avec :
+        - "insert": nouveaux avis sans équivalent en base
+        - "update": tuples (avis en base, champs modifiés)
+        - "delete": avis en base absents de l'extraction
+        - "unchanged": avis en base identiques
+    """
+    stored_by_key = dict(zip(avis_keys(stored), stored, strict=True))
+    diff: dict[str, list[Any]] = {
+        "insert": [],
+        "update": [],
+        "delete": [],
+        "unchanged": [],
+    }
+    for key, avis in zip(avis_keys(extracted), extracted, strict=True):
+        previous = stored_by_key.pop(key, None)
+        if previous is None:
+            diff["insert"].append(avis)
+            continue
+        changes = {
+            field: avis.get(field)
+            for field in EXTRACTED_FIELDS
+            if avis.get(field) != previous.get(field)
+        }
+        if changes:
+            diff["update"].append((previous, changes))
+        else:
+            diff["unchanged"].append(previous)
+    diff["delete"] = list(stored_by_key.values())
+    return diff
+
 
 class Avis:
     """Modèle représentant un avis individuel d'un critique sur un livre."""
@@ -61,11 +153,16 @@ class Avis:
             Dictionnaire formaté pour MongoDB
         """
         now = datetime.now()
-
-        return {
+        references = {
             "emission_oid": data["emission_oid"],
             "livre_oid": data.get("livre_oid"),
             "critique_oid": data.get("critique_oid"),
+        }
+
+        return {
+            **references,
+            # Clés de jointure typées : emission_id, livre_id, critique_id
+            **typed_join_fields("avis", references),
             "commentaire": data.get("commentaire", ""),
             "note": data.get("note"),
             "section": data.get("section", "programme"),
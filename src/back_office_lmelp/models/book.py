@@ -5,6 +5,8 @@ from typing import Any
 
 from bson import ObjectId
 
+from ..utils.search_keys import search_shadow_fields
+
 
 class Book:
     """Modèle représentant un livre."""
@@ -80,6 +82,8 @@ class Book:
             editeur = data.get("babelio_publisher") or data.get("editeur", "")
             result["editeur"] = editeur
 
+        # Champs de recherche : titre_normalise, titre_mots (et editeur_*)
+        result.update(search_shadow_fields("livres", result))
         return result
 
     def add_episode_reference(self, episode_id: ObjectId) -> None:
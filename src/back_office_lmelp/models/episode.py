@@ -1,7 +1,29 @@
 """Modèles pour les épisodes."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
+
+
+# Profils de projection pour la lecture des épisodes : la transcription pèse
+# plusieurs centaines de Ko, elle ne doit être chargée que si nécessaire.
+EpisodeProfile = Literal["summary", "detail", "full"]
+
+EPISODE_PROJECTIONS: dict[str, dict[str, int] | None] = {
+    # Champs de to_summary_dict() (listes, contrôles d'existence, titre/date)
+    "summary": {
+        "titre": 1,
+        "titre_corrige": 1,
+        "date": 1,
+        "type": 1,
+        "duree": 1,
+        "masked": 1,
+        "_id": 1,
+    },
+    # Tout sauf la transcription (description, URL de la page, origines...)
+    "detail": {"transcription": 0},
+    # Document complet
+    "full": None,
+}
 
 
 class Episode:
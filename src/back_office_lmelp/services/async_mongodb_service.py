@@ -0,0 +1,175 @@
+"""Service MongoDB asynchrone (Motor) pour les endpoints FastAPI.
+
+Les méthodes de MongoDBService utilisent pymongo (synchrone) : appelées depuis
+un endpoint ``async def``, elles bloquent la boucle d'événements d'uvicorn et
+toutes les requêtes concurrentes (y compris /health) attendent leur fin.
+
+AsyncMongoDBService expose les mêmes lectures en version ``async`` via Motor,
+afin que les requêtes concurrentes s'entrelacent. Le service synchrone reste
+disponible pour les scripts et les traitements hors boucle d'événements.
+"""
+
+import os
+from typing import Any
+
+from bson import ObjectId
+from dotenv import load_dotenv
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+
+from ..models.episode import EPISODE_PROJECTIONS, EpisodeProfile
+from .mongodb_service import (
+    LAST_UPDATE_PROJECTION,
+    LAST_UPDATE_SORT,
+    STATISTICS_COUNTS,
+    build_statistics,
+)
+from .stats_snapshot_service import StatsSnapshot, write_tracker
+
+
+load_dotenv()
+
+
+class AsyncMongoDBService:
+    """Service asynchrone pour interagir avec la base MongoDB via Motor."""
+
+    def __init__(self) -> None:
+        """Initialise la configuration (la connexion est établie par connect())."""
+        self.mongo_url = os.getenv(
+            "MONGODB_URL", "mongodb://localhost:27017/masque_et_la_plume"
+        )
+        self.client: AsyncIOMotorClient | None = None
+        self.db: AsyncIOMotorDatabase | None = None
+        self.episodes_collection: AsyncIOMotorCollection | None = None
+        self.avis_critiques_collection: AsyncIOMotorCollection | None = None
+        self.stats_snapshot = StatsSnapshot()
+
+    async def connect(self) -> bool:
+        """Établit la connexion à MongoDB."""
+        try:
+            self.client = AsyncIOMotorClient(
+                self.mongo_url, event_listeners=[write_tracker]
+            )
+            # Test de connexion
+            await self.client.admin.command("ping")
+            self.db = self.client.get_default_database()
+            self.episodes_collection = self.db.episodes
+            self.avis_critiques_collection = self.db.avis_critiques
+            return True
+        except Exception as e:
+            print(f"Erreur de connexion MongoDB (async): {e}")
+            if self.client is not None:
+                self.client.close()
+            self.client = None
+            self.db = None
+            self.episodes_collection = None
+            self.avis_critiques_collection = None
+            return False
+
+    def disconnect(self) -> None:
+        """Ferme la connexion MongoDB."""
+        if self.client:
+            self.client.close()
+
+    async def get_all_episodes(
+        self, include_masked: bool = False
+    ) -> list[dict[str, Any]]:
+        """Récupère tous les épisodes avec tri par date décroissante.
+
+        Équivalent asynchrone de MongoDBService.get_all_episodes().
+
+        Args:
+            include_masked: Si False (défaut), exclut les épisodes masqués.
+
+        Returns:
+            Liste des épisodes
+        """
+        if self.episodes_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        try:
+            query_filter: dict[str, Any] = {}
+            if not include_masked:
+                query_filter["masked"] = {"$ne": True}
+
+            cursor = self.episodes_collection.find(
+                query_filter, EPISODE_PROJECTIONS["summary"]
+            ).sort([("date", -1)])
+            episodes: list[dict[str, Any]] = await cursor.to_list(length=None)
+
+            for episode in episodes:
+                episode["_id"] = str(episode["_id"])
+
+            return episodes
+        except Exception as e:
+            print(f"Erreur lors de la récupération des épisodes: {e}")
+            return []
+
+    async def get_episode_by_id(
+        self, episode_id: str, profile: EpisodeProfile = "full"
+    ) -> dict[str, Any] | None:
+        """Récupère un épisode par son ID.
+
+        Args:
+            episode_id: ID de l'épisode
+            profile: Profil de projection ("summary", "detail" ou "full")
+        """
+        if self.episodes_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        try:
+            episode = await self.episodes_collection.find_one(
+                {"_id": ObjectId(episode_id)}, EPISODE_PROJECTIONS[profile]
+            )
+            if episode:
+                episode_dict: dict[str, Any] = dict(episode)
+                episode_dict["_id"] = str(episode_dict["_id"])
+                return episode_dict
+            return None
+        except Exception as e:
+            print(f"Erreur lors de la récupération de l'épisode {episode_id}: {e}")
+            return None
+
+    async def get_statistics(self) -> dict[str, Any]:
+        """Récupère les statistiques de la base de données.
+
+        Équivalent asynchrone de MongoDBService.get_statistics(). Le résultat
+        est conservé dans stats_snapshot tant que episodes et avis_critiques
+        ne sont pas modifiés.
+        """
+        if self.episodes_collection is None or self.avis_critiques_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        result: dict[str, Any] = await self.stats_snapshot.aget_section(
+            "statistics", ("episodes", "avis_critiques"), self._compute_statistics
+        )
+        return result
+
+    async def _compute_statistics(self) -> dict[str, Any]:
+        """Calcule les statistiques (mêmes requêtes que MongoDBService, STATISTICS_COUNTS)."""
+        if self.episodes_collection is None or self.avis_critiques_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        try:
+            collections = {
+                "episodes": self.episodes_collection,
+                "avis_critiques": self.avis_critiques_collection,
+            }
+            counts = {
+                key: await collections[name].count_documents(query_filter)
+                for key, (name, query_filter) in STATISTICS_COUNTS.items()
+            }
+            last_episode = await self.episodes_collection.find_one(
+                {}, LAST_UPDATE_PROJECTION, sort=LAST_UPDATE_SORT
+            )
+            return build_statistics(counts, last_episode)
+        except Exception as e:
+            print(f"Erreur lors de la récupération des statistiques: {e}")
+            raise
+
+
+# Instance globale du service
+async_mongodb_service = AsyncMongoDBService()
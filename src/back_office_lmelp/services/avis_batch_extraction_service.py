@@ -0,0 +1,472 @@
+"""Ré-extraction groupée des avis de toutes les émissions.
+
+Après un changement du parseur ou du prompt de génération des summaries, les
+avis de centaines d'émissions doivent être ré-extraits. Appeler
+POST /api/avis/extract/{emission_id} en boucle relit tous les critiques et
+répare episodes[] livre par livre (find_one + update_one) à chaque émission.
+
+Ici :
+- émissions, summaries, livres validés (livresauteurs_cache) et critiques sont
+  lus une seule fois, par $in ;
+- le parsing et le matching (AvisExtractionService, pur CPU) tournent dans un
+  ProcessPoolExecutor ; les critiques sont transmis une fois par processus
+  (initializer) et non à chaque tâche ;
+- les écritures sont groupées par lot d'émissions : un bulk_write pour les
+  avis (MongoDBService.sync_avis_for_emissions, par différence : seuls les
+  avis ajoutés, modifiés ou disparus sont écrits) et un pour episodes[] ;
+- la progression est produite par un générateur asynchrone (Server-Sent
+  Events côté API, affichage ligne à ligne côté CLI).
+
+En mode dry_run, rien n'est écrit : chaque émission rapporte l'écart entre les
+statistiques de matching des avis en base et celles de la nouvelle extraction,
+ainsi que les écritures qui seraient faites (ajouts, modifications, suppressions).
+
+CLI :
+
+    python -m back_office_lmelp.utils.reextract_avis --dry-run
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncGenerator, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from typing import Any
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from ..models.avis import Avis, diff_avis
+from .avis_extraction_service import AvisExtractionService
+
+
+# Taille maximale des listes $in envoyées à MongoDB
+AVIS_BATCH_SIZE = 500
+
+# Nombre d'émissions traitées (puis écrites) par lot
+AVIS_BATCH_CHUNK_SIZE = 50
+
+# Processus de parsing au plus (un par CPU)
+AVIS_BATCH_MAX_WORKERS = os.cpu_count() or 1
+
+# Clés des statistiques de matching (resolve_entities_with_stats)
+MATCHING_STATS_KEYS = (
+    "livres_summary",
+    "livres_mongo",
+    "match_phase1",
+    "match_phase2",
+    "match_phase3",
+    "match_phase4",
+    "unmatched",
+)
+
+# Critiques du processus de travail (initialisés une fois par processus)
+_worker_critiques: list[dict[str, Any]] = []
+
+
+def _batches(items: list[Any], size: int = AVIS_BATCH_SIZE) -> Iterable[list[Any]]:
+    """Découpe une liste en lots de taille bornée."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _object_ids(ids: Iterable[Any]) -> list[ObjectId]:
+    """Convertit des IDs (str ou ObjectId) en ObjectId, en ignorant les invalides."""
+    result = []
+    for value in ids:
+        if isinstance(value, ObjectId):
+            result.append(value)
+        elif value and ObjectId.is_valid(str(value)):
+            result.append(ObjectId(str(value)))
+    return list(dict.fromkeys(result))
+
+
+def _event(event_type: str, **fields: Any) -> dict[str, Any]:
+    """Événement de progression horodaté."""
+    return {
+        "type": event_type,
+        **fields,
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+def matching_stats_from_avis(
+    avis_list: list[dict[str, Any]], livres_mongo: int
+) -> dict[str, int]:
+    """
+    Statistiques de matching d'avis déjà en base (par livre unique, via match_phase).
+
+    Même format que resolve_entities_with_stats().
+
+    Args:
+        avis_list: Avis d'une émission (livre_titre_extrait, match_phase)
+        livres_mongo: Nombre de livres MongoDB de l'épisode
+
+    Returns:
+        Statistiques de matching
+    """
+    unique_titles: dict[str, int | None] = {}
+    for avis in avis_list:
+        titre = avis.get("livre_titre_extrait", "")
+        if titre and titre not in unique_titles:
+            unique_titles[titre] = avis.get("match_phase")
+
+    return {
+        "livres_summary": len(unique_titles),
+        "livres_mongo": livres_mongo,
+        "match_phase1": sum(1 for p in unique_titles.values() if p == 1),
+        "match_phase2": sum(1 for p in unique_titles.values() if p == 2),
+        "match_phase3": sum(1 for p in unique_titles.values() if p == 3),
+        "match_phase4": sum(1 for p in unique_titles.values() if p == 4),
+        "unmatched": sum(1 for p in unique_titles.values() if p is None),
+    }
+
+
+def matching_stats_delta(
+    before: dict[str, int], after: dict[str, int]
+) -> dict[str, int]:
+    """Écart (après - avant) entre deux statistiques de matching."""
+    return {key: after.get(key, 0) - before.get(key, 0) for key in MATCHING_STATS_KEYS}
+
+
+def run_extraction(
+    job: dict[str, Any], critiques: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Parsing + matching d'une émission (sans accès MongoDB).
+
+    Args:
+        job: {"emission_id", "summary", "livres"} (voir load_extraction_jobs)
+        critiques: Critiques connus
+
+    Returns:
+        {"emission_id", "avis" (résolus), "matching_stats"}
+    """
+    service = AvisExtractionService()
+    extracted = service.extract_avis_from_summary(job["summary"], job["emission_id"])
+    if not extracted:
+        return {"emission_id": job["emission_id"], "avis": [], "matching_stats": None}
+
+    resolved, stats = service.resolve_entities_with_stats(
+        extracted, job["livres"], critiques
+    )
+    return {
+        "emission_id": job["emission_id"],
+        "avis": resolved,
+        "matching_stats": stats,
+    }
+
+
+def _init_worker(critiques: list[dict[str, Any]]) -> None:
+    """Initialise un processus de travail avec la liste des critiques."""
+    global _worker_critiques
+    _worker_critiques = critiques
+
+
+def _extract_in_worker(job: dict[str, Any]) -> dict[str, Any]:
+    """Point d'entrée des tâches du ProcessPoolExecutor."""
+    return run_extraction(job, _worker_critiques)
+
+
+def load_extraction_jobs(
+    mongodb_service: Any, emission_ids: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Prépare les tâches d'extraction : summaries et livres de chaque émission.
+
+    Nombre de requêtes indépendant du nombre d'émissions : émissions,
+    avis_critiques, livresauteurs_cache et livres sont lus par $in.
+    Les livres d'un épisode sont ceux validés dans livresauteurs_cache
+    (status "mongo"), comme get_livres_from_collections() (Issue #185).
+
+    Args:
+        mongodb_service: Service MongoDB connecté
+        emission_ids: Émissions à traiter (toutes si None)
+
+    Returns:
+        Tâches {"emission_id", "episode_id", "summary", "livres",
+        "missing_episode_livres"} ; les émissions sans summary sont omises
+    """
+    emissions_collection = mongodb_service.get_collection("emissions")
+    query: dict[str, Any] = {"avis_critique_id": {"$ne": None}}
+    if emission_ids is not None:
+        query["_id"] = {"$in": _object_ids(emission_ids)}
+    emissions = list(
+        emissions_collection.find(query, {"avis_critique_id": 1, "episode_id": 1})
+    )
+
+    summaries: dict[ObjectId, str] = {}
+    avis_critique_ids = _object_ids(e.get("avis_critique_id") for e in emissions)
+    for batch in _batches(avis_critique_ids):
+        for avis_critique in mongodb_service.get_collection("avis_critiques").find(
+            {"_id": {"$in": batch}}, {"summary": 1}
+        ):
+            summaries[avis_critique["_id"]] = avis_critique.get("summary") or ""
+
+    # Livres validés par épisode (livresauteurs_cache → livres)
+    episode_ids = list({str(e["episode_id"]) for e in emissions if e.get("episode_id")})
+    book_ids_by_episode: dict[str, list[ObjectId]] = {}
+    for batch in _batches(episode_ids):
+        for entry in mongodb_service.get_collection("livresauteurs_cache").find(
+            {
+                "episode_oid": {"$in": batch},
+                "status": "mongo",
+                "book_id": {"$exists": True},
+                "author_id": {"$exists": True},
+            },
+            {"episode_oid": 1, "book_id": 1},
+        ):
+            book_ids_by_episode.setdefault(str(entry["episode_oid"]), []).append(
+                ObjectId(entry["book_id"])
+            )
+
+    livres_by_id: dict[ObjectId, dict[str, Any]] = {}
+    all_book_ids = _object_ids(
+        book_id for book_ids in book_ids_by_episode.values() for book_id in book_ids
+    )
+    for batch in _batches(all_book_ids):
+        for livre in mongodb_service.get_collection("livres").find(
+            {"_id": {"$in": batch}},
+            {"titre": 1, "auteur_id": 1, "editeur": 1, "episodes": 1},
+        ):
+            livres_by_id[livre["_id"]] = livre
+
+    jobs = []
+    for emission in emissions:
+        avis_critique_id = _object_ids([emission.get("avis_critique_id")])
+        summary = summaries.get(avis_critique_id[0]) if avis_critique_id else None
+        if not summary:
+            continue
+        episode_id = str(emission["episode_id"]) if emission.get("episode_id") else None
+        livres = [
+            livres_by_id[book_id]
+            for book_id in book_ids_by_episode.get(episode_id or "", [])
+            if book_id in livres_by_id
+        ]
+        jobs.append(
+            {
+                "emission_id": str(emission["_id"]),
+                "episode_id": episode_id,
+                "summary": summary,
+                # Format attendu par resolve_entities_with_stats
+                "livres": [
+                    {
+                        "_id": livre["_id"],
+                        "titre": livre.get("titre", ""),
+                        "auteur_id": (
+                            ObjectId(livre["auteur_id"])
+                            if livre.get("auteur_id")
+                            else None
+                        ),
+                        "editeur": livre.get("editeur", ""),
+                    }
+                    for livre in livres
+                ],
+                # Livres dont episodes[] ne contient pas encore l'épisode
+                "missing_episode_livres": [
+                    livre["_id"]
+                    for livre in livres
+                    if episode_id not in (livre.get("episodes") or [])
+                ],
+            }
+        )
+    return jobs
+
+
+def _load_stored_avis(
+    mongodb_service: Any, emission_ids: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Avis en base des émissions (pour les statistiques et la différence)."""
+    stored: dict[str, list[dict[str, Any]]] = {
+        emission_id: [] for emission_id in emission_ids
+    }
+    for batch in _batches(emission_ids):
+        for avis in mongodb_service.get_collection("avis").find(
+            {"emission_oid": {"$in": batch}}
+        ):
+            stored.setdefault(avis["emission_oid"], []).append(avis)
+    return stored
+
+
+def _write_chunk(
+    mongodb_service: Any,
+    jobs: list[dict[str, Any]],
+    avis_by_emission: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Écrit un lot : episodes[] manquants puis avis, un bulk_write chacun."""
+    repairs = [
+        UpdateOne({"_id": livre_id}, {"$addToSet": {"episodes": job["episode_id"]}})
+        for job in jobs
+        for livre_id in job["missing_episode_livres"]
+    ]
+    if repairs:
+        mongodb_service.get_collection("livres").bulk_write(repairs, ordered=False)
+        # Nombre de livres par épisode modifié : badges à recalculer même si
+        # les avis ne changent pas
+        mongodb_service.refresh_emission_badges_for_episodes(
+            [job["episode_id"] for job in jobs if job["missing_episode_livres"]]
+        )
+
+    mongodb_service.sync_avis_for_emissions(avis_by_emission)
+
+
+async def reextract_all_avis(
+    mongodb_service: Any,
+    emission_ids: list[str] | None = None,
+    dry_run: bool = False,
+    max_workers: int | None = None,
+    chunk_size: int = AVIS_BATCH_CHUNK_SIZE,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Ré-extrait les avis de toutes les émissions (ou d'une sélection).
+
+    Les émissions dont le summary ne donne aucun avis sont ignorées (leurs
+    avis en base sont conservés), comme pour l'extraction unitaire.
+
+    Args:
+        mongodb_service: Service MongoDB connecté
+        emission_ids: Émissions à traiter (toutes si None)
+        dry_run: Si True, aucune écriture ; seuls les écarts sont rapportés
+        max_workers: Processus de parsing (1 = dans le processus courant)
+        chunk_size: Émissions par lot d'écriture
+
+    Yields:
+        Événements de progression :
+        {"type": "start" | "emission_result" | "error" | "complete",
+         "current", "total", "emission_id", ..., "timestamp"}
+    """
+    jobs = await asyncio.to_thread(load_extraction_jobs, mongodb_service, emission_ids)
+    critiques = await asyncio.to_thread(
+        lambda: list(mongodb_service.get_collection("critiques").find())
+    )
+    total = len(jobs)
+    yield _event("start", total=total, dry_run=dry_run)
+
+    totals = {
+        "processed": 0,
+        "skipped": 0,
+        "errors": 0,
+        "extracted_count": 0,
+        "inserted_count": 0,
+        "updated_count": 0,
+        "deleted_count": 0,
+        "unchanged_count": 0,
+    }
+    delta_totals = dict.fromkeys(MATCHING_STATS_KEYS, 0)
+
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(critiques,)
+        )
+        if max_workers != 1
+        else None
+    )
+    loop = asyncio.get_running_loop()
+    current = 0
+    try:
+        for chunk in _batches(jobs, chunk_size):
+            if executor is not None:
+                outcomes = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, _extract_in_worker, job)
+                        for job in chunk
+                    ),
+                    return_exceptions=True,
+                )
+            else:
+                outcomes = []
+                for job in chunk:
+                    try:
+                        outcomes.append(run_extraction(job, critiques))
+                    except Exception as e:
+                        outcomes.append(e)
+
+            stored = await asyncio.to_thread(
+                _load_stored_avis,
+                mongodb_service,
+                [job["emission_id"] for job in chunk],
+            )
+
+            ok_jobs: list[dict[str, Any]] = []
+            avis_by_emission: dict[str, list[dict[str, Any]]] = {}
+            events: list[dict[str, Any]] = []
+            for job, outcome in zip(chunk, outcomes, strict=True):
+                current += 1
+                if isinstance(outcome, BaseException):
+                    totals["errors"] += 1
+                    events.append(
+                        _event(
+                            "error",
+                            current=current,
+                            total=total,
+                            emission_id=job["emission_id"],
+                            error=str(outcome),
+                        )
+                    )
+                    continue
+
+                stored_avis = stored.get(job["emission_id"], [])
+                if not outcome["avis"]:
+                    totals["skipped"] += 1
+                    events.append(
+                        _event(
+                            "emission_result",
+                            current=current,
+                            total=total,
+                            emission_id=job["emission_id"],
+                            skipped=True,
+                            extracted_count=0,
+                        )
+                    )
+                    continue
+
+                before = matching_stats_from_avis(stored_avis, len(job["livres"]))
+                delta = matching_stats_delta(before, outcome["matching_stats"])
+                for key, value in delta.items():
+                    delta_totals[key] += value
+                avis_to_save = [Avis.for_mongodb_insert(a) for a in outcome["avis"]]
+                diff = diff_avis(stored_avis, avis_to_save)
+                counts = {
+                    "inserted_count": len(diff["insert"]),
+                    "updated_count": len(diff["update"]),
+                    "deleted_count": len(diff["delete"]),
+                    "unchanged_count": len(diff["unchanged"]),
+                }
+                for key, value in counts.items():
+                    totals[key] += value
+                totals["processed"] += 1
+                totals["extracted_count"] += len(avis_to_save)
+                ok_jobs.append(job)
+                avis_by_emission[job["emission_id"]] = avis_to_save
+                events.append(
+                    _event(
+                        "emission_result",
+                        current=current,
+                        total=total,
+                        emission_id=job["emission_id"],
+                        skipped=False,
+                        extracted_count=len(avis_to_save),
+                        **counts,
+                        matching_stats=outcome["matching_stats"],
+                        matching_delta=delta,
+                    )
+                )
+
+            if not dry_run and avis_by_emission:
+                await asyncio.to_thread(
+                    _write_chunk, mongodb_service, ok_jobs, avis_by_emission
+                )
+
+            for event in events:
+                yield event
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    yield _event(
+        "complete",
+        total=total,
+        dry_run=dry_run,
+        **totals,
+        matching_delta=delta_totals,
+    )
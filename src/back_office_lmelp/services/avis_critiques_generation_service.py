@@ -603,7 +603,9 @@ COMMENCE DIRECTEMENT PAR "## 1. LIVRES DISCUTÉS AU PROGRAMME" et termine par le
                 """Fetch URL RadioFrance et met à jour MongoDB."""
                 logger.info("🔍 Démarrage fetch URL RadioFrance...")
                 try:
-                    episode = mongodb_service.get_episode_by_id(episode_id)
+                    episode = mongodb_service.get_episode_by_id(
+                        episode_id, profile="summary"
+                    )
                     if not episode:
                         logger.warning(f"❌ Épisode {episode_id} non trouvé")
                         return None
@@ -14,6 +14,7 @@ from bson import ObjectId
 
 from back_office_lmelp.services.babelio_service import BabelioService
 from back_office_lmelp.services.mongodb_service import MongoDBService
+from back_office_lmelp.utils.search_keys import search_shadow_fields
 
 
 logger = logging.getLogger(__name__)
@@ -497,6 +498,7 @@ class BabelioMigrationService:
         }
         if corrected_title:
             update_data["titre"] = corrected_title
+            update_data.update(search_shadow_fields("livres", update_data))
 
         result = livres_collection.update_one({"_id": livre_oid}, {"$set": update_data})
 
@@ -504,6 +506,9 @@ class BabelioMigrationService:
             logger.error(f"Livre {livre_id} non trouvé dans MongoDB")
             return False
 
+        # Titre et URL Babelio sont dénormalisés dans le palmarès
+        self.mongodb_service.refresh_palmares([livre_id])
+
         # Mettre à jour l'auteur si URL fournie
         if babelio_author_url:
             livre = livres_collection.find_one({"_id": livre_oid})
@@ -629,6 +634,7 @@ class BabelioMigrationService:
             {
                 "$set": {
                     "titre": new_title,
+                    **search_shadow_fields("livres", {"titre": new_title}),
                     "updated_at": datetime.now(UTC),
                 }
             },
@@ -638,6 +644,8 @@ class BabelioMigrationService:
             logger.error(f"Livre {livre_id} non trouvé dans MongoDB")
             return False
 
+        self.mongodb_service.refresh_palmares([livre_id])
+
         # Retirer de la collection MongoDB babelio_problematic_cases
         problematic_collection = self.mongodb_service.db["babelio_problematic_cases"]
         problematic_collection.delete_one({"livre_id": livre_id})
@@ -45,11 +45,15 @@ class CalibreMatchingService:
         self._cache: dict[str, Any] | None = None
         self._cache_timestamp: float = 0
         self._cache_ttl: float = 300  # 5 minutes
+        self._calibre_index: dict[str, dict[str, Any]] | None = None
+        self._calibre_index_timestamp: float = 0
 
     def invalidate_cache(self) -> None:
         """Invalide le cache des données de matching."""
         self._cache = None
         self._cache_timestamp = 0
+        self._calibre_index = None
+        self._calibre_index_timestamp = 0
 
     def _normalize_author_parts(self, name: str) -> set[str]:
         """Extrait et normalise les parties d'un nom d'auteur.
@@ -288,7 +292,9 @@ class CalibreMatchingService:
         """Construit un index Calibre pour l'enrichissement du palmarès.
 
         Index basé sur le titre normalisé → données du livre Calibre.
-        Utilisé pour un lookup O(1) lors de l'enrichissement.
+        Utilisé pour un lookup O(1) lors de l'enrichissement. Mis en cache
+        (même TTL que les données de matching) : chaque page du palmarès ne
+        relit plus toute la bibliothèque Calibre.
 
         Returns:
             Dict {titre_normalisé: calibre_book_data}
@@ -296,12 +302,25 @@ class CalibreMatchingService:
         if not self._calibre_service._available:
             return {}
 
+        now = time.time()
+        if (
+            self._calibre_index is not None
+            and (now - self._calibre_index_timestamp) < self._cache_ttl
+        ):
+            return self._calibre_index
+
         try:
             calibre_books = self._calibre_service.get_all_books_with_tags()
-            return {normalize_for_matching(b["title"]): b for b in calibre_books}
+            calibre_index = {
+                normalize_for_matching(b["title"]): b for b in calibre_books
+            }
         except Exception:
             return {}
 
+        self._calibre_index = calibre_index
+        self._calibre_index_timestamp = now
+        return calibre_index
+
     def enrich_palmares_item(
         self, item: dict[str, Any], calibre_index: dict[str, dict[str, Any]]
     ) -> None:
@@ -56,66 +56,92 @@ class CollectionsManagementService:
         """
         Traite automatiquement les livres avec statut 'verified'.
 
+        Traitement par lot : auteurs et livres distincts résolus par un $in
+        chacun puis créés par un bulk_write d'upserts, avis critiques des
+        épisodes lus en une requête.
+
         Returns:
-            Dictionnaire avec les résultats du traitement
+            Dictionnaire avec les compteurs et le résultat par livre (items)
         """
         try:
             # Utiliser le système unifié pour récupérer les livres verified
             verified_books = self.mongodb_service.get_books_by_validation_status(
                 "verified"
             )
+            if not verified_books:
+                return {
+                    "processed_count": 0,
+                    "created_authors": 0,
+                    "created_books": 0,
+                    "updated_references": 0,
+                    "items": [],
+                }
 
-            processed_count = 0
-            created_authors = 0
-            created_books = 0
-            updated_references = 0
+            # Utiliser le nom validé (suggested_author si disponible, sinon auteur original)
+            validated = [
+                (
+                    book.get("suggested_author") or book["auteur"],
+                    book.get("suggested_title") or book["titre"],
+                )
+                for book in verified_books
+            ]
 
-            for book in verified_books:
-                # Utiliser le nom validé (suggested_author si disponible, sinon auteur original)
-                validated_author = book.get("suggested_author") or book["auteur"]
-                validated_title = book.get("suggested_title") or book["titre"]
+            # Créer les auteurs qui n'existent pas (un $in + un bulk_write)
+            authors = self.mongodb_service.create_authors_if_not_exist(
+                [author for author, _ in validated]
+            )
 
-                # Créer l'auteur si il n'existe pas
-                author_id = self.mongodb_service.create_author_if_not_exists(
-                    validated_author
+            # Avis critiques des épisodes, en une requête
+            critical_reviews = (
+                self.mongodb_service.get_critical_reviews_by_episode_oids(
+                    [book["episode_oid"] for book in verified_books]
                 )
-                if author_id:
-                    created_authors += 1
+            )
 
-                # Récupérer l'avis critique correspondant à l'épisode
-                critical_review = (
-                    self.mongodb_service.get_critical_review_by_episode_oid(
-                        book["episode_oid"]
-                    )
+            # Créer ou compléter les livres (un $in + un bulk_write)
+            # Issue #85: Utiliser babelio_publisher si disponible (source plus fiable)
+            books_data = []
+            for book, (author, title) in zip(verified_books, validated, strict=True):
+                critical_review = critical_reviews.get(book["episode_oid"])
+                books_data.append(
+                    {
+                        "titre": title,
+                        "auteur_id": authors[author]["author_id"],
+                        "editeur": book.get("babelio_publisher")
+                        or book.get("editeur", ""),
+                        "episodes": [ObjectId(book["episode_oid"])],
+                        "avis_critiques": (
+                            [critical_review["_id"]] if critical_review else []
+                        ),
+                    }
+                )
+            book_outcomes = self.mongodb_service.create_books_if_not_exist(books_data)
+
+            items = []
+            for book, (author, title), outcome in zip(
+                verified_books, validated, book_outcomes, strict=True
+            ):
+                items.append(
+                    {
+                        "cache_id": str(book.get("_id", "")),
+                        "auteur": author,
+                        "titre": title,
+                        "author_id": str(authors[author]["author_id"]),
+                        "book_id": str(outcome["book_id"]),
+                        "author_created": authors[author]["created"],
+                        "book_created": outcome["created"],
+                    }
                 )
-                avis_critiques_ids = []
-                if critical_review:
-                    avis_critiques_ids = [critical_review["_id"]]
-
-                # Créer le livre si il n'existe pas
-                # Issue #85: Utiliser babelio_publisher si disponible (source plus fiable)
-                book_data = {
-                    "titre": validated_title,
-                    "auteur_id": author_id,
-                    "editeur": book.get("babelio_publisher") or book.get("editeur", ""),
-                    "episodes": [ObjectId(book["episode_oid"])],
-                    "avis_critiques": avis_critiques_ids,
-                }
-                book_id = self.mongodb_service.create_book_if_not_exists(book_data)
-                if book_id:
-                    created_books += 1
-
-                # Mettre à jour les références
-                # TODO: Ajouter la logique de mise à jour des références entre collections
-                updated_references += 1
-
-                processed_count += 1
 
             return {
-                "processed_count": processed_count,
-                "created_authors": created_authors,
-                "created_books": created_books,
-                "updated_references": updated_references,
+                "processed_count": len(items),
+                "created_authors": sum(
+                    1 for author in authors.values() if author["created"]
+                ),
+                "created_books": sum(1 for item in items if item["book_created"]),
+                # TODO: Ajouter la logique de mise à jour des références entre collections
+                "updated_references": len(items),
+                "items": items,
             }
 
         except Exception as e:
@@ -1,14 +1,29 @@
 """Service d'extraction des critiques depuis les avis critiques."""
 
 import re
+import threading
 from typing import Any
 
 from back_office_lmelp.utils.text_utils import normalize_for_matching
 
 
+# Index nom/variante normalisé → critique ({id, nom, animateur, match_type})
+CritiqueIndex = dict[str, dict[str, Any]]
+
+# Champs des critiques nécessaires au matching
+_CRITIQUE_INDEX_PROJECTION = {"nom": 1, "variantes": 1, "animateur": 1}
+
+
 class CritiquesExtractionService:
     """Service pour extraire les noms des critiques depuis les summaries."""
 
+    def __init__(self) -> None:
+        """Initialise le service (index des critiques construit à la demande)."""
+        self._critique_index: CritiqueIndex | None = None
+        # Collection ayant servi à construire l'index (reconstruit si elle change)
+        self._critique_index_source: Any = None
+        self._critique_index_lock = threading.Lock()
+
     def extract_critiques_from_summary(self, summary: str) -> list[str]:
         """
         Extrait les noms des critiques depuis un summary d'avis critique.
@@ -89,42 +104,111 @@ class CritiquesExtractionService:
         """
         return normalize_for_matching(name)
 
+    def build_critique_index(self, critiques: list[dict[str, Any]]) -> CritiqueIndex:
+        """
+        Construit l'index nom/variante normalisé → critique.
+
+        En cas de collision, la première correspondance rencontrée l'emporte
+        (même priorité que le parcours séquentiel : nom puis variantes de
+        chaque critique, dans l'ordre de la liste).
+
+        Args:
+            critiques: Liste des critiques existants en base
+
+        Returns:
+            Index utilisable par match_critique()
+        """
+        index: CritiqueIndex = {}
+        for critique in critiques:
+            entry = {
+                "id": str(critique["_id"]),
+                "nom": critique["nom"],
+                "animateur": critique.get("animateur", False),
+            }
+            index.setdefault(
+                self.normalize_critique_name(critique["nom"]),
+                {**entry, "match_type": "exact"},
+            )
+            for variante in critique.get("variantes", []):
+                index.setdefault(
+                    self.normalize_critique_name(variante),
+                    {**entry, "match_type": "variante"},
+                )
+        return index
+
+    def get_critique_index(self, critiques_collection: Any) -> CritiqueIndex:
+        """
+        Retourne l'index des critiques, construit une seule fois.
+
+        L'index est invalidé par invalidate_critique_index() (création de
+        critique, ajout de variante, fusion de critiques).
+
+        Args:
+            critiques_collection: Collection MongoDB critiques
+
+        Returns:
+            Index nom/variante normalisé → critique
+        """
+        with self._critique_index_lock:
+            if (
+                self._critique_index is None
+                or self._critique_index_source is not critiques_collection
+            ):
+                self._critique_index = self.build_critique_index(
+                    list(critiques_collection.find({}, _CRITIQUE_INDEX_PROJECTION))
+                )
+                self._critique_index_source = critiques_collection
+            return self._critique_index
+
+    def invalidate_critique_index(self) -> None:
+        """Invalide l'index des critiques (reconstruit au prochain accès)."""
+        with self._critique_index_lock:
+            self._critique_index = None
+            self._critique_index_source = None
+
+    def match_critique(
+        self, detected_name: str, index: CritiqueIndex
+    ) -> dict[str, Any] | None:
+        """
+        Cherche un critique correspondant dans l'index (O(1)).
+
+        Args:
+            detected_name: Nom détecté dans le summary
+            index: Index construit par build_critique_index/get_critique_index
+
+        Returns:
+            Dictionnaire avec {id, nom, animateur, match_type} si trouvé, None sinon
+            match_type peut être: "exact" ou "variante"
+        """
+        return index.get(self.normalize_critique_name(detected_name))
+
     def find_matching_critique(
         self, detected_name: str, existing_critiques: list[dict[str, Any]]
     ) -> dict[str, Any] | None:
         """
         Cherche un critique correspondant dans la base existante.
 
+        Pour plusieurs recherches, préférer get_critique_index() + match_critique()
+        qui évitent de renormaliser tous les critiques à chaque appel.
+
         Args:
             detected_name: Nom détecté dans le summary
             existing_critiques: Liste des critiques existants en base
 
         Returns:
-            Dictionnaire avec {nom, match_type} si trouvé, None sinon
+            Dictionnaire avec {id, nom, match_type} si trouvé, None sinon
             match_type peut être: "exact" ou "variante"
         """
-        normalized_detected = self.normalize_critique_name(detected_name)
-
-        for critique in existing_critiques:
-            critique_id = str(critique["_id"])
-            # Vérifier correspondance exacte
-            if self.normalize_critique_name(critique["nom"]) == normalized_detected:
-                return {
-                    "id": critique_id,
-                    "nom": critique["nom"],
-                    "match_type": "exact",
-                }
-
-            # Vérifier correspondance sur les variantes
-            for variante in critique.get("variantes", []):
-                if self.normalize_critique_name(variante) == normalized_detected:
-                    return {
-                        "id": critique_id,
-                        "nom": critique["nom"],
-                        "match_type": "variante",
-                    }
-
-        return None
+        match = self.match_critique(
+            detected_name, self.build_critique_index(existing_critiques)
+        )
+        if match is None:
+            return None
+        return {
+            "id": match["id"],
+            "nom": match["nom"],
+            "match_type": match["match_type"],
+        }
 
 
 # Instance singleton du service
@@ -0,0 +1,205 @@
+"""Statut "critiques manquants" précalculé par avis critique.
+
+Les critiques détectés dans le summary et leurs compteurs new/existants sont
+stockés dans chaque document avis_critiques :
+
+- critiques_detectes : noms détectés dans le summary
+- critiques_new_count : noms sans critique correspondant en base
+- critiques_existing_count : noms associés à un critique existant
+
+Ils sont recalculés :
+- à la sauvegarde d'un summary (extraction + matching)
+- quand la collection critiques change (création, variante, fusion) :
+  simple re-matching des noms stockés, sans reparser les summaries
+
+/api/stats/critiques-manquants et /api/episodes-with-avis-critiques lisent
+ces compteurs au lieu de reparser chaque summary. Un avis critique sans
+statut (données antérieures) est calculé et persisté à la première lecture.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from pymongo import UpdateOne
+
+from .critiques_extraction_service import (
+    CritiqueIndex,
+    critiques_extraction_service,
+)
+
+
+logger = logging.getLogger(__name__)
+
+CRITIQUES_DETECTES_FIELD = "critiques_detectes"
+CRITIQUES_NEW_COUNT_FIELD = "critiques_new_count"
+CRITIQUES_EXISTING_COUNT_FIELD = "critiques_existing_count"
+
+# Champs lus par les endpoints (jamais le summary)
+_STATUS_PROJECTION = {
+    "episode_oid": 1,
+    CRITIQUES_NEW_COUNT_FIELD: 1,
+    CRITIQUES_EXISTING_COUNT_FIELD: 1,
+}
+
+
+def _count_matches(names: list[str], critique_index: CritiqueIndex) -> dict[str, Any]:
+    """Compte les noms new/existants d'une liste de critiques détectés."""
+    existing = sum(
+        1
+        for name in names
+        if critiques_extraction_service.match_critique(name, critique_index)
+    )
+    return {
+        CRITIQUES_DETECTES_FIELD: names,
+        CRITIQUES_NEW_COUNT_FIELD: len(names) - existing,
+        CRITIQUES_EXISTING_COUNT_FIELD: existing,
+    }
+
+
+def compute_critiques_status(
+    summary: str, critique_index: CritiqueIndex
+) -> dict[str, Any]:
+    """
+    Calcule le statut des critiques d'un summary.
+
+    Args:
+        summary: Summary de l'avis critique
+        critique_index: Index des critiques existants
+
+    Returns:
+        Champs critiques_detectes, critiques_new_count, critiques_existing_count
+    """
+    names = critiques_extraction_service.extract_critiques_from_summary(summary)
+    return _count_matches(names, critique_index)
+
+
+def critiques_status_for_summary(mongodb_service: Any, summary: str) -> dict[str, Any]:
+    """
+    Calcule le statut à enregistrer avec un summary sauvegardé.
+
+    Args:
+        mongodb_service: Service MongoDB
+        summary: Summary sauvegardé
+
+    Returns:
+        Champs de statut ({} si la collection critiques est indisponible)
+    """
+    if mongodb_service.critiques_collection is None:
+        return {}
+    critique_index = critiques_extraction_service.get_critique_index(
+        mongodb_service.critiques_collection
+    )
+    return compute_critiques_status(summary or "", critique_index)
+
+
+def get_critiques_status_by_episode(
+    mongodb_service: Any, episode_oids: Iterable[str]
+) -> dict[str, dict[str, int]]:
+    """
+    Lit les compteurs new/existants des avis critiques de plusieurs épisodes.
+
+    Une requête projetée (sans summary) ; les avis critiques sans statut sont
+    calculés puis persistés au passage.
+
+    Args:
+        mongodb_service: Service MongoDB
+        episode_oids: OIDs des épisodes (String, comme avis_critiques.episode_oid)
+
+    Returns:
+        Dict episode_oid → {"new": n, "existing": n} (épisode absent si son
+        statut ne peut être calculé)
+    """
+    collection = mongodb_service.avis_critiques_collection
+    oids = list(dict.fromkeys(episode_oids))
+    if collection is None or not oids:
+        return {}
+
+    statuses: dict[str, dict[str, int]] = {}
+    missing_ids = []
+    seen: set[str] = set()
+    for doc in collection.find({"episode_oid": {"$in": oids}}, _STATUS_PROJECTION):
+        episode_oid = doc.get("episode_oid")
+        if not episode_oid or episode_oid in seen:
+            continue
+        seen.add(episode_oid)
+        if CRITIQUES_NEW_COUNT_FIELD in doc:
+            statuses[episode_oid] = {
+                "new": doc[CRITIQUES_NEW_COUNT_FIELD],
+                "existing": doc.get(CRITIQUES_EXISTING_COUNT_FIELD, 0),
+            }
+        else:
+            missing_ids.append(doc["_id"])
+
+    if missing_ids and mongodb_service.critiques_collection is not None:
+        critique_index = critiques_extraction_service.get_critique_index(
+            mongodb_service.critiques_collection
+        )
+        operations = []
+        for doc in collection.find(
+            {"_id": {"$in": missing_ids}}, {"episode_oid": 1, "summary": 1}
+        ):
+            status = compute_critiques_status(doc.get("summary") or "", critique_index)
+            statuses[doc["episode_oid"]] = {
+                "new": status[CRITIQUES_NEW_COUNT_FIELD],
+                "existing": status[CRITIQUES_EXISTING_COUNT_FIELD],
+            }
+            operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": status}))
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+
+    return statuses
+
+
+def rematch_critiques_status(mongodb_service: Any) -> int:
+    """
+    Recalcule les compteurs après un changement de la collection critiques.
+
+    Invalide l'index des critiques puis re-matche les noms déjà stockés
+    (critiques_detectes) : aucun summary n'est reparsé. Une erreur est
+    journalisée sans être propagée (l'écriture du critique a déjà réussi).
+
+    Args:
+        mongodb_service: Service MongoDB
+
+    Returns:
+        Nombre d'avis critiques dont le statut a changé
+    """
+    critiques_extraction_service.invalidate_critique_index()
+
+    collection = mongodb_service.avis_critiques_collection
+    if collection is None or mongodb_service.critiques_collection is None:
+        return 0
+
+    try:
+        critique_index = critiques_extraction_service.get_critique_index(
+            mongodb_service.critiques_collection
+        )
+        operations = []
+        for doc in collection.find(
+            {CRITIQUES_DETECTES_FIELD: {"$exists": True}},
+            {
+                CRITIQUES_DETECTES_FIELD: 1,
+                CRITIQUES_NEW_COUNT_FIELD: 1,
+                CRITIQUES_EXISTING_COUNT_FIELD: 1,
+            },
+        ):
+            status = _count_matches(
+                list(doc.get(CRITIQUES_DETECTES_FIELD) or []), critique_index
+            )
+            stored = (
+                doc.get(CRITIQUES_NEW_COUNT_FIELD),
+                doc.get(CRITIQUES_EXISTING_COUNT_FIELD),
+            )
+            computed = (
+                status[CRITIQUES_NEW_COUNT_FIELD],
+                status[CRITIQUES_EXISTING_COUNT_FIELD],
+            )
+            if stored != computed:
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": status}))
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+        return len(operations)
+    except Exception as e:
+        logger.warning(f"⚠️ Recalcul des critiques manquants impossible: {e}")
+        return 0
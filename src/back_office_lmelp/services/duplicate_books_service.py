@@ -17,6 +17,7 @@ from bson import ObjectId
 
 from back_office_lmelp.services.babelio_service import BabelioService
 from back_office_lmelp.services.mongodb_service import MongoDBService
+from back_office_lmelp.utils.search_keys import search_shadow_fields
 
 
 logger = logging.getLogger(__name__)
@@ -241,6 +242,10 @@ class DuplicateBooksService:
                 "$set": {
                     "titre": official_titre,
                     "editeur": official_editeur,
+                    **search_shadow_fields(
+                        "livres",
+                        {"titre": official_titre, "editeur": official_editeur},
+                    ),
                     "updated_at": datetime.now(UTC),
                 },
                 "$addToSet": {
@@ -259,6 +264,13 @@ class DuplicateBooksService:
             self.mongodb_service.livres_collection.delete_many(
                 {"_id": {"$in": duplicate_ids}}
             )
+            # Le nombre de livres par épisode change : badges d'émission à jour
+            self.mongodb_service.refresh_emission_badges_for_episodes(unique_episodes)
+
+        # Titre officiel du livre primaire, doublons supprimés : palmarès à jour
+        self.mongodb_service.refresh_palmares([primary_book["_id"], *duplicate_ids])
+        # Statistiques des doublons supprimés : plus aucune page ne les lit
+        self.mongodb_service.delete_livre_stats(duplicate_ids)
 
         # Étape 7: Cascading update - auteurs collection
         duplicate_ids_str = [str(book_id) for book_id in duplicate_ids]
@@ -502,6 +514,7 @@ class DuplicateBooksService:
             {
                 "$set": {
                     "nom": official_nom,
+                    **search_shadow_fields("auteurs", {"nom": official_nom}),
                     "updated_at": datetime.now(UTC),
                 },
                 "$addToSet": {
@@ -529,6 +542,11 @@ class DuplicateBooksService:
                 {"_id": {"$in": duplicate_ids}}
             )
 
+        # Nom officiel de l'auteur primaire : palmarès à jour
+        self.mongodb_service.refresh_palmares_for_auteurs(
+            [primary_auteur["_id"], *duplicate_ids]
+        )
+
         return {
             "success": True,
             "primary_auteur_id": str(primary_auteur["_id"]),
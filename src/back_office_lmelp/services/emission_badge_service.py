@@ -0,0 +1,405 @@
+"""Moteur de calcul des badges (pastilles) des émissions.
+
+Source unique de la règle de badge, partagée par GET /api/emissions et
+StatsService._count_emissions_with_problems() (count_problem_emissions) pour
+qu'elles ne divergent pas.
+
+Les données sont lues par lots ($in bornés) : le nombre de requêtes ne dépend
+plus du nombre d'émissions (2 requêtes par lot de BADGE_BATCH_SIZE émissions).
+
+Les badges calculés sont matérialisés dans la collection emission_badges
+(un document par émission, même _id que l'émission). Ils sont recalculés de
+façon incrémentale lors des écritures d'avis et des changements de
+livres.episodes (voir MongoDBService.refresh_emission_badges*), et peuvent être
+reconstruits entièrement via :
+
+    python -m back_office_lmelp.utils.rebuild_emission_badges
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, Literal
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+
+
+BadgeStatus = Literal["perfect", "count_mismatch", "unmatched", "no_avis"]
+
+# Badges considérés comme des problèmes (🔴 + 🟡)
+PROBLEM_BADGES: frozenset[str] = frozenset({"count_mismatch", "unmatched"})
+
+# Taille maximale des listes $in envoyées à MongoDB
+BADGE_BATCH_SIZE = 500
+
+# Collection des badges matérialisés
+EMISSION_BADGES_COLLECTION = "emission_badges"
+
+# Champs des avis nécessaires au calcul du badge
+_AVIS_BADGE_PROJECTION = {
+    "emission_oid": 1,
+    "livre_titre_extrait": 1,
+    "livre_oid": 1,
+    "note": 1,
+}
+
+
+def compute_badge_status(
+    avis_list: Iterable[dict[str, Any]], livres_mongo_count: int
+) -> BadgeStatus:
+    """
+    Calcule le statut du badge d'une émission à partir de ses avis.
+
+    Logique :
+    - "perfect" (🟢) : avis extraits, # livres mongo == # livres summary,
+                       tous matchés, toutes notes présentes
+    - "count_mismatch" (🔴) : avis extraits, # livres mongo != # livres summary
+                              OU au moins une note manquante
+    - "unmatched" (🟡) : avis extraits, comptes égaux, toutes notes présentes,
+                         mais ≥ 1 livre non matché
+    - "no_avis" (⚪) : avis pas encore extraits
+
+    Args:
+        avis_list: Avis extraits de l'émission
+        livres_mongo_count: Nombre de livres MongoDB liés à l'épisode
+
+    Returns:
+        Statut du badge
+    """
+    has_avis = False
+    unique_titles: set[str] = set()
+    unmatched_count = 0
+    missing_notes_count = 0
+
+    for avis in avis_list:
+        has_avis = True
+        titre = avis.get("livre_titre_extrait", "")
+        if titre:
+            unique_titles.add(titre)
+            if avis.get("livre_oid") is None:
+                unmatched_count += 1
+            if avis.get("note") is None:
+                missing_notes_count += 1
+
+    if not has_avis:
+        return "no_avis"
+
+    # 🔴 Écart de comptage OU au moins une note manquante
+    if len(unique_titles) != livres_mongo_count or missing_notes_count > 0:
+        return "count_mismatch"
+
+    # 🟡 Comptes égaux mais au moins un livre non matché (et toutes notes présentes)
+    if unmatched_count > 0:
+        return "unmatched"
+
+    # 🟢 Parfait : comptes égaux, tous matchés, toutes notes présentes
+    return "perfect"
+
+
+def _batches(items: list[str], size: int) -> Iterable[list[str]]:
+    """Découpe une liste en lots de taille bornée."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def count_livres_by_episode(
+    livres_collection: Any, episode_ids: list[str]
+) -> dict[str, int]:
+    """
+    Compte les livres MongoDB de plusieurs épisodes en une agrégation par lot.
+
+    Args:
+        livres_collection: Collection livres
+        episode_ids: IDs d'épisodes (String, comme dans livres.episodes)
+
+    Returns:
+        Dict episode_id → nombre de livres (absent = 0)
+    """
+    counts: dict[str, int] = {}
+    unique_ids = list(dict.fromkeys(episode_ids))
+    for batch in _batches(unique_ids, BADGE_BATCH_SIZE):
+        pipeline = [
+            {"$match": {"episodes": {"$in": batch}}},
+            {"$unwind": "$episodes"},
+            {"$match": {"episodes": {"$in": batch}}},
+            # Un livre compte une seule fois par épisode (comme count_documents)
+            {"$group": {"_id": "$episodes", "livres": {"$addToSet": "$_id"}}},
+            {"$project": {"count": {"$size": "$livres"}}},
+        ]
+        for row in livres_collection.aggregate(pipeline):
+            counts[str(row["_id"])] = int(row["count"])
+    return counts
+
+
+def compute_emission_badges(
+    mongodb_service: Any, emissions: list[dict[str, Any]]
+) -> dict[str, BadgeStatus]:
+    """
+    Calcule le badge de plusieurs émissions avec un nombre borné de requêtes.
+
+    Args:
+        mongodb_service: Service MongoDB (accès via get_collection)
+        emissions: Émissions (au minimum "_id" et "episode_id")
+
+    Returns:
+        Dict emission_id (str) → statut du badge
+    """
+    if not emissions:
+        return {}
+
+    avis_collection = mongodb_service.get_collection("avis")
+    livres_collection = mongodb_service.get_collection("livres")
+
+    # Note: avis.emission_oid est String, emissions._id est ObjectId
+    emission_ids = [str(emission["_id"]) for emission in emissions]
+    avis_by_emission: dict[str, list[dict[str, Any]]] = {}
+    for batch in _batches(emission_ids, BADGE_BATCH_SIZE):
+        for avis in avis_collection.find(
+            {"emission_oid": {"$in": batch}}, _AVIS_BADGE_PROJECTION
+        ):
+            emission_oid = avis.get("emission_oid")
+            if emission_oid:
+                avis_by_emission.setdefault(emission_oid, []).append(avis)
+
+    # Les livres ne sont comptés que pour les émissions ayant des avis
+    episode_ids = [
+        str(emission["episode_id"])
+        for emission in emissions
+        if str(emission["_id"]) in avis_by_emission
+    ]
+    livres_counts = (
+        count_livres_by_episode(livres_collection, episode_ids) if episode_ids else {}
+    )
+
+    return {
+        str(emission["_id"]): compute_badge_status(
+            avis_by_emission.get(str(emission["_id"]), []),
+            livres_counts.get(str(emission["episode_id"]), 0),
+        )
+        for emission in emissions
+    }
+
+
+def _persist_badges(
+    mongodb_service: Any,
+    emissions: list[dict[str, Any]],
+    badges: dict[str, BadgeStatus],
+) -> None:
+    """Enregistre les badges calculés dans emission_badges (upsert par _id)."""
+    if not emissions:
+        return
+    badges_collection = mongodb_service.get_collection(EMISSION_BADGES_COLLECTION)
+    now = datetime.now()
+    operations = [
+        UpdateOne(
+            {"_id": emission["_id"]},
+            {
+                "$set": {
+                    "episode_oid": str(emission["episode_id"]),
+                    "badge_status": badges[str(emission["_id"])],
+                    "updated_at": now,
+                }
+            },
+            upsert=True,
+        )
+        for emission in emissions
+    ]
+    badges_collection.bulk_write(operations, ordered=False)
+
+
+def _to_object_ids(ids: Iterable[Any]) -> list[ObjectId]:
+    """Convertit des IDs (str ou ObjectId) en ObjectId, en ignorant les invalides."""
+    oids: dict[str, ObjectId] = {}
+    for value in ids:
+        if isinstance(value, ObjectId):
+            oids[str(value)] = value
+        elif value and ObjectId.is_valid(str(value)):
+            oids[str(value)] = ObjectId(str(value))
+    return list(oids.values())
+
+
+def refresh_emission_badges(mongodb_service: Any, emission_oids: Iterable[Any]) -> int:
+    """
+    Recalcule et persiste le badge des émissions indiquées.
+
+    Les badges des émissions qui n'existent plus sont supprimés.
+
+    Args:
+        mongodb_service: Service MongoDB
+        emission_oids: IDs des émissions touchées (str ou ObjectId)
+
+    Returns:
+        Nombre de badges recalculés
+    """
+    oids = _to_object_ids(emission_oids)
+    if not oids:
+        return 0
+
+    emissions_collection = mongodb_service.get_collection("emissions")
+    emissions = list(
+        emissions_collection.find({"_id": {"$in": oids}}, {"_id": 1, "episode_id": 1})
+    )
+    badges = compute_emission_badges(mongodb_service, emissions)
+    _persist_badges(mongodb_service, emissions, badges)
+
+    found = {str(emission["_id"]) for emission in emissions}
+    removed = [DeleteOne({"_id": oid}) for oid in oids if str(oid) not in found]
+    if removed:
+        mongodb_service.get_collection(EMISSION_BADGES_COLLECTION).bulk_write(
+            removed, ordered=False
+        )
+    return len(emissions)
+
+
+def refresh_badges_for_episodes(
+    mongodb_service: Any, episode_oids: Iterable[Any]
+) -> int:
+    """
+    Recalcule le badge des émissions liées aux épisodes indiqués.
+
+    Utilisé quand livres.episodes change (le nombre de livres MongoDB de
+    l'épisode entre dans le calcul du badge).
+
+    Args:
+        mongodb_service: Service MongoDB
+        episode_oids: IDs des épisodes touchés (str ou ObjectId)
+
+    Returns:
+        Nombre de badges recalculés
+    """
+    oids = _to_object_ids(episode_oids)
+    if not oids:
+        return 0
+
+    emissions_collection = mongodb_service.get_collection("emissions")
+    emission_ids = [
+        emission["_id"]
+        for emission in emissions_collection.find(
+            {"episode_id": {"$in": oids}}, {"_id": 1}
+        )
+    ]
+    return refresh_emission_badges(mongodb_service, emission_ids)
+
+
+def get_emission_badges(
+    mongodb_service: Any, emissions: list[dict[str, Any]]
+) -> dict[str, BadgeStatus]:
+    """
+    Lit les badges matérialisés des émissions.
+
+    Les émissions sans badge persisté (nouvelles émissions, collection vide)
+    sont calculées puis persistées au passage.
+
+    Args:
+        mongodb_service: Service MongoDB
+        emissions: Émissions (au minimum "_id" et "episode_id")
+
+    Returns:
+        Dict emission_id (str) → statut du badge
+    """
+    if not emissions:
+        return {}
+
+    badges_collection = mongodb_service.get_collection(EMISSION_BADGES_COLLECTION)
+    badges: dict[str, BadgeStatus] = {}
+    oids = [emission["_id"] for emission in emissions]
+    for start in range(0, len(oids), BADGE_BATCH_SIZE):
+        for doc in badges_collection.find(
+            {"_id": {"$in": oids[start : start + BADGE_BATCH_SIZE]}},
+            {"badge_status": 1},
+        ):
+            badges[str(doc["_id"])] = doc["badge_status"]
+
+    missing = [emission for emission in emissions if str(emission["_id"]) not in badges]
+    if missing:
+        computed = compute_emission_badges(mongodb_service, missing)
+        _persist_badges(mongodb_service, missing, computed)
+        badges.update(computed)
+
+    return badges
+
+
+def ensure_emission_badges(mongodb_service: Any) -> int:
+    """
+    Calcule et persiste les badges des émissions qui n'en ont pas encore.
+
+    Anti-jointure emissions → emission_badges (même _id) côté serveur : seules
+    les émissions sans badge (nouvelles émissions, collection vide) sont lues.
+
+    Args:
+        mongodb_service: Service MongoDB
+
+    Returns:
+        Nombre de badges calculés
+    """
+    emissions_collection = mongodb_service.get_collection("emissions")
+    missing = list(
+        emissions_collection.aggregate(
+            [
+                {
+                    "$lookup": {
+                        "from": EMISSION_BADGES_COLLECTION,
+                        "localField": "_id",
+                        "foreignField": "_id",
+                        "pipeline": [{"$project": {"_id": 1}}],
+                        "as": "badge",
+                    }
+                },
+                {"$match": {"badge": {"$size": 0}}},
+                {"$project": {"_id": 1, "episode_id": 1}},
+            ]
+        )
+    )
+    if missing:
+        _persist_badges(
+            mongodb_service, missing, compute_emission_badges(mongodb_service, missing)
+        )
+    return len(missing)
+
+
+def count_problem_emissions(mongodb_service: Any) -> int:
+    """
+    Compte les émissions dont le badge est un problème (🔴 + 🟡).
+
+    Les badges manquants sont d'abord matérialisés, puis le comptage est fait
+    par MongoDB sur l'index badge_status de emission_badges.
+
+    Args:
+        mongodb_service: Service MongoDB
+
+    Returns:
+        Nombre d'émissions avec un badge count_mismatch ou unmatched
+    """
+    ensure_emission_badges(mongodb_service)
+    badges_collection = mongodb_service.get_collection(EMISSION_BADGES_COLLECTION)
+    return int(
+        badges_collection.count_documents(
+            {"badge_status": {"$in": sorted(PROBLEM_BADGES)}}
+        )
+    )
+
+
+def rebuild_emission_badges(mongodb_service: Any) -> dict[str, int]:
+    """
+    Reconstruit entièrement la collection emission_badges.
+
+    Recalcule le badge de toutes les émissions et supprime les badges
+    orphelins (émissions supprimées).
+
+    Args:
+        mongodb_service: Service MongoDB
+
+    Returns:
+        Dict avec "rebuilt" (badges recalculés) et "removed" (orphelins supprimés)
+    """
+    emissions_collection = mongodb_service.get_collection("emissions")
+    badges_collection = mongodb_service.get_collection(EMISSION_BADGES_COLLECTION)
+
+    emissions = list(emissions_collection.find({}, {"_id": 1, "episode_id": 1}))
+    badges = compute_emission_badges(mongodb_service, emissions)
+    _persist_badges(mongodb_service, emissions, badges)
+
+    emission_oids = [emission["_id"] for emission in emissions]
+    removed = badges_collection.delete_many({"_id": {"$nin": emission_oids}})
+
+    return {"rebuilt": len(emissions), "removed": int(removed.deleted_count)}
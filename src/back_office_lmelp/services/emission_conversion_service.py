@@ -0,0 +1,204 @@
+"""Conversion incrémentale des épisodes (avec avis critique) en émissions.
+
+Chaque avis_critique donne lieu à une émission pour son épisode. Plutôt que de
+rescanner tous les avis_critiques à chaque affichage de la page émissions, on
+mémorise un watermark (plus grand _id d'avis_critique traité) dans la
+collection sync_state et seuls les avis_critiques plus récents sont traités.
+
+Déclencheurs :
+- tâche périodique lancée par le lifespan (EMISSIONS_AUTO_CONVERT_INTERVAL_SEC)
+- sauvegarde d'un avis critique (POST /api/avis-critiques/save)
+- démasquage d'un épisode (convert_episode)
+- POST /api/emissions/auto-convert : conversion complète (rattrapage manuel)
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+
+from ..models.emission import Emission
+from ..models.episode import Episode
+from .mongodb_service import mongodb_service as default_mongodb_service
+
+
+logger = logging.getLogger(__name__)
+
+# Document de suivi de la conversion dans la collection sync_state
+SYNC_STATE_COLLECTION = "sync_state"
+WATERMARK_ID = "emissions_auto_convert"
+
+
+class EmissionConversionService:
+    """Service de conversion des avis_critiques en émissions."""
+
+    def __init__(self, mongodb_service: Any = None):
+        """Initialise le service (mongodb_service global par défaut)."""
+        self.mongodb_service = mongodb_service or default_mongodb_service
+        # Évite deux conversions simultanées (tâche périodique + sauvegarde)
+        self._lock = threading.Lock()
+
+    def get_watermark(self) -> ObjectId | None:
+        """Retourne le _id du dernier avis_critique traité (None si jamais lancé)."""
+        state = self.mongodb_service.get_collection(SYNC_STATE_COLLECTION).find_one(
+            {"_id": WATERMARK_ID}
+        )
+        return state.get("last_avis_critique_id") if state else None
+
+    def _advance_watermark(self, avis_critique_id: ObjectId) -> None:
+        """Avance le watermark ($max : ne recule jamais)."""
+        self.mongodb_service.get_collection(SYNC_STATE_COLLECTION).update_one(
+            {"_id": WATERMARK_ID},
+            {
+                "$max": {"last_avis_critique_id": avis_critique_id},
+                "$set": {"updated_at": datetime.now()},
+            },
+            upsert=True,
+        )
+
+    def convert_new_avis_critiques(self) -> dict[str, Any]:
+        """
+        Convertit uniquement les avis_critiques créés après le watermark.
+
+        Returns:
+            Statistiques de conversion (created, skipped, total_processed, errors)
+        """
+        with self._lock:
+            watermark = self.get_watermark()
+            query: dict[str, Any] = {}
+            if watermark is not None:
+                query["_id"] = {"$gt": watermark}
+            return self._convert(query)
+
+    def convert_all(self) -> dict[str, Any]:
+        """
+        Convertit tous les avis_critiques (rattrapage complet).
+
+        Returns:
+            Statistiques de conversion (created, skipped, total_processed, errors)
+        """
+        with self._lock:
+            return self._convert({})
+
+    def convert_episode(self, episode_oid: str) -> dict[str, Any]:
+        """
+        Convertit l'avis_critique d'un épisode (ex: épisode démasqué).
+
+        Args:
+            episode_oid: ID de l'épisode
+
+        Returns:
+            Statistiques de conversion (created, skipped, total_processed, errors)
+        """
+        with self._lock:
+            return self._convert({"episode_oid": episode_oid}, advance=False)
+
+    def _convert(self, query: dict[str, Any], advance: bool = True) -> dict[str, Any]:
+        """
+        Crée les émissions manquantes pour les avis_critiques du filtre.
+
+        Logique :
+        1. Ignorer les épisodes ayant déjà une émission
+        2. Ignorer les épisodes masqués
+        3. Détecter animateur_id via les critiques avec animateur=true
+        """
+        avis_critiques_collection = self.mongodb_service.get_collection(
+            "avis_critiques"
+        )
+        emissions_collection = self.mongodb_service.get_collection("emissions")
+
+        avis_critiques = list(
+            avis_critiques_collection.find(query, {"_id": 1, "episode_oid": 1}).sort(
+                "_id", 1
+            )
+        )
+
+        created_count = 0
+        skipped_count = 0
+        errors: list[str] = []
+        # Rang du premier avis en échec : le filigrane s'arrête juste avant,
+        # pour que la prochaine conversion incrémentale le retente
+        first_failure: int | None = None
+
+        if avis_critiques:
+            # Épisodes déjà convertis (emissions.episode_id est un ObjectId)
+            converted_episodes = {
+                str(emission["episode_id"])
+                for emission in emissions_collection.find({}, {"episode_id": 1})
+            }
+
+            for position, avis in enumerate(avis_critiques):
+                try:
+                    episode_oid = avis.get("episode_oid")
+                    if not episode_oid:
+                        continue
+
+                    if str(episode_oid) in converted_episodes:
+                        skipped_count += 1
+                        continue
+
+                    episode_data = self.mongodb_service.get_episode_by_id(
+                        episode_oid, profile="summary"
+                    )
+                    if not episode_data:
+                        errors.append(f"Épisode {episode_oid} non trouvé")
+                        if first_failure is None:
+                            first_failure = position
+                        continue
+
+                    episode = Episode(episode_data)
+
+                    # Épisodes masqués : convertis au démasquage (convert_episode)
+                    if episode.masked:
+                        skipped_count += 1
+                        continue
+
+                    critiques = self.mongodb_service.get_critiques_by_episode(
+                        episode_oid
+                    )
+                    animateur_id = None
+                    for critique in critiques:
+                        if critique.get("animateur", False):
+                            animateur_id = critique["id"]
+                            break  # Prendre le premier animateur trouvé
+
+                    emission_data = Emission.for_mongodb_insert(
+                        {
+                            "episode_id": episode_oid,
+                            "avis_critique_id": str(avis["_id"]),
+                            "date": episode.date,
+                            "duree": episode.duree,
+                            "animateur_id": animateur_id,
+                            "avis_ids": [],  # Vide pour l'instant (future issue)
+                        }
+                    )
+
+                    self.mongodb_service.create_emission(emission_data)
+                    converted_episodes.add(str(episode_oid))
+                    created_count += 1
+
+                except Exception as e:
+                    errors.append(f"Erreur pour avis {avis.get('_id')}: {e!s}")
+                    if first_failure is None:
+                        first_failure = position
+
+            converted = avis_critiques[:first_failure]
+            if advance and converted:
+                self._advance_watermark(converted[-1]["_id"])
+
+        if created_count:
+            logger.info(f"✅ Auto-conversion: {created_count} émissions créées")
+
+        return {
+            "success": True,
+            "created": created_count,
+            "skipped": skipped_count,
+            "total_processed": len(avis_critiques),
+            "errors": errors,
+        }
+
+
+# Instance globale
+emission_conversion_service = EmissionConversionService()
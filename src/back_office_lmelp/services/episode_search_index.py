@@ -0,0 +1,608 @@
+"""Index inversé positionnel des épisodes pour /api/search.
+
+search_episodes parcourait tous les épisodes avec un regex insensible aux
+accents sur titre, description et transcription complète, puis relançait le
+même regex pour count_documents : aucun index MongoDB utilisable, la
+recherche lisait toutes les transcriptions à chaque appel.
+
+Cet index garde en mémoire, pour chaque token (texte passé par
+normalize_for_matching puis découpé en mots), les positions où il apparaît
+dans chaque champ de chaque épisode, compactées dans un seul array d'entiers
+par token :
+
+    token → array [clé, n, position × n, clé, n, ...]
+
+où clé = numéro d'épisode × len(INDEXED_FIELDS) + rang du champ (entier
+attribué à l'indexation, pas d'ObjectId ni de tuple par posting) et
+position = rang du mot. Chaque clé garde la liste de ses tokens : retirer
+un champ ne touche que ses tokens, sans parcourir le vocabulaire. Le tout
+tient dans MEMORY_BUDGET_BYTES_PER_TOKEN octets par mot indexé.
+
+L'index garde aussi, par clé, l'offset caractère dans le texte d'origine
+d'un token sur OFFSET_CHECKPOINT_EVERY : les extraits de recherche
+retrouvent une occurrence sans relire le texte depuis le début.
+
+Requêtes :
+- mots séparés : l'épisode doit contenir chaque mot (champs quelconques)
+- "expression entre guillemets" : mots consécutifs dans un même champ
+- le dernier mot de la requête (hors guillemets) est un préfixe s'il fait
+  au moins PREFIX_MIN_LENGTH caractères (saisie en cours)
+
+Cycle de vie :
+- chargé depuis EPISODE_SEARCH_INDEX_PATH au démarrage puis resynchronisé
+  avec MongoDB (sync) : seuls les épisodes nouveaux ou modifiés sont
+  réindexés, d'après une signature lue sans transférer les transcriptions
+- mis à jour à chaque correction de titre ou de description
+  (update_episode_title_new / update_episode_description_new)
+- resynchronisé périodiquement (épisodes écrits par le pipeline lmelp) et
+  sauvegardé sur disque après chaque synchronisation qui l'a modifié
+  (arrays écrits tels quels, relus token par token : pas de JSON géant)
+
+Tant que l'index n'est pas prêt, search_episodes garde le regex MongoDB.
+"""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import logging
+import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from bson import ObjectId
+
+from ..utils.text_utils import normalize_for_matching
+
+
+logger = logging.getLogger(__name__)
+
+# Champs indexés (mêmes champs que l'ancien regex de search_episodes)
+INDEXED_FIELDS = (
+    "titre",
+    "titre_corrige",
+    "description",
+    "description_corrigee",
+    "transcription",
+)
+
+# Longueur minimale d'un dernier mot traité comme préfixe
+PREFIX_MIN_LENGTH = 3
+
+# Version du format persisté (changement de tokenisation → reconstruction)
+INDEX_FORMAT_VERSION = 3
+
+# Budget mémoire de l'index, en octets par mot indexé (occurrence) :
+# position sur 4 octets, en-têtes de postings, listes de tokens par clé et
+# vocabulaire amortis
+MEMORY_BUDGET_BYTES_PER_TOKEN = 20
+
+FIELD_COUNT = len(INDEXED_FIELDS)
+
+# Repère d'offset caractère tous les N tokens (extraits, voir char_spans)
+OFFSET_CHECKPOINT_EVERY = 64
+
+_TOKEN = re.compile(r"\w+")
+# Mots du texte d'origine : accents combinants inclus, même découpage que
+# _TOKEN sur le texte normalisé
+_SOURCE_TOKEN = re.compile(r"[\w\u0300-\u036f]+")
+_PHRASE = re.compile(r'"([^"]*)"?')
+
+# Persistance : (longueur du token en octets, nombre d'entiers) par token,
+# (clé, nombre d'entiers) par liste de repères
+_RECORD = struct.Struct("<II")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    Tokens normalisés d'un texte, dans l'ordre (position = rang dans la liste).
+
+    Exemple : "L'Étranger" → ["l", "etranger"]
+    """
+    if not isinstance(text, str):
+        return []
+    return _TOKEN.findall(normalize_for_matching(text))
+
+
+def parse_query(query: str) -> tuple[list[list[str]], bool]:
+    """
+    Découpe une requête en expressions à trouver.
+
+    Args:
+        query: Requête saisie (ex: 'camus "la peste"')
+
+    Returns:
+        (expressions, dernier_mot_prefixe) : chaque expression est une liste
+        de tokens consécutifs ; un mot hors guillemets est une expression
+        d'un seul token. dernier_mot_prefixe est vrai si la requête se
+        termine par un mot hors guillemets.
+    """
+    phrases: list[list[str]] = []
+    last_end = 0
+    last_is_word = False
+    for match in _PHRASE.finditer(query):
+        words = tokenize(query[last_end : match.start()])
+        phrases.extend([word] for word in words)
+        phrase = tokenize(match.group(1))
+        if phrase:
+            phrases.append(phrase)
+            last_is_word = False
+        elif words:
+            last_is_word = True
+        last_end = match.end()
+    words = tokenize(query[last_end:])
+    phrases.extend([word] for word in words)
+    if words:
+        last_is_word = True
+    return phrases, last_is_word
+
+
+def episode_signature(doc: dict[str, Any]) -> str:
+    """
+    Signature des champs indexés d'un épisode.
+
+    La transcription n'entre que par sa longueur et son empreinte
+    (transcription_len, transcription_hash, calculées par MongoDB, voir
+    SIGNATURE_PROJECTION) : la synchronisation ne transfère pas les
+    transcriptions des épisodes inchangés, et une correction de même
+    longueur change tout de même la signature.
+    """
+    parts = [
+        value if isinstance(value := doc.get(field), str) else ""
+        for field in INDEXED_FIELDS
+        if field != "transcription"
+    ]
+    parts.append(str(doc.get("transcription_len") or 0))
+    parts.append(str(doc.get("transcription_hash") or 0))
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+# Projection de lecture des signatures (expressions en projection ;
+# $toHashedIndexKey : MongoDB ≥ 7.0, hash 64 bits calculé côté serveur)
+SIGNATURE_PROJECTION: dict[str, Any] = {
+    **{field: 1 for field in INDEXED_FIELDS if field != "transcription"},
+    "transcription_len": {
+        "$cond": [
+            {"$eq": [{"$type": "$transcription"}, "string"]},
+            {"$strLenCP": "$transcription"},
+            0,
+        ]
+    },
+    "transcription_hash": {"$toHashedIndexKey": "$transcription"},
+}
+
+
+class EpisodeSearchIndex:
+    """Index inversé positionnel des champs texte des épisodes (thread-safe)."""
+
+    def __init__(self) -> None:
+        """Initialise un index vide, pas encore prêt."""
+        self._postings: dict[str, array] = {}
+        self._key_tokens: dict[int, tuple[str, ...]] = {}
+        self._offsets: dict[int, array] = {}
+        self._signatures: dict[str, str] = {}
+        self._doc_ids: dict[str, int] = {}
+        self._episode_ids: dict[int, str] = {}
+        self._next_doc = 0
+        self._vocabulary: list[str] | None = None
+        self._lock = threading.RLock()
+        self.ready = False
+
+    def __len__(self) -> int:
+        """Nombre d'épisodes indexés."""
+        return len(self._signatures)
+
+    def _key(self, episode_id: str, field: str) -> int | None:
+        """Clé entière d'un champ d'épisode (None si l'épisode est inconnu)."""
+        doc = self._doc_ids.get(episode_id)
+        if doc is None:
+            return None
+        return doc * FIELD_COUNT + INDEXED_FIELDS.index(field)
+
+    def _split_key(self, key: int) -> tuple[str, str]:
+        """(episode_id, champ) d'une clé entière."""
+        doc, field = divmod(key, FIELD_COUNT)
+        return self._episode_ids[doc], INDEXED_FIELDS[field]
+
+    @staticmethod
+    def _unpack(packed: array) -> dict[int, array]:
+        """Postings compactés d'un token → {clé: positions}."""
+        postings = {}
+        i = 0
+        while i < len(packed):
+            count = packed[i + 1]
+            postings[packed[i]] = packed[i + 2 : i + 2 + count]
+            i += 2 + count
+        return postings
+
+    # ── Écriture ────────────────────────────────────────────────────────
+
+    def _add_field(self, key: int, text: str | None) -> None:
+        tokens = tokenize(text)
+        if not tokens or not isinstance(text, str):
+            return
+        positions: dict[str, array] = {}
+        for position, token in enumerate(tokens):
+            # Internés : les listes de tokens par clé partagent les chaînes
+            positions.setdefault(sys.intern(token), array("I")).append(position)
+        for token, token_positions in positions.items():
+            packed = self._postings.get(token)
+            if packed is None:
+                packed = self._postings[token] = array("I")
+                self._vocabulary = None
+            packed.extend((key, len(token_positions)))
+            packed.extend(token_positions)
+        self._key_tokens[key] = tuple(positions)
+
+        # Repères d'offsets, si les deux découpages concordent
+        checkpoints = array("I")
+        count = 0
+        for match in _SOURCE_TOKEN.finditer(text):
+            if count % OFFSET_CHECKPOINT_EVERY == 0:
+                checkpoints.append(match.start())
+            count += 1
+        if count == len(tokens):
+            self._offsets[key] = checkpoints
+
+    def _remove(self, keys: set[int]) -> None:
+        """Retire des postings (seuls les tokens des clés sont parcourus)."""
+        for key in keys:
+            self._offsets.pop(key, None)
+            for token in self._key_tokens.pop(key, ()):
+                packed = self._postings[token]
+                i = 0
+                while packed[i] != key:
+                    i += 2 + packed[i + 1]
+                del packed[i : i + 2 + packed[i + 1]]
+                if not packed:
+                    del self._postings[token]
+                    self._vocabulary = None
+
+    def _doc_keys(self, episode_id: str) -> set[int]:
+        """Clés de tous les champs d'un épisode indexé."""
+        doc = self._doc_ids[episode_id]
+        return {doc * FIELD_COUNT + field for field in range(FIELD_COUNT)}
+
+    def _forget(self, episode_id: str) -> None:
+        """Retire un épisode indexé et libère son numéro."""
+        self._remove(self._doc_keys(episode_id))
+        del self._signatures[episode_id]
+        del self._episode_ids[self._doc_ids.pop(episode_id)]
+
+    def index_episode(self, doc: dict[str, Any], signature: str = "") -> None:
+        """
+        Indexe (ou réindexe) un épisode complet.
+
+        Args:
+            doc: Document épisode avec _id et les champs INDEXED_FIELDS
+            signature: Signature lue par sync (l'empreinte de la transcription
+                n'est calculable que par MongoDB) ; vide, la prochaine
+                synchronisation relit l'épisode et confirme l'état indexé
+        """
+        episode_id = str(doc["_id"])
+        with self._lock:
+            if episode_id in self._signatures:
+                self._remove(self._doc_keys(episode_id))
+            else:
+                self._doc_ids[episode_id] = self._next_doc
+                self._episode_ids[self._next_doc] = episode_id
+                self._next_doc += 1
+            base = self._doc_ids[episode_id] * FIELD_COUNT
+            for rank, field in enumerate(INDEXED_FIELDS):
+                self._add_field(base + rank, doc.get(field))
+            self._signatures[episode_id] = signature
+
+    def update_fields(self, episode_id: str, fields: dict[str, Any]) -> None:
+        """
+        Réindexe les champs modifiés d'un épisode déjà indexé.
+
+        La signature n'est pas recalculée : la prochaine synchronisation
+        relit l'épisode et confirme l'état indexé.
+
+        Args:
+            episode_id: Id de l'épisode
+            fields: Champs mis à jour (seuls les INDEXED_FIELDS sont traités)
+        """
+        with self._lock:
+            if episode_id not in self._signatures:
+                return
+            updated = {
+                field: self._key(episode_id, field)
+                for field in fields
+                if field in INDEXED_FIELDS
+            }
+            self._remove({key for key in updated.values() if key is not None})
+            for field, key in updated.items():
+                if key is not None:
+                    self._add_field(key, fields[field])
+            self._signatures[episode_id] = ""
+
+    def remove_episode(self, episode_id: str) -> None:
+        """Retire un épisode supprimé de l'index."""
+        with self._lock:
+            if episode_id in self._signatures:
+                self._forget(episode_id)
+
+    def sync(self, episodes_collection: Any) -> dict[str, int]:
+        """
+        Aligne l'index sur la collection episodes.
+
+        Lit la signature de chaque épisode (projection, sans transcription),
+        réindexe les épisodes nouveaux ou modifiés et retire les supprimés.
+
+        Args:
+            episodes_collection: Collection pymongo episodes
+
+        Returns:
+            Dict avec les nombres d'épisodes "indexed" et "removed"
+        """
+        current = {
+            str(doc["_id"]): episode_signature(doc)
+            for doc in episodes_collection.find({}, SIGNATURE_PROJECTION)
+        }
+        with self._lock:
+            stale = [
+                episode_id
+                for episode_id, signature in current.items()
+                if self._signatures.get(episode_id) != signature
+            ]
+            removed = [
+                episode_id
+                for episode_id in self._signatures
+                if episode_id not in current
+            ]
+            for episode_id in removed:
+                self._forget(episode_id)
+
+        projection = dict.fromkeys(INDEXED_FIELDS, 1)
+        for start in range(0, len(stale), 100):
+            ids = [ObjectId(episode_id) for episode_id in stale[start : start + 100]]
+            for doc in episodes_collection.find({"_id": {"$in": ids}}, projection):
+                self.index_episode(doc, current[str(doc["_id"])])
+        self.ready = True
+        return {"indexed": len(stale), "removed": len(removed)}
+
+    # ── Lecture ─────────────────────────────────────────────────────────
+
+    def _token_postings(self, token: str, prefix: bool) -> dict[int, array]:
+        """Postings d'un token, ou union des tokens commençant par token."""
+        if not prefix or len(token) < PREFIX_MIN_LENGTH:
+            return self._unpack(self._postings.get(token, array("I")))
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        merged: dict[int, array] = {}
+        start = bisect_left(self._vocabulary, token)
+        for candidate in self._vocabulary[start:]:
+            if not candidate.startswith(token):
+                break
+            for key, positions in self._unpack(self._postings[candidate]).items():
+                if key in merged:
+                    merged[key] = array("I", sorted({*merged[key], *positions}))
+                else:
+                    merged[key] = positions
+        return merged
+
+    def _phrase_hits(
+        self, tokens: list[str], prefix_last: bool
+    ) -> dict[int, list[int]]:
+        """Clé (épisode, champ) → positions de début de l'expression."""
+        postings = [
+            self._token_postings(token, prefix_last and i == len(tokens) - 1)
+            for i, token in enumerate(tokens)
+        ]
+        if not all(postings):
+            return {}
+        keys = set(postings[0])
+        for token_postings in postings[1:]:
+            keys &= token_postings.keys()
+        hits: dict[int, list[int]] = {}
+        for key in keys:
+            starts = set(postings[0][key])
+            for offset, token_postings in enumerate(postings[1:], start=1):
+                starts &= {position - offset for position in token_postings[key]}
+                if not starts:
+                    break
+            if starts:
+                hits[key] = sorted(starts)
+        return hits
+
+    def search(self, query: str) -> dict[str, dict[str, list[tuple[int, int]]]] | None:
+        """
+        Épisodes contenant toutes les expressions de la requête.
+
+        Args:
+            query: Requête (mots, "expressions entre guillemets")
+
+        Returns:
+            episode_id → champ → [(position, nombre de tokens)] des
+            occurrences trouvées, ou None si l'index n'est pas prêt
+        """
+        if not self.ready:
+            return None
+        phrases, prefix_last = parse_query(query)
+        if not phrases:
+            return {}
+        with self._lock:
+            results: dict[str, dict[str, list[tuple[int, int]]]] | None = None
+            for i, phrase in enumerate(phrases):
+                hits = self._phrase_hits(phrase, prefix_last and i == len(phrases) - 1)
+                by_episode: dict[str, dict[str, list[tuple[int, int]]]] = {}
+                for key, starts in hits.items():
+                    episode_id, field = self._split_key(key)
+                    if results is not None and episode_id not in results:
+                        continue
+                    by_episode.setdefault(episode_id, {})[field] = [
+                        (start, len(phrase)) for start in starts
+                    ]
+                if results is None:
+                    results = by_episode
+                else:
+                    for episode_id in list(results):
+                        if episode_id not in by_episode:
+                            del results[episode_id]
+                            continue
+                        for field, occurrences in by_episode[episode_id].items():
+                            results[episode_id][field] = sorted(
+                                results[episode_id].get(field, []) + occurrences
+                            )
+                if not results:
+                    return {}
+            return results or {}
+
+    def checkpoint(self, episode_id: str, field: str, position: int) -> int | None:
+        """Offset caractère du repère précédant le token position (ou None)."""
+        with self._lock:
+            key = self._key(episode_id, field)
+            checkpoints = None if key is None else self._offsets.get(key)
+        block = position // OFFSET_CHECKPOINT_EVERY
+        if checkpoints is None or block >= len(checkpoints):
+            return None
+        return int(checkpoints[block])
+
+    def char_spans(
+        self,
+        episode_id: str,
+        field: str,
+        text: str,
+        occurrences: list[tuple[int, int]],
+        base: int = 0,
+    ) -> list[tuple[int, int]]:
+        """
+        Offsets caractère des occurrences trouvées par search().
+
+        Chaque occurrence est retrouvée depuis le repère qui la précède (au
+        plus OFFSET_CHECKPOINT_EVERY tokens relus).
+
+        Args:
+            episode_id: Id de l'épisode
+            field: Champ des occurrences
+            text: Texte du champ, ou fenêtre du texte
+            occurrences: (position, nombre de tokens) retournés par search()
+            base: Offset du premier caractère de text dans le champ
+
+        Returns:
+            Occurrences (début, fin) en offsets dans le champ ; celles hors de
+            text (ou d'un texte modifié depuis l'indexation) sont ignorées
+        """
+        spans = []
+        for position, length in occurrences:
+            checkpoint = self.checkpoint(episode_id, field, position)
+            if checkpoint is None or checkpoint < base:
+                continue
+            skip = position % OFFSET_CHECKPOINT_EVERY
+            matches = list(
+                islice(_SOURCE_TOKEN.finditer(text, checkpoint - base), skip + length)
+            )
+            if len(matches) == skip + length:
+                spans.append((base + matches[skip].start(), base + matches[-1].end()))
+        return spans
+
+    # ── Persistance ─────────────────────────────────────────────────────
+
+    def save(self, path: Path | str) -> None:
+        """
+        Écrit l'index (gzip, écriture atomique).
+
+        Une ligne JSON d'en-tête (version, signatures, numéros d'épisodes)
+        puis, par token et par liste de repères, un enregistrement _RECORD
+        suivi des octets bruts de l'array.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with self._lock, gzip.open(tmp, "wb", compresslevel=1) as f:
+            header = {
+                "version": INDEX_FORMAT_VERSION,
+                "byteorder": sys.byteorder,
+                "itemsize": array("I").itemsize,
+                "signatures": self._signatures,
+                "episodes": list(self._episode_ids.items()),
+                "tokens": len(self._postings),
+                "offsets": len(self._offsets),
+            }
+            f.write(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+            f.write(b"\n")
+            for token, packed in self._postings.items():
+                encoded = token.encode("utf-8")
+                f.write(_RECORD.pack(len(encoded), len(packed)))
+                f.write(encoded)
+                f.write(packed.tobytes())
+            for key, checkpoints in self._offsets.items():
+                f.write(_RECORD.pack(key, len(checkpoints)))
+                f.write(checkpoints.tobytes())
+        tmp.replace(path)
+
+    def load(self, path: Path | str) -> bool:
+        """
+        Charge un index sauvegardé (l'index n'est prêt qu'après sync).
+
+        Le fichier est relu enregistrement par enregistrement : seuls les
+        arrays de l'index sont construits, sans document JSON intermédiaire.
+
+        Returns:
+            True si le fichier existe et a été chargé
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+        try:
+            with gzip.open(path, "rb") as f:
+                header = json.loads(f.readline())
+                if (
+                    header.get("version") != INDEX_FORMAT_VERSION
+                    or header.get("itemsize") != array("I").itemsize
+                ):
+                    return False
+                swap = header["byteorder"] != sys.byteorder
+
+                def read_array(count: int) -> array:
+                    values = array("I")
+                    data = f.read(count * values.itemsize)
+                    if len(data) != count * values.itemsize:
+                        raise EOFError("Index de recherche tronqué")
+                    values.frombytes(data)
+                    if swap:
+                        values.byteswap()
+                    return values
+
+                postings: dict[str, array] = {}
+                key_tokens: dict[int, list[str]] = {}
+                for _ in range(header["tokens"]):
+                    size, count = _RECORD.unpack(f.read(_RECORD.size))
+                    token = sys.intern(f.read(size).decode("utf-8"))
+                    packed = postings[token] = read_array(count)
+                    i = 0
+                    while i < count:
+                        key_tokens.setdefault(packed[i], []).append(token)
+                        i += 2 + packed[i + 1]
+                offsets = {}
+                for _ in range(header["offsets"]):
+                    key, count = _RECORD.unpack(f.read(_RECORD.size))
+                    offsets[key] = read_array(count)
+        except Exception as e:
+            logger.warning(f"Index de recherche illisible ({path}): {e}")
+            with contextlib.suppress(Exception):
+                path.unlink()
+            return False
+        episode_ids = dict(header["episodes"])
+        with self._lock:
+            self._signatures = dict(header["signatures"])
+            self._postings = postings
+            self._key_tokens = {
+                key: tuple(tokens) for key, tokens in key_tokens.items()
+            }
+            self._offsets = offsets
+            self._episode_ids = episode_ids
+            self._doc_ids = {episode_id: doc for doc, episode_id in episode_ids.items()}
+            self._next_doc = max(episode_ids, default=-1) + 1
+            self._vocabulary = None
+        return True
+
+
+episode_search_index = EpisodeSearchIndex()
@@ -0,0 +1,396 @@
+"""Statistiques matérialisées par livre (projection livre_stats).
+
+Les pages détail livre/auteur, le calcul des tags Calibre attendus, les notes
+moyennes et le chargement des recommandations ré-agrégeaient chacun les avis
+d'un livre avec leur propre requête. Ces agrégats sont matérialisés dans la
+collection livre_stats, un document par livre ayant au moins un avis (même _id
+que avis.livre_oid, String) :
+
+    {
+        _id, note_moyenne, nombre_avis,
+        emissions: [{emission_id, date, note_moyenne, nombre_avis}],
+        notes_critiques: [{critique_oid, note}],
+        coups_de_coeur: [nom officiel du critique],
+        calibre_tags: [lmelp_yyMMdd..., lmelp_prenom_nom...],
+    }
+
+nombre_avis et note_moyenne ne comptent que les avis notés. Les lectures sont
+des find() sur _id.
+
+Maintenance incrémentale (voir MongoDBService.refresh_livre_stats*) : chaque
+écriture d'avis recalcule les livres touchés, la fusion de critiques recalcule
+les livres de leurs avis. La projection est reconstruite au démarrage de
+l'application si elle est vide ou si LIVRE_STATS_REBUILD_ON_STARTUP est activé
+(rattrapage des écritures faites hors de l'application, ou d'un changement de
+date d'émission), ou à la demande via :
+
+    python -m back_office_lmelp.utils.rebuild_livre_stats
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+
+from ..utils.text_utils import normalize_for_matching
+
+
+# Collection des statistiques matérialisées par livre
+LIVRE_STATS_COLLECTION = "livre_stats"
+
+# Taille maximale des listes $in envoyées à MongoDB
+LIVRE_STATS_BATCH_SIZE = 500
+
+_AVIS_PROJECTION = {
+    "livre_oid": 1,
+    "emission_oid": 1,
+    "critique_oid": 1,
+    "critique_nom_extrait": 1,
+    "note": 1,
+    "section": 1,
+}
+
+
+def _batches(items: list[Any], size: int) -> Iterable[list[Any]]:
+    """Découpe une liste en lots de taille bornée."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _string_ids(oids: Iterable[Any]) -> list[str]:
+    """Normalise des IDs (str ou ObjectId) en String valides, sans doublon."""
+    ids: dict[str, None] = {}
+    for value in oids:
+        if value and ObjectId.is_valid(str(value)):
+            ids[str(value)] = None
+    return list(ids)
+
+
+def _moyenne(notes: list[float]) -> float | None:
+    """Moyenne arrondie à 1 décimale (None sans note)."""
+    return round(sum(notes) / len(notes), 1) if notes else None
+
+
+def _find_by_object_ids(
+    collection: Any, oids: Iterable[Any], projection: dict[str, Any]
+) -> dict[str, dict[str, Any]]:
+    """Lit des documents par lots ($in sur _id) à partir d'IDs String."""
+    object_ids = [ObjectId(oid) for oid in _string_ids(oids)]
+    docs: dict[str, dict[str, Any]] = {}
+    for batch in _batches(object_ids, LIVRE_STATS_BATCH_SIZE):
+        for doc in collection.find({"_id": {"$in": batch}}, projection):
+            docs[str(doc["_id"])] = doc
+    return docs
+
+
+def critic_name(
+    avis: dict[str, Any], critiques_by_id: dict[str, str] | None = None
+) -> str:
+    """Nom du critique d'un avis : nom officiel via critique_oid, sinon nom extrait."""
+    name = ""
+    critique_oid = avis.get("critique_oid", "")
+    if critique_oid and critiques_by_id:
+        name = critiques_by_id.get(critique_oid, "")
+    return name or avis.get("critique_nom_extrait", "")
+
+
+def build_calibre_tags(
+    all_avis: list[dict[str, Any]],
+    emissions_by_id: dict[str, dict[str, Any]],
+    critiques_by_id: dict[str, str] | None = None,
+) -> list[str]:
+    """Tags Calibre d'un livre à partir de ses avis (Issue #200).
+
+    - lmelp_yyMMdd pour chaque date d'émission (ordre chronologique)
+    - lmelp_prenom_nom pour chaque critique coup de cœur (ordre alphabétique)
+
+    Avec critiques_by_id, le nom officiel (via critique_oid) est préféré au
+    nom extrait par le LLM (critique_nom_extrait).
+    """
+    date_tags: set[str] = set()
+    critic_tags: set[str] = set()
+
+    for avis in all_avis:
+        emission = emissions_by_id.get(avis.get("emission_oid", ""))
+        if emission:
+            em_date = emission.get("date")
+            if isinstance(em_date, datetime):
+                date_tags.add(f"lmelp_{em_date.strftime('%y%m%d')}")
+
+        if avis.get("section") == "coup_de_coeur":
+            name = critic_name(avis, critiques_by_id)
+            if name:
+                critic_tags.add(
+                    "lmelp_" + normalize_for_matching(name).replace(" ", "_")
+                )
+
+    return sorted(date_tags) + sorted(critic_tags)
+
+
+def _livre_stats(
+    livre_avis: list[dict[str, Any]],
+    emissions_by_id: dict[str, dict[str, Any]],
+    critiques_by_id: dict[str, str],
+) -> dict[str, Any]:
+    """Agrège les avis d'un livre en document livre_stats (sans _id)."""
+    notes: list[float] = []
+    notes_by_emission: dict[str, list[float]] = {}
+    notes_critiques: list[dict[str, Any]] = []
+    coups_de_coeur: set[str] = set()
+
+    for avis in livre_avis:
+        emission_oid = avis.get("emission_oid") or ""
+        emission_notes = notes_by_emission.setdefault(emission_oid, [])
+        note = avis.get("note")
+        if note is not None:
+            notes.append(float(note))
+            emission_notes.append(float(note))
+            if avis.get("critique_oid"):
+                notes_critiques.append(
+                    {"critique_oid": avis["critique_oid"], "note": note}
+                )
+        if avis.get("section") == "coup_de_coeur":
+            name = critic_name(avis, critiques_by_id)
+            if name:
+                coups_de_coeur.add(name)
+
+    emissions = [
+        {
+            "emission_id": emission_oid,
+            "date": emissions_by_id.get(emission_oid, {}).get("date"),
+            "note_moyenne": _moyenne(emission_notes),
+            "nombre_avis": len(emission_notes),
+        }
+        for emission_oid, emission_notes in notes_by_emission.items()
+        if emission_oid
+    ]
+    emissions.sort(key=lambda em: str(em["date"] or ""), reverse=True)
+
+    return {
+        "note_moyenne": _moyenne(notes),
+        "nombre_avis": len(notes),
+        "emissions": emissions,
+        "notes_critiques": notes_critiques,
+        "coups_de_coeur": sorted(coups_de_coeur),
+        "calibre_tags": build_calibre_tags(
+            livre_avis, emissions_by_id, critiques_by_id=critiques_by_id
+        ),
+    }
+
+
+def compute_livre_stats(
+    mongodb_service: Any, livre_oids: Iterable[Any] | None = None
+) -> dict[str, dict[str, Any]]:
+    """
+    Calcule les statistiques des livres indiqués.
+
+    Une lecture des avis (index livre_oid) puis des émissions et critiques
+    référencés, par lots ($in sur _id).
+
+    Args:
+        mongodb_service: Service MongoDB (accès via get_collection)
+        livre_oids: IDs des livres (str ou ObjectId), None pour tous les livres
+
+    Returns:
+        Dict livre_id → statistiques (livres sans avis absents)
+    """
+    livre_ids = None if livre_oids is None else _string_ids(livre_oids)
+    if livre_ids == []:
+        return {}
+
+    avis_collection = mongodb_service.get_collection("avis")
+    if livre_ids is None:
+        queries: list[dict[str, Any]] = [{"livre_oid": {"$ne": None}}]
+    else:
+        queries = [
+            {"livre_oid": {"$in": batch}}
+            for batch in _batches(livre_ids, LIVRE_STATS_BATCH_SIZE)
+        ]
+
+    avis_by_livre: dict[str, list[dict[str, Any]]] = {}
+    for query in queries:
+        for avis in avis_collection.find(query, _AVIS_PROJECTION):
+            if avis.get("livre_oid"):
+                avis_by_livre.setdefault(str(avis["livre_oid"]), []).append(avis)
+    if not avis_by_livre:
+        return {}
+
+    all_avis = [avis for livre_avis in avis_by_livre.values() for avis in livre_avis]
+    emissions_by_id = _find_by_object_ids(
+        mongodb_service.get_collection("emissions"),
+        (avis.get("emission_oid") for avis in all_avis),
+        {"date": 1},
+    )
+    critiques_by_id = {
+        critique_id: critique.get("nom", "")
+        for critique_id, critique in _find_by_object_ids(
+            mongodb_service.get_collection("critiques"),
+            (avis.get("critique_oid") for avis in all_avis),
+            {"nom": 1},
+        ).items()
+    }
+
+    return {
+        livre_id: _livre_stats(livre_avis, emissions_by_id, critiques_by_id)
+        for livre_id, livre_avis in avis_by_livre.items()
+    }
+
+
+def _upsert_operations(stats: dict[str, dict[str, Any]]) -> list[UpdateOne]:
+    """Opérations d'upsert des statistiques calculées (par _id = livre_id)."""
+    now = datetime.now()
+    return [
+        UpdateOne({"_id": livre_id}, {"$set": {**doc, "updated_at": now}}, upsert=True)
+        for livre_id, doc in stats.items()
+    ]
+
+
+def refresh_livre_stats(mongodb_service: Any, livre_oids: Iterable[Any]) -> int:
+    """
+    Recalcule et persiste les statistiques des livres indiqués.
+
+    Upserts et suppressions (livres sans avis) partent en un seul bulk_write.
+
+    Args:
+        mongodb_service: Service MongoDB
+        livre_oids: IDs des livres touchés (str ou ObjectId)
+
+    Returns:
+        Nombre de livres ayant des statistiques après recalcul
+    """
+    livre_ids = _string_ids(livre_oids)
+    if not livre_ids:
+        return 0
+
+    stats = compute_livre_stats(mongodb_service, livre_ids)
+    operations: list[Any] = _upsert_operations(stats)
+    operations.extend(
+        DeleteOne({"_id": livre_id}) for livre_id in livre_ids if livre_id not in stats
+    )
+    mongodb_service.get_collection(LIVRE_STATS_COLLECTION).bulk_write(
+        operations, ordered=False
+    )
+    return len(stats)
+
+
+def delete_livre_stats(mongodb_service: Any, livre_oids: Iterable[Any]) -> int:
+    """
+    Supprime les statistiques de livres supprimés (ex. doublons fusionnés).
+
+    refresh_livre_stats() ne convient pas : les avis d'un livre supprimé le
+    référencent encore et ses statistiques seraient recalculées.
+
+    Args:
+        mongodb_service: Service MongoDB
+        livre_oids: IDs des livres supprimés (str ou ObjectId)
+
+    Returns:
+        Nombre de documents supprimés
+    """
+    livre_ids = _string_ids(livre_oids)
+    if not livre_ids:
+        return 0
+    result = mongodb_service.get_collection(LIVRE_STATS_COLLECTION).delete_many(
+        {"_id": {"$in": livre_ids}}
+    )
+    return int(result.deleted_count)
+
+
+def refresh_livre_stats_for_critiques(
+    mongodb_service: Any, critique_oids: Iterable[Any]
+) -> int:
+    """
+    Recalcule les statistiques des livres notés par les critiques indiqués.
+
+    Utilisé quand des avis changent de critique (fusion) : notes_critiques,
+    coups_de_coeur et tags dépendent du critique.
+
+    Args:
+        mongodb_service: Service MongoDB
+        critique_oids: IDs des critiques (str ou ObjectId)
+
+    Returns:
+        Nombre de livres ayant des statistiques après recalcul
+    """
+    critique_ids = _string_ids(critique_oids)
+    if not critique_ids:
+        return 0
+
+    livre_ids = mongodb_service.get_collection("avis").distinct(
+        "livre_oid", {"critique_oid": {"$in": critique_ids}}
+    )
+    return refresh_livre_stats(mongodb_service, livre_ids)
+
+
+def rebuild_livre_stats(mongodb_service: Any) -> dict[str, int]:
+    """
+    Reconstruit entièrement la collection livre_stats.
+
+    Args:
+        mongodb_service: Service MongoDB
+
+    Returns:
+        Dict avec "rebuilt" (livres ayant des avis) et "removed" (documents obsolètes)
+    """
+    stats = compute_livre_stats(mongodb_service)
+    livre_stats_collection = mongodb_service.get_collection(LIVRE_STATS_COLLECTION)
+
+    operations = _upsert_operations(stats)
+    if operations:
+        livre_stats_collection.bulk_write(operations, ordered=False)
+    removed = livre_stats_collection.delete_many({"_id": {"$nin": list(stats)}})
+
+    return {"rebuilt": len(stats), "removed": int(removed.deleted_count)}
+
+
+def get_livre_stats(
+    mongodb_service: Any,
+    livre_oids: Iterable[Any],
+    projection: dict[str, Any] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Lit les statistiques matérialisées de livres (find sur _id).
+
+    Args:
+        mongodb_service: Service MongoDB
+        livre_oids: IDs des livres (str ou ObjectId)
+        projection: Champs à lire (défaut : tous)
+
+    Returns:
+        Dict livre_id → statistiques (livres sans avis absents)
+    """
+    livre_stats_collection = mongodb_service.get_collection(LIVRE_STATS_COLLECTION)
+    stats: dict[str, dict[str, Any]] = {}
+    for batch in _batches(_string_ids(livre_oids), LIVRE_STATS_BATCH_SIZE):
+        query = {"_id": {"$in": batch}}
+        found = (
+            livre_stats_collection.find(query, projection)
+            if projection
+            else livre_stats_collection.find(query)
+        )
+        for doc in found:
+            stats[str(doc["_id"])] = doc
+    return stats
+
+
+def load_critique_notes(mongodb_service: Any) -> list[dict[str, Any]]:
+    """
+    Notes (critique, livre) de tous les livres, pour les recommandations.
+
+    Returns:
+        Liste de dicts {critique_oid, livre_oid, note}
+    """
+    livre_stats_collection = mongodb_service.get_collection(LIVRE_STATS_COLLECTION)
+    return [
+        {
+            "critique_oid": entry["critique_oid"],
+            "livre_oid": doc["_id"],
+            "note": entry["note"],
+        }
+        for doc in livre_stats_collection.find(
+            {"notes_critiques.0": {"$exists": True}}, {"notes_critiques": 1}
+        )
+        for entry in doc.get("notes_critiques", [])
+    ]
@@ -5,7 +5,8 @@ from typing import Any
 
 from bson import ObjectId
 
-from .mongodb_service import mongodb_service
+from ..utils.join_keys import to_object_id, typed_join_key
+from .mongodb_service import VISIBLE_AVIS_CRITIQUES_FILTER, mongodb_service
 
 
 class LivresAuteursCacheService:
@@ -31,6 +32,109 @@ class LivresAuteursCacheService:
         Raises:
             ValueError: Si des champs obligatoires manquent
         """
+        self._validate_book_data(book_data)
+
+        # Upsert dans la collection cache pour éviter les doublons
+        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
+
+        # Filtre d'unicité : combinaison (avis_critique_id, auteur, titre)
+        uniqueness_filter = self._uniqueness_filter(avis_critique_id, book_data)
+
+        # Vérifier si une entrée existe déjà
+        existing_entry = cache_collection.find_one(uniqueness_filter)
+        cache_entry = self._build_cache_entry(
+            avis_critique_id, book_data, existing_entry
+        )
+
+        if existing_entry:
+            # Mettre à jour l'entrée existante
+            result = cache_collection.replace_one(uniqueness_filter, cache_entry)
+            return ObjectId(existing_entry["_id"])
+        # Créer une nouvelle entrée
+        result = cache_collection.replace_one(
+            uniqueness_filter, cache_entry, upsert=True
+        )
+        if result.upserted_id is None:
+            raise RuntimeError("Failed to create cache entry: no upserted_id returned")
+        return ObjectId(result.upserted_id)
+
+    def create_cache_entries(
+        self, avis_critique_id: ObjectId, books_data: list[dict[str, Any]]
+    ) -> list[ObjectId]:
+        """
+        Crée ou met à jour en lot les entrées de cache d'un avis critique.
+
+        Même logique que create_cache_entry() : une recherche des entrées
+        existantes ($or sur les filtres d'unicité) puis un seul bulk_write.
+
+        Args:
+            avis_critique_id: ID de l'avis critique source
+            books_data: Données des livres extraits et vérifiés
+
+        Returns:
+            ObjectId des entrées, dans l'ordre de books_data
+
+        Raises:
+            ValueError: Si des champs obligatoires manquent
+        """
+        if not books_data:
+            return []
+        for book_data in books_data:
+            self._validate_book_data(book_data)
+
+        from pymongo import ReplaceOne
+
+        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
+        filters = [
+            self._uniqueness_filter(avis_critique_id, book_data)
+            for book_data in books_data
+        ]
+
+        existing_entries = {
+            (entry["auteur"], entry["titre"]): entry
+            for entry in cache_collection.find(
+                {
+                    "avis_critique_id": avis_critique_id,
+                    "$or": [
+                        {"auteur": f["auteur"], "titre": f["titre"]} for f in filters
+                    ],
+                }
+            )
+        }
+
+        # Dernière occurrence retenue pour un même (auteur, titre) du lot
+        operations: dict[tuple[str, str], ReplaceOne] = {}
+        for uniqueness_filter, book_data in zip(filters, books_data, strict=True):
+            key = (uniqueness_filter["auteur"], uniqueness_filter["titre"])
+            operations[key] = ReplaceOne(
+                uniqueness_filter,
+                self._build_cache_entry(
+                    avis_critique_id, book_data, existing_entries.get(key)
+                ),
+                upsert=True,
+            )
+
+        keys = list(operations)
+        result = cache_collection.bulk_write(list(operations.values()), ordered=False)
+
+        entry_ids = {
+            key: ObjectId(entry["_id"]) for key, entry in existing_entries.items()
+        }
+        for index, upserted_id in result.upserted_ids.items():
+            entry_ids[keys[index]] = ObjectId(upserted_id)
+
+        ids = []
+        for uniqueness_filter in filters:
+            key = (uniqueness_filter["auteur"], uniqueness_filter["titre"])
+            if key not in entry_ids:
+                raise RuntimeError(
+                    "Failed to create cache entry: no upserted_id returned"
+                )
+            ids.append(entry_ids[key])
+        return ids
+
+    def _validate_book_data(self, book_data: dict[str, Any]) -> None:
+        """Vérifie les champs obligatoires et le statut d'une entrée de cache."""
         # Validation des champs obligatoires (système simplifié)
         required_fields = ["auteur", "titre", "episode_oid", "status"]
         for field in required_fields:
@@ -44,6 +148,23 @@ class LivresAuteursCacheService:
                 f"Statut invalide: {book_data['status']}. Statuts autorisés: {allowed_statuses}"
             )
 
+    def _uniqueness_filter(
+        self, avis_critique_id: ObjectId, book_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Filtre d'unicité : combinaison (avis_critique_id, auteur, titre)."""
+        return {
+            "avis_critique_id": avis_critique_id,
+            "auteur": book_data["auteur"],
+            "titre": book_data["titre"],
+        }
+
+    def _build_cache_entry(
+        self,
+        avis_critique_id: ObjectId,
+        book_data: dict[str, Any],
+        existing_entry: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Document de cache à écrire, champs de traitement existants préservés."""
         # Préparer les données pour l'insertion
         now = datetime.now()
 
@@ -51,6 +172,8 @@ class LivresAuteursCacheService:
         cache_entry = {
             "avis_critique_id": avis_critique_id,
             "episode_oid": book_data["episode_oid"],
+            # Clé de jointure typée (utils/join_keys.py)
+            "episode_id": to_object_id(book_data["episode_oid"]),
             "auteur": book_data["auteur"],
             "titre": book_data["titre"],
             "editeur": book_data.get("editeur", ""),
@@ -72,27 +195,10 @@ class LivresAuteursCacheService:
         if "babelio_publisher" in book_data and book_data["babelio_publisher"]:
             cache_entry["babelio_publisher"] = book_data["babelio_publisher"]
 
-        # Upsert dans la collection cache pour éviter les doublons
-        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
-
-        # Filtre d'unicité : combinaison (avis_critique_id, auteur, titre)
-        uniqueness_filter = {
-            "avis_critique_id": avis_critique_id,
-            "auteur": book_data["auteur"],
-            "titre": book_data["titre"],
-        }
-
-        # Vérifier si une entrée existe déjà
-        existing_entry = cache_collection.find_one(uniqueness_filter)
-
         if existing_entry:
             # Préserver seulement les champs de traitement (NoSQL simplifié)
-            cache_entry.update(
-                {
-                    "created_at": existing_entry.get(
-                        "created_at", cache_entry["created_at"]
-                    ),
-                }
+            cache_entry["created_at"] = existing_entry.get(
+                "created_at", cache_entry["created_at"]
             )
 
             # Préserver les champs de traitement s'ils existent
@@ -107,16 +213,7 @@ class LivresAuteursCacheService:
             if existing_entry.get("status") == "mongo":
                 cache_entry["status"] = "mongo"
 
-            # Mettre à jour l'entrée existante
-            result = cache_collection.replace_one(uniqueness_filter, cache_entry)
-            return ObjectId(existing_entry["_id"])
-        # Créer une nouvelle entrée
-        result = cache_collection.replace_one(
-            uniqueness_filter, cache_entry, upsert=True
-        )
-        if result.upserted_id is None:
-            raise RuntimeError("Failed to create cache entry: no upserted_id returned")
-        return ObjectId(result.upserted_id)
+        return cache_entry
 
     def get_books_by_avis_critique_id(
         self,
@@ -179,6 +276,45 @@ class LivresAuteursCacheService:
         # Convertir en liste et retourner
         return list(cursor)
 
+    def get_cache_flags_by_episode_oids(
+        self, episode_oids: list[str]
+    ) -> dict[str, dict[str, bool]]:
+        """
+        Calcule les flags de cache de plusieurs épisodes en une agrégation.
+
+        Args:
+            episode_oids: OIDs des épisodes
+
+        Returns:
+            Dict episode_oid → {"has_cached_books", "has_incomplete_books"}
+            (épisodes sans livre en cache absents du dict)
+        """
+        if not episode_oids:
+            return {}
+
+        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
+        pipeline = [
+            {"$match": {"episode_oid": {"$in": list(set(episode_oids))}}},
+            {
+                "$group": {
+                    "_id": "$episode_oid",
+                    # Statut absent → null (compté comme non validé)
+                    "statuses": {"$addToSet": {"$ifNull": ["$status", None]}},
+                }
+            },
+        ]
+
+        flags: dict[str, dict[str, bool]] = {}
+        for row in cache_collection.aggregate(pipeline):
+            flags[str(row["_id"])] = {
+                "has_cached_books": True,
+                # Au moins un livre avec status != 'mongo'
+                "has_incomplete_books": any(
+                    status != "mongo" for status in row["statuses"]
+                ),
+            }
+        return flags
+
     def update_validation_status(
         self, cache_id: ObjectId, status: str, metadata: dict[str, Any]
     ) -> bool:
@@ -250,6 +386,43 @@ class LivresAuteursCacheService:
 
         return self.update_validation_status(cache_id, "mongo", update_metadata)
 
+    def mark_batch_as_processed(self, processed: list[dict[str, Any]]) -> int:
+        """
+        Marque en lot des entrées comme traitées (un seul bulk_write).
+
+        Args:
+            processed: Entrées {"cache_id", "author_id", "book_id", "metadata"?}
+                (mêmes champs que mark_as_processed)
+
+        Returns:
+            Nombre d'entrées modifiées
+        """
+        if not processed:
+            return 0
+
+        from pymongo import UpdateOne
+
+        now = datetime.now()
+        operations = [
+            UpdateOne(
+                {"_id": entry["cache_id"]},
+                {
+                    "$set": {
+                        "status": "mongo",
+                        "updated_at": now,
+                        "processed_at": now,
+                        "author_id": entry["author_id"],
+                        "book_id": entry["book_id"],
+                        **(entry.get("metadata") or {}),
+                    }
+                },
+            )
+            for entry in processed
+        ]
+        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
+        result = cache_collection.bulk_write(operations, ordered=False)
+        return int(result.modified_count)
+
     def mark_summary_corrected(self, cache_id: ObjectId) -> bool:
         """
         Marque qu'une entrée a eu son summary corrigé dans avis_critiques (Issue #67).
@@ -346,118 +519,109 @@ class LivresAuteursCacheService:
             print(f"Erreur lors du comptage des auteurs uniques: {e}")
             stats["auteurs_uniques"] = 0
 
-        # Récupérer les IDs des épisodes masqués
-        episodes_collection = self.mongodb_service.get_collection("episodes")
-        masked_episodes = list(episodes_collection.find({"masked": True}, {"_id": 1}))
-        masked_episode_oids = [str(ep["_id"]) for ep in masked_episodes]
-
-        # Compter les avis critiques analysés (nombre d'avis_critique_id distincts dans le cache)
-        # Exclure les épisodes masqués
-        treated_avis_ids = cache_collection.distinct(
-            "avis_critique_id", {"episode_oid": {"$nin": masked_episode_oids}}
-        )
-        stats["avis_critiques_analyses"] = len(treated_avis_ids)
-
-        # Ajouter les épisodes non traités (réutilise le calcul ci-dessus)
-        stats["episodes_non_traites"] = self._get_untreated_count_with_treated_ids(
-            treated_avis_ids, masked_episode_oids
-        )
+        # Avis critiques analysés (au moins une entrée dans le cache) et non
+        # traités, épisodes masqués exclus (avis_critiques.episode_masked)
+        total_avis, analyzed_avis = self._count_analyzed_avis_critiques()
+        stats["avis_critiques_analyses"] = analyzed_avis
+        stats["episodes_non_traites"] = total_avis - analyzed_avis
 
         # Compter les épisodes sans émission (Issue #154)
         # Logique : épisodes NON MASQUÉS qui ont avis_critiques mais pas d'émission
         try:
-            avis_critiques_collection = self.mongodb_service.get_collection(
-                "avis_critiques"
-            )
-            emissions_collection = self.mongodb_service.get_collection("emissions")
-
-            # Récupérer tous les episode_oid depuis avis_critiques
-            all_avis = list(avis_critiques_collection.find({}, {"episode_oid": 1}))
-            episodes_with_avis = {
-                avis["episode_oid"] for avis in all_avis if avis.get("episode_oid")
-            }
-
-            # IMPORTANT: Exclure les épisodes masqués (déjà calculé ci-dessus)
-            # masked_episode_oids contient les IDs en string
-            episodes_with_avis_non_masques = episodes_with_avis - set(
-                masked_episode_oids
-            )
-
-            # Récupérer tous les episode_id depuis emissions
-            all_emissions = list(emissions_collection.find({}, {"episode_id": 1}))
-            episodes_with_emission = {
-                str(emission["episode_id"]) for emission in all_emissions
-            }
-
-            # Calculer la différence (épisodes NON MASQUÉS qui ont avis mais pas d'émission)
-            episodes_sans_emission = (
-                episodes_with_avis_non_masques - episodes_with_emission
-            )
-            stats["episodes_sans_emission"] = len(episodes_sans_emission)
+            stats["episodes_sans_emission"] = self._count_episodes_sans_emission()
         except Exception as e:
             print(f"Erreur lors du comptage des épisodes sans émission: {e}")
             stats["episodes_sans_emission"] = 0
 
         return stats
 
-    def get_untreated_avis_critiques_count(self) -> int:
+    def _count_analyzed_avis_critiques(self) -> tuple[int, int]:
         """
-        Compte les avis critiques non encore traités (pas dans le cache).
+        Compte les avis critiques visibles et ceux déjà analysés.
+
+        Une seule agrégation sur avis_critiques : anti-jointure vers le cache
+        (index avis_critique_id), sans liste d'épisodes masqués. Le cache
+        stocke avis_critique_id en ObjectId ou, pour les entrées anciennes, en
+        String : la jointure porte sur les deux représentations.
 
         Returns:
-            Nombre d'avis critiques non traités
+            (avis critiques des épisodes non masqués, dont analysés)
         """
-        # Récupérer les IDs des épisodes masqués
-        episodes_collection = self.mongodb_service.get_collection("episodes")
-        masked_episodes = list(episodes_collection.find({"masked": True}, {"_id": 1}))
-        masked_episode_oids = [str(ep["_id"]) for ep in masked_episodes]
-
-        # Compter le total d'avis critiques (excluant les épisodes masqués)
         avis_collection = self.mongodb_service.get_collection("avis_critiques")
-        total_avis = avis_collection.count_documents(
-            {"episode_oid": {"$nin": masked_episode_oids}}
-        )
-
-        # Compter les avis critiques distincts dans le cache (excluant les épisodes masqués)
-        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
-        treated_avis_ids = cache_collection.distinct(
-            "avis_critique_id", {"episode_oid": {"$nin": masked_episode_oids}}
-        )
-        treated_count = len(treated_avis_ids)
-
-        return int(total_avis - treated_count)
-
-    def _get_untreated_count_with_treated_ids(
-        self, treated_avis_ids: list, masked_episode_oids: list | None = None
-    ) -> int:
+        pipeline: list[dict[str, Any]] = [
+            {"$match": VISIBLE_AVIS_CRITIQUES_FILTER},
+            # localField tableau : correspond à l'un ou l'autre type (index)
+            {"$project": {"cache_keys": ["$_id", {"$toString": "$_id"}]}},
+            {
+                "$lookup": {
+                    "from": "livresauteurs_cache",
+                    "localField": "cache_keys",
+                    "foreignField": "avis_critique_id",
+                    "pipeline": [
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "cache",
+                }
+            },
+            {
+                "$group": {
+                    "_id": None,
+                    "total": {"$sum": 1},
+                    "analyzed": {
+                        "$sum": {"$cond": [{"$gt": [{"$size": "$cache"}, 0]}, 1, 0]}
+                    },
+                }
+            },
+        ]
+        result = list(avis_collection.aggregate(pipeline))
+        if not result:
+            return 0, 0
+        return int(result[0]["total"]), int(result[0]["analyzed"])
+
+    def _count_episodes_sans_emission(self) -> int:
         """
-        Compte les avis critiques non encore traités (optimisé avec IDs déjà calculés).
+        Compte les épisodes non masqués avec avis critique mais sans émission.
 
-        Args:
-            treated_avis_ids: Liste des avis_critique_id déjà traités
-            masked_episode_oids: Liste des OIDs d'épisodes masqués (optionnel)
+        Anti-jointure avis_critiques → emissions (index episode_id) sur la
+        clé typée avis_critiques.episode_id (ObjectId des deux côtés), avec
+        repli sur episode_oid pour les avis critiques pas encore rattrapés.
 
         Returns:
-            Nombre d'avis critiques non traités
+            Nombre d'épisodes sans émission
         """
-        if masked_episode_oids is None:
-            # Récupérer les IDs des épisodes masqués si non fournis
-            episodes_collection = self.mongodb_service.get_collection("episodes")
-            masked_episodes = list(
-                episodes_collection.find({"masked": True}, {"_id": 1})
-            )
-            masked_episode_oids = [str(ep["_id"]) for ep in masked_episodes]
-
-        # Compter le total d'avis critiques (excluant les épisodes masqués)
         avis_collection = self.mongodb_service.get_collection("avis_critiques")
-        total_avis = avis_collection.count_documents(
-            {"episode_oid": {"$nin": masked_episode_oids}}
-        )
+        pipeline: list[dict[str, Any]] = [
+            {"$match": VISIBLE_AVIS_CRITIQUES_FILTER},
+            {"$group": {"_id": typed_join_key("episode_oid", "episode_id")}},
+            {"$match": {"_id": {"$ne": None}}},
+            {
+                "$lookup": {
+                    "from": "emissions",
+                    "localField": "_id",
+                    "foreignField": "episode_id",
+                    "pipeline": [
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "emissions",
+                }
+            },
+            {"$match": {"emissions": {"$size": 0}}},
+            {"$count": "total"},
+        ]
+        result = list(avis_collection.aggregate(pipeline))
+        return int(result[0]["total"]) if result else 0
 
-        # Utiliser la liste déjà calculée
-        treated_count = len(treated_avis_ids)
+    def get_untreated_avis_critiques_count(self) -> int:
+        """
+        Compte les avis critiques non encore traités (pas dans le cache).
 
-        return int(total_avis - treated_count)
+        Returns:
+            Nombre d'avis critiques non traités
+        """
+        total_avis, analyzed_avis = self._count_analyzed_avis_critiques()
+        return total_avis - analyzed_avis
 
     def delete_cache_by_episode(self, episode_oid: str) -> int:
         """
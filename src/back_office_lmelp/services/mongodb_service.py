@@ -11,9 +11,126 @@ from pymongo import MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
 
+from ..models.episode import EPISODE_PROJECTIONS, EpisodeProfile
+from ..utils.join_keys import typed_join_fields
+from ..utils.keyset_pagination import (
+    InvalidCursorError,
+    cursor_for,
+    find_page,
+    find_tiered_page,
+    keyset_filter,
+)
+from ..utils.search_keys import (
+    search_shadow_fields,
+    search_shadow_unset,
+    search_tiers,
+    search_words,
+)
+from ..utils.snippets import SNIPPET_SCAN_WINDOW
+from .stats_snapshot_service import write_tracker
+
 
 load_dotenv()
 
+# Copie de episodes.masked dans avis_critiques (évite les $nin sur la liste
+# des épisodes masqués), maintenue par update_episode_masked_status()
+EPISODE_MASKED_FIELD = "episode_masked"
+# Avis critiques des épisodes visibles (champ absent = épisode visible)
+VISIBLE_AVIS_CRITIQUES_FILTER: dict[str, Any] = {EPISODE_MASKED_FIELD: {"$ne": True}}
+
+# Statistiques de la base, partagées par MongoDBService.get_statistics() et
+# AsyncMongoDBService.get_statistics() : clé → (collection, filtre compté)
+STATISTICS_COUNTS: dict[str, tuple[str, dict[str, Any]]] = {
+    "total_episodes": ("episodes", {"masked": {"$ne": True}}),
+    "masked_episodes_count": ("episodes", {"masked": True}),
+    # Titres et descriptions corrigés : original conservé dans *_origin
+    "episodes_with_corrected_titles": (
+        "episodes",
+        {"titre_origin": {"$ne": None, "$exists": True}},
+    ),
+    "episodes_with_corrected_descriptions": (
+        "episodes",
+        {"description_origin": {"$ne": None, "$exists": True}},
+    ),
+    # Avis critiques des épisodes visibles
+    "critical_reviews_count": ("avis_critiques", VISIBLE_AVIS_CRITIQUES_FILTER),
+}
+# Dernière mise à jour : date de l'épisode le plus récent (find_one trié)
+LAST_UPDATE_PROJECTION: dict[str, Any] = {"date": 1}
+LAST_UPDATE_SORT = [("date", -1)]
+
+
+def build_statistics(
+    counts: dict[str, int], last_episode: dict[str, Any] | None
+) -> dict[str, Any]:
+    """Assemble les statistiques (comptages de STATISTICS_COUNTS + dernière date)."""
+    last_update_date = None
+    date_obj = last_episode.get("date") if last_episode else None
+    if date_obj:
+        # Format ISO pour JSON
+        last_update_date = (
+            date_obj.isoformat() if hasattr(date_obj, "isoformat") else str(date_obj)
+        )
+    return {**counts, "last_update_date": last_update_date}
+
+
+# Tris des recherches paginées par curseur (dernier champ unique)
+EPISODES_SEARCH_SORT = [("date", -1), ("_id", -1)]
+EMISSIONS_SEARCH_SORT = [("date", -1), ("_id", -1)]
+# rang (0 début de mot, 1 milieu de mot) puis _id = nom après $group
+EDITEURS_SEARCH_SORT = [("rang", 1), ("_id", 1)]
+ID_SORT = [("_id", 1)]
+
+
+def _transcription_expr(expr: dict[str, Any]) -> dict[str, Any]:
+    """Expression sur la transcription si c'est une String, sinon 0 / ""."""
+    default: Any = 0 if "$strLenCP" in expr else ""
+    return {
+        "$cond": [
+            {"$eq": [{"$type": "$transcription"}, "string"]},
+            expr,
+            default,
+        ]
+    }
+
+
+# Page de search_episodes : champs affichés, début de la transcription
+# (fenêtre des extraits sans index) et sa longueur, pas la transcription
+EPISODES_SEARCH_PROJECTION: dict[str, Any] = {
+    "titre": 1,
+    "titre_corrige": 1,
+    "description": 1,
+    "description_corrigee": 1,
+    "date": 1,
+    "transcription": _transcription_expr(
+        {"$substrCP": ["$transcription", 0, SNIPPET_SCAN_WINDOW]}
+    ),
+    "transcription_len": _transcription_expr({"$strLenCP": "$transcription"}),
+}
+
+
+def episodes_without_avis_critiques_stages() -> list[dict[str, Any]]:
+    """Anti-jointure episodes → avis_critiques (épisodes sans avis critique).
+
+    Le $lookup s'arrête au premier avis trouvé et utilise l'index
+    avis_critiques.episode_id (clé typée ObjectId, voir utils/join_keys.py).
+    """
+    return [
+        {
+            "$lookup": {
+                "from": "avis_critiques",
+                "localField": "_id",
+                "foreignField": "episode_id",
+                "pipeline": [
+                    {"$limit": 1},
+                    {"$project": {"_id": 1}},
+                ],
+                "as": "avis_critiques",
+            }
+        },
+        {"$match": {"avis_critiques": {"$size": 0}}},
+    ]
+
 
 class MongoDBService:
     """Service pour interagir avec la base MongoDB."""
@@ -38,7 +155,8 @@ class MongoDBService:
     def connect(self) -> bool:
         """Établit la connexion à MongoDB."""
         try:
-            self.client = MongoClient(self.mongo_url)
+            # write_tracker : invalidation du snapshot des statistiques
+            self.client = MongoClient(self.mongo_url, event_listeners=[write_tracker])
             # Test de connexion
             self.client.admin.command("ping")
             self.db = self.client.get_default_database()
@@ -100,16 +218,7 @@ class MongoDBService:
 
             episodes = list(
                 self.episodes_collection.find(
-                    query_filter,
-                    {
-                        "titre": 1,
-                        "titre_corrige": 1,
-                        "date": 1,
-                        "type": 1,
-                        "duree": 1,
-                        "masked": 1,
-                        "_id": 1,
-                    },
+                    query_filter, EPISODE_PROJECTIONS["summary"]
                 ).sort([("date", -1)])
             )
 
@@ -122,13 +231,26 @@ class MongoDBService:
             print(f"Erreur lors de la récupération des épisodes: {e}")
             return []
 
-    def get_episode_by_id(self, episode_id: str) -> dict[str, Any] | None:
-        """Récupère un épisode par son ID."""
+    def get_episode_by_id(
+        self, episode_id: str, profile: EpisodeProfile = "full"
+    ) -> dict[str, Any] | None:
+        """Récupère un épisode par son ID.
+
+        Args:
+            episode_id: ID de l'épisode
+            profile: Profil de projection ("summary", "detail" ou "full").
+                Utiliser le plus étroit possible : "full" charge la transcription.
+
+        Returns:
+            L'épisode (champs du profil) ou None
+        """
         if self.episodes_collection is None:
             raise Exception("Connexion MongoDB non établie")
 
         try:
-            episode = self.episodes_collection.find_one({"_id": ObjectId(episode_id)})
+            episode = self.episodes_collection.find_one(
+                {"_id": ObjectId(episode_id)}, EPISODE_PROJECTIONS[profile]
+            )
             if episode:
                 # Cast pour satisfaire MyPy
                 episode_dict: dict[str, Any] = dict(episode)
@@ -139,6 +261,34 @@ class MongoDBService:
             print(f"Erreur lors de la récupération de l'épisode {episode_id}: {e}")
             return None
 
+    def get_episodes_by_ids(
+        self, episode_ids: list[str], profile: EpisodeProfile = "summary"
+    ) -> dict[str, dict[str, Any]]:
+        """Récupère plusieurs épisodes en une requête $in.
+
+        Args:
+            episode_ids: IDs des épisodes (les IDs invalides sont ignorés)
+            profile: Profil de projection ("summary", "detail" ou "full")
+
+        Returns:
+            Dict episode_id (str) → épisode (champs du profil)
+        """
+        if self.episodes_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        oids = [ObjectId(eid) for eid in set(episode_ids) if ObjectId.is_valid(eid)]
+        if not oids:
+            return {}
+
+        episodes: dict[str, dict[str, Any]] = {}
+        for episode in self.episodes_collection.find(
+            {"_id": {"$in": oids}}, EPISODE_PROJECTIONS[profile]
+        ):
+            episode_dict: dict[str, Any] = dict(episode)
+            episode_dict["_id"] = str(episode_dict["_id"])
+            episodes[episode_dict["_id"]] = episode_dict
+        return episodes
+
     def delete_episode(self, episode_id: str) -> bool:
         """Supprime un épisode et toutes ses données associées.
 
@@ -196,6 +346,8 @@ class MongoDBService:
             print(
                 f"Mise à jour de {livres_update_result.modified_count} livres pour retirer l'épisode {episode_id}"
             )
+            if livres_update_result.modified_count:
+                self.refresh_emission_badges_for_episodes([episode_id])
 
             # 3. Supprimer l'épisode lui-même
             episode_delete_result = self.episodes_collection.delete_one(
@@ -206,6 +358,10 @@ class MongoDBService:
                 print(f"Épisode {episode_id} non trouvé")
                 return False
 
+            from .episode_search_index import episode_search_index
+
+            episode_search_index.remove_episode(episode_id)
+
             print(f"Épisode {episode_id} supprimé avec succès")
             return True
 
@@ -225,6 +381,12 @@ class MongoDBService:
                 {"_id": ObjectId(episode_id)},
                 {"$set": {"description_corrigee": description_corrigee}},
             )
+            if result.modified_count > 0:
+                from .episode_search_index import episode_search_index
+
+                episode_search_index.update_fields(
+                    episode_id, {"description_corrigee": description_corrigee}
+                )
             return bool(result.modified_count > 0)
         except Exception as e:
             print(f"Erreur lors de la mise à jour de l'épisode {episode_id}: {e}")
@@ -248,6 +410,10 @@ class MongoDBService:
                 {"_id": ObjectId(episode_id)},
                 {"$set": update_data},
             )
+            if result.modified_count > 0:
+                from .episode_search_index import episode_search_index
+
+                episode_search_index.update_fields(episode_id, update_data)
             return bool(result.modified_count > 0 or result.matched_count > 0)
         except Exception as e:
             print(f"Erreur lors de la mise à jour de l'épisode {episode_id}: {e}")
@@ -278,6 +444,12 @@ class MongoDBService:
                 {"_id": ObjectId(episode_id)},
                 {"$set": {"masked": masked}},
             )
+            # Recopie dénormalisée dans les avis critiques de l'épisode
+            if result.matched_count > 0 and self.avis_critiques_collection is not None:
+                self.avis_critiques_collection.update_many(
+                    {"episode_oid": episode_id},
+                    {"$set": {EPISODE_MASKED_FIELD: masked}},
+                )
             # Utilise matched_count au lieu de modified_count pour l'idempotence
             return bool(result.matched_count > 0)
         except Exception as e:
@@ -286,6 +458,48 @@ class MongoDBService:
             )
             return False
 
+    def sync_episode_masked_flags(self) -> int:
+        """Resynchronise avis_critiques.episode_masked avec episodes.masked.
+
+        Rattrape les avis critiques écrits hors de l'application (pipeline
+        lmelp) ou antérieurs au champ. Les épisodes masqués sont peu nombreux :
+        la liste de leurs IDs reste petite.
+
+        Returns:
+            Nombre d'avis critiques corrigés
+        """
+        if self.episodes_collection is None or self.avis_critiques_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        masked_episode_oids = [
+            str(ep["_id"])
+            for ep in self.episodes_collection.find({"masked": True}, {"_id": 1})
+        ]
+        masked = self.avis_critiques_collection.update_many(
+            {
+                "episode_oid": {"$in": masked_episode_oids},
+                EPISODE_MASKED_FIELD: {"$ne": True},
+            },
+            {"$set": {EPISODE_MASKED_FIELD: True}},
+        )
+        # Avis marqués masqués dont l'épisode a été démasqué entre-temps
+        masked_set = set(masked_episode_oids)
+        stale_ids = [
+            avis["_id"]
+            for avis in self.avis_critiques_collection.find(
+                {EPISODE_MASKED_FIELD: True}, {"episode_oid": 1}
+            )
+            if avis.get("episode_oid") not in masked_set
+        ]
+        unmasked_count = 0
+        if stale_ids:
+            unmasked = self.avis_critiques_collection.update_many(
+                {"_id": {"$in": stale_ids}},
+                {"$set": {EPISODE_MASKED_FIELD: False}},
+            )
+            unmasked_count = unmasked.modified_count
+        return int(masked.modified_count + unmasked_count)
+
     def insert_episode(self, episode_data: dict[str, Any]) -> str:
         """Insère un nouvel épisode."""
         if self.episodes_collection is None:
@@ -322,6 +536,25 @@ class MongoDBService:
             print(f"Erreur lors de la récupération des avis critiques: {e}")
             return []
 
+    def get_avis_critique_ids_by_episode(self) -> dict[str, str]:
+        """Indexe les avis critiques par épisode en une requête projetée.
+
+        Returns:
+            Dict episode_oid → _id (str) de l'avis critique le plus récent
+        """
+        if self.avis_critiques_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        avis_ids: dict[str, str] = {}
+        for avis in self.avis_critiques_collection.find(
+            {"episode_oid": {"$ne": None}}, {"_id": 1, "episode_oid": 1}
+        ).sort("created_at", -1):
+            episode_oid = avis.get("episode_oid")
+            if episode_oid:
+                # Tri décroissant : le premier avis rencontré est le plus récent
+                avis_ids.setdefault(str(episode_oid), str(avis["_id"]))
+        return avis_ids
+
     def get_critical_reviews_by_episode_oid(
         self, episode_oid: str
     ) -> list[dict[str, Any]]:
@@ -378,6 +611,32 @@ class MongoDBService:
             )
             return None
 
+    def get_existing_avis_critique_ids(self, avis_critique_ids: list[str]) -> set[str]:
+        """
+        Retourne, parmi les IDs fournis, ceux qui existent dans avis_critiques.
+
+        Args:
+            avis_critique_ids: IDs à vérifier (les IDs invalides sont ignorés)
+
+        Returns:
+            Ensemble des IDs existants (string)
+        """
+        if self.avis_critiques_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        oids = [
+            ObjectId(aid) for aid in set(avis_critique_ids) if ObjectId.is_valid(aid)
+        ]
+        if not oids:
+            return set()
+
+        return {
+            str(doc["_id"])
+            for doc in self.avis_critiques_collection.find(
+                {"_id": {"$in": oids}}, {"_id": 1}
+            )
+        }
+
     def get_avis_critique_by_episode_oid(
         self, episode_oid: str
     ) -> dict[str, Any] | None:
@@ -428,6 +687,15 @@ class MongoDBService:
             # Convertir en ObjectId
             oid = ObjectId(avis_critique_id)
 
+            # Summary modifié : recalculer les critiques détectés/manquants
+            if "summary" in updates:
+                from .critiques_status_service import critiques_status_for_summary
+
+                updates = {
+                    **updates,
+                    **critiques_status_for_summary(self, updates["summary"]),
+                }
+
             result = self.avis_critiques_collection.update_one(
                 {"_id": oid}, {"$set": updates}
             )
@@ -440,88 +708,48 @@ class MongoDBService:
             return False
 
     def get_statistics(self) -> dict[str, Any]:
-        """Récupère les statistiques de la base de données."""
+        """Récupère les statistiques de la base de données (STATISTICS_COUNTS)."""
         if self.episodes_collection is None or self.avis_critiques_collection is None:
             raise Exception("Connexion MongoDB non établie")
 
         try:
-            # Total des épisodes (visibles uniquement)
-            total_episodes = self.episodes_collection.count_documents(
-                {"masked": {"$ne": True}}
-            )
-
-            # Nombre d'épisodes masqués
-            masked_episodes_count = self.episodes_collection.count_documents(
-                {"masked": True}
-            )
-
-            # Épisodes avec titres corrigés (maintenant dans titre_origin)
-            episodes_with_corrected_titles = self.episodes_collection.count_documents(
-                {"titre_origin": {"$ne": None, "$exists": True}}
-            )
-
-            # Épisodes avec descriptions corrigées (maintenant dans description_origin)
-            episodes_with_corrected_descriptions = (
-                self.episodes_collection.count_documents(
-                    {"description_origin": {"$ne": None, "$exists": True}}
-                )
-            )
-
-            # Nombre total d'avis critiques (excluant les épisodes masqués)
-            # Récupérer les IDs des épisodes masqués
-            masked_episodes = list(
-                self.episodes_collection.find({"masked": True}, {"_id": 1})
-            )
-            masked_episode_oids = [str(ep["_id"]) for ep in masked_episodes]
-
-            critical_reviews_count = self.avis_critiques_collection.count_documents(
-                {"episode_oid": {"$nin": masked_episode_oids}}
-            )
-
-            # Dernière date de mise à jour (basée sur l'épisode le plus récent)
-            # Utilisation de l'aggregation pour trouver la plus récente date
-            pipeline: list[dict[str, Any]] = [
-                {"$sort": {"date": -1}},
-                {"$limit": 1},
-                {"$project": {"date": 1}},
-            ]
-
-            last_update_result = list(self.episodes_collection.aggregate(pipeline))
-            last_update_date = None
-            if last_update_result:
-                date_obj = last_update_result[0].get("date")
-                if date_obj:
-                    # Convertir en format ISO string pour JSON
-                    last_update_date = (
-                        date_obj.isoformat()
-                        if hasattr(date_obj, "isoformat")
-                        else str(date_obj)
-                    )
-
-            return {
-                "total_episodes": total_episodes,
-                "masked_episodes_count": masked_episodes_count,
-                "episodes_with_corrected_titles": episodes_with_corrected_titles,
-                "episodes_with_corrected_descriptions": episodes_with_corrected_descriptions,
-                "critical_reviews_count": critical_reviews_count,
-                "last_update_date": last_update_date,
+            collections = {
+                "episodes": self.episodes_collection,
+                "avis_critiques": self.avis_critiques_collection,
+            }
+            counts = {
+                key: collections[name].count_documents(query_filter)
+                for key, (name, query_filter) in STATISTICS_COUNTS.items()
             }
+            last_episode = self.episodes_collection.find_one(
+                {}, LAST_UPDATE_PROJECTION, sort=LAST_UPDATE_SORT
+            )
+            return build_statistics(counts, last_episode)
         except Exception as e:
             print(f"Erreur lors de la récupération des statistiques: {e}")
             raise
 
     def search_episodes(
-        self, query: str, limit: int = 10, offset: int = 0
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Recherche textuelle insensible aux accents et caractères typographiques dans les épisodes.
 
         Args:
             query: Terme de recherche (ex: "etranger" trouvera "L'Étranger")
             limit: Nombre maximum de résultats à retourner
-            offset: Offset pour la pagination
+            offset: Offset pour la pagination (ignoré si cursor est fourni)
+            cursor: Curseur de la page précédente (next_cursor)
 
         Returns:
-            Dict avec clés "episodes" (liste de résultats) et "total_count"
+            Dict avec clés "episodes" (liste de résultats), "total_count" et
+            "next_cursor" (None sur la dernière page)
+
+        Raises:
+            InvalidCursorError: Si le curseur est invalide
 
         Note:
             Issue #173: Recherche insensible aux accents et caractères typographiques
@@ -534,37 +762,44 @@ class MongoDBService:
 
         try:
             from ..utils.text_utils import create_accent_insensitive_regex
+            from .episode_search_index import episode_search_index
 
             query_stripped = query.strip()
 
-            # Créer un regex insensible aux accents et caractères typographiques (Issue #173)
-            regex_pattern = create_accent_insensitive_regex(query_stripped)
-
-            # Recherche dans les champs titre, description et transcription
-            search_query = {
-                "$or": [
-                    {"titre": {"$regex": regex_pattern, "$options": "i"}},
-                    {"titre_corrige": {"$regex": regex_pattern, "$options": "i"}},
-                    {"description": {"$regex": regex_pattern, "$options": "i"}},
-                    {
-                        "description_corrigee": {
-                            "$regex": regex_pattern,
-                            "$options": "i",
-                        }
-                    },
-                    {"transcription": {"$regex": regex_pattern, "$options": "i"}},
-                ]
-            }
-
-            # Compter le nombre total de résultats
-            total_count = self.episodes_collection.count_documents(search_query)
-
-            # Récupérer les résultats avec skip et limit
-            episodes = list(
-                self.episodes_collection.find(search_query)
-                .sort([("date", -1)])
-                .skip(offset)
-                .limit(limit)
+            # Index inversé en mémoire : ids et total sans parcourir les
+            # transcriptions (regex MongoDB tant qu'il n'est pas prêt)
+            hits = episode_search_index.search(query_stripped)
+            if hits is not None:
+                search_query: dict[str, Any] = {
+                    "_id": {"$in": [ObjectId(episode_id) for episode_id in hits]}
+                }
+                total_count = len(hits)
+            else:
+                # Regex insensible aux accents et caractères typographiques (Issue #173)
+                regex_pattern = create_accent_insensitive_regex(query_stripped)
+                search_query = {
+                    "$or": [
+                        {field: {"$regex": regex_pattern, "$options": "i"}}
+                        for field in (
+                            "titre",
+                            "titre_corrige",
+                            "description",
+                            "description_corrigee",
+                            "transcription",
+                        )
+                    ]
+                }
+                total_count = self.episodes_collection.count_documents(search_query)
+
+            # Page par curseur (keyset) ou, à défaut, par offset
+            episodes, next_cursor = find_page(
+                self.episodes_collection,
+                search_query,
+                EPISODES_SEARCH_SORT,
+                limit,
+                offset=offset,
+                cursor=cursor,
+                projection=EPISODES_SEARCH_PROJECTION,
             )
 
             # Conversion ObjectId simple - score minimal pour compatibility frontend
@@ -577,8 +812,16 @@ class MongoDBService:
                 episode["score"] = 1.0
                 episode["match_type"] = "found"
 
-                # Extraire le contexte de recherche
-                episode["search_context"] = self._extract_search_context(query, episode)
+                # Extrait de recherche et occurrences à surligner
+                snippet, highlights = self._episode_snippet(
+                    query_stripped,
+                    episode,
+                    hits.get(episode["_id"]) if hits is not None else None,
+                )
+                episode["search_context"] = snippet
+                episode["search_highlights"] = [list(span) for span in highlights]
+                episode.pop("transcription", None)
+                episode.pop("transcription_len", None)
 
                 # Enrichir avec emission_date pour lien cliquable vers /emissions/YYYYMMDD
                 emission_date_str = None
@@ -592,7 +835,13 @@ class MongoDBService:
 
                 results.append(episode)
 
-            return {"episodes": results, "total_count": total_count}
+            return {
+                "episodes": results,
+                "total_count": total_count,
+                "next_cursor": next_cursor,
+            }
+        except InvalidCursorError:
+            raise
         except Exception as e:
             print(f"Erreur lors de la recherche d'épisodes: {e}")
             return {"episodes": [], "total_count": 0}
@@ -658,18 +907,62 @@ class MongoDBService:
             print(f"Erreur lors de la recherche dans les avis critiques: {e}")
             return {"auteurs": [], "livres": [], "editeurs": []}
 
+    def _entity_search_tiers(
+        self, collection: Collection, field: str, query: str
+    ) -> tuple[list[dict[str, Any]], list[int | None]]:
+        """Filtres de recherche d'entités par rang et nombre de résultats connus.
+
+        Premier rang : préfixe ou début de mot sur les champs normalisés
+        (utils/search_keys.py, parcours d'index), compté. Second rang : regex
+        insensible aux accents (Issue #92) pour les correspondances au milieu
+        d'un mot, hors documents du premier rang ; parcours complet, il n'est
+        ni compté ni lu tant que la page demandée ne l'atteint pas.
+
+        Args:
+            collection: Collection recherchée
+            field: Champ recherché (nom, titre...)
+            query: Terme saisi (non vide)
+
+        Returns:
+            Tuple (filtres MongoDB par rang, [nombre du premier rang, None])
+        """
+        tiers = search_tiers(field, query)
+        return tiers, [int(collection.count_documents(tiers[0])), None]
+
+    @staticmethod
+    def _tiered_search_total(
+        counts: list[int | None], offset: int, page_size: int
+    ) -> int:
+        """Total d'une recherche par rangs : exact au premier rang, minorant ensuite.
+
+        Le second rang n'étant pas compté, le total est le nombre du premier
+        rang, ou les résultats déjà servis jusqu'à cette page s'ils sont plus
+        nombreux (has_more indique s'il en reste).
+        """
+        return max(counts[0] or 0, offset + page_size)
+
     def search_auteurs(
-        self, query: str, limit: int = 10, offset: int = 0
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Recherche textuelle insensible aux accents dans la collection auteurs.
 
         Args:
             query: Terme de recherche (ex: "carrere" trouvera "Carrère")
             limit: Nombre maximum de résultats à retourner
-            offset: Offset pour la pagination
+            offset: Offset pour la pagination (ignoré si cursor est fourni)
+            cursor: Curseur de la page précédente (next_cursor)
 
         Returns:
-            Dict avec clés "auteurs" (liste de résultats) et "total_count"
+            Dict avec clés "auteurs" (liste de résultats), "total_count"
+            (minorant au-delà des débuts de mot, voir _tiered_search_total),
+            "has_more" et "next_cursor" (None sur la dernière page)
+
+        Raises:
+            InvalidCursorError: Si le curseur est invalide
         """
         if self.auteurs_collection is None:
             raise Exception("Connexion MongoDB non établie")
@@ -678,22 +971,21 @@ class MongoDBService:
             return {"auteurs": [], "total_count": 0}
 
         try:
-            from ..utils.text_utils import create_accent_insensitive_regex
-
-            query_stripped = query.strip()
-
-            # Créer un regex insensible aux accents (Issue #92)
-            regex_pattern = create_accent_insensitive_regex(query_stripped)
-
-            # Recherche dans le champ nom avec regex insensible aux accents
-            search_query = {"nom": {"$regex": regex_pattern, "$options": "i"}}
-
-            # Compter le nombre total de résultats
-            total_count = self.auteurs_collection.count_documents(search_query)
+            # Début de mot via nom_normalise / nom_mots (indexés), sans accents,
+            # puis milieu de mot (regex)
+            tiers, counts = self._entity_search_tiers(
+                self.auteurs_collection, "nom", query.strip()
+            )
 
-            # Récupérer les résultats avec skip et limit
-            auteurs = list(
-                self.auteurs_collection.find(search_query).skip(offset).limit(limit)
+            # Page par curseur (keyset) ou, à défaut, par offset
+            auteurs, next_cursor = find_tiered_page(
+                self.auteurs_collection,
+                tiers,
+                ID_SORT,
+                limit,
+                offset=offset,
+                cursor=cursor,
+                counts=counts,
             )
 
             # Conversion ObjectId en string
@@ -702,23 +994,42 @@ class MongoDBService:
                 auteur["_id"] = str(auteur["_id"])
                 results.append(auteur)
 
-            return {"auteurs": results, "total_count": total_count}
+            return {
+                "auteurs": results,
+                "total_count": self._tiered_search_total(
+                    counts, 0 if cursor else offset, len(results)
+                ),
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            }
+        except InvalidCursorError:
+            raise
         except Exception as e:
             print(f"Erreur lors de la recherche d'auteurs: {e}")
             return {"auteurs": [], "total_count": 0}
 
     def search_livres(
-        self, query: str, limit: int = 10, offset: int = 0
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Recherche textuelle insensible aux accents dans la collection livres.
 
         Args:
             query: Terme de recherche (ex: "emonet" trouvera "Émonet")
             limit: Nombre maximum de résultats à retourner
-            offset: Offset pour la pagination
+            offset: Offset pour la pagination (ignoré si cursor est fourni)
+            cursor: Curseur de la page précédente (next_cursor)
 
         Returns:
-            Dict avec clés "livres" (liste de résultats) et "total_count"
+            Dict avec clés "livres" (liste de résultats), "total_count"
+            (minorant au-delà des débuts de mot, voir _tiered_search_total),
+            "has_more" et "next_cursor" (None sur la dernière page)
+
+        Raises:
+            InvalidCursorError: Si le curseur est invalide
         """
         if self.livres_collection is None:
             raise Exception("Connexion MongoDB non établie")
@@ -727,22 +1038,21 @@ class MongoDBService:
             return {"livres": [], "total_count": 0}
 
         try:
-            from ..utils.text_utils import create_accent_insensitive_regex
-
-            query_stripped = query.strip()
-
-            # Créer un regex insensible aux accents (Issue #92)
-            regex_pattern = create_accent_insensitive_regex(query_stripped)
-
-            # Recherche uniquement dans le champ titre avec regex insensible aux accents
-            search_query = {"titre": {"$regex": regex_pattern, "$options": "i"}}
-
-            # Compter le nombre total de résultats
-            total_count = self.livres_collection.count_documents(search_query)
+            # Début de mot du titre via titre_normalise / titre_mots (indexés),
+            # puis milieu de mot (regex)
+            tiers, counts = self._entity_search_tiers(
+                self.livres_collection, "titre", query.strip()
+            )
 
-            # Récupérer les résultats avec skip et limit
-            livres = list(
-                self.livres_collection.find(search_query).skip(offset).limit(limit)
+            # Page par curseur (keyset) ou, à défaut, par offset
+            livres, next_cursor = find_tiered_page(
+                self.livres_collection,
+                tiers,
+                ID_SORT,
+                limit,
+                offset=offset,
+                cursor=cursor,
+                counts=counts,
             )
 
             # Conversion ObjectId en string et enrichissement avec nom auteur
@@ -774,7 +1084,16 @@ class MongoDBService:
 
                 results.append(livre)
 
-            return {"livres": results, "total_count": total_count}
+            return {
+                "livres": results,
+                "total_count": self._tiered_search_total(
+                    counts, 0 if cursor else offset, len(results)
+                ),
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            }
+        except InvalidCursorError:
+            raise
         except Exception as e:
             print(f"Erreur lors de la recherche de livres: {e}")
             return {"livres": [], "total_count": 0}
@@ -831,58 +1150,52 @@ class MongoDBService:
             auteur_data = result[0]
             livres = auteur_data.get("livres", [])
 
-            # Issue #190: Pour chaque livre, récupérer les avis et émissions
+            # Notes moyennes : une lecture de livre_stats pour tous les livres
+            livre_stats = self.get_livre_stats(
+                [livre["_id"] for livre in livres], projection={"note_moyenne": 1}
+            )
+
+            # Émissions de tous les livres en une requête (épisode → émission)
+            emissions_by_episode: dict[str, dict[str, Any]] = {}
+            episode_oids = [
+                ObjectId(ep_id)
+                for livre in livres
+                for ep_id in livre.get("episodes", [])
+                if ep_id
+            ]
+            if episode_oids and self.emissions_collection is not None:
+                for em in self.emissions_collection.find(
+                    {"episode_id": {"$in": episode_oids}}
+                ):
+                    emissions_by_episode[str(em.get("episode_id"))] = em
+
+            # Issue #190: Pour chaque livre, note moyenne et émissions
             livres_formatted = []
             for livre in livres:
                 livre_id_str = str(livre["_id"])
+                note_moyenne = livre_stats.get(livre_id_str, {}).get("note_moyenne")
 
-                # Récupérer les avis pour ce livre
-                livre_notes: list[float] = []
-                if self.avis_collection is not None:
-                    livre_avis = list(
-                        self.avis_collection.find({"livre_oid": livre_id_str})
-                    )
-                    livre_notes = [
-                        float(a["note"])
-                        for a in livre_avis
-                        if a.get("note") is not None
-                    ]
-
-                note_moyenne = (
-                    round(sum(livre_notes) / len(livre_notes), 1)
-                    if livre_notes
-                    else None
-                )
-
-                # Récupérer les émissions via les épisodes du livre
-                episode_strs = livre.get("episodes", [])
                 emissions_formatted: list[dict[str, Any]] = []
                 max_emission_date = ""
+                for ep_id in livre.get("episodes", []):
+                    em = emissions_by_episode.get(str(ep_id))
+                    if em is None:
+                        continue
+                    em_date = em.get("date")
+                    if isinstance(em_date, datetime):
+                        date_str = em_date.strftime("%Y-%m-%d")
+                    else:
+                        date_str = str(em_date or "")[:10]
 
-                if episode_strs and self.emissions_collection is not None:
-                    episode_oids = [ObjectId(ep_id) for ep_id in episode_strs if ep_id]
-                    if episode_oids:
-                        emissions_docs = list(
-                            self.emissions_collection.find(
-                                {"episode_id": {"$in": episode_oids}}
-                            )
-                        )
-                        for em in emissions_docs:
-                            em_date = em.get("date")
-                            if isinstance(em_date, datetime):
-                                date_str = em_date.strftime("%Y-%m-%d")
-                            else:
-                                date_str = str(em_date or "")[:10]
-
-                            emissions_formatted.append(
-                                {
-                                    "emission_id": str(em["_id"]),
-                                    "date": date_str,
-                                }
-                            )
+                    emissions_formatted.append(
+                        {
+                            "emission_id": str(em["_id"]),
+                            "date": date_str,
+                        }
+                    )
 
-                            if date_str > max_emission_date:
-                                max_emission_date = date_str
+                    if date_str > max_emission_date:
+                        max_emission_date = date_str
 
                 # Trier les émissions par date décroissante
                 emissions_formatted.sort(key=lambda x: x.get("date", ""), reverse=True)
@@ -966,28 +1279,17 @@ class MongoDBService:
                                 }
                             },
                             # Lookup pour récupérer le champ programme depuis livresauteurs_cache
+                            # (clé typée episode_id, index episode_id + book_id)
                             {
                                 "$lookup": {
                                     "from": "livresauteurs_cache",
-                                    "let": {"episode_oid": {"$toString": "$_id"}},
+                                    "localField": "_id",
+                                    "foreignField": "episode_id",
                                     "pipeline": [
                                         {
                                             "$match": {
                                                 "$expr": {
-                                                    "$and": [
-                                                        {
-                                                            "$eq": [
-                                                                "$episode_oid",
-                                                                "$$episode_oid",
-                                                            ]
-                                                        },
-                                                        {
-                                                            "$eq": [
-                                                                "$book_id",
-                                                                "$$livre_id",
-                                                            ]
-                                                        },
-                                                    ]
+                                                    "$eq": ["$book_id", "$$livre_id"]
                                                 }
                                             }
                                         },
@@ -1067,27 +1369,11 @@ class MongoDBService:
                     ep_id_str = str(em["episode_id"])
                     emissions_by_episode[ep_id_str] = em
 
-            # Issue #190: Récupérer les avis pour ce livre
-            all_avis: list[dict[str, Any]] = []
-            if self.avis_collection is not None:
-                all_avis = list(self.avis_collection.find({"livre_oid": livre_id}))
-
-            # Grouper les avis par emission_oid
-            avis_by_emission: dict[str, list[float]] = {}
-            all_notes: list[float] = []
-            for avis in all_avis:
-                note = avis.get("note")
-                if note is not None:
-                    all_notes.append(float(note))
-                    em_oid = avis.get("emission_oid", "")
-                    if em_oid not in avis_by_emission:
-                        avis_by_emission[em_oid] = []
-                    avis_by_emission[em_oid].append(float(note))
-
-            # Note moyenne globale
-            note_moyenne = (
-                round(sum(all_notes) / len(all_notes), 1) if all_notes else None
-            )
+            # Issue #190: Notes du livre, matérialisées dans livre_stats
+            stats = self.get_livre_stats([livre_id]).get(livre_id, {})
+            stats_by_emission = {
+                em["emission_id"]: em for em in stats.get("emissions", [])
+            }
 
             # Construire la liste des émissions triées par date décroissante
             emissions_list = []
@@ -1104,57 +1390,20 @@ class MongoDBService:
                         date_str = str(em_date or "")[:10]
 
                     # Notes pour cette émission
-                    em_notes = avis_by_emission.get(em_id_str, [])
-                    em_note_moyenne = (
-                        round(sum(em_notes) / len(em_notes), 1) if em_notes else None
-                    )
+                    em_stats = stats_by_emission.get(em_id_str, {})
 
                     emissions_list.append(
                         {
                             "emission_id": em_id_str,
                             "date": date_str,
-                            "note_moyenne": em_note_moyenne,
-                            "nombre_avis": len(em_notes),
+                            "note_moyenne": em_stats.get("note_moyenne"),
+                            "nombre_avis": em_stats.get("nombre_avis", 0),
                         }
                     )
 
             # Trier par date décroissante
             emissions_list.sort(key=lambda x: str(x.get("date", "")), reverse=True)
 
-            # Issue #200: Build Calibre-style tags from avis data
-            # Build emissions_by_id map for tag generation
-            emissions_by_id: dict[str, dict[str, Any]] = {}
-            for em in emissions_by_episode.values():
-                em_id_str = str(em["_id"])
-                emissions_by_id[em_id_str] = em
-
-            # Build critiques_by_id for official critic names
-            # critique_oid is String in avis, but _id is ObjectId in critiques
-            critiques_by_id: dict[str, str] = {}
-            critique_oid_strs = {
-                a.get("critique_oid", "") for a in all_avis if a.get("critique_oid")
-            }
-            if critique_oid_strs and self.critiques_collection is not None:
-                from bson import ObjectId as BsonObjectId
-
-                critique_object_ids = []
-                for oid in critique_oid_strs:
-                    with contextlib.suppress(Exception):
-                        critique_object_ids.append(BsonObjectId(oid))
-
-                if critique_object_ids:
-                    critiques_docs = list(
-                        self.critiques_collection.find(
-                            {"_id": {"$in": critique_object_ids}}
-                        )
-                    )
-                    for c in critiques_docs:
-                        critiques_by_id[str(c["_id"])] = c.get("nom", "")
-
-            calibre_tags = self._build_calibre_tags(
-                all_avis, emissions_by_id, critiques_by_id=critiques_by_id
-            )
-
             # Issue #189: Résoudre editeur - soit string, soit via editeur_id
             editeur_nom = livre_data.get("editeur", "")
             if (
@@ -1176,67 +1425,22 @@ class MongoDBService:
                 "editeur": editeur_nom,
                 "url_babelio": livre_data.get("url_babelio"),
                 "url_cover": livre_data.get("url_cover"),  # Issue #242
-                "note_moyenne": note_moyenne,
+                "note_moyenne": stats.get("note_moyenne"),
                 "nombre_emissions": len(emissions_list),
                 "emissions": emissions_list,
-                "calibre_tags": calibre_tags,
+                # Issue #200: tags Calibre, matérialisés dans livre_stats
+                "calibre_tags": stats.get("calibre_tags", []),
             }
 
         except Exception as e:
             print(f"Erreur lors de la récupération du livre {livre_id}: {e}")
             return None
 
-    def _build_calibre_tags(
-        self,
-        all_avis: list[dict[str, Any]],
-        emissions_by_id: dict[str, dict[str, Any]],
-        critiques_by_id: dict[str, str] | None = None,
-    ) -> list[str]:
-        """Build Calibre-style tags from avis data (Issue #200).
-
-        Returns list of tags:
-        - lmelp_yyMMdd for each emission date (chronological order)
-        - lmelp_prenom_nom for each coup de coeur critic (alphabetical order)
-
-        When critiques_by_id is provided, uses the official critique name
-        (resolved via critique_oid) instead of critique_nom_extrait (LLM name).
-        """
-        date_tags: set[str] = set()
-        critic_tags: set[str] = set()
-
-        for avis in all_avis:
-            # Get emission date for lmelp_yyMMdd tag
-            em_oid = avis.get("emission_oid", "")
-            emission = emissions_by_id.get(em_oid)
-            if emission:
-                em_date = emission.get("date")
-                if isinstance(em_date, datetime):
-                    date_tag = f"lmelp_{em_date.strftime('%y%m%d')}"
-                    date_tags.add(date_tag)
-
-            # Get critic name for coup_de_coeur → lmelp_prenom_nom
-            if avis.get("section") == "coup_de_coeur":
-                # Prefer official name via critique_oid over LLM-extracted name
-                critic_name = ""
-                critique_oid = avis.get("critique_oid", "")
-                if critique_oid and critiques_by_id:
-                    critic_name = critiques_by_id.get(critique_oid, "")
-                if not critic_name:
-                    critic_name = avis.get("critique_nom_extrait", "")
-                if critic_name:
-                    from ..utils.text_utils import normalize_for_matching
-
-                    normalized = normalize_for_matching(critic_name)
-                    tag = "lmelp_" + normalized.replace(" ", "_")
-                    critic_tags.add(tag)
-
-        # Sort: dates chronologically, critics alphabetically
-        return sorted(date_tags) + sorted(critic_tags)
-
     def get_expected_calibre_tags(self, livre_ids: list[str]) -> dict[str, list[str]]:
         """Compute expected Calibre lmelp_ tags for multiple livres in bulk.
 
-        Uses the same logic as _build_calibre_tags() but for multiple livres.
+        Tags are materialized in livre_stats (livre_stats_service.build_calibre_tags()),
+        so this is a single read on _id.
 
         Args:
             livre_ids: List of livre _id strings.
@@ -1244,169 +1448,152 @@ class MongoDBService:
         Returns:
             Dict mapping livre_id → list of expected lmelp_ tags.
         """
-        if not livre_ids or self.avis_collection is None:
+        if not livre_ids:
             return {}
 
         try:
-            # Bulk fetch all avis for these livres
-            all_avis = list(
-                self.avis_collection.find({"livre_oid": {"$in": livre_ids}})
-            )
-            if not all_avis:
-                return {}
-
-            # Collect all emission_oid references
-            emission_oids = {
-                avis.get("emission_oid", "")
-                for avis in all_avis
-                if avis.get("emission_oid")
-            }
-
-            # Bulk fetch emissions
-            from bson import ObjectId as BsonObjectId
-
-            emissions_by_id: dict[str, dict[str, Any]] = {}
-            if emission_oids and self.emissions_collection is not None:
-                emission_object_ids = []
-                for oid in emission_oids:
-                    with contextlib.suppress(Exception):
-                        emission_object_ids.append(BsonObjectId(oid))
-
-                if emission_object_ids:
-                    emissions = list(
-                        self.emissions_collection.find(
-                            {"_id": {"$in": emission_object_ids}}
-                        )
-                    )
-                    for em in emissions:
-                        emissions_by_id[str(em["_id"])] = em
-
-            # Bulk fetch critiques for official critic names
-            # critique_oid is String in avis, but _id is ObjectId in critiques
-            critiques_by_id: dict[str, str] = {}
-            critique_oid_strs = {
-                avis.get("critique_oid", "")
-                for avis in all_avis
-                if avis.get("critique_oid")
+            stats = self.get_livre_stats(livre_ids, projection={"calibre_tags": 1})
+            return {
+                livre_id: doc["calibre_tags"]
+                for livre_id, doc in stats.items()
+                if doc.get("calibre_tags")
             }
-            if critique_oid_strs and self.critiques_collection is not None:
-                critique_object_ids = []
-                for oid in critique_oid_strs:
-                    with contextlib.suppress(Exception):
-                        critique_object_ids.append(BsonObjectId(oid))
-
-                if critique_object_ids:
-                    critiques_docs = list(
-                        self.critiques_collection.find(
-                            {"_id": {"$in": critique_object_ids}}
-                        )
-                    )
-                    for c in critiques_docs:
-                        critiques_by_id[str(c["_id"])] = c.get("nom", "")
-
-            # Group avis by livre_oid
-            avis_by_livre: dict[str, list[dict[str, Any]]] = {}
-            for avis in all_avis:
-                livre_oid = avis.get("livre_oid", "")
-                if livre_oid:
-                    avis_by_livre.setdefault(livre_oid, []).append(avis)
-
-            # Build tags for each livre using existing _build_calibre_tags
-            result: dict[str, list[str]] = {}
-            for livre_id in livre_ids:
-                livre_avis = avis_by_livre.get(livre_id, [])
-                if livre_avis:
-                    tags = self._build_calibre_tags(
-                        livre_avis,
-                        emissions_by_id,
-                        critiques_by_id=critiques_by_id,
-                    )
-                    if tags:
-                        result[livre_id] = tags
-
-            return result
 
         except Exception as e:
             print(f"Erreur get_expected_calibre_tags: {e}")
             return {}
 
     def search_editeurs(
-        self, query: str, limit: int = 10, offset: int = 0
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Recherche textuelle insensible aux accents dans editeurs.nom ET livres.editeur.
 
+        Les deux sources sont réunies côté serveur ($unionWith) et dédupliquées
+        par nom ($group) : la pagination porte sur les éditeurs uniques. Les
+        débuts de mot sur les champs normalisés (index) sont servis d'abord,
+        puis les correspondances au milieu d'un mot (regex insensible aux
+        accents), chaque rang trié par nom. Le second rang (parcours complet)
+        n'est agrégé que si la page demandée l'atteint.
+
         Args:
             query: Terme de recherche (ex: "flammarion")
             limit: Nombre maximum de résultats à retourner
-            offset: Offset pour la pagination
+            offset: Offset pour la pagination (ignoré si cursor est fourni)
+            cursor: Curseur de la page précédente (next_cursor)
 
         Returns:
-            Dict avec clés "editeurs" (liste de résultats) et "total_count"
+            Dict avec clés "editeurs" (liste de résultats), "total_count"
+            (débuts de mot seuls tant que le second rang n'est pas agrégé),
+            "has_more" et "next_cursor" (None sur la dernière page)
+
+        Raises:
+            InvalidCursorError: Si le curseur est invalide
         """
-        if self.editeurs_collection is None or self.livres_collection is None:
+        editeurs_collection = self.editeurs_collection
+        livres_collection = self.livres_collection
+        if editeurs_collection is None or livres_collection is None:
             raise Exception("Connexion MongoDB non établie")
 
         if not query or len(query.strip()) == 0:
             return {"editeurs": [], "total_count": 0}
 
         try:
-            from ..utils.text_utils import create_accent_insensitive_regex
-
             query_stripped = query.strip()
+            after = keyset_filter(EDITEURS_SEARCH_SORT, cursor) if cursor else None
+
+            # Rangs par collection : début de mot sur nom / editeur normalisés
+            # (index editeurs.nom_mots, livres.editeur_mots), puis milieu de
+            # mot (regex, Issue #92). Un même nom a le même rang dans les deux
+            # collections : les rangs restent disjoints après dédoublonnage.
+            editeurs_tiers = search_tiers("nom", query_stripped)
+            livres_tiers = search_tiers("editeur", query_stripped)
+
+            def rank_page(rang: int, skip: int, wanted: int) -> tuple[int, list[Any]]:
+                """Éditeurs uniques d'un rang : nombre total et page triée par nom."""
+                page_stages: list[dict[str, Any]] = [
+                    {"$sort": dict(EDITEURS_SEARCH_SORT)}
+                ]
+                if after is not None:
+                    page_stages.append({"$match": after})
+                if skip:
+                    page_stages.append({"$skip": skip})
+                page_stages.append({"$limit": wanted})
+                pipeline: list[dict[str, Any]] = [
+                    # 1. Éditeurs de la collection editeurs
+                    {"$match": editeurs_tiers[rang]},
+                    {"$project": {"nom": 1}},
+                    # 2. Éditeurs cités dans livres.editeur (sans _id d'éditeur)
+                    {
+                        "$unionWith": {
+                            "coll": livres_collection.name,
+                            "pipeline": [
+                                {"$match": livres_tiers[rang]},
+                                {"$project": {"_id": 0, "nom": "$editeur"}},
+                            ],
+                        }
+                    },
+                    # 3. Dédupliquer par nom (l'_id d'éditeur est gardé s'il existe)
+                    {"$match": {"nom": {"$type": "string", "$ne": ""}}},
+                    {"$group": {"_id": "$nom", "editeur_id": {"$max": "$_id"}}},
+                    {"$set": {"rang": {"$literal": rang}}},
+                    {
+                        "$facet": {
+                            "total": [{"$count": "count"}],
+                            "page": page_stages,
+                        }
+                    },
+                ]
+                facet: dict[str, Any] = next(
+                    iter(editeurs_collection.aggregate(pipeline)), {}
+                )
+                total = facet.get("total", [])
+                return (int(total[0]["count"]) if total else 0), facet.get("page", [])
+
+            # Page par curseur (keyset sur rang puis nom) ou, à défaut, par offset
+            skip = 0 if cursor else offset
+            total_count, rows = rank_page(0, skip, limit + 1)
+            if len(rows) <= limit:
+                # Page non remplie par les débuts de mot : milieu de mot
+                infix_count, infix_rows = rank_page(
+                    1, max(skip - total_count, 0), limit + 1 - len(rows)
+                )
+                total_count += infix_count
+                rows += infix_rows
 
-            # Créer un regex insensible aux accents (Issue #92)
-            regex_pattern = create_accent_insensitive_regex(query_stripped)
-
-            search_query = {"nom": {"$regex": regex_pattern, "$options": "i"}}
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = cursor_for(rows[-1], EDITEURS_SEARCH_SORT)
 
-            # 1. Recherche dans collection editeurs
-            editeurs_from_collection = list(
-                self.editeurs_collection.find(search_query).skip(offset).limit(limit)
-            )
+            results = []
+            for row in rows:
+                editeur: dict[str, Any] = {"nom": row["_id"]}
+                if row.get("editeur_id"):
+                    editeur["_id"] = str(row["editeur_id"])
+                results.append(editeur)
 
-            # 2. Recherche dans livres.editeur
-            livres_search_query = {
-                "editeur": {"$regex": regex_pattern, "$options": "i"}
+            return {
+                "editeurs": results,
+                "total_count": total_count,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
             }
-            livres_with_editeur = list(
-                self.livres_collection.find(livres_search_query)
-                .skip(offset)
-                .limit(limit)
-            )
-
-            # 3. Combiner et dédupliquer
-            editeurs_set = set()
-            results = []
-
-            # Ajouter éditeurs de la collection editeurs
-            for editeur in editeurs_from_collection:
-                editeur["_id"] = str(editeur["_id"])
-                editeur_nom = editeur.get("nom")
-                if editeur_nom and editeur_nom not in editeurs_set:
-                    editeurs_set.add(editeur_nom)
-                    results.append(editeur)
-
-            # Ajouter éditeurs depuis livres.editeur
-            for livre in livres_with_editeur:
-                editeur_nom = livre.get("editeur")
-                if editeur_nom and editeur_nom not in editeurs_set:
-                    editeurs_set.add(editeur_nom)
-                    results.append({"nom": editeur_nom})
-
-            # Total = nombre d'éditeurs UNIQUES après déduplication
-            # (pas la somme brute des deux collections)
-            total_count = len(editeurs_set)
-
-            # Respecter la limite
-            results = results[:limit]
-
-            return {"editeurs": results, "total_count": total_count}
+        except InvalidCursorError:
+            raise
         except Exception as e:
             print(f"Erreur lors de la recherche d'éditeurs: {e}")
             return {"editeurs": [], "total_count": 0}
 
     def search_emissions(
-        self, query: str, limit: int = 10, offset: int = 0
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Recherche textuelle dans les émissions via les sources canoniques.
 
@@ -1419,114 +1606,181 @@ class MongoDBService:
         sont des extractions LLM non canoniques et peuvent différer des titres
         Babelio (ex: "4 jours" vs "Quatre jours").
 
+        Nombre de requêtes borné, indépendant du nombre d'auteurs ou de livres
+        matchés : _id des livres et auteurs matchés, livres des auteurs en un
+        seul $in, émissions distinctes des avis matchés (distinct), page
+        d'émissions, puis avis et titres des livres de cette page seulement.
+
+        Comme pour les auteurs et les livres, les émissions des livres et
+        auteurs matchés en début de mot (index) sont servies d'abord, triées
+        par date ; celles matchées seulement au milieu d'un mot (regex,
+        parcours complet) ne sont cherchées que si la page les atteint.
+
         Args:
             query: Terme de recherche (ex: "Camus" trouvera "Albert Camus")
             limit: Nombre maximum de résultats à retourner
-            offset: Offset pour la pagination
+            offset: Offset pour la pagination (ignoré si cursor est fourni)
+            cursor: Curseur de la page précédente (next_cursor)
 
         Returns:
-            Dict avec clés "emissions" (liste de résultats) et "total_count"
+            Dict avec clés "emissions" (liste de résultats), "total_count"
+            (minorant tant que le milieu de mot n'est pas cherché), "has_more"
+            et "next_cursor" (None sur la dernière page)
+
+        Raises:
+            InvalidCursorError: Si le curseur est invalide
         """
-        if self.avis_collection is None or self.emissions_collection is None:
+        avis_collection = self.avis_collection
+        if avis_collection is None or self.emissions_collection is None:
             raise Exception("Connexion MongoDB non établie")
 
         if not query or len(query.strip()) == 0:
             return {"emissions": [], "total_count": 0}
 
         try:
-            from bson import ObjectId
-
+            from ..utils.snippets import find_spans
             from ..utils.text_utils import create_accent_insensitive_regex
 
             query_stripped = query.strip()
             regex_pattern = create_accent_insensitive_regex(query_stripped)
             regex_query = {"$regex": regex_pattern, "$options": "i"}
 
-            # Collecter les avis matchés par ID pour déduplication
-            matching_avis_by_id: dict[str, dict[str, Any]] = {}
-
-            # Pass 1 : avis dont le commentaire matche (directement canonique)
-            for avis in self.avis_collection.find({"commentaire": regex_query}):
-                avis_id = str(avis["_id"])
-                matching_avis_by_id[avis_id] = avis
-
-            # Pass 2 : livres dont le titre ou l'éditeur matche → avis liés via livre_oid
-            if self.livres_collection is not None:
-                matching_livres = list(
-                    self.livres_collection.find(
-                        {
-                            "$or": [
-                                {"titre": regex_query},
-                                {"editeur": regex_query},
-                            ]
-                        }
+            def matched_livre_ids(rang: int) -> list[ObjectId]:
+                """Livres matchés (_id seuls) au rang donné de search_tiers().
+
+                Titre ou éditeur (pass 2), puis livres des auteurs dont le nom
+                matche (pass 3, un seul $in).
+                """
+                if self.livres_collection is None:
+                    return []
+                ids = [
+                    livre["_id"]
+                    for field in ("titre", "editeur")
+                    for livre in self.livres_collection.find(
+                        search_tiers(field, query_stripped)[rang], {"_id": 1}
                     )
-                )
-                if matching_livres:
-                    # livres._id est ObjectId, avis.livre_oid est String
-                    livre_ids_str = [str(livre["_id"]) for livre in matching_livres]
-                    for avis in self.avis_collection.find(
-                        {"livre_oid": {"$in": livre_ids_str}}
-                    ):
-                        avis_id = str(avis["_id"])
-                        matching_avis_by_id[avis_id] = avis
-
-            # Pass 3 : auteurs dont le nom matche → livres liés → avis liés
-            if (
-                self.auteurs_collection is not None
-                and self.livres_collection is not None
-            ):
-                matching_auteurs = list(
-                    self.auteurs_collection.find({"nom": regex_query})
-                )
-                if matching_auteurs:
-                    for auteur in matching_auteurs:
-                        # livres.auteur_id est ObjectId, auteurs._id est ObjectId
-                        auteur_livres = list(
-                            self.livres_collection.find({"auteur_id": auteur["_id"]})
+                ]
+                if self.auteurs_collection is not None:
+                    auteur_ids = [
+                        auteur["_id"]
+                        for auteur in self.auteurs_collection.find(
+                            search_tiers("nom", query_stripped)[rang], {"_id": 1}
                         )
-                        if auteur_livres:
-                            auteur_livre_ids_str = [
-                                str(livre["_id"]) for livre in auteur_livres
-                            ]
-                            for avis in self.avis_collection.find(
-                                {"livre_oid": {"$in": auteur_livre_ids_str}}
-                            ):
-                                avis_id = str(avis["_id"])
-                                matching_avis_by_id[avis_id] = avis
-
-            matching_avis = list(matching_avis_by_id.values())
-            total_avis_count = len(matching_avis)
+                    ]
+                    if auteur_ids:
+                        # livres.auteur_id et auteurs._id sont des ObjectId
+                        ids.extend(
+                            livre["_id"]
+                            for livre in self.livres_collection.find(
+                                {"auteur_id": {"$in": auteur_ids}}, {"_id": 1}
+                            )
+                        )
+                return ids
+
+            def matched_emission_ids(match: dict[str, Any]) -> list[ObjectId]:
+                """Émissions distinctes (clé typée avis.emission_id) : ids seuls."""
+                return [
+                    emission_id
+                    for emission_id in avis_collection.distinct("emission_id", match)
+                    if isinstance(emission_id, ObjectId)
+                ]
 
-            if total_avis_count == 0:
-                return {"emissions": [], "total_count": 0}
+            # Avis matchés : commentaire (pass 1, seul champ avis canonique)
+            # ou livre matché (clé typée avis.livre_id)
+            livre_ids = matched_livre_ids(0)
+
+            def avis_match() -> dict[str, Any]:
+                return {
+                    "$or": [{"commentaire": regex_query}]
+                    + (
+                        [{"livre_id": {"$in": list(set(livre_ids))}}]
+                        if livre_ids
+                        else []
+                    )
+                }
 
-            # Dédupliquer par emission_oid, collecter les livres/auteurs matchés
-            emissions_map: dict[str, list[dict[str, Any]]] = {}
-            for avis in matching_avis:
-                emission_oid = avis.get("emission_oid")
-                if not emission_oid:
-                    continue
-                if emission_oid not in emissions_map:
-                    emissions_map[emission_oid] = []
-                emissions_map[emission_oid].append(avis)
-
-            # Nombre total d'émissions uniques
-            total_count = len(emissions_map)
-
-            if total_count == 0:
-                return {"emissions": [], "total_count": 0}
-
-            # Récupérer les émissions (avec conversion String → ObjectId, CRITIQUE)
-            emission_oids_as_objectid = [ObjectId(oid) for oid in emissions_map if oid]
-            emissions_docs = list(
-                self.emissions_collection.find(
-                    {"_id": {"$in": emission_oids_as_objectid}}
-                ).sort("date", -1)
+            # Premier rang : commentaire ou livre matché en début de mot
+            word_start_ids = matched_emission_ids(avis_match())
+            infix_ids: list[ObjectId] | None = None
+
+            def infix_query() -> dict[str, Any] | None:
+                """Second rang : émissions des livres matchés au milieu d'un mot."""
+                nonlocal infix_ids
+                infix_ids = []
+                infix_livre_ids = matched_livre_ids(1)
+                if not infix_livre_ids:
+                    return None
+                livre_ids.extend(infix_livre_ids)
+                seen = set(word_start_ids)
+                infix_ids = [
+                    emission_id
+                    for emission_id in matched_emission_ids(
+                        {"livre_id": {"$in": list(set(infix_livre_ids))}}
+                    )
+                    if emission_id not in seen
+                ]
+                return {"_id": {"$in": infix_ids}} if infix_ids else None
+
+            # Seule la page demandée est lue (curseur keyset ou offset)
+            paginated_emissions, next_cursor = find_tiered_page(
+                self.emissions_collection,
+                [{"_id": {"$in": word_start_ids}}, infix_query],
+                EMISSIONS_SEARCH_SORT,
+                limit,
+                offset=offset,
+                cursor=cursor,
+                projection={"date": 1},
+                counts=[len(word_start_ids), None],
             )
+            if infix_ids is not None:
+                total_count = len(word_start_ids) + len(infix_ids)
+            else:
+                total_count = self._tiered_search_total(
+                    [len(word_start_ids), None],
+                    0 if cursor else offset,
+                    len(paginated_emissions),
+                )
+            if not paginated_emissions:
+                return {
+                    "emissions": [],
+                    "total_count": total_count,
+                    "has_more": False,
+                    "next_cursor": next_cursor,
+                }
 
-            # Paginer sur les émissions triées
-            paginated_emissions = emissions_docs[offset : offset + limit]
+            # Contexte de la page : avis matchés des émissions de la page,
+            # puis vrais titres de leurs livres (une requête chacun)
+            emissions_map: dict[str, list[dict[str, Any]]] = {}
+            for avis in avis_collection.find(
+                {
+                    **avis_match(),
+                    "emission_id": {
+                        "$in": [emission["_id"] for emission in paginated_emissions]
+                    },
+                },
+                {
+                    "emission_id": 1,
+                    "livre_oid": 1,
+                    "livre_id": 1,
+                    "auteur_nom_extrait": 1,
+                    "livre_titre_extrait": 1,
+                    "commentaire": 1,
+                },
+            ):
+                emissions_map.setdefault(str(avis["emission_id"]), []).append(avis)
+
+            livres_titles: dict[str, str] = {}
+            page_livre_ids = {
+                avis["livre_id"]
+                for matched_avis in emissions_map.values()
+                for avis in matched_avis
+                if isinstance(avis.get("livre_id"), ObjectId)
+            }
+            if page_livre_ids and self.livres_collection is not None:
+                for livre in self.livres_collection.find(
+                    {"_id": {"$in": list(page_livre_ids)}}, {"titre": 1}
+                ):
+                    livres_titles[str(livre["_id"])] = livre.get("titre", "")
 
             results = []
             for emission in paginated_emissions:
@@ -1541,26 +1795,8 @@ class MongoDBService:
                 # Construire le contexte depuis les avis matchés pour cette émission
                 matched_avis = emissions_map.get(emission_id_str, [])
 
-                # Pré-charger les vrais titres depuis livres_collection (batch)
-                livre_oids = [
-                    avis.get("livre_oid")
-                    for avis in matched_avis
-                    if avis.get("livre_oid")
-                ]
-                livres_titles: dict[str, str] = {}
-                if livre_oids and self.livres_collection is not None:
-                    livre_oids_as_objectid = [
-                        ObjectId(oid) for oid in livre_oids if oid
-                    ]
-                    for livre in self.livres_collection.find(
-                        {"_id": {"$in": livre_oids_as_objectid}},
-                        {"titre": 1},
-                    ):
-                        livres_titles[str(livre["_id"])] = livre.get("titre", "")
-
                 context_parts = []
                 seen_books: set[str] = set()
-                query_lower = query_stripped.lower()
                 for avis in matched_avis:
                     auteur = avis.get("auteur_nom_extrait", "")
                     livre_oid = avis.get("livre_oid", "")
@@ -1580,11 +1816,15 @@ class MongoDBService:
                         else:
                             book_label = ""
                         # Si le match vient du commentaire, ajouter l'extrait
-                        commentaire_lower = commentaire.lower() if commentaire else ""
-                        if commentaire and query_lower in commentaire_lower:
-                            idx = commentaire_lower.find(query_lower)
+                        spans = (
+                            find_spans(commentaire, query_stripped, max_hits=1)
+                            if isinstance(commentaire, str)
+                            else []
+                        )
+                        if spans:
+                            [(idx, idx_end)] = spans
                             start = max(0, idx - 30)
-                            end = min(len(commentaire), idx + len(query_stripped) + 30)
+                            end = min(len(commentaire), idx_end + 30)
                             snippet = commentaire[start:end].strip()
                             if start > 0:
                                 snippet = "..." + snippet
@@ -1607,7 +1847,14 @@ class MongoDBService:
                     }
                 )
 
-            return {"emissions": results, "total_count": total_count}
+            return {
+                "emissions": results,
+                "total_count": total_count,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor,
+            }
+        except InvalidCursorError:
+            raise
         except Exception as e:
             print(f"Erreur lors de la recherche d'émissions: {e}")
             return {"emissions": [], "total_count": 0}
@@ -1715,60 +1962,104 @@ class MongoDBService:
 
         return 0.0
 
-    def _extract_search_context(self, query: str, episode: dict[str, Any]) -> str:
-        """Extrait le contexte de recherche avec 10 mots avant et après le terme trouvé."""
+    def _episode_snippet(
+        self,
+        query: str,
+        episode: dict[str, Any],
+        field_hits: dict[str, list[tuple[int, int]]] | None = None,
+    ) -> tuple[str, list[tuple[int, int]]]:
+        """Extrait de recherche d'un épisode et occurrences à surligner.
+
+        Les occurrences viennent de l'index de recherche quand il est prêt
+        (premier champ trouvé, dans l'ordre de INDEXED_FIELDS) ; une
+        occurrence de la transcription hors de la fenêtre lue par la page
+        de résultats est relue seule ($substrCP). Sinon : regex dans le
+        début de chaque champ (find_spans).
 
-        query_lower = query.lower().strip()
+        Args:
+            query: Terme de recherche
+            episode: Épisode (transcription éventuellement tronquée, avec
+                transcription_len, voir EPISODES_SEARCH_PROJECTION)
+            field_hits: Occurrences de l'index par champ (search())
 
-        # Chercher dans titre, description, transcription par ordre de priorité
-        fields_to_search = [
-            episode.get("titre", ""),
-            episode.get("description", ""),
-            episode.get("transcription", ""),
-        ]
+        Returns:
+            (extrait, surlignages) : voir build_snippet
+        """
+        from ..utils.snippets import (
+            SNIPPET_MAX_HITS,
+            SNIPPET_WINDOW_AFTER,
+            build_snippet,
+            find_spans,
+        )
+        from .episode_search_index import INDEXED_FIELDS, episode_search_index
 
-        for text in fields_to_search:
-            if not text or not isinstance(text, str):
+        episode_id = str(episode.get("_id", ""))
+        for field in INDEXED_FIELDS:
+            occurrences = (field_hits or {}).get(field)
+            text = episode.get(field)
+            if not occurrences or not isinstance(text, str):
                 continue
+            occurrences = occurrences[:SNIPPET_MAX_HITS]
+            base = 0
+            length = len(text)
+            if field == "transcription":
+                length = int(episode.get("transcription_len") or len(text))
+                checkpoint = episode_search_index.checkpoint(
+                    episode_id, field, occurrences[0][0]
+                )
+                # Occurrence au-delà du début lu avec la page : fenêtre relue
+                if (
+                    checkpoint is not None
+                    and len(text) < length
+                    and checkpoint + SNIPPET_WINDOW_AFTER > len(text)
+                ):
+                    text, base = self._transcription_window(episode_id, checkpoint)
+            spans = episode_search_index.char_spans(
+                episode_id, field, text, occurrences, base
+            )
+            if spans:
+                return build_snippet(text, spans, base=base, length=length)
 
-            text_lower = text.lower()
-
-            # Vérifier si le terme est présent
-            if query_lower in text_lower:
-                # Trouver la position du terme
-                pos = text_lower.find(query_lower)
-
-                # Diviser en mots
-                words = text.split()
-
-                # Trouver l'index du mot contenant le terme
-                char_count = 0
-                word_index = -1
-
-                for i, word in enumerate(words):
-                    word_end = char_count + len(word)
-                    if char_count <= pos < word_end:
-                        word_index = i
-                        break
-                    char_count += len(word) + 1  # +1 pour l'espace
-
-                if word_index >= 0:
-                    # Extraire 10 mots avant et après
-                    start_word = max(0, word_index - 10)
-                    end_word = min(len(words), word_index + 11)
-
-                    context_words = words[start_word:end_word]
-                    context = " ".join(context_words)
-
-                    # Ajouter des ellipses si nécessaire
-                    if start_word > 0:
-                        context = "..." + context
-                    if end_word < len(words):
-                        context = context + "..."
-
-                    return context
+        for field in INDEXED_FIELDS:
+            text = episode.get(field)
+            if not isinstance(text, str) or not text:
+                continue
+            spans = find_spans(text, query)
+            if spans:
+                length = len(text)
+                if field == "transcription":
+                    length = int(episode.get("transcription_len") or length)
+                return build_snippet(text, spans, length=length)
+        return "", []
+
+    def _transcription_window(
+        self, episode_id: str, checkpoint: int
+    ) -> tuple[str, int]:
+        """Fenêtre de la transcription autour d'un repère d'offset (texte, base)."""
+        from ..utils.snippets import SNIPPET_WINDOW_AFTER, SNIPPET_WINDOW_BEFORE
+
+        base = max(0, checkpoint - SNIPPET_WINDOW_BEFORE)
+        doc = None
+        if self.episodes_collection is not None:
+            doc = self.episodes_collection.find_one(
+                {"_id": ObjectId(episode_id)},
+                {
+                    "extrait": _transcription_expr(
+                        {
+                            "$substrCP": [
+                                "$transcription",
+                                base,
+                                checkpoint - base + SNIPPET_WINDOW_AFTER,
+                            ]
+                        }
+                    )
+                },
+            )
+        return (doc or {}).get("extrait") or "", base
 
-        return ""
+    def _extract_search_context(self, query: str, episode: dict[str, Any]) -> str:
+        """Extrait le contexte de recherche avec 10 mots avant et après le terme trouvé."""
+        return self._episode_snippet(query.strip(), episode)[0]
 
     def _fuzzy_match_simple(self, query: str, word: str) -> bool:
         """Correspondance floue simple pour l'extraction de contexte."""
@@ -1819,6 +2110,10 @@ class MongoDBService:
                 {"_id": ObjectId(episode_id)},
                 {"$set": update_data},
             )
+            if result.modified_count > 0:
+                from .episode_search_index import episode_search_index
+
+                episode_search_index.update_fields(episode_id, {"titre": titre_corrige})
             return bool(result.modified_count > 0)
         except Exception as e:
             print(f"Erreur lors de la mise à jour du titre {episode_id}: {e}")
@@ -1855,6 +2150,12 @@ class MongoDBService:
                 {"_id": ObjectId(episode_id)},
                 {"$set": update_data},
             )
+            if result.modified_count > 0:
+                from .episode_search_index import episode_search_index
+
+                episode_search_index.update_fields(
+                    episode_id, {"description": description_corrigee}
+                )
             return bool(result.modified_count > 0)
         except Exception as e:
             print(f"Erreur lors de la mise à jour de la description {episode_id}: {e}")
@@ -1950,7 +2251,7 @@ class MongoDBService:
                         "editeur_id": editeur_oid,
                         "updated_at": datetime.now(),
                     }
-                    update_ops["$unset"] = {"editeur": ""}
+                    update_ops["$unset"] = search_shadow_unset("editeur")
 
                 # Issue #96 Bug Fix: Ajouter les nouveaux épisodes/avis_critiques avec $addToSet
                 # $addToSet évite les doublons automatiquement
@@ -1975,7 +2276,13 @@ class MongoDBService:
 
                 # Appliquer les mises à jour si nécessaire
                 if update_ops:
-                    self.livres_collection.update_one({"_id": book_id}, update_ops)
+                    update_result = self.livres_collection.update_one(
+                        {"_id": book_id}, update_ops
+                    )
+                    if "episodes" in addtoset_ops and update_result.modified_count:
+                        self.refresh_emission_badges_for_episodes(
+                            addtoset_ops["episodes"]["$each"]
+                        )
 
                 # S'assurer que l'auteur a la référence au livre existant
                 self._add_book_to_author(book_data["auteur_id"], book_id)
@@ -1995,6 +2302,13 @@ class MongoDBService:
             formatted_data = Book.for_mongodb_insert(insert_data)
             result = self.livres_collection.insert_one(formatted_data)
             book_id = ObjectId(result.inserted_id)
+            self.refresh_emission_badges_for_episodes(
+                [
+                    episode_id
+                    for episode_id in book_data.get("episodes", [])
+                    if episode_id
+                ]
+            )
 
             # Ajouter la référence du livre à l'auteur
             self._add_book_to_author(book_data["auteur_id"], book_id)
@@ -2007,6 +2321,254 @@ class MongoDBService:
             )
             raise
 
+    def create_authors_if_not_exist(self, noms: list[str]) -> dict[str, dict[str, Any]]:
+        """Crée en lot les auteurs qui n'existent pas encore.
+
+        Une recherche ($in sur nom) puis un seul bulk_write d'upserts sur nom
+        (deux traitements concurrents ne créent pas de doublon).
+
+        Args:
+            noms: Noms des auteurs (doublons et noms vides ignorés)
+
+        Returns:
+            Dict nom → {"author_id": ObjectId, "created": bool}
+        """
+        if self.auteurs_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        from pymongo import UpdateOne
+
+        from ..models.author import Author
+
+        unique_noms = list(dict.fromkeys(nom for nom in noms if nom))
+        if not unique_noms:
+            return {}
+
+        authors: dict[str, dict[str, Any]] = {
+            author["nom"]: {"author_id": ObjectId(author["_id"]), "created": False}
+            for author in self.auteurs_collection.find(
+                {"nom": {"$in": unique_noms}}, {"nom": 1}
+            )
+        }
+        missing = [nom for nom in unique_noms if nom not in authors]
+        if not missing:
+            return authors
+
+        result = self.auteurs_collection.bulk_write(
+            [
+                UpdateOne(
+                    {"nom": nom},
+                    {"$setOnInsert": Author.for_mongodb_insert({"nom": nom})},
+                    upsert=True,
+                )
+                for nom in missing
+            ],
+            ordered=False,
+        )
+        for index, upserted_id in (result.upserted_ids or {}).items():
+            authors[missing[index]] = {
+                "author_id": ObjectId(upserted_id),
+                "created": True,
+            }
+
+        # Créés entre-temps par un traitement concurrent
+        concurrent = [nom for nom in missing if nom not in authors]
+        if concurrent:
+            for author in self.auteurs_collection.find(
+                {"nom": {"$in": concurrent}}, {"nom": 1}
+            ):
+                authors[author["nom"]] = {
+                    "author_id": ObjectId(author["_id"]),
+                    "created": False,
+                }
+        return authors
+
+    def _resolve_editeur_ids(self, names: list[str]) -> dict[str, ObjectId]:
+        """Résout des noms d'éditeurs en editeur_id (un $in, création au besoin).
+
+        Les éditeurs absents de l'index nom_normalise (nouveaux) passent par
+        get_or_create_editeur().
+        """
+        if self.editeurs_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        from ..utils.text_utils import normalize_for_matching
+
+        normalized = {name: normalize_for_matching(name) for name in names if name}
+        if not normalized:
+            return {}
+
+        by_normalized = {
+            editeur["nom_normalise"]: ObjectId(editeur["_id"])
+            for editeur in self.editeurs_collection.find(
+                {"nom_normalise": {"$in": list(set(normalized.values()))}},
+                {"nom_normalise": 1},
+            )
+        }
+        editeur_ids: dict[str, ObjectId] = {}
+        for name, normalized_name in normalized.items():
+            if normalized_name not in by_normalized:
+                by_normalized[normalized_name], _ = self.get_or_create_editeur(name)
+            editeur_ids[name] = by_normalized[normalized_name]
+        return editeur_ids
+
+    def create_books_if_not_exist(
+        self, books_data: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Crée ou complète en lot des livres (même logique que create_book_if_not_exists).
+
+        Les livres existants (même titre + même auteur) sont lus en une requête,
+        puis un seul bulk_write applique les upserts : $setOnInsert pour les
+        nouveaux, $addToSet des épisodes/avis critiques pour tous, migration
+        editeur → editeur_id. Les références livres[] des auteurs sont ajoutées
+        par un second bulk_write (collection auteurs).
+
+        Args:
+            books_data: Livres (titre, auteur_id, editeur ou babelio_publisher,
+                episodes, avis_critiques, url_babelio)
+
+        Returns:
+            Résultat par livre, dans l'ordre : {"book_id": ObjectId, "created": bool}
+        """
+        if self.livres_collection is None or self.auteurs_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+        if not books_data:
+            return []
+
+        from pymongo import UpdateOne
+
+        from ..models.book import Book
+
+        editeur_names = {
+            index: (book.get("babelio_publisher") or book.get("editeur") or "").strip()
+            for index, book in enumerate(books_data)
+        }
+        editeur_ids = self._resolve_editeur_ids(list(set(editeur_names.values())))
+
+        # Regrouper les doublons du lot (même titre + même auteur)
+        groups: dict[tuple[str, ObjectId], dict[str, Any]] = {}
+        for index, book in enumerate(books_data):
+            key = (book["titre"], book["auteur_id"])
+            group = groups.setdefault(
+                key,
+                {
+                    "indexes": [],
+                    "data": book,
+                    "editeur_id": editeur_ids.get(editeur_names[index]),
+                    "episodes": [],
+                    "avis_critiques": [],
+                },
+            )
+            group["indexes"].append(index)
+            for field in ("episodes", "avis_critiques"):
+                for ref in book.get(field) or []:
+                    if ref and ref not in group[field]:
+                        group[field].append(ref)
+
+        existing = {
+            (book["titre"], book["auteur_id"]): book
+            for book in self.livres_collection.find(
+                {
+                    "titre": {"$in": list({key[0] for key in groups})},
+                    "auteur_id": {"$in": list({key[1] for key in groups})},
+                },
+                {"titre": 1, "auteur_id": 1, "editeur_id": 1},
+            )
+            if (book["titre"], book["auteur_id"]) in groups
+        }
+
+        now = datetime.now()
+        operations = []
+        operation_keys: list[tuple[str, ObjectId]] = []
+        for key in groups:
+            group = groups[key]
+            update: dict[str, Any] = {}
+            addtoset = {
+                field: {"$each": group[field]}
+                for field in ("episodes", "avis_critiques")
+                if group[field]
+            }
+            if addtoset:
+                update["$addToSet"] = addtoset
+
+            if key in existing:
+                # Issue #189: Migrer editeur string → editeur_id
+                if group["editeur_id"] and not existing[key].get("editeur_id"):
+                    update["$set"] = {
+                        "editeur_id": group["editeur_id"],
+                        "updated_at": now,
+                    }
+                    update["$unset"] = search_shadow_unset("editeur")
+                if update:
+                    operations.append(UpdateOne({"_id": existing[key]["_id"]}, update))
+                    operation_keys.append(key)
+                continue
+
+            insert_data = dict(group["data"])
+            if group["editeur_id"]:
+                insert_data["editeur_id"] = group["editeur_id"]
+                insert_data.pop("editeur", None)
+                insert_data.pop("babelio_publisher", None)
+            new_book = Book.for_mongodb_insert(insert_data)
+            for field in addtoset:
+                new_book.pop(field, None)
+            update["$setOnInsert"] = new_book
+            operations.append(
+                UpdateOne({"titre": key[0], "auteur_id": key[1]}, update, upsert=True)
+            )
+            operation_keys.append(key)
+
+        book_ids: dict[tuple[str, ObjectId], ObjectId] = {
+            key: ObjectId(book["_id"]) for key, book in existing.items()
+        }
+        created: set[tuple[str, ObjectId]] = set()
+        if operations:
+            result = self.livres_collection.bulk_write(operations, ordered=False)
+            for index, upserted_id in (result.upserted_ids or {}).items():
+                book_ids[operation_keys[index]] = ObjectId(upserted_id)
+                created.add(operation_keys[index])
+
+        # Créés entre-temps par un traitement concurrent
+        for key in groups:
+            if key not in book_ids:
+                concurrent = self.livres_collection.find_one(
+                    {"titre": key[0], "auteur_id": key[1]}, {"_id": 1}
+                )
+                if concurrent:
+                    book_ids[key] = ObjectId(concurrent["_id"])
+
+        # Références livres[] des auteurs, un bulk_write
+        livres_by_author: dict[ObjectId, list[str]] = {}
+        for key, book_id in book_ids.items():
+            livres_by_author.setdefault(key[1], []).append(str(book_id))
+        if livres_by_author:
+            self.auteurs_collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": author_id},
+                        {
+                            "$addToSet": {"livres": {"$each": livre_ids}},
+                            "$set": {"updated_at": now},
+                        },
+                    )
+                    for author_id, livre_ids in livres_by_author.items()
+                ],
+                ordered=False,
+            )
+
+        self.refresh_emission_badges_for_episodes(
+            list({ep for group in groups.values() for ep in group["episodes"]})
+        )
+
+        outcomes: list[dict[str, Any]] = [{} for _ in books_data]
+        for key, group in groups.items():
+            for index in group["indexes"]:
+                outcomes[index] = {
+                    "book_id": book_ids.get(key),
+                    "created": key in created,
+                }
+        return outcomes
+
     def get_books_by_validation_status(self, status: str) -> list[dict[str, Any]]:
         """Récupère les livres par statut de validation depuis le cache livresauteurs_cache."""
         cache_collection = self.get_collection("livresauteurs_cache")
@@ -2146,6 +2708,27 @@ class MongoDBService:
             )
             return None
 
+    def get_critical_reviews_by_episode_oids(
+        self, episode_oids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Récupère en une requête les avis critiques de plusieurs épisodes.
+
+        Args:
+            episode_oids: IDs des épisodes (String)
+
+        Returns:
+            Dict episode_oid → avis critique (premier trouvé par épisode)
+        """
+        if self.avis_critiques_collection is None or not episode_oids:
+            return {}
+
+        reviews: dict[str, dict[str, Any]] = {}
+        for review in self.avis_critiques_collection.find(
+            {"episode_oid": {"$in": list(set(episode_oids))}}
+        ):
+            reviews.setdefault(review["episode_oid"], dict(review))
+        return reviews
+
     # ========== EMISSIONS METHODS (Issue #154) ==========
 
     def get_all_emissions(self) -> list[dict[str, Any]]:
@@ -2203,25 +2786,22 @@ class MongoDBService:
             avis.get("summary", "")
         )
 
-        # 3. Matcher avec collection critiques
+        # 3. Matcher avec l'index des critiques
         if self.critiques_collection is None:
             return []
-        all_critiques = list(self.critiques_collection.find())
+        critique_index = critiques_extraction_service.get_critique_index(
+            self.critiques_collection
+        )
         matched_critiques = []
 
         for name in detected_names:
-            match = critiques_extraction_service.find_matching_critique(
-                name, all_critiques
-            )
+            match = critiques_extraction_service.match_critique(name, critique_index)
             if match:
-                critique_doc = next(
-                    c for c in all_critiques if c["nom"] == match["nom"]
-                )
                 matched_critiques.append(
                     {
-                        "id": str(critique_doc["_id"]),
-                        "nom": critique_doc["nom"],
-                        "animateur": critique_doc.get("animateur", False),
+                        "id": match["id"],
+                        "nom": match["nom"],
+                        "animateur": match["animateur"],
                     }
                 )
 
@@ -2248,9 +2828,9 @@ class MongoDBService:
     def get_all_critiques(self) -> list[dict[str, Any]]:
         """Retourne tous les critiques avec nombre_avis et note_moyenne (Issue #227).
 
-        Utilise un pipeline d'agrégation pour joindre la collection avis.
-        Note : avis.critique_oid est un String, critiques._id est un ObjectId —
-        la conversion via $toString est donc nécessaire pour le $lookup.
+        Les compteurs viennent d'un seul $group sur avis.critique_oid (parcours
+        couvert par l'index critique_oid + note), fusionné en Python avec les
+        critiques : aucun tableau d'avis n'est chargé par critique.
 
         Returns:
             Liste de critiques triés par nom, chacun avec les champs :
@@ -2259,27 +2839,31 @@ class MongoDBService:
         if self.critiques_collection is None:
             raise Exception("Connexion MongoDB non établie")
 
-        pipeline: list[dict[str, Any]] = [
-            {
-                "$lookup": {
-                    "from": "avis",
-                    "let": {"cid": {"$toString": "$_id"}},
-                    "pipeline": [
-                        {"$match": {"$expr": {"$eq": ["$critique_oid", "$$cid"]}}}
-                    ],
-                    "as": "avis_list",
-                }
-            },
-            {
-                "$addFields": {
-                    "nombre_avis": {"$size": "$avis_list"},
-                    "note_moyenne": {"$avg": "$avis_list.note"},
-                }
-            },
-            {"$project": {"avis_list": 0}},
-            {"$sort": {"nom": 1}},
-        ]
-        return list(self.critiques_collection.aggregate(pipeline))
+        counts: dict[str, dict[str, Any]] = {}
+        if self.avis_collection is not None:
+            counts = {
+                row["_id"]: row
+                for row in self.avis_collection.aggregate(
+                    [
+                        {"$match": {"critique_oid": {"$type": "string"}}},
+                        {"$project": {"_id": 0, "critique_oid": 1, "note": 1}},
+                        {
+                            "$group": {
+                                "_id": "$critique_oid",
+                                "nombre_avis": {"$sum": 1},
+                                "note_moyenne": {"$avg": "$note"},
+                            }
+                        },
+                    ]
+                )
+            }
+
+        critiques = list(self.critiques_collection.find().sort("nom", 1))
+        for critique in critiques:
+            row = counts.get(str(critique["_id"]), {})
+            critique["nombre_avis"] = row.get("nombre_avis", 0)
+            critique["note_moyenne"] = row.get("note_moyenne")
+        return critiques
 
     def merge_critiques(self, source_id: str, target_id: str) -> dict[str, Any]:
         """Fusionne le critique source dans le critique target (Issue #227).
@@ -2307,12 +2891,14 @@ class MongoDBService:
         if not source or not target:
             raise ValueError("Critique source ou target introuvable")
 
-        # 1. Remapper les avis (critique_oid est un String)
+        # 1. Remapper les avis (critique_oid String et critique_id typé)
         result = self.avis_collection.update_many(
             {"critique_oid": source_id},
-            {"$set": {"critique_oid": target_id}},
+            {"$set": {"critique_oid": target_id, "critique_id": ObjectId(target_id)}},
         )
         merged_avis = result.modified_count
+        # Notes par critique, coups de cœur et tags des livres concernés
+        self.refresh_livre_stats_for_critiques([target_id])
 
         # 2. Fusionner les variantes de source dans target (sans doublons)
         source_variantes: list[str] = source.get("variantes", [])
@@ -2336,6 +2922,11 @@ class MongoDBService:
         # 3. Supprimer le critique source
         self.critiques_collection.delete_one({"_id": ObjectId(source_id)})
 
+        # 4. Invalider l'index des critiques et recalculer les critiques manquants
+        from .critiques_status_service import rematch_critiques_status
+
+        rematch_critiques_status(self)
+
         return {
             "merged_avis": merged_avis,
             "deleted_critique": source_id,
@@ -2554,6 +3145,197 @@ class MongoDBService:
         except Exception:
             return None
 
+    def refresh_emission_badges(self, emission_oids: list[Any]) -> None:
+        """
+        Recalcule les badges matérialisés des émissions touchées par une écriture.
+
+        Ne lève jamais d'exception : un échec laisse le badge à reconstruire
+        (rebuild_emission_badges) sans faire échouer l'écriture d'origine.
+
+        Args:
+            emission_oids: IDs des émissions (str ou ObjectId)
+        """
+        if self.db is None or not emission_oids:
+            return
+        try:
+            from .emission_badge_service import refresh_emission_badges
+
+            refresh_emission_badges(self, emission_oids)
+        except Exception as e:
+            print(f"Erreur lors de la mise à jour des badges d'émission: {e}")
+
+    def refresh_emission_badges_for_episodes(self, episode_oids: list[Any]) -> None:
+        """
+        Recalcule les badges des émissions liées à des épisodes (livres.episodes).
+
+        Args:
+            episode_oids: IDs des épisodes (str ou ObjectId)
+        """
+        if self.db is None or not episode_oids:
+            return
+        try:
+            from .emission_badge_service import refresh_badges_for_episodes
+
+            refresh_badges_for_episodes(self, episode_oids)
+        except Exception as e:
+            print(f"Erreur lors de la mise à jour des badges d'émission: {e}")
+
+    def refresh_palmares(self, livre_oids: list[Any]) -> None:
+        """
+        Recalcule les entrées du palmarès des livres touchés par une écriture.
+
+        Ne lève jamais d'exception : un échec laisse l'entrée à reconstruire
+        (rebuild_palmares) sans faire échouer l'écriture d'origine.
+
+        Args:
+            livre_oids: IDs des livres (str ou ObjectId)
+        """
+        if self.db is None or not livre_oids:
+            return
+        try:
+            from .palmares_service import refresh_palmares
+
+            refresh_palmares(self, livre_oids)
+        except Exception as e:
+            print(f"Erreur lors de la mise à jour du palmarès: {e}")
+
+    def refresh_palmares_for_auteurs(self, auteur_oids: list[Any]) -> None:
+        """
+        Recalcule les entrées du palmarès des livres d'auteurs renommés.
+
+        Args:
+            auteur_oids: IDs des auteurs (str ou ObjectId)
+        """
+        if self.db is None or not auteur_oids:
+            return
+        try:
+            from .palmares_service import refresh_palmares_for_auteurs
+
+            refresh_palmares_for_auteurs(self, auteur_oids)
+        except Exception as e:
+            print(f"Erreur lors de la mise à jour du palmarès: {e}")
+
+    def rebuild_palmares(self) -> dict[str, int]:
+        """
+        Reconstruit entièrement le palmarès matérialisé.
+
+        Returns:
+            Dict avec "rebuilt" et "removed"
+        """
+        from .palmares_service import rebuild_palmares
+
+        return rebuild_palmares(self)
+
+    def refresh_livre_stats(self, livre_oids: list[Any]) -> None:
+        """
+        Recalcule les statistiques matérialisées des livres touchés par une écriture.
+
+        Ne lève jamais d'exception : un échec laisse les statistiques à
+        reconstruire (rebuild_livre_stats) sans faire échouer l'écriture d'origine.
+
+        Args:
+            livre_oids: IDs des livres (str ou ObjectId)
+        """
+        if self.db is None or not livre_oids:
+            return
+        try:
+            from .livre_stats_service import refresh_livre_stats
+
+            refresh_livre_stats(self, livre_oids)
+        except Exception as e:
+            print(f"Erreur lors de la mise à jour des statistiques de livre: {e}")
+
+    def delete_livre_stats(self, livre_oids: list[Any]) -> None:
+        """
+        Supprime les statistiques matérialisées de livres supprimés.
+
+        Ne lève jamais d'exception (voir refresh_livre_stats).
+
+        Args:
+            livre_oids: IDs des livres (str ou ObjectId)
+        """
+        if self.db is None or not livre_oids:
+            return
+        try:
+            from .livre_stats_service import delete_livre_stats
+
+            delete_livre_stats(self, livre_oids)
+        except Exception as e:
+            print(f"Erreur lors de la suppression des statistiques de livre: {e}")
+
+    def refresh_livre_stats_for_critiques(self, critique_oids: list[Any]) -> None:
+        """
+        Recalcule les statistiques des livres notés par des critiques fusionnés.
+
+        Args:
+            critique_oids: IDs des critiques (str ou ObjectId)
+        """
+        if self.db is None or not critique_oids:
+            return
+        try:
+            from .livre_stats_service import refresh_livre_stats_for_critiques
+
+            refresh_livre_stats_for_critiques(self, critique_oids)
+        except Exception as e:
+            print(f"Erreur lors de la mise à jour des statistiques de livre: {e}")
+
+    def rebuild_livre_stats(self) -> dict[str, int]:
+        """
+        Reconstruit entièrement les statistiques matérialisées par livre.
+
+        Returns:
+            Dict avec "rebuilt" et "removed"
+        """
+        from .livre_stats_service import rebuild_livre_stats
+
+        return rebuild_livre_stats(self)
+
+    def get_livre_stats(
+        self, livre_oids: list[Any], projection: dict[str, Any] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Lit les statistiques matérialisées de livres (livre_stats).
+
+        Args:
+            livre_oids: IDs des livres (str ou ObjectId)
+            projection: Champs à lire (défaut : tous)
+
+        Returns:
+            Dict livre_id → statistiques ({} sans connexion)
+        """
+        if self.db is None or not livre_oids:
+            return {}
+
+        from .livre_stats_service import get_livre_stats
+
+        return get_livre_stats(self, livre_oids, projection=projection)
+
+    def get_critique_notes(self) -> list[dict[str, Any]]:
+        """
+        Notes (critique, livre) de tous les livres, lues dans livre_stats.
+
+        Returns:
+            Liste de dicts {critique_oid, livre_oid, note}
+        """
+        if self.db is None:
+            return []
+
+        from .livre_stats_service import load_critique_notes
+
+        return load_critique_notes(self)
+
+    def _get_avis_refs(self, avis_id: str) -> dict[str, Any]:
+        """Retourne emission_oid et livre_oid d'un avis (dict vide si introuvable)."""
+        if self.avis_collection is None:
+            return {}
+        try:
+            avis = self.avis_collection.find_one(
+                {"_id": ObjectId(avis_id)}, {"emission_oid": 1, "livre_oid": 1}
+            )
+        except Exception:
+            return {}
+        return avis or {}
+
     def save_avis_batch(self, avis_list: list[dict[str, Any]]) -> list[str]:
         """
         Sauvegarde un batch d'avis en base.
@@ -2574,6 +3356,16 @@ class MongoDBService:
             avis["updated_at"] = now
 
         result = self.avis_collection.insert_many(avis_list)
+        self.refresh_emission_badges(
+            list(
+                {avis["emission_oid"] for avis in avis_list if avis.get("emission_oid")}
+            )
+        )
+        livre_oids = list(
+            {avis["livre_oid"] for avis in avis_list if avis.get("livre_oid")}
+        )
+        self.refresh_palmares(livre_oids)
+        self.refresh_livre_stats(livre_oids)
         return [str(oid) for oid in result.inserted_ids]
 
     def delete_avis_by_emission(self, emission_oid: str) -> int:
@@ -2590,9 +3382,93 @@ class MongoDBService:
         """
         if self.avis_collection is None:
             return 0
+        livre_oids = self.avis_collection.distinct(
+            "livre_oid", {"emission_oid": emission_oid}
+        )
         result = self.avis_collection.delete_many({"emission_oid": emission_oid})
+        self.refresh_emission_badges([emission_oid])
+        self.refresh_palmares(livre_oids)
+        self.refresh_livre_stats(livre_oids)
         return int(result.deleted_count)
 
+    def sync_avis_for_emissions(
+        self, avis_by_emission: dict[str, list[dict[str, Any]]]
+    ) -> dict[str, int]:
+        """
+        Applique une ré-extraction des avis par différence (un seul bulk_write).
+
+        Chaque avis est identifié par une clé stable (émission, section, titre
+        normalisé, critique normalisé, voir models.avis.diff_avis) : seuls les
+        avis nouveaux sont insérés, les avis modifiés mis à jour ($set des
+        champs changés, _id et created_at conservés) et les avis disparus
+        supprimés. Les avis inchangés ne sont pas réécrits. Badges, palmarès
+        et statistiques ne sont recalculés que pour les émissions et livres
+        effectivement touchés.
+
+        Args:
+            avis_by_emission: Dict emission_oid → avis extraits (format
+                Avis.for_mongodb_insert)
+
+        Returns:
+            Dict avec "inserted", "updated", "deleted" et "unchanged"
+        """
+        counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        if self.avis_collection is None or not avis_by_emission:
+            return counts
+
+        from pymongo import DeleteOne, InsertOne, UpdateOne
+
+        from ..models.avis import diff_avis
+
+        stored_by_emission: dict[str, list[dict[str, Any]]] = {
+            emission_oid: [] for emission_oid in avis_by_emission
+        }
+        for avis in self.avis_collection.find(
+            {"emission_oid": {"$in": list(avis_by_emission)}}
+        ):
+            stored_by_emission.setdefault(avis["emission_oid"], []).append(avis)
+
+        now = datetime.now()
+        operations: list[Any] = []
+        touched_emissions: list[str] = []
+        touched_livres: set[str] = set()
+        for emission_oid, extracted in avis_by_emission.items():
+            diff = diff_avis(stored_by_emission[emission_oid], extracted)
+            counts["unchanged"] += len(diff["unchanged"])
+            for avis in diff["insert"]:
+                avis["created_at"] = now
+                avis["updated_at"] = now
+                operations.append(InsertOne(avis))
+                touched_livres.add(avis.get("livre_oid"))
+            for previous, changes in diff["update"]:
+                operations.append(
+                    UpdateOne(
+                        {"_id": previous["_id"]},
+                        {"$set": {**changes, "updated_at": now}},
+                    )
+                )
+                touched_livres.add(previous.get("livre_oid"))
+                touched_livres.add(changes.get("livre_oid", previous.get("livre_oid")))
+            for previous in diff["delete"]:
+                operations.append(DeleteOne({"_id": previous["_id"]}))
+                touched_livres.add(previous.get("livre_oid"))
+            if diff["insert"] or diff["update"] or diff["delete"]:
+                touched_emissions.append(emission_oid)
+
+        if not operations:
+            return counts
+
+        result = self.avis_collection.bulk_write(operations, ordered=False)
+        counts["inserted"] = int(result.inserted_count)
+        counts["updated"] = int(result.modified_count)
+        counts["deleted"] = int(result.deleted_count)
+
+        livre_oids = [oid for oid in touched_livres if oid]
+        self.refresh_emission_badges(touched_emissions)
+        self.refresh_palmares(livre_oids)
+        self.refresh_livre_stats(livre_oids)
+        return counts
+
     def update_avis(self, avis_id: str, data: dict[str, Any]) -> bool:
         """
         Met à jour un avis (résolution manuelle d'entité).
@@ -2607,17 +3483,33 @@ class MongoDBService:
         if self.avis_collection is None:
             return False
 
-        # Ajouter timestamp de mise à jour
+        # Ajouter timestamp de mise à jour et clés de jointure typées
         data["updated_at"] = datetime.now()
+        data.update(typed_join_fields("avis", data))
+
+        # Références avant écriture : l'ancien livre quitte peut-être le palmarès
+        previous = self._get_avis_refs(avis_id)
 
         try:
             result = self.avis_collection.update_one(
                 {"_id": ObjectId(avis_id)}, {"$set": data}
             )
-            return bool(result.matched_count > 0)
         except Exception:
             return False
 
+        if result.matched_count > 0:
+            emission_oid = data.get("emission_oid") or previous.get("emission_oid")
+            if emission_oid:
+                self.refresh_emission_badges([emission_oid])
+            livre_oids = [
+                livre_oid
+                for livre_oid in (previous.get("livre_oid"), data.get("livre_oid"))
+                if livre_oid
+            ]
+            self.refresh_palmares(livre_oids)
+            self.refresh_livre_stats(livre_oids)
+        return bool(result.matched_count > 0)
+
     def delete_avis(self, avis_id: str) -> bool:
         """
         Supprime un avis par son ID.
@@ -2630,12 +3522,20 @@ class MongoDBService:
         """
         if self.avis_collection is None:
             return False
+        previous = self._get_avis_refs(avis_id)
         try:
             result = self.avis_collection.delete_one({"_id": ObjectId(avis_id)})
-            return bool(result.deleted_count > 0)
         except Exception:
             return False
 
+        if result.deleted_count > 0:
+            if previous.get("emission_oid"):
+                self.refresh_emission_badges([previous["emission_oid"]])
+            if previous.get("livre_oid"):
+                self.refresh_palmares([previous["livre_oid"]])
+                self.refresh_livre_stats([previous["livre_oid"]])
+        return bool(result.deleted_count > 0)
+
     def get_avis_stats(self) -> dict[str, Any]:
         """
         Récupère les statistiques sur les avis.
@@ -2689,83 +3589,27 @@ class MongoDBService:
             return 0
         return int(self.avis_collection.count_documents({"emission_oid": emission_oid}))
 
-    def get_palmares(self, page: int = 1, limit: int = 30) -> dict[str, Any]:
+    def get_palmares(
+        self, page: int = 1, limit: int = 30, cursor: str | None = None
+    ) -> dict[str, Any]:
         """Get books ranked by average rating (descending).
 
         Only books with at least 2 reviews are included.
         Tied ratings are broken by number of reviews (descending),
         then by title (alphabetical).
 
+        Lit le palmarès matérialisé (collection palmares, voir
+        palmares_service) : find() trié sur index, par curseur ou skip/limit.
+
         Args:
             page: Page number (1-indexed)
             limit: Number of items per page
+            cursor: Opaque cursor from a previous page (next_cursor)
 
         Returns:
-            Dict with items, total, page, limit, total_pages
+            Dict with items, total, page, limit, total_pages, next_cursor
         """
-        skip = (page - 1) * limit
-
-        pipeline: list[dict[str, Any]] = [
-            # Match avis with both livre_oid and note
-            {"$match": {"livre_oid": {"$ne": None}, "note": {"$ne": None}}},
-            # Group by book, compute average and count
-            {
-                "$group": {
-                    "_id": "$livre_oid",
-                    "note_moyenne": {"$avg": "$note"},
-                    "nombre_avis": {"$sum": 1},
-                }
-            },
-            # Filter: minimum 2 reviews
-            {"$match": {"nombre_avis": {"$gte": 2}}},
-            # Sort by note desc, then nombre_avis desc
-            {"$sort": {"note_moyenne": -1, "nombre_avis": -1}},
-            # Lookup book info
-            {
-                "$lookup": {
-                    "from": "livres",
-                    "let": {"livre_id": {"$toObjectId": "$_id"}},
-                    "pipeline": [
-                        {"$match": {"$expr": {"$eq": ["$_id", "$$livre_id"]}}}
-                    ],
-                    "as": "livre_info",
-                }
-            },
-            {"$unwind": {"path": "$livre_info", "preserveNullAndEmptyArrays": True}},
-            # Lookup author info
-            {
-                "$lookup": {
-                    "from": "auteurs",
-                    "localField": "livre_info.auteur_id",
-                    "foreignField": "_id",
-                    "as": "auteur_info",
-                }
-            },
-            {"$unwind": {"path": "$auteur_info", "preserveNullAndEmptyArrays": True}},
-            # Project final fields
-            {
-                "$project": {
-                    "_id": 1,
-                    "note_moyenne": {"$round": ["$note_moyenne", 1]},
-                    "nombre_avis": 1,
-                    "titre": "$livre_info.titre",
-                    "auteur_id": {"$toString": "$livre_info.auteur_id"},
-                    "auteur_nom": "$auteur_info.nom",
-                    "url_babelio": "$livre_info.url_babelio",
-                }
-            },
-            # Secondary sort by titre for stable ordering of equal notes
-            {"$sort": {"note_moyenne": -1, "nombre_avis": -1, "titre": 1}},
-            # Facet for pagination
-            {
-                "$facet": {
-                    "metadata": [{"$count": "total"}],
-                    "data": [{"$skip": skip}, {"$limit": limit}],
-                }
-            },
-        ]
-
-        if self.avis_collection is None:
+        if self.db is None:
             return {
                 "items": [],
                 "total": 0,
@@ -2774,47 +3618,12 @@ class MongoDBService:
                 "total_pages": 0,
             }
 
-        result = list(self.avis_collection.aggregate(pipeline))
+        from .palmares_service import get_palmares_page
 
-        if not result or not result[0]:
-            return {
-                "items": [],
-                "total": 0,
-                "page": page,
-                "limit": limit,
-                "total_pages": 0,
-            }
-
-        facet = result[0]
-        metadata = facet.get("metadata", [])
-        total = metadata[0]["total"] if metadata else 0
-        data = facet.get("data", [])
-
-        items = [
-            {
-                "livre_id": str(doc["_id"]),
-                "titre": doc.get("titre", ""),
-                "auteur_id": doc.get("auteur_id", ""),
-                "auteur_nom": doc.get("auteur_nom", ""),
-                "note_moyenne": doc.get("note_moyenne", 0),
-                "nombre_avis": doc.get("nombre_avis", 0),
-                "url_babelio": doc.get("url_babelio"),
-            }
-            for doc in data
-        ]
-
-        total_pages = (total + limit - 1) // limit if total > 0 else 0
-
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "limit": limit,
-            "total_pages": total_pages,
-        }
+        return get_palmares_page(self, page=page, limit=limit, cursor=cursor)
 
     def get_notes_for_livres(self, livre_ids: list[str]) -> dict[str, float]:
-        """Calcule les notes moyennes pour une liste de livres.
+        """Notes moyennes d'une liste de livres (lues dans livre_stats).
 
         Args:
             livre_ids: Liste des IDs de livres (strings)
@@ -2822,31 +3631,24 @@ class MongoDBService:
         Returns:
             Dict {livre_id: note_moyenne} pour les livres ayant au moins un avis noté
         """
-        if self.avis_collection is None or not livre_ids:
+        if not livre_ids:
             return {}
 
-        pipeline: list[dict[str, Any]] = [
-            {"$match": {"livre_oid": {"$in": livre_ids}, "note": {"$ne": None}}},
-            {
-                "$group": {
-                    "_id": "$livre_oid",
-                    "note_moyenne": {"$avg": "$note"},
-                }
-            },
-        ]
-
-        result = {}
-        for doc in self.avis_collection.aggregate(pipeline):
-            result[doc["_id"]] = round(doc["note_moyenne"], 1)
-
-        return result
+        stats = self.get_livre_stats(livre_ids, projection={"note_moyenne": 1})
+        return {
+            livre_id: doc["note_moyenne"]
+            for livre_id, doc in stats.items()
+            if doc.get("note_moyenne") is not None
+        }
 
     # --- Editeur management (Issue #189) ---
 
     def search_editeur_by_name(self, name: str) -> dict[str, Any] | None:
         """Recherche un éditeur par nom (insensible casse/accents).
 
-        Charge tous les éditeurs et compare via normalize_for_matching().
+        Requête sur nom_normalise (index unique). Les éditeurs écrits sans
+        nom_normalise sont complétés au démarrage (migrate_editeurs_nom_normalise),
+        les doublons fusionnés par la migration explicite.
 
         Args:
             name: Nom de l'éditeur à rechercher
@@ -2859,12 +3661,10 @@ class MongoDBService:
 
         from ..utils.text_utils import normalize_for_matching
 
-        normalized_name = normalize_for_matching(name)
-        for editeur in self.editeurs_collection.find():
-            if normalize_for_matching(editeur.get("nom", "")) == normalized_name:
-                result: dict[str, Any] = editeur
-                return result
-        return None
+        editeur: dict[str, Any] | None = self.editeurs_collection.find_one(
+            {"nom_normalise": normalize_for_matching(name)}
+        )
+        return editeur
 
     def create_editeur(self, name: str) -> ObjectId:
         """Crée un nouvel éditeur avec timestamps.
@@ -2878,15 +3678,26 @@ class MongoDBService:
         if self.editeurs_collection is None:
             raise Exception("Connexion MongoDB non établie")
 
+        from ..utils.text_utils import normalize_for_matching
+
         now = datetime.now()
         result = self.editeurs_collection.insert_one(
-            {"nom": name, "created_at": now, "updated_at": now}
+            {
+                "nom": name,
+                "nom_normalise": normalize_for_matching(name),
+                "nom_mots": search_words(name),
+                "created_at": now,
+                "updated_at": now,
+            }
         )
         return ObjectId(result.inserted_id)
 
     def get_or_create_editeur(self, name: str) -> tuple[ObjectId, bool]:
         """Trouve un éditeur existant ou en crée un nouveau.
 
+        La création est un upsert sur nom_normalise : avec l'index unique,
+        deux rafraîchissements concurrents ne peuvent pas créer de doublon.
+
         Args:
             name: Nom de l'éditeur
 
@@ -2896,8 +3707,42 @@ class MongoDBService:
         existing = self.search_editeur_by_name(name)
         if existing:
             return existing["_id"], False
-        new_id = self.create_editeur(name)
-        return new_id, True
+
+        if self.editeurs_collection is None:
+            raise Exception("Connexion MongoDB non établie")
+
+        from pymongo.errors import DuplicateKeyError
+
+        from ..utils.text_utils import normalize_for_matching
+
+        normalized_name = normalize_for_matching(name)
+        now = datetime.now()
+        try:
+            result = self.editeurs_collection.update_one(
+                {"nom_normalise": normalized_name},
+                {
+                    "$setOnInsert": {
+                        "nom": name,
+                        "nom_normalise": normalized_name,
+                        "nom_mots": search_words(name),
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                },
+                upsert=True,
+            )
+            if result.upserted_id is not None:
+                return ObjectId(result.upserted_id), True
+        except DuplicateKeyError:
+            # Créé entre-temps par un rafraîchissement concurrent
+            pass
+
+        editeur = self.editeurs_collection.find_one(
+            {"nom_normalise": normalized_name}, {"_id": 1}
+        )
+        if not editeur:
+            raise Exception(f"Éditeur introuvable après upsert: {name}")
+        return editeur["_id"], False
 
     # --- Livre/Auteur refresh helpers (Issue #189) ---
 
@@ -2918,15 +3763,19 @@ class MongoDBService:
             raise Exception("Connexion MongoDB non établie")
 
         updates["updated_at"] = datetime.now()
+        # Champs de recherche du titre (et de l'éditeur string) modifiés
+        updates.update(search_shadow_fields("livres", updates))
         update_doc: dict[str, Any] = {"$set": updates}
 
         # Issue #189: Si editeur_id est fourni, supprimer le champ editeur string
         if "editeur_id" in updates:
-            update_doc["$unset"] = {"editeur": ""}
+            update_doc["$unset"] = search_shadow_unset("editeur")
 
         result = self.livres_collection.update_one(
             {"_id": ObjectId(livre_id)}, update_doc
         )
+        if result.matched_count > 0 and "titre" in updates:
+            self.refresh_palmares([livre_id])
         return bool(result.matched_count > 0)
 
     def update_auteur_name_and_url(
@@ -2951,6 +3800,7 @@ class MongoDBService:
         set_fields: dict[str, Any] = {}
         if nom is not None:
             set_fields["nom"] = nom
+            set_fields.update(search_shadow_fields("auteurs", set_fields))
         if url_babelio is not None:
             set_fields["url_babelio"] = url_babelio
 
@@ -2961,6 +3811,8 @@ class MongoDBService:
         result = self.auteurs_collection.update_one(
             {"_id": ObjectId(auteur_id)}, {"$set": set_fields}
         )
+        if result.matched_count > 0 and nom is not None:
+            self.refresh_palmares_for_auteurs([auteur_id])
         return bool(result.matched_count > 0)
 
 
@@ -0,0 +1,331 @@
+"""Palmarès matérialisé : classement des livres par note moyenne.
+
+Le palmarès n'est plus agrégé à chaque page (groupement de toute la collection
+avis, $lookup via $toObjectId dans $expr, double tri, $facet) : il est
+matérialisé dans la collection palmares, un document par livre ayant au moins
+PALMARES_MIN_AVIS avis notés (même _id que avis.livre_oid, String) :
+
+    {_id, note_moyenne, nombre_avis, titre, auteur_id, auteur_nom, url_babelio}
+
+Une page est un find() trié sur l'index
+(note_moyenne desc, nombre_avis desc, titre asc, _id asc), par curseur
+(keyset_pagination) ou par skip/limit.
+
+Maintenance incrémentale (voir MongoDBService.refresh_palmares*) :
+- écriture d'avis (insertion, mise à jour, suppression) : seuls les livres
+  touchés sont recalculés
+- changement de titre/URL Babelio d'un livre ou de nom d'un auteur : les
+  champs dénormalisés des livres concernés sont recalculés
+
+Le palmarès est reconstruit au démarrage de l'application s'il est vide ou si
+PALMARES_REBUILD_ON_STARTUP est activé (rattrapage des écritures faites hors
+de l'application), ou à la demande via :
+
+    python -m back_office_lmelp.utils.rebuild_palmares
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+
+from ..utils.keyset_pagination import find_page
+
+
+# Collection du palmarès matérialisé
+PALMARES_COLLECTION = "palmares"
+
+# Nombre minimal d'avis notés pour figurer au palmarès
+PALMARES_MIN_AVIS = 2
+
+# Ordre du palmarès, _id en dernier pour la pagination par curseur
+# (couvert par l'index note_moyenne_-1_nombre_avis_-1_titre_1__id_1)
+PALMARES_SORT = [("note_moyenne", -1), ("nombre_avis", -1), ("titre", 1), ("_id", 1)]
+
+# Taille maximale des listes $in envoyées à MongoDB
+PALMARES_BATCH_SIZE = 500
+
+_PALMARES_PROJECTION = {
+    "note_moyenne": 1,
+    "nombre_avis": 1,
+    "titre": 1,
+    "auteur_id": 1,
+    "auteur_nom": 1,
+    "url_babelio": 1,
+}
+
+
+def _batches(items: list[Any], size: int) -> Iterable[list[Any]]:
+    """Découpe une liste en lots de taille bornée."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _string_ids(oids: Iterable[Any]) -> list[str]:
+    """Normalise des IDs (str ou ObjectId) en String valides, sans doublon."""
+    ids: dict[str, None] = {}
+    for value in oids:
+        if value and ObjectId.is_valid(str(value)):
+            ids[str(value)] = None
+    return list(ids)
+
+
+def _aggregate_notes(
+    avis_collection: Any, livre_ids: list[str] | None
+) -> dict[str, dict[str, Any]]:
+    """
+    Calcule note moyenne et nombre d'avis notés par livre.
+
+    Args:
+        avis_collection: Collection avis
+        livre_ids: Livres à calculer (None : tous les livres)
+
+    Returns:
+        Dict livre_id → {"note_moyenne", "nombre_avis"}
+    """
+    if livre_ids is None:
+        matches: list[dict[str, Any]] = [{"livre_oid": {"$ne": None}}]
+    else:
+        matches = [
+            {"livre_oid": {"$in": batch}}
+            for batch in _batches(livre_ids, PALMARES_BATCH_SIZE)
+        ]
+
+    notes: dict[str, dict[str, Any]] = {}
+    for match in matches:
+        pipeline = [
+            {"$match": {**match, "note": {"$ne": None}}},
+            {
+                "$group": {
+                    "_id": "$livre_oid",
+                    "note_moyenne": {"$avg": "$note"},
+                    "nombre_avis": {"$sum": 1},
+                }
+            },
+        ]
+        for row in avis_collection.aggregate(pipeline):
+            notes[str(row["_id"])] = {
+                "note_moyenne": round(row["note_moyenne"], 1),
+                "nombre_avis": int(row["nombre_avis"]),
+            }
+    return notes
+
+
+def compute_palmares_entries(
+    mongodb_service: Any, livre_oids: Iterable[Any] | None = None
+) -> dict[str, dict[str, Any]]:
+    """
+    Calcule les entrées du palmarès des livres indiqués.
+
+    Les livres et auteurs sont lus par lots ($in sur _id) : pas de $lookup.
+
+    Args:
+        mongodb_service: Service MongoDB (accès via get_collection)
+        livre_oids: IDs des livres (str ou ObjectId), None pour tous les livres
+
+    Returns:
+        Dict livre_id → entrée du palmarès (livres sous le seuil absents)
+    """
+    livre_ids = None if livre_oids is None else _string_ids(livre_oids)
+    if livre_ids == []:
+        return {}
+
+    notes = _aggregate_notes(mongodb_service.get_collection("avis"), livre_ids)
+    ranked = {
+        livre_id: note
+        for livre_id, note in notes.items()
+        if note["nombre_avis"] >= PALMARES_MIN_AVIS and ObjectId.is_valid(livre_id)
+    }
+    if not ranked:
+        return {}
+
+    livres: dict[str, dict[str, Any]] = {}
+    livres_collection = mongodb_service.get_collection("livres")
+    for batch in _batches(
+        [ObjectId(livre_id) for livre_id in ranked], PALMARES_BATCH_SIZE
+    ):
+        for livre in livres_collection.find(
+            {"_id": {"$in": batch}}, {"titre": 1, "auteur_id": 1, "url_babelio": 1}
+        ):
+            livres[str(livre["_id"])] = livre
+
+    auteur_oids = list(
+        {livre["auteur_id"] for livre in livres.values() if livre.get("auteur_id")}
+    )
+    auteurs: dict[str, str] = {}
+    auteurs_collection = mongodb_service.get_collection("auteurs")
+    for batch in _batches(auteur_oids, PALMARES_BATCH_SIZE):
+        for auteur in auteurs_collection.find({"_id": {"$in": batch}}, {"nom": 1}):
+            auteurs[str(auteur["_id"])] = auteur.get("nom", "")
+
+    entries: dict[str, dict[str, Any]] = {}
+    for livre_id, note in ranked.items():
+        livre = livres.get(livre_id, {})
+        auteur_id = livre.get("auteur_id")
+        entries[livre_id] = {
+            **note,
+            "titre": livre.get("titre", ""),
+            "auteur_id": str(auteur_id) if auteur_id else None,
+            "auteur_nom": auteurs.get(str(auteur_id), "") if auteur_id else "",
+            "url_babelio": livre.get("url_babelio"),
+        }
+    return entries
+
+
+def _upsert_operations(entries: dict[str, dict[str, Any]]) -> list[UpdateOne]:
+    """Opérations d'upsert des entrées calculées (par _id = livre_id)."""
+    now = datetime.now()
+    return [
+        UpdateOne(
+            {"_id": livre_id}, {"$set": {**entry, "updated_at": now}}, upsert=True
+        )
+        for livre_id, entry in entries.items()
+    ]
+
+
+def refresh_palmares(mongodb_service: Any, livre_oids: Iterable[Any]) -> int:
+    """
+    Recalcule et persiste l'entrée du palmarès des livres indiqués.
+
+    Les livres passés sous le seuil (avis supprimés, note retirée, avis
+    réaffecté à un autre livre) sont retirés du palmarès.
+
+    Args:
+        mongodb_service: Service MongoDB
+        livre_oids: IDs des livres touchés (str ou ObjectId)
+
+    Returns:
+        Nombre de livres présents au palmarès après recalcul
+    """
+    livre_ids = _string_ids(livre_oids)
+    if not livre_ids:
+        return 0
+
+    entries = compute_palmares_entries(mongodb_service, livre_ids)
+    operations: list[Any] = _upsert_operations(entries)
+    operations.extend(
+        DeleteOne({"_id": livre_id})
+        for livre_id in livre_ids
+        if livre_id not in entries
+    )
+    mongodb_service.get_collection(PALMARES_COLLECTION).bulk_write(
+        operations, ordered=False
+    )
+    return len(entries)
+
+
+def refresh_palmares_for_auteurs(
+    mongodb_service: Any, auteur_oids: Iterable[Any]
+) -> int:
+    """
+    Recalcule les entrées du palmarès des livres des auteurs indiqués.
+
+    Utilisé quand le nom d'un auteur change (auteur_nom est dénormalisé).
+
+    Args:
+        mongodb_service: Service MongoDB
+        auteur_oids: IDs des auteurs (str ou ObjectId)
+
+    Returns:
+        Nombre de livres présents au palmarès après recalcul
+    """
+    auteur_ids = _string_ids(auteur_oids)
+    if not auteur_ids:
+        return 0
+
+    palmares_collection = mongodb_service.get_collection(PALMARES_COLLECTION)
+    livre_ids = [
+        entry["_id"]
+        for entry in palmares_collection.find(
+            {"auteur_id": {"$in": auteur_ids}}, {"_id": 1}
+        )
+    ]
+    return refresh_palmares(mongodb_service, livre_ids)
+
+
+def rebuild_palmares(mongodb_service: Any) -> dict[str, int]:
+    """
+    Reconstruit entièrement la collection palmares.
+
+    Args:
+        mongodb_service: Service MongoDB
+
+    Returns:
+        Dict avec "rebuilt" (livres classés) et "removed" (entrées obsolètes)
+    """
+    entries = compute_palmares_entries(mongodb_service)
+    palmares_collection = mongodb_service.get_collection(PALMARES_COLLECTION)
+
+    operations = _upsert_operations(entries)
+    if operations:
+        palmares_collection.bulk_write(operations, ordered=False)
+    removed = palmares_collection.delete_many({"_id": {"$nin": list(entries)}})
+
+    return {"rebuilt": len(entries), "removed": int(removed.deleted_count)}
+
+
+def get_palmares_page(
+    mongodb_service: Any,
+    page: int = 1,
+    limit: int = 30,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """
+    Lit une page du palmarès matérialisé.
+
+    Args:
+        mongodb_service: Service MongoDB
+        page: Numéro de page (à partir de 1, ignoré pour la lecture si cursor
+            est fourni)
+        limit: Nombre de livres par page
+        cursor: Curseur de la page précédente (next_cursor)
+
+    Returns:
+        Dict avec items, total, page, limit, total_pages et next_cursor
+
+    Raises:
+        InvalidCursorError: Si le curseur est invalide
+    """
+    palmares_collection = mongodb_service.get_collection(PALMARES_COLLECTION)
+    skip = (page - 1) * limit
+
+    total = int(palmares_collection.count_documents({}))
+    docs, next_cursor = (
+        find_page(
+            palmares_collection,
+            {},
+            PALMARES_SORT,
+            limit,
+            offset=skip,
+            cursor=cursor,
+            projection=_PALMARES_PROJECTION,
+        )
+        if cursor or total > skip
+        else ([], None)
+    )
+
+    items = [
+        {
+            "livre_id": str(doc["_id"]),
+            "titre": doc.get("titre", ""),
+            "auteur_id": doc.get("auteur_id", ""),
+            "auteur_nom": doc.get("auteur_nom", ""),
+            "note_moyenne": doc.get("note_moyenne", 0),
+            "nombre_avis": doc.get("nombre_avis", 0),
+            "url_babelio": doc.get("url_babelio"),
+        }
+        for doc in docs
+    ]
+
+    total_pages = (total + limit - 1) // limit if total > 0 else 0
+
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+    }
@@ -196,34 +196,13 @@ class RecommendationService:
         return notes
 
     def _load_avis_mongodb(self) -> list[dict[str, Any]]:
-        """Charge les avis notés depuis la collection MongoDB `avis`.
+        """Charge les avis notés (critique × livre) depuis livre_stats.
 
         Returns:
             Liste de dicts {critique_oid: str, livre_oid: str, note: int}
         """
-        if self._mongodb_service.avis_collection is None:
-            return []
-
-        pipeline: list[dict[str, Any]] = [
-            {
-                "$match": {
-                    "livre_oid": {"$ne": None},
-                    "note": {"$ne": None},
-                    "critique_oid": {"$ne": None},
-                }
-            },
-            {
-                "$project": {
-                    "_id": 0,
-                    "critique_oid": 1,
-                    "livre_oid": 1,
-                    "note": 1,
-                }
-            },
-        ]
-
         try:
-            return list(self._mongodb_service.avis_collection.aggregate(pipeline))
+            return list(self._mongodb_service.get_critique_notes())
         except Exception:
             logger.exception("Erreur lors du chargement des avis MongoDB")
             return []
@@ -2,8 +2,46 @@
 
 from typing import Any
 
+from ..utils.join_keys import typed_join_key
+from .emission_badge_service import count_problem_emissions
 from .livres_auteurs_cache_service import livres_auteurs_cache_service
-from .mongodb_service import mongodb_service
+from .mongodb_service import (
+    VISIBLE_AVIS_CRITIQUES_FILTER,
+    episodes_without_avis_critiques_stages,
+    mongodb_service,
+)
+from .stats_snapshot_service import StatsSnapshot
+
+
+# Collections lues par chaque section de get_cache_statistics()
+_CACHE_SOURCES = (
+    "livresauteurs_cache",
+    "livres",
+    "auteurs",
+    "episodes",
+    "avis_critiques",
+    "emissions",
+)
+_SECTION_SOURCES: dict[str, tuple[str, ...]] = {
+    "books_without_url_babelio": ("livres",),
+    "authors_without_url_babelio": ("auteurs",),
+    "last_episode_date": ("episodes",),
+    "episodes_without_avis_critiques": ("episodes", "avis_critiques"),
+    "avis_critiques_without_analysis": (
+        "episodes",
+        "avis_critiques",
+        "livresauteurs_cache",
+    ),
+    "emissions_sans_avis": ("emissions", "avis"),
+    "emissions_with_problems": (
+        "emissions",
+        "emission_badges",
+        "avis",
+        "livres",
+        "episodes",
+    ),
+    "books_without_cover": ("livres",),
+}
 
 
 class StatsService:
@@ -13,36 +51,46 @@ class StatsService:
         """Initialise le service de statistiques."""
         self.cache_service = livres_auteurs_cache_service
         self.mongodb_service = mongodb_service
+        self.snapshot = StatsSnapshot()
 
     def get_cache_statistics(self) -> dict[str, Any]:
         """
         Récupère les statistiques optimisées depuis le cache.
 
+        Chaque section est lue dans le snapshot et recalculée uniquement si
+        l'une de ses collections sources a été modifiée (voir
+        stats_snapshot_service).
+
         Returns:
             Dictionnaire avec les statistiques complètes (incluant métriques Issue #124 et #128)
         """
-        result = self.cache_service.get_statistics_from_cache()
-        stats = dict(result) if result else {}
-
-        # Issue #124: Ajouter métriques de complétude URL Babelio
-        stats["books_without_url_babelio"] = self._count_books_without_url_babelio()
-        stats["authors_without_url_babelio"] = self._count_authors_without_url_babelio()
-
-        # Issue #128: Ajouter nouvelles métriques
-        stats["last_episode_date"] = self._get_last_episode_date()
-        stats["episodes_without_avis_critiques"] = (
-            self._count_episodes_without_avis_critiques()
+        result = self.snapshot.get_section(
+            "cache", _CACHE_SOURCES, self.cache_service.get_statistics_from_cache
         )
-        stats["avis_critiques_without_analysis"] = (
-            self._count_avis_critiques_without_analysis()
-        )
-
-        # Issue #185: Ajouter métriques des badges d'émissions
-        stats["emissions_sans_avis"] = self._count_emissions_sans_avis()
-        stats["emissions_with_problems"] = self._count_emissions_with_problems()
+        stats = dict(result) if result else {}
 
-        # Issue #238: Livres avec url_babelio mais sans url_cover
-        stats["books_without_cover"] = self._count_books_without_cover()
+        sections = {
+            # Issue #124: métriques de complétude URL Babelio
+            "books_without_url_babelio": self._count_books_without_url_babelio,
+            "authors_without_url_babelio": self._count_authors_without_url_babelio,
+            # Issue #128
+            "last_episode_date": self._get_last_episode_date,
+            "episodes_without_avis_critiques": (
+                self._count_episodes_without_avis_critiques
+            ),
+            "avis_critiques_without_analysis": (
+                self._count_avis_critiques_without_analysis
+            ),
+            # Issue #185: métriques des badges d'émissions
+            "emissions_sans_avis": self._count_emissions_sans_avis,
+            "emissions_with_problems": self._count_emissions_with_problems,
+            # Issue #238: livres avec url_babelio mais sans url_cover
+            "books_without_cover": self._count_books_without_cover,
+        }
+        for name, compute in sections.items():
+            stats[name] = self.snapshot.get_section(
+                name, _SECTION_SOURCES[name], compute
+            )
 
         return stats
 
@@ -131,57 +179,21 @@ class StatsService:
         """
         Compte les épisodes non masqués sans avis critiques extraits (Issue #128).
 
+        Anti-jointure episodes → avis_critiques côté serveur (index
+        avis_critiques.episode_oid), sans liste d'IDs côté Python.
+
         Returns:
             Nombre d'épisodes où masked=False et n'ont pas d'avis critiques
         """
         episodes_collection = self.mongodb_service.get_collection("episodes")
-        avis_critiques_collection = self.mongodb_service.get_collection(
-            "avis_critiques"
-        )
-
-        # Compter les épisodes non masqués
-        non_masked_count = episodes_collection.count_documents(
-            {"$or": [{"masked": False}, {"masked": {"$exists": False}}]}
-        )
 
-        # FIX: Utiliser aggregation pour filtrer les avis dont l'épisode est masqué
-        # Seuls les avis_critiques avec épisode non masqué doivent être comptés
         pipeline = [
-            {
-                "$lookup": {
-                    "from": "episodes",
-                    "let": {"episode_oid_str": "$episode_oid"},
-                    "pipeline": [
-                        {
-                            "$match": {
-                                "$expr": {
-                                    "$eq": [{"$toString": "$_id"}, "$$episode_oid_str"]
-                                }
-                            }
-                        }
-                    ],
-                    "as": "episode",
-                }
-            },
-            {"$unwind": "$episode"},
-            {
-                "$match": {
-                    "$or": [
-                        {"episode.masked": {"$ne": True}},
-                        {"episode.masked": {"$exists": False}},
-                    ]
-                }
-            },
-            {"$group": {"_id": "$episode_oid"}},
+            {"$match": {"masked": {"$ne": True}}},
+            *episodes_without_avis_critiques_stages(),
+            {"$count": "total"},
         ]
-
-        episodes_with_avis_non_masques = list(
-            avis_critiques_collection.aggregate(pipeline)
-        )
-        episodes_with_avis_count = len(episodes_with_avis_non_masques)
-
-        # Retourner la différence
-        return int(max(0, non_masked_count - episodes_with_avis_count))
+        result = list(episodes_collection.aggregate(pipeline))
+        return int(result[0]["total"]) if result else 0
 
     def _count_avis_critiques_without_analysis(self) -> int:
         """
@@ -193,54 +205,39 @@ class StatsService:
         Un épisode est considéré comme "analysé" s'il existe au moins un document
         dans livresauteurs_cache qui référence cet épisode.
 
-        Exclut les épisodes masqués (Issue #143).
+        Exclut les épisodes masqués (Issue #143) via avis_critiques.episode_masked.
+        Anti-jointure avis_critiques → livresauteurs_cache sur la clé typée
+        episode_id (ObjectId des deux côtés), index episode_id du cache. Les
+        avis critiques pas encore rattrapés se replient sur episode_oid.
 
         Returns:
             Nombre d'épisodes avec avis critiques mais sans analyse (épisodes non masqués uniquement)
         """
-        episodes_collection = self.mongodb_service.get_collection("episodes")
         avis_critiques_collection = self.mongodb_service.get_collection(
             "avis_critiques"
         )
-        cache_collection = self.mongodb_service.get_collection("livresauteurs_cache")
-
-        # Récupérer les IDs des épisodes NON masqués
-        non_masked_episodes = episodes_collection.find(
-            {"$or": [{"masked": False}, {"masked": {"$exists": False}}]}, {"_id": 1}
-        )
-        non_masked_episode_ids = {ep["_id"] for ep in non_masked_episodes}
-
-        # Récupérer les épisodes distincts qui ont des avis critiques
-        # IMPORTANT (Issue #148): episode_oid est stocké comme STRING dans la base,
-        # on doit le convertir en ObjectId pour matcher avec les IDs de episodes.find()
-        from bson import ObjectId
-
-        episodes_with_avis = {
-            ObjectId(ep_id) if isinstance(ep_id, str) else ep_id
-            for ep_id in avis_critiques_collection.distinct("episode_oid")
-            if ep_id is not None
-        }
-
-        # Filtrer pour ne garder que les épisodes NON masqués
-        episodes_with_avis_non_masked = episodes_with_avis & non_masked_episode_ids
-
-        # Récupérer les épisodes distincts qui ont été analysés
-        # IMPORTANT (Issue #148): episode_oid est stocké comme STRING dans la base,
-        # on doit le convertir en ObjectId pour matcher avec les IDs de episodes.find()
-        episodes_analyzed = {
-            ObjectId(ep_id) if isinstance(ep_id, str) else ep_id
-            for ep_id in cache_collection.distinct("episode_oid")
-            if ep_id is not None
-        }
-
-        # Filtrer pour ne garder que les épisodes NON masqués
-        episodes_analyzed_non_masked = episodes_analyzed & non_masked_episode_ids
 
-        # Calculer la différence: épisodes avec avis mais non analysés
-        count_with_avis = len(episodes_with_avis_non_masked)
-        count_analyzed = len(episodes_analyzed_non_masked)
-
-        return int(max(0, count_with_avis - count_analyzed))
+        pipeline = [
+            {"$match": VISIBLE_AVIS_CRITIQUES_FILTER},
+            {"$group": {"_id": typed_join_key("episode_oid", "episode_id")}},
+            {"$match": {"_id": {"$ne": None}}},
+            {
+                "$lookup": {
+                    "from": "livresauteurs_cache",
+                    "localField": "_id",
+                    "foreignField": "episode_id",
+                    "pipeline": [
+                        {"$limit": 1},
+                        {"$project": {"_id": 1}},
+                    ],
+                    "as": "cache",
+                }
+            },
+            {"$match": {"cache": {"$size": 0}}},
+            {"$count": "total"},
+        ]
+        result = list(avis_critiques_collection.aggregate(pipeline))
+        return int(result[0]["total"]) if result else 0
 
     def get_detailed_breakdown(self) -> list[dict[str, Any]]:
         """
@@ -385,8 +382,8 @@ Total livres traités : {total_traites}"""
 
         Performance: 1 aggregation au lieu de ~1500 requêtes (pour 500 émissions).
 
-        IMPORTANT: emissions._id est ObjectId, mais avis.emission_oid est String.
-        Il faut convertir _id en String pour le $lookup (Issue #194 type mismatch).
+        Jointure sur la clé typée avis.emission_id (ObjectId, index
+        emission_id) : plus de conversion de _id en String (Issue #194).
 
         Returns:
             Nombre d'émissions sans avis extraits
@@ -395,23 +392,19 @@ Total livres traités : {total_traites}"""
 
         # Aggregation pipeline: compter les émissions avec 0 avis
         pipeline = [
-            # Step 1: Convertir _id (ObjectId) en String pour le lookup
-            {"$addFields": {"emission_id_str": {"$toString": "$_id"}}},
-            # Step 2: Joindre les avis pour chaque émission
-            # Note: avis.emission_oid est String, emissions._id est ObjectId
+            # Step 1: Joindre le premier avis de chaque émission (anti-jointure)
             {
                 "$lookup": {
                     "from": "avis",
-                    "localField": "emission_id_str",
-                    "foreignField": "emission_oid",
+                    "localField": "_id",
+                    "foreignField": "emission_id",
+                    "pipeline": [{"$limit": 1}, {"$project": {"_id": 1}}],
                     "as": "avis_list",
                 }
             },
-            # Step 3: Ajouter un champ avis_count
-            {"$addFields": {"avis_count": {"$size": "$avis_list"}}},
-            # Step 4: Filtrer les émissions avec avis_count == 0 (condition no_avis)
-            {"$match": {"avis_count": 0}},
-            # Step 5: Compter
+            # Step 2: Filtrer les émissions sans avis (condition no_avis)
+            {"$match": {"avis_list": {"$size": 0}}},
+            # Step 3: Compter
             {"$count": "total"},
         ]
 
@@ -425,91 +418,15 @@ Total livres traités : {total_traites}"""
         Rouge (count_mismatch): Écart de comptage OU note manquante
         Jaune (unmatched): Livres non matchés
 
-        OPTIMIZED (Issue #194): Utilise batch fetching (2 requêtes) au lieu
-        d'itérer sur N émissions avec N×3 requêtes.
-
-        Performance: ~N+2 requêtes au lieu de ~1500 requêtes (pour 500 émissions).
-
-        La logique de badge est préservée depuis _calculate_emission_badge_status
-        (app.py:1058-1133) pour garantir la cohérence.
+        Les badges sont comptés par MongoDB dans la collection matérialisée
+        emission_badges (index badge_status), partagée avec GET /api/emissions
+        (emission_badge_service). Les émissions sans badge persisté sont
+        d'abord calculées.
 
         Returns:
             Nombre total d'émissions avec problèmes (rouge + jaune)
         """
-        emissions_collection = self.mongodb_service.get_collection("emissions")
-        avis_collection = self.mongodb_service.get_collection("avis")
-        livres_collection = self.mongodb_service.get_collection("livres")
-
-        # Step 1: Récupérer toutes les émissions (requête unique)
-        emissions = list(emissions_collection.find({}, {"_id": 1, "episode_id": 1}))
-
-        # Step 2: Récupérer tous les avis d'un coup (requête unique)
-        all_avis = list(
-            avis_collection.find(
-                {},
-                {
-                    "emission_oid": 1,
-                    "livre_titre_extrait": 1,
-                    "livre_oid": 1,
-                    "note": 1,
-                },
-            )
-        )
-
-        # Step 3: Grouper les avis par emission_id en mémoire (O(N))
-        avis_by_emission: dict[str, list[dict[str, Any]]] = {}
-        for avis in all_avis:
-            emission_id = avis.get("emission_oid")
-            if emission_id:
-                if emission_id not in avis_by_emission:
-                    avis_by_emission[emission_id] = []
-                avis_by_emission[emission_id].append(avis)
-
-        # Step 4: Pour chaque émission, calculer le badge status (en mémoire, rapide)
-        count = 0
-        for emission in emissions:
-            emission_id_str = str(emission["_id"])
-            episode_id_str = str(emission["episode_id"])
-
-            # Récupérer les avis pour cette émission
-            emission_avis = avis_by_emission.get(emission_id_str, [])
-
-            # Ignorer si pas d'avis (badge no_avis, pas un problème)
-            if not emission_avis:
-                continue
-
-            # Calculer le badge status (même logique que _calculate_emission_badge_status)
-            unique_titles: set[str] = set()
-            unmatched_count = 0
-            missing_notes_count = 0
-
-            for avis in emission_avis:
-                titre = avis.get("livre_titre_extrait", "")
-                if titre:
-                    unique_titles.add(titre)
-                    if avis.get("livre_oid") is None:
-                        unmatched_count += 1
-                    if avis.get("note") is None:
-                        missing_notes_count += 1
-
-            livres_summary = len(unique_titles)
-
-            # Compter les livres MongoDB pour cet épisode (requête indexée rapide)
-            livres_mongo_count = livres_collection.count_documents(
-                {"episodes": episode_id_str}
-            )
-
-            # Déterminer le badge status
-            # 🔴 count_mismatch: écart de comptage OU note manquante
-            # 🟡 unmatched: comptes égaux mais livre(s) non matché(s)
-            if (
-                livres_summary != livres_mongo_count
-                or missing_notes_count > 0
-                or unmatched_count > 0
-            ):
-                count += 1
-
-        return count
+        return count_problem_emissions(self.mongodb_service)
 
     def _count_books_without_cover(self) -> int:
         """Compte les livres avec url_babelio mais sans url_cover (Issue #238)."""
@@ -0,0 +1,204 @@
+"""Snapshot des statistiques du tableau de bord, invalidé par les écritures.
+
+Les statistiques (/api/statistics, /api/stats, /api/livres-auteurs/statistics)
+enchaînent une douzaine de count/distinct/aggregate. Elles sont découpées en
+sections, chacune associée aux collections qu'elle lit ; une section n'est
+recalculée que si l'une de ses collections a été modifiée depuis son calcul.
+
+Détection des écritures :
+- WriteTracker (pymongo.monitoring) est enregistré sur les clients MongoDB
+  (pymongo et Motor) et incrémente la version d'une collection à chaque
+  insert/update/delete/findAndModify terminé
+- les écritures faites par un autre processus (pipeline lmelp, mongosh) ne
+  sont pas vues : une section est aussi recalculée au-delà de
+  STATS_SNAPSHOT_MAX_AGE_SEC
+
+compute_etag() donne l'ETag du dict servi : le tableau de bord reçoit un 304
+tant que les statistiques n'ont pas changé.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from pymongo import monitoring
+
+from ..settings import settings
+
+
+# Commandes MongoDB qui modifient une collection
+WRITE_COMMANDS = frozenset({"insert", "update", "delete", "findAndModify"})
+
+
+class CollectionVersions:
+    """Compteurs de version par collection (process-wide, thread-safe)."""
+
+    def __init__(self) -> None:
+        """Initialise les compteurs (0 pour une collection jamais modifiée)."""
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def bump(self, collection: str) -> None:
+        """Signale une écriture sur une collection."""
+        with self._lock:
+            self._versions[collection] = self._versions.get(collection, 0) + 1
+
+    def get(self, collections: Iterable[str]) -> tuple[int, ...]:
+        """Retourne les versions courantes des collections demandées."""
+        with self._lock:
+            return tuple(self._versions.get(name, 0) for name in collections)
+
+
+collection_versions = CollectionVersions()
+
+
+class WriteTracker(monitoring.CommandListener):
+    """Incrémente la version des collections à chaque écriture terminée.
+
+    La version est incrémentée à la fin de la commande (succès ou échec
+    partiel) : un calcul lancé pendant l'écriture sera refait au prochain
+    appel.
+    """
+
+    def __init__(self, versions: CollectionVersions) -> None:
+        """Initialise le listener."""
+        self._versions = versions
+        self._pending: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        """Mémorise la collection visée par une commande d'écriture."""
+        if event.command_name not in WRITE_COMMANDS:
+            return
+        collection = event.command.get(event.command_name)
+        if isinstance(collection, str):
+            with self._lock:
+                self._pending[event.request_id] = collection
+
+    def _finish(self, request_id: int) -> None:
+        with self._lock:
+            collection = self._pending.pop(request_id, None)
+        if collection:
+            self._versions.bump(collection)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        """Écriture terminée."""
+        self._finish(event.request_id)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        """Écriture en échec (un bulk non ordonné a pu être appliqué en partie)."""
+        self._finish(event.request_id)
+
+
+# Listener passé aux clients MongoClient / AsyncIOMotorClient
+write_tracker = WriteTracker(collection_versions)
+
+
+@dataclass
+class _Section:
+    value: Any
+    versions: tuple[int, ...]
+    computed_at: float
+
+
+class StatsSnapshot:
+    """Cache de sections de statistiques, versionné par collection source."""
+
+    def __init__(
+        self,
+        versions: CollectionVersions | None = None,
+        max_age_sec: float | None = None,
+    ) -> None:
+        """
+        Initialise un snapshot vide.
+
+        Args:
+            versions: Compteurs de version (collection_versions par défaut)
+            max_age_sec: Âge maximal d'une section
+                (settings.stats_snapshot_max_age_sec par défaut)
+        """
+        self._versions = versions or collection_versions
+        self._max_age_sec = max_age_sec
+        self._sections: dict[str, _Section] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_age_sec(self) -> float:
+        """Âge maximal d'une section avant recalcul."""
+        if self._max_age_sec is not None:
+            return self._max_age_sec
+        return settings.stats_snapshot_max_age_sec
+
+    def _lookup(self, name: str, versions: tuple[int, ...]) -> _Section | None:
+        with self._lock:
+            section = self._sections.get(name)
+        if section is None or section.versions != versions:
+            return None
+        if time.monotonic() - section.computed_at >= self.max_age_sec:
+            return None
+        return section
+
+    def _store(self, name: str, value: Any, versions: tuple[int, ...]) -> None:
+        with self._lock:
+            self._sections[name] = _Section(value, versions, time.monotonic())
+
+    def get_section(
+        self, name: str, sources: Iterable[str], compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Retourne une section, recalculée si ses collections ont changé.
+
+        Args:
+            name: Nom de la section
+            sources: Collections lues par compute
+            compute: Calcul de la section
+
+        Returns:
+            Valeur de la section
+        """
+        # Versions lues AVANT le calcul : une écriture concurrente invalide
+        versions = self._versions.get(sources)
+        section = self._lookup(name, versions)
+        if section is not None:
+            return section.value
+        value = compute()
+        self._store(name, value, versions)
+        return value
+
+    async def aget_section(
+        self,
+        name: str,
+        sources: Iterable[str],
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Équivalent de get_section() pour un calcul asynchrone."""
+        versions = self._versions.get(sources)
+        section = self._lookup(name, versions)
+        if section is not None:
+            return section.value
+        value = await compute()
+        self._store(name, value, versions)
+        return value
+
+    def invalidate(self) -> None:
+        """Oublie toutes les sections (prochain appel : recalcul complet)."""
+        with self._lock:
+            self._sections.clear()
+
+
+def compute_etag(data: Any) -> str:
+    """
+    Calcule l'ETag d'une réponse JSON de statistiques.
+
+    Args:
+        data: Dict sérialisable (valeurs non JSON converties en str)
+
+    Returns:
+        ETag entre guillemets (dépend uniquement du contenu)
+    """
+    payload = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return f'"{hashlib.sha1(payload, usedforsecurity=False).hexdigest()}"'
@@ -78,6 +78,89 @@ class Settings:
             os.path.join(os.getcwd(), "data", "processed", "babelio_cache"),
         )
 
+    # Émissions
+    @property
+    def emissions_auto_convert_interval_sec(self) -> float:
+        """Intervalle de la conversion incrémentale épisodes → émissions.
+
+        EMISSIONS_AUTO_CONVERT_INTERVAL_SEC, défaut 300s.
+        0 : conversion lancée une seule fois au démarrage.
+        """
+        return float(os.environ.get("EMISSIONS_AUTO_CONVERT_INTERVAL_SEC", "300"))
+
+    # Statistiques
+    @property
+    def stats_snapshot_max_age_sec(self) -> float:
+        """Âge maximal d'une section du snapshot des statistiques.
+
+        STATS_SNAPSHOT_MAX_AGE_SEC, défaut 300s. Couvre les écritures faites
+        hors de l'application (pipeline lmelp, mongosh), non détectées.
+        """
+        return float(os.environ.get("STATS_SNAPSHOT_MAX_AGE_SEC", "300"))
+
+    # Collections matérialisées
+    @property
+    def palmares_rebuild_on_startup(self) -> bool:
+        """Reconstruction complète du palmarès au démarrage.
+
+        PALMARES_REBUILD_ON_STARTUP, défaut false : le palmarès est maintenu à
+        chaque écriture d'avis et n'est reconstruit au démarrage que s'il est
+        vide. true : rattrape les avis écrits hors de l'application.
+        """
+        return os.environ.get("PALMARES_REBUILD_ON_STARTUP", "false").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+
+    @property
+    def livre_stats_rebuild_on_startup(self) -> bool:
+        """Reconstruction complète des statistiques par livre au démarrage.
+
+        LIVRE_STATS_REBUILD_ON_STARTUP, défaut false : même règle que le
+        palmarès (reconstruction seulement si livre_stats est vide). true :
+        rattrape aussi un changement de date d'émission.
+        """
+        return os.environ.get("LIVRE_STATS_REBUILD_ON_STARTUP", "false").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+
+    # Recherche d'épisodes
+    @property
+    def episode_search_index_path(self) -> str:
+        """Fichier de l'index de recherche des épisodes (EPISODE_SEARCH_INDEX_PATH).
+
+        Par défaut: data/processed/episode_search_index.bin.gz.
+        """
+        return os.environ.get(
+            "EPISODE_SEARCH_INDEX_PATH",
+            os.path.join(
+                os.getcwd(), "data", "processed", "episode_search_index.bin.gz"
+            ),
+        )
+
+    @property
+    def episode_search_index_sync_interval_sec(self) -> float:
+        """Intervalle de resynchronisation de l'index de recherche des épisodes.
+
+        EPISODE_SEARCH_INDEX_SYNC_INTERVAL_SEC, défaut 300s. Rattrape les
+        épisodes écrits hors de l'application (pipeline lmelp).
+        0 : synchronisation au démarrage seulement.
+        """
+        return float(os.environ.get("EPISODE_SEARCH_INDEX_SYNC_INTERVAL_SEC", "300"))
+
+    @property
+    def search_entity_timeout_sec(self) -> float:
+        """Délai maximum de recherche par entité (/api/search, recherche avancée).
+
+        SEARCH_ENTITY_TIMEOUT_SEC, défaut 5s. Au-delà, la section de
+        l'entité est rendue vide avec <entité>_timed_out à true.
+        0 : pas de délai.
+        """
+        return float(os.environ.get("SEARCH_ENTITY_TIMEOUT_SEC", "5"))
+
     # Anna's Archive (Issue #188)
     @property
     def annas_archive_url(self) -> str | None:
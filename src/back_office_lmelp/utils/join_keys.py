@@ -0,0 +1,86 @@
+"""Clés de jointure typées (ObjectId) à côté des références *_oid en String.
+
+Les références historiques (avis.livre_oid, avis.emission_oid,
+avis.critique_oid, livresauteurs_cache.episode_oid, avis_critiques.episode_oid)
+sont des Strings alors que les _id ciblés sont des ObjectId. Chaque document
+porte aussi la version typée de ces références (livre_id, emission_id,
+critique_id, episode_id) : les $lookup utilisent localField/foreignField et
+les index, sans $toString/$toObjectId. Les champs String sont conservés pour
+l'API et le pipeline lmelp.
+"""
+
+from typing import Any
+
+from bson import ObjectId
+
+
+# Par collection : (champ String historique, champ ObjectId typé)
+TYPED_JOIN_FIELDS: dict[str, tuple[tuple[str, str], ...]] = {
+    "avis": (
+        ("emission_oid", "emission_id"),
+        ("livre_oid", "livre_id"),
+        ("critique_oid", "critique_id"),
+    ),
+    "livresauteurs_cache": (("episode_oid", "episode_id"),),
+    "avis_critiques": (("episode_oid", "episode_id"),),
+}
+
+
+def to_object_id(value: Any) -> ObjectId | None:
+    """ObjectId d'une référence String (None si absente ou invalide)."""
+    if isinstance(value, ObjectId):
+        return value
+    if value and ObjectId.is_valid(str(value)):
+        return ObjectId(str(value))
+    return None
+
+
+def typed_join_fields(collection: str, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Champs typés correspondant aux références String présentes dans data.
+
+    Seules les références présentes sont converties : utilisable pour un
+    document complet comme pour un $set partiel.
+
+    Args:
+        collection: Nom de la collection (clé de TYPED_JOIN_FIELDS)
+        data: Document ou champs mis à jour
+
+    Returns:
+        Dict champ typé → ObjectId (ou None)
+    """
+    return {
+        typed_field: to_object_id(data[string_field])
+        for string_field, typed_field in TYPED_JOIN_FIELDS[collection]
+        if string_field in data
+    }
+
+
+def typed_join_key(string_field: str, typed_field: str) -> dict[str, Any]:
+    """
+    Expression d'agrégation de la clé typée, avec repli sur la référence String.
+
+    Les documents écrits hors de l'application (pipeline lmelp) n'ont le champ
+    typé qu'après le rattrapage (utils/migrate_typed_join_fields.py) : en
+    attendant, la clé est convertie depuis le champ String (null si invalide).
+
+    Args:
+        string_field: Champ String historique (ex: "episode_oid")
+        typed_field: Champ ObjectId typé (ex: "episode_id")
+
+    Returns:
+        Expression ObjectId (ou null) utilisable dans $group / $project
+    """
+    return {
+        "$ifNull": [
+            f"${typed_field}",
+            {
+                "$convert": {
+                    "input": f"${string_field}",
+                    "to": "objectId",
+                    "onError": None,
+                    "onNull": None,
+                }
+            },
+        ]
+    }
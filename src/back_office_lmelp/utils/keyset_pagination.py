@@ -0,0 +1,242 @@
+"""Pagination par curseur (keyset) pour les recherches et listes paginées.
+
+Avec skip(offset), MongoDB parcourt puis jette les offset premiers documents :
+le coût d'une page croît avec sa profondeur. Un curseur mémorise la clé de
+tri du dernier document servi (valeurs des champs de tri, _id en dernier pour
+départager) ; la page suivante filtre sur « strictement après cette clé » et
+profite de l'index de tri : une page profonde coûte autant que la première.
+
+Le curseur est un jeton opaque (JSON étendu BSON en base64 URL-safe) : les
+types ObjectId et datetime des clés sont conservés.
+
+Contrainte : les champs de tri doivent être renseignés (les opérateurs
+$lt/$gt ne comparent pas null aux autres types).
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from bson import json_util
+
+
+SortSpec = Sequence[tuple[str, int]]
+
+# Filtre d'un rang, ou fonction qui le construit si la page atteint ce rang
+# (None : rang vide, aucune requête)
+TierQuery = dict[str, Any] | Callable[[], dict[str, Any] | None]
+
+
+class InvalidCursorError(ValueError):
+    """Jeton de pagination illisible ou incompatible avec le tri demandé."""
+
+
+def encode_cursor(payload: Any) -> str:
+    """
+    Encode une valeur sérialisable BSON en jeton opaque.
+
+    Args:
+        payload: Valeur à encoder (liste de clés de tri, dict de curseurs...)
+
+    Returns:
+        Jeton base64 URL-safe, sans padding
+    """
+    raw = json_util.dumps(payload, json_options=json_util.CANONICAL_JSON_OPTIONS)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Any:
+    """
+    Décode un jeton produit par encode_cursor().
+
+    Args:
+        token: Jeton opaque
+
+    Returns:
+        Valeur d'origine (types BSON restaurés)
+
+    Raises:
+        InvalidCursorError: Si le jeton est illisible
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        return json_util.loads(raw)
+    except (binascii.Error, UnicodeError, ValueError, json.JSONDecodeError) as e:
+        raise InvalidCursorError(f"Curseur de pagination invalide: {token}") from e
+
+
+def cursor_for(doc: dict[str, Any], sort: SortSpec) -> str:
+    """Jeton désignant la position juste après un document (avant conversion de _id)."""
+    return encode_cursor([doc.get(field) for field, _ in sort])
+
+
+def keyset_filter(sort: SortSpec, token: str) -> dict[str, Any]:
+    """
+    Filtre « strictement après la clé du curseur » dans l'ordre de tri.
+
+    Pour un tri (a desc, _id asc), la clé (va, vid) donne :
+    {"$or": [{"a": {"$lt": va}}, {"a": va, "_id": {"$gt": vid}}]}
+
+    Args:
+        sort: Tri de la requête (le dernier champ doit être unique, ex. _id)
+        token: Jeton produit par cursor_for() avec le même tri
+
+    Returns:
+        Filtre MongoDB à combiner ($and) avec la requête
+
+    Raises:
+        InvalidCursorError: Si le jeton ne correspond pas au tri
+    """
+    values = decode_cursor(token)
+    if not isinstance(values, list) or len(values) != len(sort):
+        raise InvalidCursorError(f"Curseur de pagination invalide: {token}")
+    return _after_key(sort, values)
+
+
+def _after_key(sort: SortSpec, values: list[Any]) -> dict[str, Any]:
+    """Filtre « strictement après » des valeurs de clé déjà décodées."""
+    branches = []
+    for position, (field, direction) in enumerate(sort):
+        branch = {
+            previous_field: values[index]
+            for index, (previous_field, _) in enumerate(sort[:position])
+        }
+        branch[field] = {"$gt" if direction > 0 else "$lt": values[position]}
+        branches.append(branch)
+    return {"$or": branches}
+
+
+def find_page(
+    collection: Any,
+    query: dict[str, Any],
+    sort: SortSpec,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    projection: dict[str, Any] | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    Lit une page triée, par curseur si fourni, sinon par offset.
+
+    Un document de plus que limit est lu pour savoir s'il existe une page
+    suivante.
+
+    Args:
+        collection: Collection MongoDB
+        query: Filtre de la recherche
+        sort: Tri (dernier champ unique, ex. _id)
+        limit: Taille de la page
+        offset: Décalage (ignoré si cursor est fourni, compatibilité)
+        cursor: Jeton de la page précédente (next_cursor)
+        projection: Projection optionnelle
+
+    Returns:
+        Tuple (documents de la page, next_cursor ou None si dernière page)
+
+    Raises:
+        InvalidCursorError: Si le curseur est invalide
+    """
+    if cursor:
+        query = {"$and": [query, keyset_filter(sort, cursor)]}
+        offset = 0
+
+    found = collection.find(query, projection) if projection else collection.find(query)
+    docs = list(found.sort(list(sort)).skip(offset).limit(limit + 1))
+    if len(docs) <= limit:
+        return docs, None
+    docs = docs[:limit]
+    return docs, cursor_for(docs[-1], sort)
+
+
+def find_tiered_page(
+    collection: Any,
+    queries: Sequence[TierQuery],
+    sort: SortSpec,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    projection: dict[str, Any] | None = None,
+    counts: Sequence[int | None] | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    Lit une page sur des requêtes successives (rangs), par curseur ou offset.
+
+    Tous les documents du premier rang sont servis, triés, avant ceux du
+    suivant. Les requêtes doivent être disjointes (ex. search_tiers()). Le
+    curseur mémorise le rang du dernier document servi puis sa clé de tri.
+    Un rang n'est lu (ni compté) que si la page l'atteint : un rang coûteux
+    (regex non indexé) peut être passé sous forme de fonction, appelée
+    seulement à ce moment (None si le rang se révèle vide).
+
+    Args:
+        collection: Collection MongoDB
+        queries: Filtres (ou fonctions les construisant), du rang le plus
+            pertinent au moins pertinent
+        sort: Tri à l'intérieur d'un rang (dernier champ unique, ex. _id)
+        limit: Taille de la page
+        offset: Décalage global (ignoré si cursor est fourni, compatibilité)
+        cursor: Jeton de la page précédente (next_cursor)
+        projection: Projection optionnelle
+        counts: Nombre de documents par rang s'il est déjà connu, None sinon
+            (les rangs vides ne sont pas lus, l'offset est décompté sans
+            requête ; le dernier rang n'est jamais compté)
+
+    Returns:
+        Tuple (documents de la page, next_cursor ou None si dernière page)
+
+    Raises:
+        InvalidCursorError: Si le curseur est invalide
+    """
+    start = 0
+    after: list[Any] | None = None
+    if cursor:
+        values = decode_cursor(cursor)
+        if (
+            not isinstance(values, list)
+            or len(values) != len(sort) + 1
+            or not isinstance(values[0], int)
+            or not 0 <= values[0] < len(queries)
+        ):
+            raise InvalidCursorError(f"Curseur de pagination invalide: {cursor}")
+        start, after = values[0], values[1:]
+        offset = 0
+
+    ranked: list[tuple[int, dict[str, Any]]] = []
+    for rank in range(start, len(queries)):
+        known = counts[rank] if counts is not None else None
+        if known == 0:
+            continue
+        tier = queries[rank]
+        query = tier() if callable(tier) else tier
+        if query is None:
+            continue
+        if after is not None and rank == start:
+            query = {"$and": [query, _after_key(sort, after)]}
+        elif offset:
+            # Rang entièrement sauté par l'offset : seul son nombre est lu
+            # (dernier rang : skip direct, sans comptage)
+            if known is None and rank < len(queries) - 1:
+                known = collection.count_documents(query)
+            if known is not None and offset >= known:
+                offset -= known
+                continue
+
+        found = (
+            collection.find(query, projection) if projection else collection.find(query)
+        )
+        wanted = limit + 1 - len(ranked)
+        ranked.extend(
+            (rank, doc) for doc in found.sort(list(sort)).skip(offset).limit(wanted)
+        )
+        offset = 0
+        if len(ranked) > limit:
+            break
+
+    docs = [doc for _, doc in ranked[:limit]]
+    if len(ranked) <= limit:
+        return docs, None
+    last_rank, last = ranked[limit - 1]
+    return docs, encode_cursor([last_rank] + [last.get(field) for field, _ in sort])
@@ -0,0 +1,155 @@
+"""Migration : ajout du champ nom_normalise aux éditeurs existants.
+
+CONTEXTE:
+- get_or_create_editeur() recherche les éditeurs via nom_normalise
+  (normalize_for_matching du nom), couvert par l'index unique nom_normalise_1.
+- Un éditeur sans nom_normalise n'est pas trouvé par cette recherche : cette
+  migration les complète tous d'un coup. Lancée aussi au démarrage de
+  l'application (éditeurs écrits par les scripts), sans fusion.
+
+USAGE:
+    # Aperçu : aucune écriture, doublons listés
+    python -m back_office_lmelp.utils.migrate_editeurs_nom_normalise --dry-run
+
+    # Complète nom_normalise et fusionne les doublons
+    python -m back_office_lmelp.utils.migrate_editeurs_nom_normalise
+
+CRITÈRES:
+- Ne traite que les éditeurs sans nom_normalise (idempotent)
+- Doublons normalisés ("Gallimard" / "gallimard") : fusionnés (CLI seulement)
+  dans l'éditeur qui porte déjà nom_normalise, sinon dans le plus ancien _id.
+  Les livres du doublon (livres.editeur_id) sont repointés, puis le doublon
+  est supprimé ; chaque fusion est journalisée. Au démarrage, les doublons
+  sont seulement signalés et gardent leur nom_normalise absent
+"""
+
+import argparse
+import logging
+from typing import Any
+
+from pymongo import UpdateMany, UpdateOne
+
+from ..services.mongodb_service import MongoDBService
+from .text_utils import normalize_for_matching
+
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_nom_normalise(
+    mongodb_service: Any, merge: bool = False, dry_run: bool = False
+) -> dict[str, int]:
+    """
+    Complète nom_normalise pour les éditeurs qui ne l'ont pas encore.
+
+    Args:
+        mongodb_service: Service MongoDB connecté
+        merge: Si True, fusionne les doublons normalisés (livres repointés,
+            doublon supprimé) ; sinon ils sont seulement signalés
+        dry_run: Si True, aucune écriture (complétions et fusions comptées)
+
+    Returns:
+        Dict avec "updated" (éditeurs complétés), "duplicates" (doublons
+        trouvés) et "merged" (doublons fusionnés puis supprimés)
+    """
+    collection = mongodb_service.editeurs_collection
+    livres_collection = mongodb_service.livres_collection
+    if collection is None or livres_collection is None:
+        raise Exception("Connexion MongoDB non établie")
+
+    # Nom normalisé → éditeur conservé (index unique)
+    kept = {
+        editeur["nom_normalise"]: editeur["_id"]
+        for editeur in collection.find(
+            {"nom_normalise": {"$type": "string"}}, {"nom_normalise": 1}
+        )
+    }
+
+    operations = []
+    repoints = []
+    duplicate_ids = []
+    for editeur in collection.find(
+        {"nom_normalise": {"$exists": False}}, {"nom": 1}
+    ).sort("_id", 1):
+        normalized_name = normalize_for_matching(editeur.get("nom", ""))
+        kept_id = kept.get(normalized_name)
+        if kept_id is not None:
+            duplicate_ids.append(editeur["_id"])
+            if not merge:
+                logger.warning(
+                    f"⚠️ Doublon éditeur '{editeur.get('nom')}' ({editeur['_id']}) "
+                    f"de {kept_id} non fusionné (migrate_editeurs_nom_normalise)"
+                )
+                continue
+            logger.info(
+                f"🔀 Doublon éditeur '{editeur.get('nom')}' ({editeur['_id']}) "
+                f"fusionné dans {kept_id}{' (dry-run)' if dry_run else ''}"
+            )
+            repoints.append(
+                UpdateMany(
+                    {"editeur_id": editeur["_id"]}, {"$set": {"editeur_id": kept_id}}
+                )
+            )
+            continue
+        kept[normalized_name] = editeur["_id"]
+        operations.append(
+            UpdateOne(
+                {"_id": editeur["_id"]}, {"$set": {"nom_normalise": normalized_name}}
+            )
+        )
+
+    if not dry_run:
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+        if repoints:
+            # Livres repointés avant la suppression : aucun editeur_id orphelin
+            livres_collection.bulk_write(repoints, ordered=False)
+            collection.delete_many({"_id": {"$in": duplicate_ids}})
+
+    return {
+        "updated": len(operations),
+        "duplicates": len(duplicate_ids),
+        "merged": len(repoints),
+    }
+
+
+def migrate_editeurs_nom_normalise(dry_run: bool = False) -> dict[str, int]:
+    """
+    Lance la migration (avec fusion des doublons) sur la base configurée.
+
+    Args:
+        dry_run: Si True, aucune écriture
+
+    Returns:
+        Dict avec "updated", "duplicates" et "merged"
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect():
+        logger.error("❌ Connexion MongoDB impossible")
+        return {"updated": 0, "duplicates": 0, "merged": 0}
+
+    try:
+        result = backfill_nom_normalise(mongodb_service, merge=True, dry_run=dry_run)
+        mode = " (dry-run)" if dry_run else ""
+        logger.info(
+            f"✅ {result['updated']} éditeurs complétés, "
+            f"{result['merged']} doublons fusionnés{mode}"
+        )
+        return result
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(
+        description="Complète editeurs.nom_normalise et fusionne les doublons"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Aucune écriture : complétions et fusions seulement journalisées",
+    )
+    migrate_editeurs_nom_normalise(dry_run=parser.parse_args().dry_run)
@@ -0,0 +1,110 @@
+"""Migration : ajout des champs de recherche normalisés (auteurs, livres, éditeurs).
+
+CONTEXTE:
+- search_auteurs, search_livres, search_editeurs et search_emissions
+  cherchent par préfixe ou début de mot sur <champ>_normalise et
+  <champ>_mots (voir utils/search_keys.py), couverts par des index.
+- Les documents créés avant ces champs ne sont trouvés que par le repli
+  regex : cette migration les complète.
+- Lancée aussi au démarrage de l'application (documents écrits par les
+  scripts hors application).
+
+USAGE:
+    python -m back_office_lmelp.utils.migrate_search_fields
+
+CRITÈRES:
+- Ne traite que les documents ayant le champ source sans <champ>_mots
+  ($exists: false) : reprise possible après interruption, chaque lot écrit
+  reste acquis
+- editeurs.nom_normalise n'est pas écrit ici (index unique, doublons gérés
+  par migrate_editeurs_nom_normalise) : seul nom_mots est complété
+"""
+
+import logging
+from typing import Any
+
+from pymongo import UpdateOne
+
+from ..services.mongodb_service import MongoDBService
+from .search_keys import SEARCH_SHADOW_FIELDS, search_shadow_fields
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELDS_BATCH_SIZE = 1000
+
+# Champs fantômes gérés par une autre migration
+_SKIPPED_FIELDS = {"editeurs": {"nom_normalise"}}
+
+
+def backfill_search_fields(
+    db: Any, batch_size: int = SEARCH_FIELDS_BATCH_SIZE
+) -> dict[str, int]:
+    """
+    Complète les champs de recherche des documents qui ne les ont pas encore.
+
+    Args:
+        db: Base MongoDB (pymongo)
+        batch_size: Nombre de documents par bulk_write
+
+    Returns:
+        Dict "collection.champ" → nombre de documents complétés
+    """
+    report: dict[str, int] = {}
+    for collection_name, fields in SEARCH_SHADOW_FIELDS.items():
+        collection = db[collection_name]
+        skipped = _SKIPPED_FIELDS.get(collection_name, set())
+        for field in fields:
+            updated = 0
+            operations: list[UpdateOne] = []
+            for doc in collection.find(
+                {f"{field}_mots": {"$exists": False}, field: {"$exists": True}},
+                {field: 1},
+            ):
+                shadow = {
+                    key: value
+                    for key, value in search_shadow_fields(
+                        collection_name, {field: doc.get(field)}
+                    ).items()
+                    if key not in skipped
+                }
+                operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": shadow}))
+                if len(operations) >= batch_size:
+                    updated += collection.bulk_write(
+                        operations, ordered=False
+                    ).modified_count
+                    operations = []
+            if operations:
+                updated += collection.bulk_write(
+                    operations, ordered=False
+                ).modified_count
+            report[f"{collection_name}.{field}"] = int(updated)
+    return report
+
+
+def migrate_search_fields() -> dict[str, int]:
+    """
+    Lance la migration sur la base configurée.
+
+    Returns:
+        Dict "collection.champ" → nombre de documents complétés
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect() or mongodb_service.db is None:
+        logger.error("❌ Connexion MongoDB impossible")
+        return {}
+
+    try:
+        report = backfill_search_fields(mongodb_service.db)
+        for field, updated in report.items():
+            logger.info(f"✅ {field}: {updated} documents complétés")
+        return report
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    migrate_search_fields()
@@ -0,0 +1,103 @@
+"""Migration : ajout des clés de jointure typées (ObjectId) aux références *_oid.
+
+CONTEXTE:
+- avis.livre_oid / emission_oid / critique_oid, livresauteurs_cache.episode_oid
+  et avis_critiques.episode_oid sont des Strings, les _id ciblés des ObjectId :
+  les $lookup devaient convertir via $toString/$toObjectId dans $expr, sans
+  index possible.
+- Cette migration ajoute à chaque document la version ObjectId de ces
+  références (livre_id, emission_id, critique_id, episode_id, voir
+  utils/join_keys.py). Les champs String sont conservés.
+- Lancée aussi au démarrage de l'application : rattrape les avis critiques
+  écrits par le pipeline lmelp depuis le dernier démarrage.
+
+USAGE:
+    python -m back_office_lmelp.utils.migrate_typed_join_fields
+
+CRITÈRES:
+- Ne traite que les documents sans champ typé ($exists: false) : reprise
+  possible après interruption, chaque lot écrit reste acquis
+- Référence absente ou invalide → champ typé à null (document traité)
+"""
+
+import logging
+from typing import Any
+
+from pymongo import UpdateOne
+
+from ..services.mongodb_service import MongoDBService
+from .join_keys import TYPED_JOIN_FIELDS, to_object_id
+
+
+logger = logging.getLogger(__name__)
+
+TYPED_JOIN_BATCH_SIZE = 1000
+
+
+def backfill_typed_join_fields(
+    db: Any, batch_size: int = TYPED_JOIN_BATCH_SIZE
+) -> dict[str, int]:
+    """
+    Complète les champs typés des documents qui ne les ont pas encore.
+
+    Args:
+        db: Base MongoDB (pymongo)
+        batch_size: Nombre de documents par bulk_write
+
+    Returns:
+        Dict "collection.champ_typé" → nombre de documents complétés
+    """
+    report: dict[str, int] = {}
+    for collection_name, fields in TYPED_JOIN_FIELDS.items():
+        collection = db[collection_name]
+        for string_field, typed_field in fields:
+            updated = 0
+            operations: list[UpdateOne] = []
+            for doc in collection.find(
+                {typed_field: {"$exists": False}}, {string_field: 1}
+            ):
+                operations.append(
+                    UpdateOne(
+                        {"_id": doc["_id"]},
+                        {"$set": {typed_field: to_object_id(doc.get(string_field))}},
+                    )
+                )
+                if len(operations) >= batch_size:
+                    updated += collection.bulk_write(
+                        operations, ordered=False
+                    ).modified_count
+                    operations = []
+            if operations:
+                updated += collection.bulk_write(
+                    operations, ordered=False
+                ).modified_count
+            report[f"{collection_name}.{typed_field}"] = int(updated)
+    return report
+
+
+def migrate_typed_join_fields() -> dict[str, int]:
+    """
+    Lance la migration sur la base configurée.
+
+    Returns:
+        Dict "collection.champ_typé" → nombre de documents complétés
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect() or mongodb_service.db is None:
+        logger.error("❌ Connexion MongoDB impossible")
+        return {}
+
+    try:
+        report = backfill_typed_join_fields(mongodb_service.db)
+        for field, updated in report.items():
+            logger.info(f"✅ {field}: {updated} documents complétés")
+        return report
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    migrate_typed_join_fields()
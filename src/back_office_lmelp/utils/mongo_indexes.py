@@ -0,0 +1,464 @@
+"""Registre déclaratif des index MongoDB et vérification des plans de requête.
+
+CONTEXTE:
+- Les requêtes chaudes des services filtrent sur des champs de jointure
+  (avis.emission_oid, livres.episodes, emissions.episode_id...) qui n'étaient
+  couverts par aucun index : chaque appel faisait un COLLSCAN.
+- REQUIRED_INDEXES déclare les index attendus par collection.
+  reconcile_indexes() crée ceux qui manquent (appelé dans le lifespan).
+- explain_canonical_queries() lance explain() sur les requêtes canoniques des
+  services et signale tout COLLSCAN restant.
+
+USAGE:
+    # Créer les index manquants puis afficher le rapport des plans
+    python -m back_office_lmelp.utils.mongo_indexes
+
+    # Rapport seul, sans créer d'index
+    python -m back_office_lmelp.utils.mongo_indexes --report-only
+
+Les index existants qui ne sont pas déclarés ne sont jamais supprimés : ils
+sont seulement listés dans le rapport (clé "unmanaged"), sauf les index
+retirés du registre (RETIRED_INDEXES, clé "dropped"). Un index existant
+avec les mêmes clés mais d'autres options (unique, sparse, filtre partiel) est
+signalé (clé "conflicts") : il doit être supprimé à la main pour être recréé.
+"""
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+
+from bson import ObjectId
+from pymongo.database import Database
+
+
+logger = logging.getLogger(__name__)
+
+# Valeur factice pour les champs *_oid stockés en String : le plan choisi par
+# MongoDB ne dépend pas de l'existence de la valeur.
+_SAMPLE_OID = "000000000000000000000000"
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Index attendu sur une collection."""
+
+    collection: str
+    keys: tuple[tuple[str, int], ...]
+    name: str
+    unique: bool = False
+    sparse: bool = False
+    partial_filter: dict[str, Any] | None = field(default=None, hash=False)
+
+    def options(self) -> dict[str, Any]:
+        """Options passées à create_index()."""
+        options: dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.sparse:
+            options["sparse"] = True
+        if self.partial_filter is not None:
+            options["partialFilterExpression"] = self.partial_filter
+        return options
+
+
+@dataclass(frozen=True)
+class CanonicalQuery:
+    """Requête représentative d'un service, vérifiée via explain()."""
+
+    label: str
+    collection: str
+    filter: dict[str, Any]
+    sort: tuple[tuple[str, int], ...] = ()
+
+
+REQUIRED_INDEXES: list[IndexSpec] = [
+    # avis : jointures vers émission, livre et critique
+    IndexSpec("avis", (("emission_oid", 1),), "emission_oid_1"),
+    IndexSpec("avis", (("livre_oid", 1),), "livre_oid_1"),
+    # avis : avis d'un critique (préfixe) et compteurs de la liste des
+    # critiques ($group couvert par l'index)
+    IndexSpec("avis", (("critique_oid", 1), ("note", 1)), "critique_oid_1_note_1"),
+    # avis : clés de jointure typées (ObjectId, $lookup localField/foreignField)
+    IndexSpec("avis", (("emission_id", 1),), "emission_id_1"),
+    IndexSpec("avis", (("livre_id", 1),), "livre_id_1"),
+    IndexSpec("avis", (("critique_id", 1),), "critique_id_1"),
+    # livres : tableau d'épisodes (multikey), URL Babelio, auteur ($lookup)
+    IndexSpec("livres", (("episodes", 1),), "episodes_1"),
+    IndexSpec("livres", (("url_babelio", 1),), "url_babelio_1", sparse=True),
+    IndexSpec("livres", (("auteur_id", 1),), "auteur_id_1"),
+    # recherche par préfixe / début de mot (champs normalisés, utils/search_keys)
+    IndexSpec("livres", (("titre_normalise", 1),), "titre_normalise_1"),
+    IndexSpec("livres", (("titre_mots", 1),), "titre_mots_1"),
+    IndexSpec(
+        "livres", (("editeur_normalise", 1),), "editeur_normalise_1", sparse=True
+    ),
+    IndexSpec("livres", (("editeur_mots", 1),), "editeur_mots_1", sparse=True),
+    IndexSpec("auteurs", (("nom_normalise", 1),), "nom_normalise_1"),
+    IndexSpec("auteurs", (("nom_mots", 1),), "nom_mots_1"),
+    IndexSpec("editeurs", (("nom_mots", 1),), "nom_mots_1"),
+    # livresauteurs_cache : lecture par épisode (+ statut) et clé d'upsert
+    IndexSpec(
+        "livresauteurs_cache",
+        (("episode_oid", 1), ("status", 1)),
+        "episode_oid_1_status_1",
+    ),
+    IndexSpec(
+        "livresauteurs_cache",
+        (("avis_critique_id", 1), ("auteur", 1), ("titre", 1)),
+        "avis_critique_id_1_auteur_1_titre_1",
+    ),
+    # livresauteurs_cache : clé typée episode_id (+ livre, programme d'un livre)
+    IndexSpec(
+        "livresauteurs_cache",
+        (("episode_id", 1), ("book_id", 1)),
+        "episode_id_1_book_id_1",
+    ),
+    # emissions : lien vers l'épisode et tri par date
+    IndexSpec("emissions", (("episode_id", 1),), "episode_id_1"),
+    IndexSpec("emissions", (("date", -1),), "date_-1"),
+    # avis_critiques : lien vers l'épisode, copie de episodes.masked
+    # (comptage des avis visibles sans $nin, couvert par l'index)
+    IndexSpec("avis_critiques", (("episode_oid", 1),), "episode_oid_1"),
+    IndexSpec("avis_critiques", (("episode_masked", 1),), "episode_masked_1"),
+    IndexSpec("avis_critiques", (("episode_id", 1),), "episode_id_1"),
+    # emission_badges : badges matérialisés (comptage des problèmes, par épisode)
+    IndexSpec("emission_badges", (("badge_status", 1),), "badge_status_1"),
+    IndexSpec("emission_badges", (("episode_oid", 1),), "episode_oid_1"),
+    # editeurs : get-or-create par nom normalisé (unicité garantie par l'index,
+    # partiel pour tolérer les éditeurs pas encore migrés)
+    IndexSpec(
+        "editeurs",
+        (("nom_normalise", 1),),
+        "nom_normalise_1",
+        unique=True,
+        partial_filter={"nom_normalise": {"$type": "string"}},
+    ),
+    # palmares : pagination du classement matérialisé, dans l'ordre servi
+    IndexSpec(
+        "palmares",
+        (("note_moyenne", -1), ("nombre_avis", -1), ("titre", 1), ("_id", 1)),
+        "note_moyenne_-1_nombre_avis_-1_titre_1__id_1",
+    ),
+    # palmares : recalcul des livres d'un auteur renommé
+    IndexSpec("palmares", (("auteur_id", 1),), "auteur_id_1"),
+    # episodes : liste des épisodes visibles triée par date
+    IndexSpec("episodes", (("masked", 1), ("date", -1)), "masked_1_date_-1"),
+    IndexSpec("episodes", (("date", -1),), "date_-1"),
+]
+
+# Index retirés du registre, supprimés par reconcile_indexes() : préfixes
+# redondants d'un index composé déclaré
+RETIRED_INDEXES: list[tuple[str, str]] = [
+    # préfixe de critique_oid_1_note_1
+    ("avis", "critique_oid_1"),
+]
+
+
+CANONICAL_QUERIES: list[CanonicalQuery] = [
+    CanonicalQuery("avis par émission", "avis", {"emission_oid": _SAMPLE_OID}),
+    CanonicalQuery("avis par livre", "avis", {"livre_oid": _SAMPLE_OID}),
+    CanonicalQuery("avis par critique", "avis", {"critique_oid": _SAMPLE_OID}),
+    CanonicalQuery(
+        "compteurs des critiques", "avis", {"critique_oid": {"$type": "string"}}
+    ),
+    CanonicalQuery(
+        "avis par émission (clé typée)",
+        "avis",
+        {"emission_id": ObjectId(_SAMPLE_OID)},
+    ),
+    CanonicalQuery(
+        "avis par livre (clé typée)", "avis", {"livre_id": ObjectId(_SAMPLE_OID)}
+    ),
+    CanonicalQuery(
+        "avis par critique (clé typée)",
+        "avis",
+        {"critique_id": ObjectId(_SAMPLE_OID)},
+    ),
+    CanonicalQuery("livres par épisode", "livres", {"episodes": _SAMPLE_OID}),
+    CanonicalQuery(
+        "livres par URL Babelio",
+        "livres",
+        {"url_babelio": "https://www.babelio.com/livres/x/1"},
+    ),
+    CanonicalQuery("livres par auteur", "livres", {"auteur_id": ObjectId(_SAMPLE_OID)}),
+    CanonicalQuery(
+        "livres par début de titre", "livres", {"titre_mots": {"$regex": "^carte"}}
+    ),
+    CanonicalQuery(
+        "auteurs par préfixe du nom",
+        "auteurs",
+        {"nom_normalise": {"$regex": "^carrere"}},
+    ),
+    CanonicalQuery(
+        "éditeurs par début de nom", "editeurs", {"nom_mots": {"$regex": "^minuit"}}
+    ),
+    CanonicalQuery(
+        "cache livres-auteurs par épisode et statut",
+        "livresauteurs_cache",
+        {"episode_oid": _SAMPLE_OID, "status": "verified"},
+    ),
+    CanonicalQuery(
+        "cache livres-auteurs par épisode (clé typée)",
+        "livresauteurs_cache",
+        {"episode_id": ObjectId(_SAMPLE_OID)},
+    ),
+    CanonicalQuery(
+        "émission par épisode", "emissions", {"episode_id": ObjectId(_SAMPLE_OID)}
+    ),
+    CanonicalQuery(
+        "avis critique par épisode", "avis_critiques", {"episode_oid": _SAMPLE_OID}
+    ),
+    CanonicalQuery(
+        "avis critique par épisode (clé typée)",
+        "avis_critiques",
+        {"episode_id": ObjectId(_SAMPLE_OID)},
+    ),
+    CanonicalQuery(
+        "avis critiques visibles",
+        "avis_critiques",
+        {"episode_masked": {"$ne": True}},
+    ),
+    CanonicalQuery(
+        "éditeur par nom normalisé", "editeurs", {"nom_normalise": "gallimard"}
+    ),
+    CanonicalQuery(
+        "page du palmarès",
+        "palmares",
+        {},
+        sort=(("note_moyenne", -1), ("nombre_avis", -1), ("titre", 1), ("_id", 1)),
+    ),
+    CanonicalQuery("épisodes masqués", "episodes", {"masked": True}),
+    CanonicalQuery("épisodes par date", "episodes", {}, sort=(("date", -1),)),
+]
+
+
+def _key_signature(keys: Any) -> tuple[tuple[str, Any], ...]:
+    """Signature comparable des clés d'un index (ordre significatif)."""
+    return tuple((str(name), direction) for name, direction in keys)
+
+
+def _option_mismatches(spec: IndexSpec, info: dict[str, Any]) -> list[str]:
+    """Options de spec absentes ou différentes dans l'index existant."""
+    mismatches = []
+    if bool(info.get("unique", False)) != spec.unique:
+        mismatches.append(f"unique={spec.unique}")
+    if bool(info.get("sparse", False)) != spec.sparse:
+        mismatches.append(f"sparse={spec.sparse}")
+    partial_filter = info.get("partialFilterExpression")
+    if (dict(partial_filter) if partial_filter else None) != spec.partial_filter:
+        mismatches.append(f"partialFilterExpression={spec.partial_filter}")
+    return mismatches
+
+
+def reconcile_indexes(
+    db: Database,
+    specs: list[IndexSpec] | None = None,
+    retired: list[tuple[str, str]] | None = None,
+) -> dict[str, list[str]]:
+    """Crée les index déclarés qui n'existent pas encore.
+
+    Un index existant avec les mêmes clés (quel que soit son nom) et les mêmes
+    options (unique, sparse, filtre partiel) est considéré comme satisfaisant.
+    Mêmes clés mais autres options : conflit rapporté, l'index n'est ni
+    supprimé ni recréé (une contrainte unique attendue manquerait sinon sans
+    bruit). Les index non déclarés ne sont pas supprimés, sauf les index
+    retirés (redondants avec un index déclaré).
+
+    Args:
+        db: Base MongoDB (pymongo)
+        specs: Index attendus (REQUIRED_INDEXES par défaut)
+        retired: Index (collection, nom) à supprimer s'ils existent
+            (RETIRED_INDEXES par défaut, aucun si specs est fourni)
+
+    Returns:
+        Dict avec les listes "created", "existing", "conflicts", "dropped",
+        "unmanaged" et "errors" (éléments au format "collection.nom_index")
+    """
+    if retired is None:
+        retired = RETIRED_INDEXES if specs is None else []
+    specs = REQUIRED_INDEXES if specs is None else specs
+    report: dict[str, list[str]] = {
+        "created": [],
+        "existing": [],
+        "conflicts": [],
+        "dropped": [],
+        "unmanaged": [],
+        "errors": [],
+    }
+
+    for collection_name, index_name in retired:
+        qualified = f"{collection_name}.{index_name}"
+        try:
+            collection = db[collection_name]
+            if index_name in collection.index_information():
+                collection.drop_index(index_name)
+                report["dropped"].append(qualified)
+                logger.info(f"🗑️ Index retiré supprimé: {qualified}")
+        except Exception as e:
+            report["errors"].append(f"{qualified}: {e}")
+            logger.error(f"❌ Suppression de l'index {qualified} impossible: {e}")
+
+    by_collection: dict[str, list[IndexSpec]] = {}
+    for spec in specs:
+        by_collection.setdefault(spec.collection, []).append(spec)
+
+    for collection_name, collection_specs in by_collection.items():
+        collection = db[collection_name]
+        try:
+            existing = collection.index_information()
+        except Exception as e:
+            report["errors"].append(f"{collection_name}: {e}")
+            continue
+
+        existing_signatures = {
+            _key_signature(info.get("key", [])): name for name, info in existing.items()
+        }
+        declared_signatures = {_key_signature(s.keys) for s in collection_specs}
+
+        for spec in collection_specs:
+            qualified = f"{collection_name}.{spec.name}"
+            existing_name = existing_signatures.get(_key_signature(spec.keys))
+            if existing_name is not None:
+                mismatches = _option_mismatches(spec, existing[existing_name])
+                if not mismatches:
+                    report["existing"].append(qualified)
+                    continue
+                conflict = (
+                    f"{qualified}: index existant {existing_name} différent "
+                    f"(attendu {', '.join(mismatches)})"
+                )
+                report["conflicts"].append(conflict)
+                logger.error(f"❌ Options d'index divergentes: {conflict}")
+                continue
+            try:
+                collection.create_index(list(spec.keys), **spec.options())
+                report["created"].append(qualified)
+                logger.info(f"✅ Index créé: {qualified}")
+            except Exception as e:
+                report["errors"].append(f"{qualified}: {e}")
+                logger.error(f"❌ Création de l'index {qualified} impossible: {e}")
+
+        for signature, name in existing_signatures.items():
+            if name != "_id_" and signature not in declared_signatures:
+                report["unmanaged"].append(f"{collection_name}.{name}")
+
+    return report
+
+
+def _collect_stages(plan: Any) -> list[str]:
+    """Liste tous les stages d'un plan explain() (parcours récursif)."""
+    stages: list[str] = []
+    if isinstance(plan, dict):
+        stage = plan.get("stage")
+        if isinstance(stage, str):
+            stages.append(stage)
+        for value in plan.values():
+            stages.extend(_collect_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_collect_stages(item))
+    return stages
+
+
+def explain_canonical_queries(
+    db: Database, queries: list[CanonicalQuery] | None = None
+) -> list[dict[str, Any]]:
+    """Lance explain() sur les requêtes canoniques et signale les COLLSCAN.
+
+    Args:
+        db: Base MongoDB (pymongo)
+        queries: Requêtes à vérifier (CANONICAL_QUERIES par défaut)
+
+    Returns:
+        Une entrée par requête : label, collection, stages du plan gagnant,
+        collscan (bool) et error (str | None)
+    """
+    queries = CANONICAL_QUERIES if queries is None else queries
+    results: list[dict[str, Any]] = []
+
+    for query in queries:
+        entry: dict[str, Any] = {
+            "label": query.label,
+            "collection": query.collection,
+            "stages": [],
+            "collscan": False,
+            "error": None,
+        }
+        try:
+            cursor = db[query.collection].find(query.filter)
+            if query.sort:
+                cursor = cursor.sort(list(query.sort))
+            explanation = cursor.explain()
+            winning_plan = explanation.get("queryPlanner", {}).get("winningPlan", {})
+            stages = _collect_stages(winning_plan)
+            entry["stages"] = stages
+            entry["collscan"] = "COLLSCAN" in stages
+        except Exception as e:
+            entry["error"] = str(e)
+        results.append(entry)
+
+    return results
+
+
+def main() -> int:
+    """Réconcilie les index puis affiche le rapport des plans de requête."""
+    parser = argparse.ArgumentParser(
+        description="Réconciliation des index MongoDB et détection des COLLSCAN"
+    )
+    parser.add_argument(
+        "--report-only",
+        action="store_true",
+        help="n'affiche que le rapport explain(), sans créer d'index",
+    )
+    args = parser.parse_args()
+
+    from ..services.mongodb_service import MongoDBService
+
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect() or mongodb_service.db is None:
+        logger.error("❌ Connexion MongoDB impossible")
+        return 1
+
+    try:
+        if not args.report_only:
+            report = reconcile_indexes(mongodb_service.db)
+            logger.info(
+                f"📊 Index: {len(report['created'])} créés, "
+                f"{len(report['existing'])} existants, "
+                f"{len(report['conflicts'])} en conflit, "
+                f"{len(report['dropped'])} retirés, "
+                f"{len(report['unmanaged'])} non déclarés, "
+                f"{len(report['errors'])} erreurs"
+            )
+            for item in report["conflicts"]:
+                logger.error(f"   ❌ {item}")
+            for item in report["unmanaged"]:
+                logger.info(f"   • non déclaré: {item}")
+            for item in report["errors"]:
+                logger.error(f"   ❌ {item}")
+
+        results = explain_canonical_queries(mongodb_service.db)
+        collscans = 0
+        for result in results:
+            if result["error"]:
+                logger.error(f"❌ {result['label']}: {result['error']}")
+            elif result["collscan"]:
+                collscans += 1
+                logger.warning(f"⚠️ COLLSCAN {result['collection']} — {result['label']}")
+            else:
+                logger.info(
+                    f"✅ {result['collection']} — {result['label']}: "
+                    f"{' > '.join(result['stages'])}"
+                )
+        return 1 if collscans else 0
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Reconstruction complète de la collection matérialisée emission_badges.
+
+CONTEXTE:
+- Le badge (pastille) de chaque émission est persisté dans emission_badges et
+  mis à jour de façon incrémentale lors des écritures d'avis et des
+  changements de livres.episodes.
+- Une écriture faite hors de MongoDBService (script, mongosh) ou un échec de
+  mise à jour peut laisser un badge périmé : cette commande recalcule tout.
+
+USAGE:
+    python -m back_office_lmelp.utils.rebuild_emission_badges
+
+CRITÈRES:
+- Recalcule le badge de toutes les émissions (upsert, idempotent)
+- Supprime les badges des émissions qui n'existent plus
+"""
+
+import logging
+
+from ..services.emission_badge_service import rebuild_emission_badges
+from ..services.mongodb_service import MongoDBService
+
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_all_emission_badges() -> dict[str, int]:
+    """
+    Reconstruit tous les badges d'émission.
+
+    Returns:
+        Dict avec "rebuilt" et "removed"
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect():
+        logger.error("❌ Connexion MongoDB impossible")
+        return {"rebuilt": 0, "removed": 0}
+
+    try:
+        result = rebuild_emission_badges(mongodb_service)
+        logger.info(
+            f"✅ {result['rebuilt']} badges recalculés, "
+            f"{result['removed']} badges orphelins supprimés"
+        )
+        return result
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    rebuild_all_emission_badges()
@@ -0,0 +1,56 @@
+"""Reconstruction complète de la collection matérialisée livre_stats.
+
+CONTEXTE:
+- Les statistiques par livre (note moyenne, notes par émission, notes par
+  critique, coups de cœur, tags Calibre lmelp_) sont persistées dans
+  livre_stats et mises à jour lors des écritures d'avis.
+- Elles sont reconstruites au démarrage de l'application ; cette commande
+  permet de le faire sans redémarrage après une écriture faite hors de
+  MongoDBService (script, mongosh) ou un changement de date d'émission.
+
+USAGE:
+    python -m back_office_lmelp.utils.rebuild_livre_stats
+
+CRITÈRES:
+- Recalcule le document de tous les livres ayant au moins un avis (upsert,
+  idempotent)
+- Supprime les documents des livres qui n'ont plus d'avis
+"""
+
+import logging
+
+from ..services.livre_stats_service import rebuild_livre_stats
+from ..services.mongodb_service import MongoDBService
+
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_all_livre_stats() -> dict[str, int]:
+    """
+    Reconstruit toutes les statistiques par livre.
+
+    Returns:
+        Dict avec "rebuilt" et "removed"
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect():
+        logger.error("❌ Connexion MongoDB impossible")
+        return {"rebuilt": 0, "removed": 0}
+
+    try:
+        result = rebuild_livre_stats(mongodb_service)
+        logger.info(
+            f"✅ {result['rebuilt']} livres recalculés, "
+            f"{result['removed']} documents obsolètes supprimés"
+        )
+        return result
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    rebuild_all_livre_stats()
@@ -0,0 +1,56 @@
+"""Reconstruction complète de la collection matérialisée palmares.
+
+CONTEXTE:
+- Le palmarès (livres classés par note moyenne) est persisté dans palmares et
+  mis à jour de façon incrémentale lors des écritures d'avis et des
+  changements de titre de livre ou de nom d'auteur.
+- Il est reconstruit au démarrage de l'application ; cette commande permet de
+  le faire sans redémarrage après une écriture faite hors de MongoDBService
+  (script, mongosh).
+
+USAGE:
+    python -m back_office_lmelp.utils.rebuild_palmares
+
+CRITÈRES:
+- Recalcule l'entrée de tous les livres ayant au moins 2 avis notés (upsert,
+  idempotent)
+- Supprime les entrées des livres passés sous le seuil
+"""
+
+import logging
+
+from ..services.mongodb_service import MongoDBService
+from ..services.palmares_service import rebuild_palmares
+
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_all_palmares() -> dict[str, int]:
+    """
+    Reconstruit tout le palmarès.
+
+    Returns:
+        Dict avec "rebuilt" et "removed"
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect():
+        logger.error("❌ Connexion MongoDB impossible")
+        return {"rebuilt": 0, "removed": 0}
+
+    try:
+        result = rebuild_palmares(mongodb_service)
+        logger.info(
+            f"✅ {result['rebuilt']} livres classés, "
+            f"{result['removed']} entrées obsolètes supprimées"
+        )
+        return result
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    rebuild_all_palmares()
@@ -0,0 +1,160 @@
+"""Ré-extraction groupée des avis de toutes les émissions.
+
+CONTEXTE:
+- Les avis structurés sont extraits des summaries des avis critiques
+  (POST /api/avis/extract/{emission_id}, une émission à la fois).
+- Après un changement du parseur ou des summaries, cette commande ré-extrait
+  toutes les émissions en une passe (parsing en processus parallèles,
+  écritures groupées), voir services/avis_batch_extraction_service.py.
+
+USAGE:
+    python -m back_office_lmelp.utils.reextract_avis --dry-run
+    python -m back_office_lmelp.utils.reextract_avis
+    python -m back_office_lmelp.utils.reextract_avis --emission <id> --workers 4
+
+CRITÈRES:
+- Émissions ayant un avis critique avec summary
+- Les avis de chaque émission sont synchronisés par différence (idempotent) :
+  ajouts (+), modifications (~), suppressions (-), inchangés (=) ; une
+  émission dont le summary ne donne aucun avis est ignorée
+- --dry-run : aucune écriture, affiche l'écart des statistiques de matching
+  (phases 1 à 4, non matchés) entre les avis en base et la nouvelle extraction
+"""
+
+import argparse
+import asyncio
+import logging
+from typing import Any
+
+from ..services.avis_batch_extraction_service import (
+    AVIS_BATCH_MAX_WORKERS,
+    reextract_all_avis,
+)
+from ..services.mongodb_service import MongoDBService
+
+
+logger = logging.getLogger(__name__)
+
+
+def workers_count(value: str) -> int:
+    """Valide --workers : entre 1 et le nombre de CPU (AVIS_BATCH_MAX_WORKERS)."""
+    try:
+        workers = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"nombre entier attendu: {value}") from e
+    if not 1 <= workers <= AVIS_BATCH_MAX_WORKERS:
+        raise argparse.ArgumentTypeError(
+            f"doit être compris entre 1 et {AVIS_BATCH_MAX_WORKERS}"
+        )
+    return workers
+
+
+def _format_delta(delta: dict[str, int]) -> str:
+    """Écarts non nuls, ex. « match_phase1 +2, unmatched -2 »."""
+    parts = [f"{key} {value:+d}" for key, value in delta.items() if value]
+    return ", ".join(parts) or "aucun écart"
+
+
+def _format_writes(event: dict[str, Any]) -> str:
+    """Écritures par type, ex. « +1 ~2 -0 =11 »."""
+    return (
+        f"+{event['inserted_count']} ~{event['updated_count']} "
+        f"-{event['deleted_count']} ={event['unchanged_count']}"
+    )
+
+
+async def reextract(
+    emission_ids: list[str] | None = None,
+    dry_run: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """
+    Ré-extrait les avis et journalise la progression.
+
+    Args:
+        emission_ids: Émissions à traiter (toutes si None)
+        dry_run: Si True, aucune écriture
+        max_workers: Processus de parsing (défaut : nombre de CPU)
+
+    Returns:
+        Événement final ("complete") avec les totaux
+    """
+    mongodb_service = MongoDBService()
+    if not mongodb_service.connect():
+        logger.error("❌ Connexion MongoDB impossible")
+        return {}
+
+    summary: dict[str, Any] = {}
+    try:
+        async for event in reextract_all_avis(
+            mongodb_service,
+            emission_ids=emission_ids,
+            dry_run=dry_run,
+            max_workers=max_workers,
+        ):
+            if event["type"] == "start":
+                mode = " (dry-run)" if dry_run else ""
+                logger.info(f"🔄 {event['total']} émissions à ré-extraire{mode}")
+            elif event["type"] == "error":
+                logger.error(
+                    f"❌ [{event['current']}/{event['total']}] "
+                    f"{event['emission_id']}: {event['error']}"
+                )
+            elif event["type"] == "emission_result":
+                if event["skipped"]:
+                    detail = "aucun avis extrait, ignorée"
+                else:
+                    detail = (
+                        f"{event['extracted_count']} avis "
+                        f"({_format_writes(event)}), "
+                        f"{_format_delta(event['matching_delta'])}"
+                    )
+                logger.info(
+                    f"[{event['current']}/{event['total']}] "
+                    f"{event['emission_id']}: {detail}"
+                )
+            elif event["type"] == "complete":
+                summary = event
+                logger.info(
+                    f"✅ {event['processed']} émissions ré-extraites, "
+                    f"{event['skipped']} ignorées, {event['errors']} erreurs "
+                    f"({event['extracted_count']} avis : {_format_writes(event)}) — "
+                    f"{_format_delta(event['matching_delta'])}"
+                )
+        return summary
+    finally:
+        mongodb_service.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(
+        description="Ré-extraction groupée des avis de toutes les émissions"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Ne rien écrire, afficher les écarts de matching",
+    )
+    parser.add_argument(
+        "--emission",
+        action="append",
+        dest="emission_ids",
+        help="ID d'émission à traiter (répétable, toutes par défaut)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=workers_count,
+        default=None,
+        help="Nombre de processus de parsing, 1 à nombre de CPU (défaut : nombre de CPU)",
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        reextract(
+            emission_ids=args.emission_ids,
+            dry_run=args.dry_run,
+            max_workers=args.workers,
+        )
+    )
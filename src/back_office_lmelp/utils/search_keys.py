@@ -0,0 +1,118 @@
+"""Champs de recherche normalisés (sans accents) et requêtes par préfixe indexées.
+
+Les recherches d'entités (auteurs, livres, éditeurs) utilisaient un regex non
+ancré insensible aux accents (create_accent_insensitive_regex, $options: i) :
+aucun index utilisable, chaque frappe parcourait toute la collection.
+
+Chaque champ recherché a deux champs fantômes produits par
+normalize_for_matching, maintenus par les chemins d'écriture et indexés :
+- <champ>_normalise : texte normalisé complet (recherche par préfixe)
+- <champ>_mots : suffixes du texte normalisé commençant à chaque mot suivant
+  le premier (recherche par début de mot, index multikey)
+
+Un regex ancré ("^...", sans option i) sur ces champs est un parcours d'index
+par intervalle. Le regex historique ne sert plus qu'en repli, pour les
+correspondances au milieu d'un mot.
+"""
+
+import re
+from typing import Any
+
+from .text_utils import create_accent_insensitive_regex, normalize_for_matching
+
+
+# Par collection : champs recherchés
+SEARCH_SHADOW_FIELDS: dict[str, tuple[str, ...]] = {
+    "auteurs": ("nom",),
+    "livres": ("titre", "editeur"),
+    "editeurs": ("nom",),
+}
+
+# Début de mot : caractère de mot précédé d'un séparateur (espace, ', -...)
+_WORD_START = re.compile(r"(?<=\W)\w")
+
+# Borne du nombre de suffixes indexés par valeur (titres très longs)
+SEARCH_WORDS_MAX = 30
+
+
+def search_words(text: str | None) -> list[str]:
+    """
+    Suffixes normalisés commençant à chaque mot après le premier.
+
+    Exemple : "L'Œuvre au noir" → ["oeuvre au noir", "au noir", "noir"]
+
+    Args:
+        text: Texte source (nom, titre, éditeur)
+
+    Returns:
+        Suffixes, dans l'ordre du texte (au plus SEARCH_WORDS_MAX)
+    """
+    normalized = normalize_for_matching(text or "")
+    starts = [match.start() for match in _WORD_START.finditer(normalized)]
+    return [normalized[start:] for start in starts[:SEARCH_WORDS_MAX]]
+
+
+def search_shadow_fields(collection: str, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Champs fantômes correspondant aux champs recherchés présents dans data.
+
+    Seuls les champs présents sont traités : utilisable pour un document
+    complet comme pour un $set partiel.
+
+    Args:
+        collection: Nom de la collection (clé de SEARCH_SHADOW_FIELDS)
+        data: Document ou champs mis à jour
+
+    Returns:
+        Dict <champ>_normalise / <champ>_mots → valeurs normalisées
+    """
+    fields: dict[str, Any] = {}
+    for field in SEARCH_SHADOW_FIELDS[collection]:
+        if field in data:
+            value = data[field] if isinstance(data[field], str) else ""
+            fields[f"{field}_normalise"] = normalize_for_matching(value)
+            fields[f"{field}_mots"] = search_words(value)
+    return fields
+
+
+def search_shadow_unset(field: str) -> dict[str, str]:
+    """$unset d'un champ recherché et de ses champs fantômes."""
+    return {field: "", f"{field}_normalise": "", f"{field}_mots": ""}
+
+
+def word_start_filter(field: str, query: str) -> dict[str, Any]:
+    """
+    Filtre indexé : le champ commence par query, ou l'un de ses mots.
+
+    Args:
+        field: Champ recherché (ex. "nom", "titre")
+        query: Terme saisi (normalisé ici)
+
+    Returns:
+        Filtre $or de deux regex ancrés (parcours d'index par intervalle)
+    """
+    prefix = {"$regex": "^" + re.escape(normalize_for_matching(query))}
+    return {"$or": [{f"{field}_normalise": prefix}, {f"{field}_mots": prefix}]}
+
+
+def infix_filter(field: str, query: str) -> dict[str, Any]:
+    """Filtre de repli : regex insensible aux accents au milieu d'un mot (Issue #92)."""
+    return {field: {"$regex": create_accent_insensitive_regex(query), "$options": "i"}}
+
+
+def search_tiers(field: str, query: str) -> list[dict[str, Any]]:
+    """
+    Filtres disjoints par rang : début de mot, puis milieu de mot.
+
+    "ange" trouve "Angelo" au premier rang et "Solange" au second ; le
+    second rang exclut ($nor) les documents déjà trouvés au premier.
+
+    Args:
+        field: Champ recherché (ex. "nom", "titre")
+        query: Terme saisi
+
+    Returns:
+        [filtre indexé word_start_filter, filtre infix_filter hors premier rang]
+    """
+    word_start = word_start_filter(field, query)
+    return [word_start, {**infix_filter(field, query), "$nor": [word_start]}]
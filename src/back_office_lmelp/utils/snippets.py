@@ -0,0 +1,164 @@
+"""Extraits de recherche à partir d'offsets caractère.
+
+_extract_search_context passait la transcription entière en minuscules puis
+la découpait en liste de mots pour n'afficher que 10 mots de contexte : des
+mégaoctets alloués par page de résultats sur les transcriptions d'une heure.
+
+Ici, tout part d'occurrences (début, fin) en offsets caractère :
+- fournies par l'index de recherche des épisodes (positions des tokens,
+  voir EpisodeSearchIndex.char_spans) quand il est prêt
+- sinon cherchées par regex insensible aux accents dans une fenêtre bornée
+  (SNIPPET_SCAN_WINDOW premiers caractères, find_spans)
+
+Le contexte (SNIPPET_CONTEXT_WORDS mots avant et après) est lu dans une
+fenêtre bornée autour de chaque occurrence : le coût dépend de la taille de
+l'extrait, pas de celle du document. Le texte peut n'être qu'une fenêtre du
+document (base = offset de son premier caractère).
+"""
+
+import re
+from itertools import islice
+
+from .text_utils import create_accent_insensitive_regex
+
+
+# Mots de contexte avant et après une occurrence
+SNIPPET_CONTEXT_WORDS = 10
+
+# Fragments ("...") au plus par extrait, occurrences surlignées au plus
+SNIPPET_MAX_FRAGMENTS = 3
+SNIPPET_MAX_HITS = 10
+
+# Caractères parcourus au plus par la recherche sans index
+SNIPPET_SCAN_WINDOW = 20_000
+
+# Longueur maximale d'un mot prise en compte pour borner le contexte
+_MAX_WORD_LENGTH = 40
+
+# Fenêtre relue autour d'une occurrence éloignée du début du texte :
+# contexte avant le repère d'offset, puis occurrences proches et contexte
+SNIPPET_WINDOW_BEFORE = (SNIPPET_CONTEXT_WORDS + 1) * _MAX_WORD_LENGTH
+SNIPPET_WINDOW_AFTER = 4_000
+
+_WORD = re.compile(r"\S+")
+
+Span = tuple[int, int]
+
+
+def find_spans(text: str, query: str, max_hits: int = SNIPPET_MAX_HITS) -> list[Span]:
+    """
+    Occurrences de la requête (regex insensible aux accents, Issue #173).
+
+    Seuls les SNIPPET_SCAN_WINDOW premiers caractères sont parcourus.
+
+    Args:
+        text: Texte (ou début du texte) où chercher
+        query: Requête saisie
+        max_hits: Nombre maximum d'occurrences retournées
+
+    Returns:
+        Occurrences (début, fin) en offsets caractère dans text
+    """
+    if not query.strip() or not text:
+        return []
+    pattern = re.compile(create_accent_insensitive_regex(query.strip()), re.IGNORECASE)
+    matches = pattern.finditer(text, 0, min(len(text), SNIPPET_SCAN_WINDOW))
+    return [match.span() for match in islice(matches, max_hits)]
+
+
+def _context_start(text: str, pos: int, words: int) -> int:
+    """Début des `words` mots précédant pos (mot de l'occurrence inclus)."""
+    low = max(0, pos - (words + 1) * _MAX_WORD_LENGTH)
+    starts = [match.start() for match in _WORD.finditer(text, low, pos)]
+    if pos > 0 and not text[pos - 1].isspace():
+        words += 1  # début du mot de l'occurrence (ex: "L'" de "L'Étranger")
+    if len(starts) >= words:
+        return starts[-words] if words else pos
+    return 0 if low == 0 else (starts[0] if starts else pos)
+
+
+def _context_end(text: str, end: int, words: int) -> int:
+    """Fin des `words` mots suivant end (fin du mot de l'occurrence incluse)."""
+    high = min(len(text), end + (words + 1) * _MAX_WORD_LENGTH)
+    if end < len(text) and not text[end].isspace():
+        words += 1  # fin du mot de l'occurrence (ex: "s" de "maisons")
+    ends = [match.end() for match in islice(_WORD.finditer(text, end, high), words)]
+    if len(ends) >= words:
+        return ends[-1] if words else end
+    return high if high == len(text) else (ends[-1] if ends else end)
+
+
+def build_snippet(
+    text: str,
+    spans: list[Span],
+    base: int = 0,
+    length: int | None = None,
+    context_words: int = SNIPPET_CONTEXT_WORDS,
+    max_fragments: int = SNIPPET_MAX_FRAGMENTS,
+) -> tuple[str, list[Span]]:
+    """
+    Extrait avec contexte autour des occurrences, et leurs positions surlignées.
+
+    Les occurrences proches sont réunies dans un même fragment ; les
+    fragments éloignés sont séparés par "...". Des "..." encadrent aussi
+    l'extrait quand il ne commence ou ne finit pas avec le document.
+
+    Args:
+        text: Texte du document, ou fenêtre du document
+        spans: Occurrences (début, fin) en offsets dans le document
+        base: Offset du premier caractère de text dans le document
+        length: Longueur du document (défaut: base + len(text))
+        context_words: Mots de contexte avant et après chaque occurrence
+        max_fragments: Nombre maximum de fragments
+
+    Returns:
+        (extrait, surlignages) : surlignages = occurrences (début, fin) en
+        offsets dans l'extrait, à rendre en <mark>
+    """
+    if length is None:
+        length = base + len(text)
+    fragments: list[tuple[int, int, list[Span]]] = []
+    for start, end in sorted(spans):
+        start, end = start - base, end - base
+        if start < 0 or end > len(text):
+            continue
+        if fragments and start < fragments[-1][1]:
+            frag_start, frag_end, frag_spans = fragments[-1]
+            if start < frag_spans[-1][1]:
+                continue  # chevauche l'occurrence précédente
+            frag_spans.append((start, end))
+            fragments[-1] = (
+                frag_start,
+                max(frag_end, _context_end(text, end, context_words)),
+                frag_spans,
+            )
+            continue
+        if len(fragments) == max_fragments:
+            break
+        frag_start = _context_start(text, start, context_words)
+        if fragments:
+            frag_start = max(frag_start, fragments[-1][1])
+        fragments.append(
+            (frag_start, _context_end(text, end, context_words), [(start, end)])
+        )
+
+    parts: list[str] = []
+    highlights: list[Span] = []
+    size = 0
+    previous_end: int | None = None
+    for frag_start, frag_end, frag_spans in fragments:
+        if frag_start != previous_end and (
+            previous_end is not None or base + frag_start > 0
+        ):
+            parts.append("...")
+            size += 3
+        highlights.extend(
+            (size + start - frag_start, size + end - frag_start)
+            for start, end in frag_spans
+        )
+        parts.append(text[frag_start:frag_end])
+        size += frag_end - frag_start
+        previous_end = frag_end
+    if previous_end is not None and base + previous_end < length:
+        parts.append("...")
+    return "".join(parts), highlights
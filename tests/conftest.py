@@ -1,6 +1,7 @@
 """Configuration pytest pour les tests du Back-Office LMELP."""
 
 import asyncio
+from collections import defaultdict
 from collections.abc import AsyncGenerator
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -56,6 +57,31 @@ def mock_mongodb_service():
         yield mock_service_source
 
 
+@pytest.fixture
+def collections_service():
+    """Fabrique un service MongoDB mocké dont get_collection route par nom.
+
+    Usage: service, collections = collections_service(avis=[...],
+    aggregate={"livres": [...]}) ; chaque argument nommé fixe le retour de
+    find() de la collection du même nom, aggregate celui de aggregate().
+    Les autres collections sont des MagicMock créés au premier accès.
+    """
+
+    def make(
+        aggregate: dict[str, list[Any]] | None = None, **find: Any
+    ) -> tuple[MagicMock, dict[str, MagicMock]]:
+        collections: dict[str, MagicMock] = defaultdict(MagicMock)
+        for name, docs in find.items():
+            collections[name].find.return_value = list(docs)
+        for name, rows in (aggregate or {}).items():
+            collections[name].aggregate.return_value = list(rows)
+        service = MagicMock()
+        service.get_collection.side_effect = lambda name: collections[name]
+        return service, collections
+
+    return make
+
+
 @pytest.fixture
 def client(mock_mongodb_service):
     """Create a test client for the FastAPI app."""
@@ -137,7 +137,7 @@ class TestMongoDBServiceAccentInsensitive:
         # Mock de la collection MongoDB
         mock_collection = mocker.MagicMock()
         mock_collection.count_documents.return_value = 1
-        mock_collection.find.return_value.skip.return_value.limit.return_value = [
+        mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [
             {"_id": "123", "nom": "Emmanuel Carrère"}
         ]
 
@@ -148,8 +148,9 @@ class TestMongoDBServiceAccentInsensitive:
         # Appeler search_auteurs avec un terme sans accent
         service.search_auteurs("carrere", limit=10, offset=0)
 
-        # Vérifier que count_documents a été appelé avec un regex insensible aux accents
-        call_args = mock_collection.count_documents.call_args
+        # Le rang « milieu de mot » (lu, page non remplie) filtre avec un
+        # regex insensible aux accents
+        call_args = mock_collection.find.call_args
         search_query = call_args[0][0]
 
         # Le regex doit contenir des charsets pour les variantes accentuées
@@ -170,7 +171,7 @@ class TestMongoDBServiceAccentInsensitive:
         # Mock de la collection MongoDB
         mock_livres_collection = mocker.MagicMock()
         mock_livres_collection.count_documents.return_value = 1
-        mock_livres_collection.find.return_value.skip.return_value.limit.return_value = [
+        mock_livres_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [
             {"_id": "456", "titre": "Simone Émonet", "auteur_id": None}
         ]
 
@@ -182,8 +183,9 @@ class TestMongoDBServiceAccentInsensitive:
         # Appeler search_livres avec un terme sans accent
         service.search_livres("emonet", limit=10, offset=0)
 
-        # Vérifier que count_documents a été appelé avec un regex insensible aux accents
-        call_args = mock_livres_collection.count_documents.call_args
+        # Le rang « milieu de mot » (lu, page non remplie) filtre avec un
+        # regex insensible aux accents
+        call_args = mock_livres_collection.find.call_args
         search_query = call_args[0][0]
 
         # Le regex doit contenir des charsets pour les variantes accentuées
@@ -202,12 +204,8 @@ class TestMongoDBServiceAccentInsensitive:
 
         # Mock des collections MongoDB
         mock_editeurs_collection = mocker.MagicMock()
-        mock_editeurs_collection.find.return_value.skip.return_value.limit.return_value = [
-            {"_id": "789", "nom": "Flammarion"}
-        ]
-
+        mock_editeurs_collection.aggregate.return_value = iter([])
         mock_livres_collection = mocker.MagicMock()
-        mock_livres_collection.find.return_value.skip.return_value.limit.return_value = []
 
         # Créer une instance du service avec les collections mockées
         service = MongoDBService()
@@ -217,9 +215,10 @@ class TestMongoDBServiceAccentInsensitive:
         # Appeler search_editeurs
         service.search_editeurs("flammarion", limit=10, offset=0)
 
-        # Vérifier que find a été appelé avec un regex insensible aux accents
-        call_args_editeurs = mock_editeurs_collection.find.call_args
-        search_query_editeurs = call_args_editeurs[0][0]
+        # Vérifier que l'agrégation filtre avec un regex insensible aux accents
+        # (agrégation du rang « milieu de mot », page non remplie)
+        pipeline = mock_editeurs_collection.aggregate.call_args[0][0]
+        search_query_editeurs = pipeline[0]["$match"]
 
         # Le regex doit contenir des charsets pour les variantes accentuées
         assert "$regex" in search_query_editeurs["nom"]
@@ -436,7 +435,7 @@ class TestMongoDBServiceTypographicCharacters:
 
         mock_collection = mocker.MagicMock()
         mock_collection.count_documents.return_value = 1
-        mock_collection.find.return_value.skip.return_value.limit.return_value = [
+        mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [
             {"_id": "123", "nom": "L'Œuvre au noir"}
         ]
 
@@ -445,7 +444,7 @@ class TestMongoDBServiceTypographicCharacters:
 
         service.search_auteurs("oeuvre", limit=10, offset=0)
 
-        call_args = mock_collection.count_documents.call_args
+        call_args = mock_collection.find.call_args
         search_query = call_args[0][0]
 
         # Vérifier que le regex contient le pattern pour ligature œ
@@ -464,7 +463,7 @@ class TestMongoDBServiceTypographicCharacters:
 
         mock_collection = mocker.MagicMock()
         mock_collection.count_documents.return_value = 1
-        mock_collection.find.return_value.skip.return_value.limit.return_value = [
+        mock_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [
             {"_id": "456", "titre": "Marie–Claire", "auteur_id": None}
         ]
 
@@ -474,7 +473,7 @@ class TestMongoDBServiceTypographicCharacters:
 
         service.search_livres("Marie-Claire", limit=10, offset=0)
 
-        call_args = mock_collection.count_documents.call_args
+        call_args = mock_collection.find.call_args
         search_query = call_args[0][0]
 
         # Vérifier que le regex contient les deux types de tirets
@@ -500,7 +499,7 @@ class TestMongoDBServiceTypographicCharacters:
 
         service.search_episodes("etranger", limit=10, offset=0)
 
-        call_args = mock_collection.count_documents.call_args
+        call_args = mock_collection.find.call_args
         search_query = call_args[0][0]
 
         # Vérifier que le regex est insensible aux accents (contient charsets)
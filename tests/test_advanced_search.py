@@ -1,5 +1,8 @@
 """Tests pour l'endpoint de recherche avancée avec filtres et pagination."""
 
+import threading
+import time
+
 
 class TestAdvancedSearchFilters:
     """Tests pour les filtres par entité de la recherche avancée."""
@@ -236,6 +239,32 @@ class TestAdvancedSearchPagination:
         assert results["livres_total_count"] == 25
         assert results["episodes_total_count"] == 42
 
+    def test_advanced_search_estimated_total_covers_next_page(
+        self, client, mock_mongodb_service
+    ):
+        """
+        GIVEN: Une entité dont le total n'est qu'une estimation (rang infixe
+               non lu) mais qui a encore des résultats (has_more)
+        WHEN: L'endpoint /api/advanced-search est appelé
+        THEN: Le total et total_pages couvrent au moins la page suivante
+        """
+        mock_mongodb_service.search_auteurs.return_value = {
+            "auteurs": [{"nom": "Angelo Rinaldi"}, {"nom": "Angela Huth"}],
+            "total_count": 2,
+            "next_cursor": "curseur",
+            "has_more": True,
+        }
+
+        response = client.get(
+            "/api/advanced-search?q=ange&entities=auteurs&page=1&limit=2"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"]["auteurs_total_count"] == 3
+        assert data["pagination"]["total_pages"] == 2
+        assert data["pagination"]["next_cursor"] is not None
+
     def test_advanced_search_invalid_page_number(self, client):
         """
         GIVEN: Une requête avec page=0 (invalide)
@@ -465,3 +494,125 @@ class TestAdvancedSearchResponse:
             data_page2["results"]["editeurs"][0]["nom"]
             != data_page1["results"]["editeurs"][0]["nom"]
         )
+
+
+class TestAdvancedSearchTimeouts:
+    """Recherches par entité en parallèle, bornées par un délai."""
+
+    @staticmethod
+    def _slow_auteurs(*_args):
+        time.sleep(0.5)
+        return {"auteurs": [{"nom": "Albert Camus"}], "total_count": 1}
+
+    def test_slow_entity_times_out_others_returned(
+        self, client, mock_mongodb_service, monkeypatch
+    ):
+        """
+        GIVEN: Une recherche d'auteurs plus lente que SEARCH_ENTITY_TIMEOUT_SEC
+        WHEN: L'endpoint /api/advanced-search est appelé
+        THEN: Section auteurs vide avec auteurs_timed_out, les autres rendues
+        """
+        monkeypatch.setenv("SEARCH_ENTITY_TIMEOUT_SEC", "0.05")
+        mock_mongodb_service.search_auteurs.side_effect = self._slow_auteurs
+        mock_mongodb_service.search_livres.return_value = {
+            "livres": [{"titre": "L'Étranger"}],
+            "total_count": 1,
+        }
+
+        response = client.get("/api/advanced-search?q=Camus&entities=auteurs,livres")
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results["auteurs"] == []
+        assert results["auteurs_timed_out"] is True
+        assert results["livres"] == [{"titre": "L'Étranger"}]
+        assert results["livres_timed_out"] is False
+
+    def test_simple_search_reports_timed_out_entity(
+        self, client, mock_mongodb_service, monkeypatch
+    ):
+        """
+        GIVEN: Une recherche d'auteurs plus lente que SEARCH_ENTITY_TIMEOUT_SEC
+        WHEN: L'endpoint /api/search est appelé
+        THEN: auteurs_timed_out à true, les autres entités sans délai dépassé
+        """
+        monkeypatch.setenv("SEARCH_ENTITY_TIMEOUT_SEC", "0.05")
+        mock_mongodb_service.search_auteurs.side_effect = self._slow_auteurs
+
+        response = client.get("/api/search?q=Camus")
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results["auteurs"] == []
+        assert results["auteurs_timed_out"] is True
+        assert results["episodes_timed_out"] is False
+        assert results["emissions_timed_out"] is False
+
+    def test_searches_run_on_dedicated_bounded_pool(self, client, mock_mongodb_service):
+        """
+        GIVEN: Une recherche avancée
+        WHEN: Les entités sont recherchées
+        THEN: Dans le pool dédié borné, pas dans l'exécuteur par défaut
+        """
+        from back_office_lmelp.app import _get_search_executor
+
+        threads = []
+
+        def auteurs(*_args):
+            threads.append(threading.current_thread().name)
+            return {"auteurs": [], "total_count": 0}
+
+        mock_mongodb_service.search_auteurs.side_effect = auteurs
+
+        response = client.get("/api/advanced-search?q=Camus&entities=auteurs")
+
+        assert response.status_code == 200
+        assert threads and threads[0].startswith("search")
+        assert _get_search_executor()._max_workers == 10
+
+    def test_search_queries_bounded_server_side(
+        self, client, mock_mongodb_service, monkeypatch
+    ):
+        """
+        GIVEN: SEARCH_ENTITY_TIMEOUT_SEC à 2s
+        WHEN: Une entité est recherchée
+        THEN: La recherche tourne sous pymongo.timeout() (temps restant ≤ 2s),
+              pour que MongoDB interrompe aussi la requête
+        """
+        from contextlib import nullcontext
+        from unittest.mock import MagicMock
+
+        from back_office_lmelp import app as app_module
+
+        monkeypatch.setenv("SEARCH_ENTITY_TIMEOUT_SEC", "2")
+        timeout = MagicMock(return_value=nullcontext())
+        monkeypatch.setattr(app_module.pymongo, "timeout", timeout)
+        mock_mongodb_service.search_auteurs.return_value = {
+            "auteurs": [],
+            "total_count": 0,
+        }
+
+        response = client.get("/api/advanced-search?q=Camus&entities=auteurs")
+
+        assert response.status_code == 200
+        remaining = timeout.call_args[0][0]
+        assert 0 < remaining <= 2
+
+    def test_search_pool_shut_down_and_recreated(self):
+        """
+        GIVEN: Le pool des recherches arrêté (fin du cycle de vie)
+        WHEN: Une nouvelle recherche le demande (application relancée)
+        THEN: Un nouveau pool utilisable est créé
+        """
+        from back_office_lmelp.app import (
+            _get_search_executor,
+            _shutdown_search_executor,
+        )
+
+        executor = _get_search_executor()
+        _shutdown_search_executor()
+
+        assert executor._shutdown
+        new_executor = _get_search_executor()
+        assert new_executor is not executor
+        assert new_executor.submit(lambda: 42).result() == 42
@@ -286,17 +286,29 @@ class TestExtractAvisFromEmission:
         self.mock_mongodb.livres_collection.find.return_value = []
         self.mock_mongodb.critiques_collection.find.return_value = []
 
-        # Mock delete et save
-        self.mock_mongodb.delete_avis_by_emission.return_value = 0
-        self.mock_mongodb.save_avis_batch.return_value = [str(ObjectId())]
+        # Mock de la synchronisation par différence
+        self.mock_mongodb.sync_avis_for_emissions.return_value = {
+            "inserted": 1,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+        }
 
         response = self.client.post(f"/api/avis/extract/{str(emission_id)}")
 
         assert response.status_code == 200
         data = response.json()
         assert data["extracted_count"] == 1
+        assert data["inserted_count"] == 1
+        assert data["updated_count"] == 0
+        assert data["unchanged_count"] == 0
         assert "message" in data
 
+        # Une seule écriture, par différence, pour l'émission
+        [avis_by_emission] = self.mock_mongodb.sync_avis_for_emissions.call_args[0]
+        assert list(avis_by_emission) == [str(emission_id)]
+        self.mock_mongodb.delete_avis_by_emission.assert_not_called()
+
     def test_extract_emission_not_found(self):
         """Test que POST retourne 404 si émission non trouvée."""
         self.mock_mongodb.avis_collection = MagicMock()
@@ -740,9 +752,13 @@ class TestExtractAvisUsesCache:
         # Mock critiques (pas de match)
         self.mock_mongodb.critiques_collection.find.return_value = []
 
-        # Mock delete et save
-        self.mock_mongodb.delete_avis_by_emission.return_value = 0
-        self.mock_mongodb.save_avis_batch.return_value = [str(ObjectId())]
+        # Mock de la synchronisation par différence
+        self.mock_mongodb.sync_avis_for_emissions.return_value = {
+            "inserted": 1,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+        }
 
         # Mock update_one pour l'ajout de l'episode
         self.mock_mongodb.livres_collection.update_one = MagicMock()
@@ -839,8 +855,12 @@ class TestExtractAvisUsesCache:
         )
 
         self.mock_mongodb.critiques_collection.find.return_value = []
-        self.mock_mongodb.delete_avis_by_emission.return_value = 0
-        self.mock_mongodb.save_avis_batch.return_value = [str(ObjectId())]
+        self.mock_mongodb.sync_avis_for_emissions.return_value = {
+            "inserted": 1,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+        }
 
         # Mock update_one pour capturer l'appel
         self.mock_mongodb.livres_collection.update_one = MagicMock()
@@ -865,6 +885,11 @@ class TestExtractAvisUsesCache:
         assert "episodes" in update_arg["$addToSet"]
         assert update_arg["$addToSet"]["episodes"] == str(episode_id)
 
+        # Nombre de livres de l'épisode modifié : badge recalculé
+        self.mock_mongodb.refresh_emission_badges_for_episodes.assert_called_once_with(
+            [str(episode_id)]
+        )
+
     @patch("back_office_lmelp.app.get_livres_from_collections")
     def test_extract_returns_unmatched_avis_list(self, mock_get_livres):
         """
@@ -941,8 +966,12 @@ class TestExtractAvisUsesCache:
 
         self.mock_mongodb.critiques_collection = MagicMock()
         self.mock_mongodb.critiques_collection.find.return_value = []
-        self.mock_mongodb.delete_avis_by_emission.return_value = 0
-        self.mock_mongodb.save_avis_batch.return_value = [str(ObjectId())]
+        self.mock_mongodb.sync_avis_for_emissions.return_value = {
+            "inserted": 1,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+        }
 
         response = self.client.post(f"/api/avis/extract/{str(emission_id)}")
 
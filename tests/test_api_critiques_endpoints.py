@@ -27,6 +27,19 @@ def mock_mongodb_service():
         yield mock
 
 
+def _avis_critiques_find(avis_critiques):
+    """Faux find() sur avis_critiques : filtre $in sur episode_oid ou _id."""
+
+    def find(query, projection=None):
+        for field in ("episode_oid", "_id"):
+            if field in query:
+                values = query[field]["$in"]
+                return [avis for avis in avis_critiques if avis[field] in values]
+        return list(avis_critiques)
+
+    return find
+
+
 def test_get_detected_critiques_success(client, mock_mongodb_service):
     """Test de récupération des critiques détectés depuis un épisode.
 
@@ -187,51 +200,40 @@ def test_get_episodes_with_avis_critiques_success(client, mock_mongodb_service):
         "686bf5e18380ee925ae5e319",  # pragma: allowlist secret
     ]
 
-    # Mock du service d'extraction de critiques pour les pastilles
-    with patch(
-        "back_office_lmelp.app.critiques_extraction_service"
-    ) as mock_critiques_service:
-        # Mock des avis critiques pour vérifier les critiques "new"
-        # Premier épisode: a des critiques dont au moins un "new" (Bernard Poiret)
-        # Deuxième épisode: tous les critiques existent déjà (Elisabeth Philippe)
-        def mock_find_one(query):
-            episode_oid = query.get("episode_oid")
-            if episode_oid == "686bf5e18380ee925ae5e318":  # pragma: allowlist secret
-                return {
-                    "_id": "avis1",
-                    "episode_oid": episode_oid,
-                    "summary": "**Bernard Poiret**: avis critique",
-                }
-            if episode_oid == "686bf5e18380ee925ae5e319":  # pragma: allowlist secret
-                return {
-                    "_id": "avis2",
-                    "episode_oid": episode_oid,
-                    "summary": "**Elisabeth Philippe**: avis critique",
-                }
-            return None
-
-        mock_mongodb_service.avis_critiques_collection.find_one.side_effect = (
-            mock_find_one
-        )
+    # Critique existant : Elisabeth Philippe (Bernard Poiret est "new")
+    mock_mongodb_service.critiques_collection.find.return_value = [
+        {"_id": "crit1", "nom": "Elisabeth Philippe", "variantes": []}
+    ]
 
-        # Mock du service d'extraction de critiques
-        mock_critiques_service.extract_critiques_from_summary.side_effect = (
-            lambda summary: (
-                ["Bernard Poiret"]
-                if "Bernard Poiret" in summary
-                else ["Elisabeth Philippe"]
-            )
-        )
+    # Avis critiques : le premier a un statut précalculé, le second (données
+    # antérieures) est calculé depuis son summary puis persisté
+    avis_critiques = [
+        {
+            "_id": "avis1",
+            "episode_oid": "686bf5e18380ee925ae5e318",  # pragma: allowlist secret
+            "critiques_new_count": 1,
+            "critiques_existing_count": 0,
+        },
+        {
+            "_id": "avis2",
+            "episode_oid": "686bf5e18380ee925ae5e319",  # pragma: allowlist secret
+            "summary": "**Elisabeth Philippe**: avis critique",
+        },
+    ]
+    mock_mongodb_service.avis_critiques_collection.find.side_effect = (
+        _avis_critiques_find(avis_critiques)
+    )
 
-        # Mock find_matching_critique: Bernard Poiret n'existe pas (new), Elisabeth Philippe existe
-        mock_critiques_service.find_matching_critique.side_effect = lambda name, _: (
-            None
-            if name == "Bernard Poiret"
-            else {"nom": "Elisabeth Philippe", "match_type": "exact"}
-        )
+    # Appel de l'endpoint
+    response = client.get("/api/episodes-with-avis-critiques")
 
-        # Appel de l'endpoint
-        response = client.get("/api/episodes-with-avis-critiques")
+    # Aucun summary relu par épisode, le statut manquant est persisté
+    mock_mongodb_service.avis_critiques_collection.find_one.assert_not_called()
+    operations = mock_mongodb_service.avis_critiques_collection.bulk_write.call_args[0][
+        0
+    ]
+    assert [op._filter for op in operations] == [{"_id": "avis2"}]
+    assert operations[0]._doc["$set"]["critiques_existing_count"] == 1
 
     # Vérifications
     assert response.status_code == 200
@@ -351,6 +353,36 @@ def test_create_critique_success(client, mock_mongodb_service):
     assert "Variante 1" in data["variantes"]
 
 
+def test_add_variante_invalidates_critique_index(client, mock_mongodb_service):
+    """L'ajout d'une variante invalide l'index de matching des critiques."""
+    from bson import ObjectId
+
+    critique_id = ObjectId()
+    mock_mongodb_service.critiques_collection.find_one.return_value = {
+        "_id": critique_id,
+        "nom": "Patricia Martin",
+        "variantes": [],
+        "animateur": False,
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+    }
+    mock_mongodb_service.critiques_collection.update_one.return_value = MagicMock(
+        matched_count=1
+    )
+
+    with patch(
+        "back_office_lmelp.app.critiques_extraction_service.invalidate_critique_index"
+    ) as mock_invalidate:
+        response = client.put(
+            f"/api/critiques/{critique_id}/variantes",
+            json={"variante": "P. Martin"},
+        )
+
+    assert response.status_code == 200
+    assert "P. Martin" in response.json()["variantes"]
+    mock_invalidate.assert_called_once()
+
+
 def test_create_critique_with_animateur_true(client, mock_mongodb_service):
     """Test de création d'un critique avec animateur=True (Issue #154)."""
     from bson import ObjectId
@@ -491,54 +523,26 @@ def test_get_critiques_manquants_count(client, mock_mongodb_service):
         mock_existing_critiques
     )
 
-    # Mock des avis critiques
-    def mock_find_one(query):
-        episode_oid = query.get("episode_oid")
-        if episode_oid == str(mock_episode1_id):
-            # Épisode 1: a un critique "new" (Bernard Poiret)
-            return {
+    # Avis critiques (statut calculé depuis le summary à la première lecture)
+    mock_mongodb_service.avis_critiques_collection.find.side_effect = _avis_critiques_find(
+        [
+            {
+                # Épisode 1: a un critique "new" (Bernard Poiret)
                 "_id": "avis1",
-                "episode_oid": episode_oid,
+                "episode_oid": str(mock_episode1_id),
                 "summary": "**Bernard Poiret**: avis critique <br> **Patricia Martin**: autre avis",
-            }
-        if episode_oid == str(mock_episode2_id):
-            # Épisode 2: tous les critiques existent (Patricia Martin + Arnaud Viviant)
-            return {
+            },
+            {
+                # Épisode 2: tous les critiques existent
                 "_id": "avis2",
-                "episode_oid": episode_oid,
+                "episode_oid": str(mock_episode2_id),
                 "summary": "**Patricia Martin**: avis <br> **Arnaud Viviant**: avis",
-            }
-        return None
-
-    mock_mongodb_service.avis_critiques_collection.find_one.side_effect = mock_find_one
-
-    # Mock du service d'extraction de critiques
-    with patch(
-        "back_office_lmelp.app.critiques_extraction_service"
-    ) as mock_critiques_service:
-        mock_critiques_service.extract_critiques_from_summary.side_effect = (
-            lambda summary: (
-                ["Bernard Poiret", "Patricia Martin"]
-                if "Bernard Poiret" in summary
-                else ["Patricia Martin", "Arnaud Viviant"]
-            )
-        )
-
-        # Mock find_matching_critique:
-        # Bernard Poiret n'existe pas (new)
-        # Patricia Martin et Arnaud Viviant existent
-        critique_matches = {
-            "Patricia Martin": {"nom": "Patricia Martin", "match_type": "exact"},
-            "Arnaud Viviant": {"nom": "Arnaud Viviant", "match_type": "exact"},
-        }
-
-        def mock_find_matching(name, _):
-            return critique_matches.get(name)
-
-        mock_critiques_service.find_matching_critique.side_effect = mock_find_matching
+            },
+        ]
+    )
 
-        # Appel de l'endpoint
-        response = client.get("/api/stats/critiques-manquants")
+    # Appel de l'endpoint
+    response = client.get("/api/stats/critiques-manquants")
 
     # Vérifications
     assert response.status_code == 200
@@ -580,44 +584,28 @@ def test_get_critiques_manquants_count_filters_masked_episodes(
         mock_existing_critiques
     )
 
-    # Mock des avis critiques
-    def mock_find_one(query):
-        episode_oid = query.get("episode_oid")
-        if episode_oid == str(mock_episode1_id):
-            # Épisode masqué avec critique "new"
-            return {
-                "_id": "avis1",
-                "episode_oid": episode_oid,
-                "summary": "**Bernard Poiret**: avis critique",
-            }
-        if episode_oid == str(mock_episode2_id):
-            # Épisode non masqué avec critique "new"
-            return {
-                "_id": "avis2",
-                "episode_oid": episode_oid,
-                "summary": "**Arnaud Viviant**: avis critique",
-            }
-        return None
-
-    mock_mongodb_service.avis_critiques_collection.find_one.side_effect = mock_find_one
-
-    # Mock du service d'extraction
-    with patch(
-        "back_office_lmelp.app.critiques_extraction_service"
-    ) as mock_critiques_service:
-        mock_critiques_service.extract_critiques_from_summary.side_effect = (
-            lambda summary: (
-                ["Bernard Poiret"]
-                if "Bernard Poiret" in summary
-                else ["Arnaud Viviant"]
-            )
+    # Avis critiques avec statut précalculé : tous deux ont un critique "new"
+    mock_mongodb_service.avis_critiques_collection.find.side_effect = (
+        _avis_critiques_find(
+            [
+                {
+                    "_id": "avis1",
+                    "episode_oid": str(mock_episode1_id),
+                    "critiques_new_count": 1,
+                    "critiques_existing_count": 0,
+                },
+                {
+                    "_id": "avis2",
+                    "episode_oid": str(mock_episode2_id),
+                    "critiques_new_count": 1,
+                    "critiques_existing_count": 0,
+                },
+            ]
         )
+    )
 
-        # Les deux critiques n'existent pas (sont "new")
-        mock_critiques_service.find_matching_critique.return_value = None
-
-        # Appel de l'endpoint
-        response = client.get("/api/stats/critiques-manquants")
+    # Appel de l'endpoint
+    response = client.get("/api/stats/critiques-manquants")
 
     # Vérifications
     assert response.status_code == 200
@@ -266,40 +266,52 @@ class TestMergeCritiques:
 class TestMongoDBServiceGetAllCritiques:
     """Tests unitaires pour mongodb_service.get_all_critiques()."""
 
-    def test_get_all_critiques_uses_aggregation(self):
-        """get_all_critiques utilise un pipeline d'agrégation."""
+    def _make_service(self, critiques, counts):
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService()
         service.critiques_collection = MagicMock()
-        service.critiques_collection.aggregate.return_value = []
+        service.critiques_collection.find.return_value.sort.return_value = critiques
+        service.avis_collection = MagicMock()
+        service.avis_collection.aggregate.return_value = counts
+        return service
+
+    def test_get_all_critiques_uses_single_group_without_lookup(self):
+        """Un seul $group sur avis.critique_oid, pas de $lookup par critique."""
+        service = self._make_service([], [])
 
         result = service.get_all_critiques()
 
         assert result == []
-        service.critiques_collection.aggregate.assert_called_once()
+        pipeline = service.avis_collection.aggregate.call_args[0][0]
+        assert pipeline[-1]["$group"]["_id"] == "$critique_oid"
+        assert "$lookup" not in str(pipeline)
+        service.critiques_collection.aggregate.assert_not_called()
+        service.critiques_collection.find.return_value.sort.assert_called_once_with(
+            "nom", 1
+        )
 
     def test_get_all_critiques_returns_nombre_avis_and_note_moyenne(self):
-        """get_all_critiques inclut nombre_avis et note_moyenne depuis le pipeline."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService()
-        service.critiques_collection = MagicMock()
-        service.critiques_collection.aggregate.return_value = [
-            {
-                "_id": ObjectId(OID_VIVIANT),
-                "nom": "Arnaud Viviant",
-                "animateur": False,
-                "variantes": [],
-                "nombre_avis": 706,
-                "note_moyenne": 7.5,
-            }
-        ]
+        """Compteurs du $group fusionnés par ID, critique sans avis à zéro."""
+        service = self._make_service(
+            [
+                {
+                    "_id": ObjectId(OID_VIVIANT),
+                    "nom": "Arnaud Viviant",
+                    "animateur": False,
+                    "variantes": [],
+                },
+                {"_id": ObjectId(OID_NEUHOFF), "nom": "Eric Neuhoff"},
+            ],
+            [{"_id": OID_VIVIANT, "nombre_avis": 706, "note_moyenne": 7.5}],
+        )
 
         result = service.get_all_critiques()
-        assert len(result) == 1
+        assert len(result) == 2
         assert result[0]["nombre_avis"] == 706
         assert result[0]["note_moyenne"] == pytest.approx(7.5, abs=0.01)
+        assert result[1]["nombre_avis"] == 0
+        assert result[1]["note_moyenne"] is None
 
 
 # ── mongodb_service.merge_critiques (méthode unitaire) ───────────────────────
@@ -339,7 +351,12 @@ class TestMongoDBServiceMergeCritiques:
 
         service.avis_collection.update_many.assert_called_once_with(
             {"critique_oid": OID_NEUHOFF},
-            {"$set": {"critique_oid": OID_VIVIANT}},
+            {
+                "$set": {
+                    "critique_oid": OID_VIVIANT,
+                    "critique_id": ObjectId(OID_VIVIANT),
+                }
+            },
         )
 
     def test_merge_deletes_source_critique(self):
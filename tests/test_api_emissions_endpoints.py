@@ -1,11 +1,15 @@
 """Tests pour les endpoints API emissions (Issue #154)."""
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bson import ObjectId
 
+from back_office_lmelp.services.emission_conversion_service import (
+    emission_conversion_service,
+)
+
 
 @pytest.fixture
 def mock_emission():
@@ -49,9 +53,11 @@ class TestGetAllEmissions:
         """Doit retourner la liste des émissions."""
         with patch("back_office_lmelp.app.mongodb_service") as mock_service:
             mock_service.get_all_emissions.return_value = [mock_emission]
-            mock_service.get_episode_by_id.return_value = mock_episode
-            mock_service.get_avis_critique_by_id.return_value = {
-                "_id": mock_emission["avis_critique_id"]
+            mock_service.get_episodes_by_ids.return_value = {
+                str(mock_episode["_id"]): mock_episode
+            }
+            mock_service.get_existing_avis_critique_ids.return_value = {
+                str(mock_emission["avis_critique_id"])
             }
 
             response = client.get("/api/emissions")
@@ -61,24 +67,49 @@ class TestGetAllEmissions:
             assert len(data) == 1
             assert data[0]["id"] == str(mock_emission["_id"])
             assert data[0]["episode"]["titre"] == mock_episode["titre"]
-
-    def test_should_trigger_auto_conversion_if_empty(self, client):
-        """Doit déclencher l'auto-conversion si collection vide."""
+            assert data[0]["has_avis_critique"] is True
+            assert data[0]["badge_status"] == "no_avis"
+            # Lectures par lots, pas d'accès unitaire par émission
+            mock_service.get_episode_by_id.assert_not_called()
+            mock_service.get_avis_critique_by_id.assert_not_called()
+
+    def test_should_not_trigger_auto_conversion_on_read(self, client):
+        """GET /api/emissions est en lecture seule (conversion incrémentale ailleurs)."""
         with (
             patch("back_office_lmelp.app.mongodb_service") as mock_service,
             patch(
-                "back_office_lmelp.app.auto_convert_episodes_to_emissions"
-            ) as mock_convert,
+                "back_office_lmelp.app.emission_conversion_service"
+            ) as mock_conversion,
         ):
-            # Premier appel retourne liste vide, deuxième après conversion retourne toujours vide
             mock_service.get_all_emissions.return_value = []
-            mock_convert.return_value = AsyncMock()
 
             response = client.get("/api/emissions")
 
             assert response.status_code == 200
-            # Vérifier que auto_convert a été appelé
-            mock_convert.assert_called_once()
+            assert response.json() == []
+            mock_conversion.convert_new_avis_critiques.assert_not_called()
+            mock_conversion.convert_all.assert_not_called()
+            mock_service.create_emission.assert_not_called()
+
+    def test_auto_convert_endpoint_runs_full_conversion(self, client):
+        """POST /api/emissions/auto-convert lance une conversion complète."""
+        stats = {
+            "success": True,
+            "created": 2,
+            "skipped": 5,
+            "total_processed": 7,
+            "errors": [],
+        }
+        with patch(
+            "back_office_lmelp.app.emission_conversion_service"
+        ) as mock_conversion:
+            mock_conversion.convert_all.return_value = stats
+
+            response = client.post("/api/emissions/auto-convert")
+
+            assert response.status_code == 200
+            assert response.json() == stats
+            mock_conversion.convert_all.assert_called_once()
 
 
 class TestGetEmissionDetails:
@@ -648,7 +679,23 @@ class TestOrphanAvisCritiqueIdFallback:
 
 
 class TestAutoConvertEpisodes:
-    """Tests pour POST /api/emissions/auto-convert."""
+    """Tests pour POST /api/emissions/auto-convert (conversion complète)."""
+
+    @staticmethod
+    def _mock_service(mock_avis, existing_emissions=()):
+        """MongoDB mocké pour emission_conversion_service."""
+        avis_critiques_collection = MagicMock()
+        avis_critiques_collection.find.return_value.sort.return_value = mock_avis
+        emissions_collection = MagicMock()
+        emissions_collection.find.return_value = list(existing_emissions)
+        collections = {
+            "avis_critiques": avis_critiques_collection,
+            "emissions": emissions_collection,
+            "sync_state": MagicMock(),
+        }
+        mock_service = MagicMock()
+        mock_service.get_collection.side_effect = lambda name: collections[name]
+        return mock_service
 
     def test_should_skip_masked_episodes(self, client):
         """Doit ignorer les épisodes masqués (masked=True)."""
@@ -656,7 +703,6 @@ class TestAutoConvertEpisodes:
             {
                 "_id": ObjectId("686c48b728b9e451c1cee31f"),  # pragma: allowlist secret
                 "episode_oid": "686bf5e18380ee925ae5e319",  # pragma: allowlist secret
-                "summary": "**Rebecca Manzoni**: Test",
             }
         ]
 
@@ -669,17 +715,17 @@ class TestAutoConvertEpisodes:
             "masked": True,  # MASQUÉ
         }
 
-        with patch("back_office_lmelp.app.mongodb_service") as mock_service:
-            mock_service.get_all_critical_reviews.return_value = mock_avis
-            mock_service.get_emission_by_episode_id.return_value = None
-            mock_service.get_episode_by_id.return_value = mock_episode_masked
+        mock_service = self._mock_service(mock_avis)
+        mock_service.get_episode_by_id.return_value = mock_episode_masked
 
+        with patch.object(emission_conversion_service, "mongodb_service", mock_service):
             response = client.post("/api/emissions/auto-convert")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["created"] == 0  # Aucune émission créée
-            assert data["skipped"] == 1  # Episode masqué skip
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 0  # Aucune émission créée
+        assert data["skipped"] == 1  # Episode masqué skip
+        mock_service.create_emission.assert_not_called()
 
     def test_should_create_emission_from_avis(self, client, mock_episode):
         """Doit créer une émission depuis un avis critique."""
@@ -687,48 +733,45 @@ class TestAutoConvertEpisodes:
             {
                 "_id": ObjectId("686c48b728b9e451c1cee31f"),  # pragma: allowlist secret
                 "episode_oid": str(mock_episode["_id"]),
-                "summary": "**Rebecca Manzoni**: Test",
             }
         ]
+        animateur_id = "686c48b728b9e451c1cee320"  # pragma: allowlist secret
+        mock_critiques = [
+            {"id": animateur_id, "nom": "Rebecca Manzoni", "animateur": True}
+        ]
 
-        mock_critiques = [{"id": "123", "nom": "Rebecca Manzoni", "animateur": True}]
+        mock_service = self._mock_service(mock_avis)
+        mock_service.get_episode_by_id.return_value = mock_episode
+        mock_service.get_critiques_by_episode.return_value = mock_critiques
+        mock_service.create_emission.return_value = "new_emission_id"
 
-        with (
-            patch("back_office_lmelp.app.mongodb_service") as mock_service,
-            patch("back_office_lmelp.app.Emission") as mock_emission_class,
-        ):
-            mock_service.get_all_critical_reviews.return_value = mock_avis
-            mock_service.get_emission_by_episode_id.return_value = (
-                None  # Pas d'émission existante
-            )
-            mock_service.get_episode_by_id.return_value = mock_episode
-            mock_service.get_critiques_by_episode.return_value = mock_critiques
-            mock_service.create_emission.return_value = "new_emission_id"
-
-            # Mock Emission.for_mongodb_insert
-            mock_emission_class.for_mongodb_insert.return_value = {
-                "episode_id": mock_episode["_id"],
-                "avis_critique_id": ObjectId(
-                    "686c48b728b9e451c1cee31f"  # pragma: allowlist secret
-                ),
-                "date": mock_episode["date"],
-                "duree": mock_episode["duree"],
-                "animateur_id": "123",
-                "avis_ids": [],
+        with patch.object(emission_conversion_service, "mongodb_service", mock_service):
+            response = client.post("/api/emissions/auto-convert")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["created"] == 1
+        assert data["skipped"] == 0
+        emission = mock_service.create_emission.call_args[0][0]
+        assert emission["episode_id"] == mock_episode["_id"]
+        assert emission["animateur_id"] == ObjectId(animateur_id)
+
+    def test_should_skip_episode_with_existing_emission(self, client, mock_episode):
+        """Doit ignorer les épisodes déjà convertis."""
+        mock_avis = [
+            {
+                "_id": ObjectId("686c48b728b9e451c1cee31f"),  # pragma: allowlist secret
+                "episode_oid": str(mock_episode["_id"]),
             }
+        ]
+        mock_service = self._mock_service(
+            mock_avis, existing_emissions=[{"episode_id": mock_episode["_id"]}]
+        )
+
+        with patch.object(emission_conversion_service, "mongodb_service", mock_service):
+            response = client.post("/api/emissions/auto-convert")
 
-            # Mock Episode constructor to return mock_episode
-            with patch("back_office_lmelp.app.Episode") as mock_episode_class:
-                mock_episode_instance = MagicMock()
-                mock_episode_instance.date = mock_episode["date"]
-                mock_episode_instance.duree = mock_episode["duree"]
-                mock_episode_instance.masked = mock_episode["masked"]  # False
-                mock_episode_class.return_value = mock_episode_instance
-
-                response = client.post("/api/emissions/auto-convert")
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
-                assert data["created"] == 1
-                assert data["skipped"] == 0
+        assert response.status_code == 200
+        assert response.json()["skipped"] == 1
+        mock_service.get_episode_by_id.assert_not_called()
@@ -159,7 +159,7 @@ class TestPalmaresEndpoint:
 
         client.get("/api/palmares?page=2&limit=10")
 
-        mock_service.get_palmares.assert_called_once_with(page=2, limit=10)
+        mock_service.get_palmares.assert_called_once_with(page=2, limit=10, cursor=None)
 
     @patch("back_office_lmelp.app.mongodb_service")
     def test_palmares_default_pagination(
@@ -170,7 +170,7 @@ class TestPalmaresEndpoint:
 
         client.get("/api/palmares")
 
-        mock_service.get_palmares.assert_called_once_with(page=1, limit=30)
+        mock_service.get_palmares.assert_called_once_with(page=1, limit=30, cursor=None)
 
     @patch("back_office_lmelp.app.mongodb_service")
     def test_palmares_error_handling(self, mock_service, client):
@@ -185,42 +185,42 @@ class TestPalmaresEndpoint:
 class TestPalmaresService:
     """Tests for the MongoDB service get_palmares method."""
 
-    def test_get_palmares_returns_dict_with_items(self):
-        """Test that get_palmares returns expected structure."""
+    def _service(self, total, docs):
+        """MongoDBService dont la collection palmares est mockée."""
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService.__new__(MongoDBService)
-        # Mock the avis collection with aggregation
-        mock_collection = MagicMock()
-        service.avis_collection = mock_collection
+        service.db = MagicMock()
+        palmares_collection = service.db["palmares"]
+        palmares_collection.count_documents.return_value = total
+        cursor = palmares_collection.find.return_value.sort.return_value
+        cursor.skip.return_value.limit.return_value = docs
+        return service
 
-        # Mock aggregation result matching real MongoDB structure
-        mock_collection.aggregate.return_value = iter(
+    def test_get_palmares_returns_dict_with_items(self):
+        """Test that get_palmares returns expected structure."""
+        service = self._service(
+            2,
             [
                 {
-                    "metadata": [{"total": 2}],
-                    "data": [
-                        {
-                            "_id": "6956ba2affd13096430f9cb9",
-                            "note_moyenne": 10.0,
-                            "nombre_avis": 4,
-                            "titre": "Le Lambeau",
-                            "auteur_id": "6950027a26f38eb0ca5aabed",
-                            "auteur_nom": "Philippe Lançon",
-                            "url_babelio": "https://www.babelio.com/livres/Lancon-Le-Lambeau/1036944",
-                        },
-                        {
-                            "_id": "694a538a7f4fb7d4a62077dc",
-                            "note_moyenne": 10.0,
-                            "nombre_avis": 4,
-                            "titre": "Feu",
-                            "auteur_id": "68e2c3ba1391489c77ccdee5",
-                            "auteur_nom": "Maria Pourchet",
-                            "url_babelio": "https://www.babelio.com/livres/Pourchet-Feu/1331996",
-                        },
-                    ],
-                }
-            ]
+                    "_id": "6956ba2affd13096430f9cb9",
+                    "note_moyenne": 10.0,
+                    "nombre_avis": 4,
+                    "titre": "Le Lambeau",
+                    "auteur_id": "6950027a26f38eb0ca5aabed",
+                    "auteur_nom": "Philippe Lançon",
+                    "url_babelio": "https://www.babelio.com/livres/Lancon-Le-Lambeau/1036944",
+                },
+                {
+                    "_id": "694a538a7f4fb7d4a62077dc",
+                    "note_moyenne": 10.0,
+                    "nombre_avis": 4,
+                    "titre": "Feu",
+                    "auteur_id": "68e2c3ba1391489c77ccdee5",
+                    "auteur_nom": "Maria Pourchet",
+                    "url_babelio": "https://www.babelio.com/livres/Pourchet-Feu/1331996",
+                },
+            ],
         )
 
         result = service.get_palmares(page=1, limit=30)
@@ -234,29 +234,19 @@ class TestPalmaresService:
 
     def test_get_palmares_item_has_correct_fields(self):
         """Test that each palmares item has all required fields."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-        mock_collection = MagicMock()
-        service.avis_collection = mock_collection
-
-        mock_collection.aggregate.return_value = iter(
+        service = self._service(
+            1,
             [
                 {
-                    "metadata": [{"total": 1}],
-                    "data": [
-                        {
-                            "_id": "6956ba2affd13096430f9cb9",
-                            "note_moyenne": 10.0,
-                            "nombre_avis": 4,
-                            "titre": "Le Lambeau",
-                            "auteur_id": "6950027a26f38eb0ca5aabed",
-                            "auteur_nom": "Philippe Lançon",
-                            "url_babelio": "https://www.babelio.com/livres/Lancon-Le-Lambeau/1036944",
-                        },
-                    ],
-                }
-            ]
+                    "_id": "6956ba2affd13096430f9cb9",
+                    "note_moyenne": 10.0,
+                    "nombre_avis": 4,
+                    "titre": "Le Lambeau",
+                    "auteur_id": "6950027a26f38eb0ca5aabed",
+                    "auteur_nom": "Philippe Lançon",
+                    "url_babelio": "https://www.babelio.com/livres/Lancon-Le-Lambeau/1036944",
+                },
+            ],
         )
 
         result = service.get_palmares(page=1, limit=30)
@@ -275,13 +265,7 @@ class TestPalmaresService:
 
     def test_get_palmares_empty_result(self):
         """Test that get_palmares handles empty results."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-        mock_collection = MagicMock()
-        service.avis_collection = mock_collection
-
-        mock_collection.aggregate.return_value = iter([{"metadata": [], "data": []}])
+        service = self._service(0, [])
 
         result = service.get_palmares(page=1, limit=30)
 
@@ -291,29 +275,19 @@ class TestPalmaresService:
 
     def test_get_palmares_pagination_calculation(self):
         """Test correct total_pages calculation."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-        mock_collection = MagicMock()
-        service.avis_collection = mock_collection
-
-        mock_collection.aggregate.return_value = iter(
+        service = self._service(
+            65,
             [
                 {
-                    "metadata": [{"total": 65}],
-                    "data": [
-                        {
-                            "_id": "id1",
-                            "note_moyenne": 8.0,
-                            "nombre_avis": 3,
-                            "titre": "Book",
-                            "auteur_id": "a1",
-                            "auteur_nom": "Author",
-                            "url_babelio": None,
-                        },
-                    ],
-                }
-            ]
+                    "_id": "id1",
+                    "note_moyenne": 8.0,
+                    "nombre_avis": 3,
+                    "titre": "Book",
+                    "auteur_id": "a1",
+                    "auteur_nom": "Author",
+                    "url_babelio": None,
+                },
+            ],
         )
 
         result = service.get_palmares(page=1, limit=30)
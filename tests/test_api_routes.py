@@ -22,6 +22,13 @@ def mock_mongodb_service():
         yield mock
 
 
+@pytest.fixture
+def mock_async_mongodb_service():
+    """Mock async (Motor) MongoDB service used by the read endpoints."""
+    with patch("back_office_lmelp.app.async_mongodb_service", spec=True) as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_memory_guard():
     """Mock memory guard for testing."""
@@ -42,7 +49,7 @@ class TestAPIRoutes:
         assert "version" in data  # Version dynamique depuis git (Issue #205)
 
     def test_get_episodes_success(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test successful episodes retrieval."""
         # Mock data with datetime objects
@@ -60,27 +67,27 @@ class TestAPIRoutes:
                 "type": "test",
             },
         ]
-        mock_mongodb_service.get_all_episodes.return_value = mock_episodes
+        mock_async_mongodb_service.get_all_episodes.return_value = mock_episodes
 
         response = client.get("/api/episodes")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
-        mock_mongodb_service.get_all_episodes.assert_called_once()
+        mock_async_mongodb_service.get_all_episodes.assert_called_once()
 
     def test_get_episodes_memory_warning(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test episodes retrieval with memory warning."""
         mock_memory_guard.check_memory_limit.return_value = "Memory usage: 85%"
-        mock_mongodb_service.get_all_episodes.return_value = []
+        mock_async_mongodb_service.get_all_episodes.return_value = []
 
         response = client.get("/api/episodes")
         assert response.status_code == 200
         mock_memory_guard.check_memory_limit.assert_called()
 
     def test_get_episodes_memory_limit_exceeded(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test episodes retrieval with memory limit exceeded."""
         mock_memory_guard.check_memory_limit.return_value = (
@@ -89,7 +96,7 @@ class TestAPIRoutes:
         mock_memory_guard.force_shutdown.return_value = None
 
         with patch(
-            "back_office_lmelp.app.mongodb_service.get_all_episodes",
+            "back_office_lmelp.app.async_mongodb_service.get_all_episodes",
             side_effect=Exception("Shutdown triggered"),
         ):
             response = client.get("/api/episodes")
@@ -97,10 +104,10 @@ class TestAPIRoutes:
             mock_memory_guard.force_shutdown.assert_called_once()
 
     def test_get_episodes_database_error(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test episodes retrieval with database error."""
-        mock_mongodb_service.get_all_episodes.side_effect = Exception(
+        mock_async_mongodb_service.get_all_episodes.side_effect = Exception(
             "Database connection failed"
         )
 
@@ -109,7 +116,7 @@ class TestAPIRoutes:
         assert "Erreur serveur" in response.json()["detail"]
 
     def test_get_episode_by_id_success(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test successful single episode retrieval."""
         mock_episode = {
@@ -119,7 +126,7 @@ class TestAPIRoutes:
             "type": "test",
             "description": "Test description",
         }
-        mock_mongodb_service.get_episode_by_id.return_value = mock_episode
+        mock_async_mongodb_service.get_episode_by_id.return_value = mock_episode
 
         response = client.get("/api/episodes/507f1f77bcf86cd799439011")
         assert response.status_code == 200
@@ -128,17 +135,17 @@ class TestAPIRoutes:
         assert data["titre"] == "Test Episode"
 
     def test_get_episode_by_id_not_found(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test episode retrieval when episode not found."""
-        mock_mongodb_service.get_episode_by_id.return_value = None
+        mock_async_mongodb_service.get_episode_by_id.return_value = None
 
         response = client.get("/api/episodes/nonexistent")
         assert response.status_code == 404
         assert "Épisode non trouvé" in response.json()["detail"]
 
     def test_get_episode_by_id_memory_limit_exceeded(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test single episode retrieval with memory limit exceeded."""
         mock_memory_guard.check_memory_limit.return_value = (
@@ -147,7 +154,7 @@ class TestAPIRoutes:
         mock_memory_guard.force_shutdown.return_value = None
 
         with patch(
-            "back_office_lmelp.app.mongodb_service.get_episode_by_id",
+            "back_office_lmelp.app.async_mongodb_service.get_episode_by_id",
             side_effect=Exception("Shutdown triggered"),
         ):
             response = client.get("/api/episodes/507f1f77bcf86cd799439011")
@@ -155,10 +162,12 @@ class TestAPIRoutes:
             mock_memory_guard.force_shutdown.assert_called_once()
 
     def test_get_episode_by_id_database_error(
-        self, client, mock_mongodb_service, mock_memory_guard
+        self, client, mock_async_mongodb_service, mock_memory_guard
     ):
         """Test single episode retrieval with database error."""
-        mock_mongodb_service.get_episode_by_id.side_effect = Exception("Database error")
+        mock_async_mongodb_service.get_episode_by_id.side_effect = Exception(
+            "Database error"
+        )
 
         response = client.get("/api/episodes/507f1f77bcf86cd799439011")
         assert response.status_code == 500
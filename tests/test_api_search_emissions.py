@@ -37,43 +37,70 @@ def mock_memory_guard():
 # ===========================================================================
 
 
-class TestSearchEmissionsService:
-    """Tests pour la méthode search_emissions() du MongoDBService."""
+def _search_service(avis_docs=(), livres_docs=(), auteurs_docs=(), emission_date=None):
+    """MongoDBService dont les collections simulent search_emissions.
 
-    def test_search_emissions_returns_correct_structure(self):
-        """search_emissions() retourne {emissions: [...], total_count: int}."""
-        service = MongoDBService.__new__(MongoDBService)
-
-        # Mocks des collections
-        emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        emission_date = datetime(2025, 7, 6)
+    avis.distinct renvoie les émissions des avis fournis, avis.find (contexte
+    de la page) ces avis, emissions.find les émissions demandées ($in).
+    Livres et auteurs fournis matchent en début de mot (rang indexé), aucun
+    seulement au milieu d'un mot (rang $nor).
+    """
+    service = MongoDBService.__new__(MongoDBService)
+    emission_ids = list(dict.fromkeys(avis["emission_id"] for avis in avis_docs))
 
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
+    def word_start_only(docs):
+        return lambda query, *_args: [] if "$nor" in query else list(docs)
 
-        # Un avis correspondant à la recherche "Camus"
-        mock_avis_collection.find.return_value = [
-            {
-                "_id": ObjectId(),
-                "emission_oid": str(emission_id),
-                "livre_titre_extrait": "La Peste",
-                "auteur_nom_extrait": "Albert Camus",
-                "editeur_extrait": "Gallimard",
-                "section": "programme",
-            }
+    def emissions_find(query, *_args):
+        emissions = [
+            {"_id": emission_id, "date": emission_date or datetime(2025, 7, 6)}
+            for emission_id in query["_id"]["$in"]
         ]
-        mock_avis_collection.count_documents.return_value = 1
+        cursor = MagicMock()
+        cursor.sort.return_value.skip.side_effect = lambda n: MagicMock(
+            limit=lambda k: emissions[n : n + k]
+        )
+        return cursor
+
+    service.avis_collection = MagicMock()
+    service.avis_collection.distinct.return_value = emission_ids
+    service.avis_collection.find.return_value = list(avis_docs)
+    service.livres_collection = MagicMock()
+    service.livres_collection.find.side_effect = word_start_only(livres_docs)
+    service.auteurs_collection = MagicMock()
+    service.auteurs_collection.find.side_effect = word_start_only(auteurs_docs)
+    service.emissions_collection = MagicMock()
+    service.emissions_collection.find.side_effect = emissions_find
+    return service
+
+
+def _avis(emission_id, **fields):
+    """Avis avec références String et clés typées."""
+    return {
+        "_id": ObjectId(),
+        "emission_oid": str(emission_id),
+        "emission_id": emission_id,
+        "section": "programme",
+        **fields,
+    }
 
-        # L'émission correspondante (find().sort() chain)
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {
-                "_id": emission_id,
-                "date": emission_date,
-            }
-        ]
 
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
+class TestSearchEmissionsService:
+    """Tests pour la méthode search_emissions() du MongoDBService."""
+
+    def test_search_emissions_returns_correct_structure(self):
+        """search_emissions() retourne {emissions: [...], total_count: int}."""
+        emission_id = ObjectId("694fea90e46eedc769bcd96c")
+        service = _search_service(
+            [
+                _avis(
+                    emission_id,
+                    livre_titre_extrait="La Peste",
+                    auteur_nom_extrait="Albert Camus",
+                    editeur_extrait="Gallimard",
+                )
+            ]
+        )
 
         result = service.search_emissions("Camus")
 
@@ -84,42 +111,10 @@ class TestSearchEmissionsService:
 
     def test_search_emissions_result_has_required_fields(self):
         """Chaque résultat d'émission a _id, emission_date, search_context."""
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        emission_date = datetime(2025, 7, 6)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "commentaire": "Albert Camus La Peste",
-            "section": "programme",
-        }
-
-        # Pass 1 (commentaire search): returns avis
-        # Pass 2 (livre_oid search): empty (no livres matched)
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "commentaire" in query:
-                return [avis_doc]
-            return []
-
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
-
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service(
+            [_avis(emission_id, commentaire="Albert Camus La Peste")]
+        )
 
         result = service.search_emissions("Camus")
 
@@ -131,340 +126,172 @@ class TestSearchEmissionsService:
 
     def test_search_emissions_emission_date_format(self):
         """emission_date est au format YYYYMMDD (pour URL /emissions/YYYYMMDD)."""
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        emission_date = datetime(2025, 7, 6)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "commentaire": "Albert Camus La Peste",
-            "section": "programme",
-        }
-
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "commentaire" in query:
-                return [avis_doc]
-            return []
-
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
-
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service(
+            [_avis(emission_id, commentaire="Albert Camus La Peste")],
+            emission_date=datetime(2025, 7, 6),
+        )
 
         result = service.search_emissions("Camus")
-        emission = result["emissions"][0]
 
-        assert emission["emission_date"] == "20250706"
+        assert result["emissions"][0]["emission_date"] == "20250706"
 
     def test_search_emissions_deduplicates_by_emission(self):
         """Plusieurs avis pour la même émission → un seul résultat d'émission."""
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        emission_date = datetime(2025, 7, 6)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        # Deux avis pour la même émission matchant via commentaire
-        avis_docs = [
-            {
-                "_id": ObjectId(),
-                "emission_oid": str(emission_id),
-                "commentaire": "Albert Camus La Peste",
-                "section": "programme",
-            },
-            {
-                "_id": ObjectId(),
-                "emission_oid": str(emission_id),
-                "commentaire": "Albert Camus L'Étranger",
-                "section": "coup_de_coeur",
-            },
-        ]
-
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "commentaire" in query:
-                return avis_docs
-            return []
-
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
-
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service(
+            [
+                _avis(emission_id, commentaire="Albert Camus La Peste"),
+                _avis(emission_id, commentaire="Albert Camus L'Étranger"),
+            ]
+        )
 
         result = service.search_emissions("Camus")
 
         # Deux avis mais UN seul résultat d'émission
         assert len(result["emissions"]) == 1
+        assert result["total_count"] == 1
 
     def test_search_emissions_searches_in_commentaire(self):
         """search_emissions() trouve les émissions via le texte du commentaire critique."""
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        emission_date = datetime(2026, 2, 13)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "livre_titre_extrait": "Départ",
-            "auteur_nom_extrait": "Julian Barnes",
-            "editeur_extrait": "Stock",
-            "commentaire": "Roman qui donne envie d'aimer la vie, grande complicité avec le lecteur",
-            "section": "programme",
-        }
-
-        # commentaire search: returns avis; livre_oid search: empty
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "commentaire" in query:
-                return [avis_doc]
-            return []
-
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
-
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service(
+            [
+                _avis(
+                    emission_id,
+                    livre_titre_extrait="Départ",
+                    auteur_nom_extrait="Julian Barnes",
+                    commentaire="Roman qui donne envie d'aimer la vie, grande complicité avec le lecteur",
+                )
+            ]
+        )
 
         result = service.search_emissions("Roman qui donne envie")
 
         assert len(result["emissions"]) == 1, (
             "La recherche dans le commentaire doit trouver l'émission"
         )
-
-        # Vérifier que la 1ère query avis.find contient bien le champ commentaire
-        first_call_args = mock_avis_collection.find.call_args_list[0]
-        query = first_call_args[0][0]
-        assert "commentaire" in query, (
-            f"Le 1er appel à avis.find() doit chercher dans 'commentaire'. Query: {query}"
+        field, match = service.avis_collection.distinct.call_args[0]
+        assert field == "emission_id"
+        assert "commentaire" in match["$or"][0], (
+            f"avis.distinct() doit chercher dans 'commentaire'. Query: {match}"
         )
 
     def test_search_emissions_context_shows_commentaire_when_match_in_commentaire(self):
         """Quand la recherche matche dans commentaire, search_context inclut l'extrait du commentaire."""
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
         livre_id = ObjectId("6994e74f95e08117826da195")
-        emission_date = datetime(2026, 2, 13)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "livre_oid": str(livre_id),
-            "livre_titre_extrait": "Départ",
-            "auteur_nom_extrait": "Julian Barnes",
-            "editeur_extrait": "Stock",
-            "commentaire": "Roman qui donne envie d'aimer la vie, grande complicité avec le lecteur",
-            "section": "programme",
-        }
-
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "commentaire" in query:
-                return [avis_doc]
-            return []
-
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
-
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service(
+            [
+                _avis(
+                    emission_id,
+                    livre_oid=str(livre_id),
+                    livre_titre_extrait="Départ",
+                    auteur_nom_extrait="Julian Barnes",
+                    commentaire="Roman qui donne envie d'aimer la vie, grande complicité avec le lecteur",
+                )
+            ]
+        )
 
         result = service.search_emissions("Roman qui donne envie")
 
-        emission = result["emissions"][0]
-        search_context = emission["search_context"]
-
+        search_context = result["emissions"][0]["search_context"]
         # Le contexte doit contenir livre/auteur ET l'extrait du commentaire
-        assert "Julian Barnes" in search_context, (
-            f"Le search_context doit contenir l'auteur pour le contexte, got: '{search_context}'"
-        )
-        assert "Départ" in search_context, (
-            f"Le search_context doit contenir le titre pour le contexte, got: '{search_context}'"
-        )
-        assert "Roman qui donne envie" in search_context, (
-            f"Le search_context doit contenir l'extrait du commentaire, got: '{search_context}'"
+        assert "Julian Barnes" in search_context
+        assert "Départ" in search_context
+        assert "Roman qui donne envie" in search_context
+
+    def test_search_emissions_context_commentaire_is_accent_insensitive(self):
+        """L'extrait du commentaire est trouvé sans accents, comme l'avis."""
+        emission_id = ObjectId("694fea90e46eedc769bcd96c")
+        service = _search_service(
+            [_avis(emission_id, commentaire="Une très belle complicité")]
         )
 
+        result = service.search_emissions("complicite")
+
+        assert result["emissions"][0]["search_context"] == ("Une très belle complicité")
+
     def test_search_emissions_uses_real_title_from_livres_collection(self):
         """search_emissions() utilise le vrai titre depuis livres pour le search_context."""
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
         livre_id = ObjectId("6994e74f95e08117826da195")
-        emission_date = datetime(2026, 2, 13)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
         # avis.livre_titre_extrait est tronqué ("Départ") mais le vrai titre est "Départ(s)"
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "livre_oid": str(livre_id),
-            "livre_titre_extrait": "Départ",  # tronqué !
-            "auteur_nom_extrait": "Julian Barnes",
-            "editeur_extrait": "Stock",
-            "commentaire": "Roman qui donne envie d'aimer la vie",
-            "section": "programme",
-        }
-
         livre_doc = {"_id": livre_id, "titre": "Départ(s)", "editeur": "Stock"}
-
-        # Pass 2: livres trouve "Départ(s)" matching "Départ"
-        def livres_find_side_effect(query, *args, **kwargs):
-            if "$or" in query:
-                return [livre_doc]
-            # lookup by _id for context enrichment
-            return [livre_doc]
-
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "livre_oid" in query:
-                return [avis_doc]
-            return []
-
-        mock_livres_collection.find.side_effect = livres_find_side_effect
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_auteurs_collection.find.return_value = []
-
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service(
+            [
+                _avis(
+                    emission_id,
+                    livre_oid=str(livre_id),
+                    livre_id=livre_id,
+                    livre_titre_extrait="Départ",
+                    auteur_nom_extrait="Julian Barnes",
+                    commentaire="Roman qui donne envie d'aimer la vie",
+                )
+            ],
+            livres_docs=[livre_doc],
+        )
 
         result = service.search_emissions("Départ")
 
-        emission = result["emissions"][0]
-        search_context = emission["search_context"]
-
+        search_context = result["emissions"][0]["search_context"]
         assert "Départ(s)" in search_context, (
             f"Le titre doit venir de livres.titre ('Départ(s)'), got: '{search_context}'"
         )
 
     def test_search_emissions_empty_result_when_no_match(self):
         """search_emissions() retourne liste vide si aucun résultat."""
-        service = MongoDBService.__new__(MongoDBService)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        mock_avis_collection.find.return_value = []
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
-
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service = _search_service()
 
         result = service.search_emissions("terme_inexistant_xyz")
 
         assert result["emissions"] == []
         assert result["total_count"] == 0
+        service.emissions_collection.find.assert_not_called()
 
     def test_search_emissions_uses_objectid_conversion(self):
-        """La jointure émissions utilise ObjectId() pour convertir emission_oid (String → ObjectId)."""
-        service = MongoDBService.__new__(MongoDBService)
-
+        """La page d'émissions est lue par _id ObjectId (clé typée avis.emission_id)."""
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        emission_date = datetime(2025, 7, 6)
-
-        mock_avis_collection = MagicMock()
-        mock_emissions_collection = MagicMock()
-        mock_livres_collection = MagicMock()
-        mock_auteurs_collection = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),  # String!
-            "commentaire": "Albert Camus La Peste",
-            "section": "programme",
-        }
+        service = _search_service(
+            [_avis(emission_id, commentaire="Albert Camus La Peste")]
+        )
 
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "commentaire" in query:
-                return [avis_doc]
-            return []
+        service.search_emissions("Camus")
 
-        mock_avis_collection.find.side_effect = avis_find_side_effect
-        mock_livres_collection.find.return_value = []
-        mock_auteurs_collection.find.return_value = []
+        query = service.emissions_collection.find.call_args[0][0]
+        ids_list = query["_id"]["$in"]
+        assert ids_list == [emission_id]
+
+    def test_query_count_does_not_scale_with_matching_authors(self):
+        """Beaucoup d'auteurs matchés : un seul livres.find pour leurs livres."""
+        emission_id = ObjectId()
+        livre_ids = [ObjectId() for _ in range(50)]
+        auteurs = [{"_id": ObjectId()} for _ in range(50)]
+        service = _search_service(
+            [_avis(emission_id, livre_id=livre_ids[0])], auteurs_docs=auteurs
+        )
 
-        mock_emissions_collection.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
+        def livres_find(query, projection=None):
+            if "auteur_id" in query:
+                return [{"_id": livre_id} for livre_id in livre_ids]
+            return []
 
-        service.avis_collection = mock_avis_collection
-        service.emissions_collection = mock_emissions_collection
-        service.livres_collection = mock_livres_collection
-        service.auteurs_collection = mock_auteurs_collection
+        service.livres_collection.find.side_effect = livres_find
 
-        service.search_emissions("Camus")
+        service.search_emissions("mar")
 
-        # Vérifier que emissions.find() a été appelé avec ObjectId (pas String)
-        call_args = mock_emissions_collection.find.call_args
-        assert call_args is not None
-        query = call_args[0][0]
-        ids_list = query["_id"]["$in"]
-        assert all(isinstance(oid, ObjectId) for oid in ids_list), (
-            "Les IDs doivent être des ObjectId, pas des strings"
-        )
+        author_queries = [
+            call[0][0]
+            for call in service.livres_collection.find.call_args_list
+            if "auteur_id" in call[0][0]
+        ]
+        assert author_queries == [
+            {"auteur_id": {"$in": [auteur["_id"] for auteur in auteurs]}}
+        ]
+        assert service.avis_collection.distinct.call_count == 1
+        assert service.avis_collection.find.call_count == 1
+        _, match = service.avis_collection.distinct.call_args[0]
+        assert set(match["$or"][1]["livre_id"]["$in"]) == set(livre_ids)
 
 
 # ===========================================================================
@@ -801,51 +628,6 @@ class TestSearchEmissionsCanonicalSources:
     - avis.commentaire (unchanged, already canonical)
     """
 
-    def _make_service_with_mocks(
-        self,
-        avis_docs=None,
-        livres_docs=None,
-        auteurs_docs=None,
-        emission_date=None,
-        emission_id=None,
-    ):
-        """Helper to build a MongoDBService with all collections mocked."""
-        service = MongoDBService.__new__(MongoDBService)
-
-        if emission_id is None:
-            emission_id = ObjectId("694fea90e46eedc769bcd96c")
-        if emission_date is None:
-            emission_date = datetime(2025, 12, 7)
-
-        mock_avis = MagicMock()
-        mock_emissions = MagicMock()
-        mock_livres = MagicMock()
-        mock_auteurs = MagicMock()
-
-        # Default: empty results
-        mock_avis.find.return_value = avis_docs if avis_docs is not None else []
-        mock_livres.find.return_value = livres_docs if livres_docs is not None else []
-        mock_auteurs.find.return_value = (
-            auteurs_docs if auteurs_docs is not None else []
-        )
-        mock_emissions.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": emission_date}
-        ]
-
-        service.avis_collection = mock_avis
-        service.emissions_collection = mock_emissions
-        service.livres_collection = mock_livres
-        service.auteurs_collection = mock_auteurs
-
-        return (
-            service,
-            emission_id,
-            mock_avis,
-            mock_livres,
-            mock_auteurs,
-            mock_emissions,
-        )
-
     def test_search_by_canonical_titre_finds_emission_when_titre_extrait_differs(self):
         """Issue #224: 'Quatre jours' doit trouver l'émission même si livre_titre_extrait='4 jours'.
 
@@ -855,161 +637,74 @@ class TestSearchEmissionsCanonicalSources:
         """
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
         livre_id = ObjectId("6935d067705ddce2450b2588")
-
-        service = MongoDBService.__new__(MongoDBService)
-        mock_avis = MagicMock()
-        mock_emissions = MagicMock()
-        mock_livres = MagicMock()
-        mock_auteurs = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "livre_oid": str(livre_id),
-            "livre_titre_extrait": "4 jours sans ma mère",  # LLM extracted (chiffre)
-            "auteur_nom_extrait": "Ramsès Kefi",
-            "editeur_extrait": "Philippe Rey",
-            "commentaire": "Un beau roman",
-            "section": "programme",
-        }
-
         livre_doc = {
             "_id": livre_id,  # ObjectId
             "titre": "Quatre jours sans ma mère",  # Babelio canonical (lettres)
             "editeur": "Philippe Rey",
         }
-
-        # livres.find() returns the book matching "Quatre jours"
-        mock_livres.find.return_value = [livre_doc]
-        mock_auteurs.find.return_value = []
-
-        # avis.find() with livre_oid filter returns the linked avis
-        # We use side_effect to handle multiple calls:
-        # 1st call: commentaire search → empty (no match in commentaire)
-        # 2nd call: livre_oid filter → returns the avis
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "livre_oid" in query:
-                return [avis_doc]
-            if "commentaire" in str(query):
-                return []
-            return []
-
-        mock_avis.find.side_effect = avis_find_side_effect
-
-        mock_emissions.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": datetime(2025, 12, 7)}
-        ]
-
-        service.avis_collection = mock_avis
-        service.emissions_collection = mock_emissions
-        service.livres_collection = mock_livres
-        service.auteurs_collection = mock_auteurs
+        service = _search_service(
+            [
+                _avis(
+                    emission_id,
+                    livre_oid=str(livre_id),
+                    livre_id=livre_id,
+                    livre_titre_extrait="4 jours sans ma mère",  # LLM (chiffre)
+                    auteur_nom_extrait="Ramsès Kefi",
+                    commentaire="Un beau roman",
+                )
+            ],
+            livres_docs=[livre_doc],
+        )
 
         result = service.search_emissions("Quatre jours")
 
-        assert len(result["emissions"]) == 1, (
-            f"Searching 'Quatre jours' should find the emission via livres.titre "
-            f"(canonical), even though livre_titre_extrait='4 jours'. "
-            f"Got {len(result['emissions'])} results."
-        )
+        assert len(result["emissions"]) == 1
         assert result["total_count"] == 1
+        _, match = service.avis_collection.distinct.call_args[0]
+        assert {"livre_id": {"$in": [livre_id]}} in match["$or"]
 
     def test_search_by_canonical_auteur_nom_finds_emission(self):
         """La recherche par nom d'auteur utilise auteurs.nom (canonique), pas auteur_nom_extrait."""
         emission_id = ObjectId("694fea90e46eedc769bcd96c")
         livre_id = ObjectId("6935d067705ddce2450b2588")
         auteur_id = ObjectId("6935d067705ddce2450b2587")
+        service = _search_service(
+            [
+                _avis(
+                    emission_id,
+                    livre_oid=str(livre_id),
+                    livre_id=livre_id,
+                    auteur_nom_extrait="R. Kefi",  # abbreviated, non-canonical
+                    commentaire="Un beau roman",
+                )
+            ],
+            auteurs_docs=[{"_id": auteur_id}],
+        )
 
-        service = MongoDBService.__new__(MongoDBService)
-        mock_avis = MagicMock()
-        mock_emissions = MagicMock()
-        mock_livres = MagicMock()
-        mock_auteurs = MagicMock()
-
-        avis_doc = {
-            "_id": ObjectId(),
-            "emission_oid": str(emission_id),
-            "livre_oid": str(livre_id),
-            "livre_titre_extrait": "4 jours sans ma mère",
-            "auteur_nom_extrait": "R. Kefi",  # abbreviated, non-canonical
-            "editeur_extrait": "Philippe Rey",
-            "commentaire": "Un beau roman",
-            "section": "programme",
-        }
-
-        auteur_doc = {
-            "_id": auteur_id,  # ObjectId
-            "nom": "Ramsès Kefi",  # Babelio canonical full name
-        }
-
-        livre_doc_for_auteur = {
-            "_id": livre_id,  # ObjectId
-            "titre": "Quatre jours sans ma mère",
-            "auteur_id": auteur_id,
-            "editeur": "Philippe Rey",
-        }
-
-        # auteurs.find() returns the author matching "Kefi"
-        mock_auteurs.find.return_value = [auteur_doc]
-
-        # livres.find() returns books for that author (when queried by auteur_id)
-        # and empty list when queried for titre/editeur regex
+        # livres.find() : livres de l'auteur (auteur_id), rien sur titre/éditeur
         def livres_find_side_effect(query, *args, **kwargs):
             if "auteur_id" in query:
-                return [livre_doc_for_auteur]
-            # titre/editeur regex search: no match (searching "Kefi" in titre)
-            return []
-
-        mock_livres.find.side_effect = livres_find_side_effect
-
-        def avis_find_side_effect(query, *args, **kwargs):
-            if "livre_oid" in query:
-                return [avis_doc]
+                return [{"_id": livre_id}]
             return []
 
-        mock_avis.find.side_effect = avis_find_side_effect
-
-        mock_emissions.find.return_value.sort.return_value = [
-            {"_id": emission_id, "date": datetime(2025, 12, 7)}
-        ]
-
-        service.avis_collection = mock_avis
-        service.emissions_collection = mock_emissions
-        service.livres_collection = mock_livres
-        service.auteurs_collection = mock_auteurs
+        service.livres_collection.find.side_effect = livres_find_side_effect
 
         result = service.search_emissions("Kefi")
 
-        assert len(result["emissions"]) == 1, (
-            f"Searching 'Kefi' should find the emission via auteurs.nom (canonical). "
-            f"Got {len(result['emissions'])} results."
-        )
+        assert len(result["emissions"]) == 1
+        _, match = service.avis_collection.distinct.call_args[0]
+        assert {"livre_id": {"$in": [livre_id]}} in match["$or"]
 
     def test_search_livres_titre_is_queried_not_livre_titre_extrait(self):
         """La nouvelle implémentation doit chercher dans livres.titre, pas avis.livre_titre_extrait."""
-        service = MongoDBService.__new__(MongoDBService)
-        mock_avis = MagicMock()
-        mock_emissions = MagicMock()
-        mock_livres = MagicMock()
-        mock_auteurs = MagicMock()
-
-        mock_livres.find.return_value = []
-        mock_auteurs.find.return_value = []
-        mock_avis.find.return_value = []
-        mock_emissions.find.return_value.sort.return_value = []
-
-        service.avis_collection = mock_avis
-        service.emissions_collection = mock_emissions
-        service.livres_collection = mock_livres
-        service.auteurs_collection = mock_auteurs
+        service = _search_service()
 
         service.search_emissions("Quatre jours")
 
         # livres_collection.find() doit être appelé avec une query sur "titre"
-        assert mock_livres.find.called, "livres_collection.find() doit être appelé"
-        livres_call_args = mock_livres.find.call_args_list
+        assert service.livres_collection.find.called
         searched_fields = []
-        for call in livres_call_args:
+        for call in service.livres_collection.find.call_args_list:
             q = call[0][0] if call[0] else {}
             for key in q:
                 if key == "$or":
@@ -1023,29 +718,14 @@ class TestSearchEmissionsCanonicalSources:
 
     def test_search_auteurs_nom_is_queried_not_auteur_nom_extrait(self):
         """La nouvelle implémentation doit chercher dans auteurs.nom, pas avis.auteur_nom_extrait."""
-        service = MongoDBService.__new__(MongoDBService)
-        mock_avis = MagicMock()
-        mock_emissions = MagicMock()
-        mock_livres = MagicMock()
-        mock_auteurs = MagicMock()
-
-        mock_livres.find.return_value = []
-        mock_auteurs.find.return_value = []
-        mock_avis.find.return_value = []
-        mock_emissions.find.return_value.sort.return_value = []
-
-        service.avis_collection = mock_avis
-        service.emissions_collection = mock_emissions
-        service.livres_collection = mock_livres
-        service.auteurs_collection = mock_auteurs
+        service = _search_service()
 
         service.search_emissions("Kefi")
 
         # auteurs_collection.find() doit être appelé avec une query sur "nom"
-        assert mock_auteurs.find.called, "auteurs_collection.find() doit être appelé"
-        auteurs_call_args = mock_auteurs.find.call_args_list
+        assert service.auteurs_collection.find.called
         searched_fields = []
-        for call in auteurs_call_args:
+        for call in service.auteurs_collection.find.call_args_list:
             q = call[0][0] if call[0] else {}
             searched_fields.extend(q.keys())
         assert "nom" in searched_fields, (
@@ -0,0 +1,183 @@
+"""Tests pour le service MongoDB asynchrone (Motor)."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+
+from back_office_lmelp.services.async_mongodb_service import AsyncMongoDBService
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+def _cursor(docs):
+    """Crée un faux curseur Motor (find().sort().to_list())."""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+    return cursor
+
+
+class TestAsyncMongoDBService:
+    """Tests pour AsyncMongoDBService."""
+
+    @pytest.fixture
+    def service(self):
+        """Service avec collections Motor mockées."""
+        service = AsyncMongoDBService()
+        service.episodes_collection = MagicMock()
+        service.avis_critiques_collection = MagicMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_get_all_episodes_excludes_masked_by_default(self, service):
+        """Les épisodes masqués sont exclus et les ObjectId convertis."""
+        oid = ObjectId()
+        service.episodes_collection.find.return_value = _cursor(
+            [{"_id": oid, "titre": "Episode", "date": datetime(2025, 1, 5)}]
+        )
+
+        episodes = await service.get_all_episodes()
+
+        assert episodes == [
+            {"_id": str(oid), "titre": "Episode", "date": datetime(2025, 1, 5)}
+        ]
+        query_filter = service.episodes_collection.find.call_args[0][0]
+        assert query_filter == {"masked": {"$ne": True}}
+
+    @pytest.mark.asyncio
+    async def test_get_all_episodes_include_masked(self, service):
+        """include_masked=True n'applique aucun filtre."""
+        service.episodes_collection.find.return_value = _cursor([])
+
+        await service.get_all_episodes(include_masked=True)
+
+        assert service.episodes_collection.find.call_args[0][0] == {}
+
+    @pytest.mark.asyncio
+    async def test_get_episode_by_id(self, service):
+        """Retourne l'épisode avec _id converti en string."""
+        oid = ObjectId()
+        service.episodes_collection.find_one = AsyncMock(
+            return_value={"_id": oid, "titre": "Episode"}
+        )
+
+        episode = await service.get_episode_by_id(str(oid))
+
+        assert episode == {"_id": str(oid), "titre": "Episode"}
+        service.episodes_collection.find_one.assert_awaited_once_with(
+            {"_id": oid}, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_episode_by_id_summary_profile_excludes_transcription(
+        self, service
+    ):
+        """Le profil summary ne projette pas la transcription."""
+        oid = ObjectId()
+        service.episodes_collection.find_one = AsyncMock(
+            return_value={"_id": oid, "titre": "Episode"}
+        )
+
+        await service.get_episode_by_id(str(oid), profile="summary")
+
+        projection = service.episodes_collection.find_one.call_args[0][1]
+        assert "transcription" not in projection
+        assert projection["titre"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_episode_by_id_invalid_id_returns_none(self, service):
+        """Un ID invalide retourne None sans lever d'exception."""
+        service.episodes_collection.find_one = AsyncMock()
+
+        assert await service.get_episode_by_id("invalid") is None
+
+    @pytest.mark.asyncio
+    async def test_get_statistics(self, service):
+        """Les statistiques reprennent le format du service synchrone."""
+        service.episodes_collection.count_documents = AsyncMock(
+            side_effect=[140, 2, 30, 40]
+        )
+        service.episodes_collection.find_one = AsyncMock(
+            return_value={"date": datetime(2025, 9, 6, 10, 30)}
+        )
+        service.avis_critiques_collection.count_documents = AsyncMock(return_value=25)
+
+        stats = await service.get_statistics()
+
+        assert stats == {
+            "total_episodes": 140,
+            "masked_episodes_count": 2,
+            "episodes_with_corrected_titles": 30,
+            "episodes_with_corrected_descriptions": 40,
+            "critical_reviews_count": 25,
+            "last_update_date": "2025-09-06T10:30:00",
+        }
+        # Épisodes masqués exclus via avis_critiques.episode_masked (pas de $nin)
+        service.avis_critiques_collection.count_documents.assert_awaited_once_with(
+            {"episode_masked": {"$ne": True}}
+        )
+        service.episodes_collection.find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_statistics_matches_sync_service(self, service):
+        """Mêmes requêtes et même résultat que MongoDBService.get_statistics()."""
+        counts = [140, 2, 30, 40]
+        last_episode = {"date": datetime(2025, 9, 6, 10, 30)}
+        service.episodes_collection.count_documents = AsyncMock(side_effect=counts)
+        service.episodes_collection.find_one = AsyncMock(return_value=last_episode)
+        service.avis_critiques_collection.count_documents = AsyncMock(return_value=25)
+
+        sync_service = MongoDBService()
+        sync_service.episodes_collection = MagicMock()
+        sync_service.episodes_collection.count_documents.side_effect = counts
+        sync_service.episodes_collection.find_one.return_value = last_episode
+        sync_service.avis_critiques_collection = MagicMock()
+        sync_service.avis_critiques_collection.count_documents.return_value = 25
+
+        assert await service.get_statistics() == sync_service.get_statistics()
+        assert (
+            service.episodes_collection.count_documents.await_args_list
+            == sync_service.episodes_collection.count_documents.call_args_list
+        )
+        assert (
+            service.episodes_collection.find_one.await_args
+            == sync_service.episodes_collection.find_one.call_args
+        )
+
+    @pytest.mark.asyncio
+    async def test_requires_connection(self):
+        """Sans connexion, les méthodes lèvent une exception explicite."""
+        service = AsyncMongoDBService()
+
+        with pytest.raises(Exception, match="Connexion MongoDB non établie"):
+            await service.get_all_episodes()
+
+    @pytest.mark.asyncio
+    async def test_slow_query_does_not_block_event_loop(self, service):
+        """Une requête lente laisse les autres coroutines progresser."""
+
+        async def slow_count(*_args, **_kwargs):
+            await asyncio.sleep(0.2)
+            return 0
+
+        service.episodes_collection.count_documents = slow_count
+        service.episodes_collection.find.return_value = _cursor([])
+        service.episodes_collection.find_one = AsyncMock(return_value=None)
+        service.avis_critiques_collection.count_documents = AsyncMock(return_value=0)
+
+        finished: list[str] = []
+
+        async def stats():
+            await service.get_statistics()
+            finished.append("statistics")
+
+        async def heartbeat():
+            await asyncio.sleep(0.01)
+            finished.append("heartbeat")
+
+        await asyncio.gather(stats(), heartbeat())
+
+        # Le heartbeat se termine pendant que les statistiques attendent MongoDB
+        assert finished == ["heartbeat", "statistics"]
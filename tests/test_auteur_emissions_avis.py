@@ -29,6 +29,9 @@ def mongodb_service_instance():
     service.auteurs_collection = MagicMock()
     service.avis_collection = MagicMock()
     service.emissions_collection = MagicMock()
+    # Statistiques matérialisées lues via get_collection("livre_stats")
+    service.db = MagicMock()
+    service.db["livre_stats"].find.return_value = []
     return service
 
 
@@ -68,23 +71,12 @@ class TestAuteurWithEmissionsAndAvis:
             }
         ]
 
-        # Mock avis for livre1: notes [9, 7], for livre2: notes [5]
-        def avis_find_side_effect(query):
-            livre_oid = query.get("livre_oid")
-            if livre_oid == str(livre1_id):
-                return [
-                    {"note": 9, "emission_oid": "em1", "livre_oid": str(livre1_id)},
-                    {"note": 7, "emission_oid": "em1", "livre_oid": str(livre1_id)},
-                ]
-            if livre_oid == str(livre2_id):
-                return [
-                    {"note": 5, "emission_oid": "em2", "livre_oid": str(livre2_id)},
-                ]
-            return []
-
-        mongodb_service_instance.avis_collection.find.side_effect = (
-            avis_find_side_effect
-        )
+        # Statistiques : livre1 noté [9, 7], livre2 noté [5]
+        livre_stats = mongodb_service_instance.db["livre_stats"]
+        livre_stats.find.return_value = [
+            {"_id": str(livre1_id), "note_moyenne": 8.0},
+            {"_id": str(livre2_id), "note_moyenne": 5.0},
+        ]
 
         # Mock emissions (no emissions needed for note_moyenne test)
         mongodb_service_instance.emissions_collection.find.return_value = []
@@ -97,8 +89,11 @@ class TestAuteurWithEmissionsAndAvis:
         livres = result["livres"]
         assert len(livres) == 2
 
-        for livre in livres:
-            assert "note_moyenne" in livre
+        notes = {livre["titre"]: livre["note_moyenne"] for livre in livres}
+        assert notes == {"Love me tender": 8.0, "Nom": 5.0}
+        # Une seule lecture de livre_stats pour tous les livres, pas d'avis
+        livre_stats.find.assert_called_once()
+        mongodb_service_instance.avis_collection.find.assert_not_called()
 
     def test_auteur_books_include_emission_dates(self, mongodb_service_instance):
         """Test that each book includes its emission dates."""
@@ -122,11 +117,6 @@ class TestAuteurWithEmissionsAndAvis:
             }
         ]
 
-        # Mock avis
-        mongodb_service_instance.avis_collection.find.return_value = [
-            {"note": 8, "emission_oid": str(emission_id), "livre_oid": str(livre_id)},
-        ]
-
         # Mock emissions collection directly
         mongodb_service_instance.emissions_collection.find.return_value = [
             {
@@ -180,9 +170,6 @@ class TestAuteurWithEmissionsAndAvis:
             }
         ]
 
-        # Mock avis (no notes needed for this test)
-        mongodb_service_instance.avis_collection.find.return_value = []
-
         # Mock emissions: need to return correct results based on query
         def emissions_find_side_effect(query):
             episode_ids = query.get("episode_id", {}).get("$in", [])
@@ -41,13 +41,17 @@ class TestAuthorCreationWithCorrection:
         ):
             # Mock: cache service
             cache_id = ObjectId("68d3eb092f32bb8c43063f91")  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_id
+            mock_cache_service.create_cache_entries.return_value = [cache_id]
 
             # Mock: mongodb service
             author_id = ObjectId("507f1f77bcf86cd799439011")  # pragma: allowlist secret
             book_id = ObjectId("507f1f77bcf86cd799439012")  # pragma: allowlist secret
-            mock_mongodb_service.create_author_if_not_exists.return_value = author_id
-            mock_mongodb_service.create_book_if_not_exists.return_value = book_id
+            mock_mongodb_service.create_authors_if_not_exist.return_value = {
+                "Adrien Bosc": {"author_id": author_id, "created": True}
+            }
+            mock_mongodb_service.create_books_if_not_exist.return_value = [
+                {"book_id": book_id, "created": True}
+            ]
 
             # Simuler une réponse de validation avec correction d'auteur
             response = client.post(
@@ -73,9 +77,9 @@ class TestAuthorCreationWithCorrection:
             data = response.json()
             assert data["success"] is True
 
-            # Vérifier que create_author_if_not_exists a été appelé avec le nom CORRIGÉ
-            mock_mongodb_service.create_author_if_not_exists.assert_called_once_with(
-                "Adrien Bosc"  # ✅ Nom corrigé, PAS "Adrien Bosque"
+            # Vérifier que create_authors_if_not_exist a été appelé avec le nom CORRIGÉ
+            mock_mongodb_service.create_authors_if_not_exist.assert_called_once_with(
+                ["Adrien Bosc"]  # ✅ Nom corrigé, PAS "Adrien Bosque"
             )
 
     def test_verified_book_without_correction_uses_original_name(self):
@@ -101,13 +105,17 @@ class TestAuthorCreationWithCorrection:
         ):
             # Mock: cache service
             cache_id = ObjectId("68d3eb092f32bb8c43063f91")  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_id
+            mock_cache_service.create_cache_entries.return_value = [cache_id]
 
             # Mock: mongodb service
             author_id = ObjectId("507f1f77bcf86cd799439011")  # pragma: allowlist secret
             book_id = ObjectId("507f1f77bcf86cd799439012")  # pragma: allowlist secret
-            mock_mongodb_service.create_author_if_not_exists.return_value = author_id
-            mock_mongodb_service.create_book_if_not_exists.return_value = book_id
+            mock_mongodb_service.create_authors_if_not_exist.return_value = {
+                "Victoria Mas": {"author_id": author_id, "created": True}
+            }
+            mock_mongodb_service.create_books_if_not_exist.return_value = [
+                {"book_id": book_id, "created": True}
+            ]
 
             response = client.post(
                 "/api/set-validation-results",
@@ -130,8 +138,8 @@ class TestAuthorCreationWithCorrection:
             assert response.status_code == 200
 
             # Vérifier que l'auteur est créé avec le nom original (pas de correction)
-            mock_mongodb_service.create_author_if_not_exists.assert_called_once_with(
-                "Victoria Mas"
+            mock_mongodb_service.create_authors_if_not_exist.assert_called_once_with(
+                ["Victoria Mas"]
             )
 
     def test_verified_book_creates_livre_with_corrected_title(self):
@@ -157,13 +165,17 @@ class TestAuthorCreationWithCorrection:
         ):
             # Mock: cache service
             cache_id = ObjectId("68d3eb092f32bb8c43063f91")  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_id
+            mock_cache_service.create_cache_entries.return_value = [cache_id]
 
             # Mock: mongodb service
             author_id = ObjectId("507f1f77bcf86cd799439011")  # pragma: allowlist secret
             book_id = ObjectId("507f1f77bcf86cd799439012")  # pragma: allowlist secret
-            mock_mongodb_service.create_author_if_not_exists.return_value = author_id
-            mock_mongodb_service.create_book_if_not_exists.return_value = book_id
+            mock_mongodb_service.create_authors_if_not_exist.return_value = {
+                "Amélie Nothomb": {"author_id": author_id, "created": True}
+            }
+            mock_mongodb_service.create_books_if_not_exist.return_value = [
+                {"book_id": book_id, "created": True}
+            ]
 
             response = client.post(
                 "/api/set-validation-results",
@@ -186,8 +198,8 @@ class TestAuthorCreationWithCorrection:
 
             assert response.status_code == 200
 
-            # Vérifier que create_book_if_not_exists a été appelé avec le titre corrigé
-            call_args = mock_mongodb_service.create_book_if_not_exists.call_args
+            # Vérifier que create_books_if_not_exist a été appelé avec le titre corrigé
+            call_args = mock_mongodb_service.create_books_if_not_exist.call_args
             assert call_args is not None
-            book_data = call_args[0][0]  # Premier argument
+            book_data = call_args[0][0][0]  # Premier livre du lot
             assert book_data["titre"] == "Tant mieux"  # ✅ Titre corrigé
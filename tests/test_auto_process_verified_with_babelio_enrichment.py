@@ -72,28 +72,18 @@ def test_auto_process_enriched_books_updates_editeur():
     mock_auteurs_collection = Mock()
     # Issue #189: editeurs_collection needed for get_or_create_editeur
     mock_editeurs_collection = Mock()
-    mock_editeurs_collection.find.return_value = []  # Editeur not found → will be created
-    mock_editeurs_insert_result = Mock()
-    mock_editeurs_insert_result.inserted_id = ObjectId()
-    mock_editeurs_collection.insert_one.return_value = mock_editeurs_insert_result
+    mock_editeurs_collection.find_one.return_value = None  # Editeur not found
+    mock_editeurs_collection.find.return_value = []
+    # → sera créé par upsert sur nom_normalise
+    mock_editeurs_collection.update_one.return_value.upserted_id = ObjectId()
 
     mongodb_service.livres_collection = mock_livres_collection
     mongodb_service.auteurs_collection = mock_auteurs_collection
     mongodb_service.editeurs_collection = mock_editeurs_collection
 
-    # Mock find_one pour retourner le livre existant
-    mock_livres_collection.find_one.return_value = livres_doc
-
-    # Mock update_one pour mettre à jour le doc in-memory (simulation MongoDB)
-    def update_livres_doc(_filter_dict, update_dict):
-        if "$set" in update_dict:
-            livres_doc.update(update_dict["$set"])
-        return Mock(modified_count=1)
-
-    mock_livres_collection.update_one.side_effect = update_livres_doc
-
-    # Mock auteurs_collection (pour _add_book_to_author)
-    mock_auteurs_collection.update_one = Mock()
+    # Mock find pour retourner le livre existant (recherche groupée)
+    mock_livres_collection.find.return_value = [livres_doc]
+    mock_livres_collection.bulk_write.return_value.upserted_ids = {}
 
     # Setup service
     service = CollectionsManagementService()
@@ -107,12 +97,16 @@ def test_auto_process_enriched_books_updates_editeur():
             return_value=[cache_book_enriched],
         ) as mock_get_books,
         patch.object(
-            mongodb_service, "create_author_if_not_exists", return_value=author_id
+            mongodb_service,
+            "create_authors_if_not_exist",
+            return_value={
+                "Emmanuel Carrère": {"author_id": author_id, "created": False}
+            },
         ),
         patch.object(
             mongodb_service,
-            "get_critical_review_by_episode_oid",
-            return_value={"_id": avis_critique_id},
+            "get_critical_reviews_by_episode_oids",
+            return_value={episode_oid: {"_id": avis_critique_id}},
         ),
     ):
         # Act
@@ -126,11 +120,11 @@ def test_auto_process_enriched_books_updates_editeur():
         # Assert 2: Vérifier que le livre a été trouvé et traité
         assert result["processed_count"] == 1, "Un livre devrait être traité"
 
-        # Assert 3: Vérifier que update_one a été appelé avec editeur_id (Issue #189)
-        mock_livres_collection.update_one.assert_called_once()
-        call_args = mock_livres_collection.update_one.call_args
-        assert call_args[0][0] == {"_id": book_id}, "Filter doit chercher par _id"
-        update_doc = call_args[0][1]
+        # Assert 3: Vérifier que le bulk_write met à jour editeur_id (Issue #189)
+        mock_livres_collection.bulk_write.assert_called_once()
+        [operation] = mock_livres_collection.bulk_write.call_args[0][0]
+        assert operation._filter == {"_id": book_id}, "Filter doit chercher par _id"
+        update_doc = operation._doc
         # Issue #189: editeur_id dans $set au lieu de editeur string
         assert "editeur_id" in update_doc["$set"], "$set doit contenir editeur_id"
         # Issue #189: editeur string supprimé via $unset
@@ -173,17 +167,15 @@ def test_auto_process_no_update_when_editeur_same():
     # Issue #189: editeurs_collection needed for get_or_create_editeur
     mock_editeurs_collection = Mock()
     mock_editeurs_collection.find.return_value = [
-        {"_id": ObjectId(), "nom": "Gallimard"},
+        {"_id": ObjectId(), "nom_normalise": "gallimard"}
     ]
-    mock_editeurs_collection.insert_one = Mock()
 
     mongodb_service.livres_collection = mock_livres_collection
     mongodb_service.auteurs_collection = mock_auteurs_collection
     mongodb_service.editeurs_collection = mock_editeurs_collection
 
-    mock_livres_collection.find_one.return_value = livres_doc
-    mock_livres_collection.update_one = Mock()
-    mock_auteurs_collection.update_one = Mock()
+    mock_livres_collection.find.return_value = [livres_doc]
+    mock_livres_collection.bulk_write.return_value.upserted_ids = {}
 
     service = CollectionsManagementService()
     service.mongodb_service = mongodb_service
@@ -193,20 +185,22 @@ def test_auto_process_no_update_when_editeur_same():
             mongodb_service, "get_books_by_validation_status", return_value=[cache_book]
         ),
         patch.object(
-            mongodb_service, "create_author_if_not_exists", return_value=author_id
+            mongodb_service,
+            "create_authors_if_not_exist",
+            return_value={"Test Author": {"author_id": author_id, "created": False}},
         ),
         patch.object(
-            mongodb_service, "get_critical_review_by_episode_oid", return_value=None
+            mongodb_service, "get_critical_reviews_by_episode_oids", return_value={}
         ),
     ):
         # Act
         service.auto_process_verified_books()
 
-        # Assert: Issue #96 Fix - update_one EST appelé pour ajouter l'épisode avec $addToSet
+        # Assert: Issue #96 Fix - le bulk_write ajoute l'épisode avec $addToSet
         # MongoDB ne créera pas de doublon grâce à $addToSet
-        mock_livres_collection.update_one.assert_called_once()
-        call_args = mock_livres_collection.update_one.call_args[0]
-        assert call_args[0] == {"_id": book_id}
+        mock_livres_collection.bulk_write.assert_called_once()
+        [operation] = mock_livres_collection.bulk_write.call_args[0][0]
+        assert operation._filter == {"_id": book_id}
         # Vérifier que $addToSet est utilisé pour éviter les doublons
-        assert "$addToSet" in call_args[1]
-        assert "episodes" in call_args[1]["$addToSet"]
+        assert "$addToSet" in operation._doc
+        assert "episodes" in operation._doc["$addToSet"]
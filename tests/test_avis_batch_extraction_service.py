@@ -0,0 +1,344 @@
+"""Tests de la ré-extraction groupée des avis (avis_batch_extraction_service)."""
+
+import argparse
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne
+
+from back_office_lmelp.models.avis import diff_avis
+from back_office_lmelp.services.avis_batch_extraction_service import (
+    AVIS_BATCH_MAX_WORKERS,
+    load_extraction_jobs,
+    matching_stats_from_avis,
+    reextract_all_avis,
+)
+from back_office_lmelp.services.mongodb_service import MongoDBService
+from back_office_lmelp.utils.reextract_avis import workers_count
+
+
+EMISSION = ObjectId()
+AVIS_CRITIQUE = ObjectId()
+EPISODE = ObjectId()
+LIVRE = ObjectId()
+AUTEUR = ObjectId()
+CRITIQUE = ObjectId()
+
+SUMMARY = """## 1. LIVRES DISCUTÉS DANS L'ÉMISSION
+
+| Auteur | Titre | Éditeur | Avis des critiques |
+|--------|-------|---------|-------------------|
+| Maylis de Kerangal | Un monde à portée de main | Verticales | **Frédéric Beigbeder**: Fascinant. Note: 8 |
+
+## 2. COUPS DE CŒUR DES CRITIQUES
+"""
+
+
+def _seeded_service(collections_service, stored_avis=(), episodes=()):
+    """Service MongoDB mocké : une émission, son summary et un livre validé."""
+    return collections_service(
+        emissions=[
+            {"_id": EMISSION, "avis_critique_id": AVIS_CRITIQUE, "episode_id": EPISODE}
+        ],
+        avis_critiques=[{"_id": AVIS_CRITIQUE, "summary": SUMMARY}],
+        livresauteurs_cache=[{"episode_oid": str(EPISODE), "book_id": LIVRE}],
+        livres=[
+            {
+                "_id": LIVRE,
+                "titre": "Un monde à portée de main",
+                "auteur_id": AUTEUR,
+                "editeur": "Verticales",
+                "episodes": list(episodes),
+            }
+        ],
+        critiques=[{"_id": CRITIQUE, "nom": "Frédéric Beigbeder", "variantes": []}],
+        avis=stored_avis,
+    )
+
+
+async def _events(service, **kwargs):
+    return [event async for event in reextract_all_avis(service, **kwargs)]
+
+
+class TestLoadExtractionJobs:
+    """Préchargement des summaries et livres, par $in."""
+
+    def test_job_has_summary_livres_and_missing_episode(self, collections_service):
+        """Livre validé au format du matching, episodes[] manquant détecté."""
+        service, collections = _seeded_service(collections_service)
+
+        [job] = load_extraction_jobs(service)
+
+        assert job["emission_id"] == str(EMISSION)
+        assert job["summary"] == SUMMARY
+        assert job["livres"] == [
+            {
+                "_id": LIVRE,
+                "titre": "Un monde à portée de main",
+                "auteur_id": AUTEUR,
+                "editeur": "Verticales",
+            }
+        ]
+        assert job["missing_episode_livres"] == [LIVRE]
+        for name in ("emissions", "avis_critiques", "livresauteurs_cache", "livres"):
+            collections[name].find.assert_called_once()
+
+    def test_emission_without_summary_is_skipped(self, collections_service):
+        """Pas de summary → pas de tâche."""
+        service, collections = _seeded_service(collections_service)
+        collections["avis_critiques"].find.return_value = []
+
+        assert load_extraction_jobs(service) == []
+
+
+class TestMatchingStatsFromAvis:
+    """Statistiques des avis en base (livres uniques par match_phase)."""
+
+    def test_unique_titles_by_phase(self):
+        """Un titre compte une fois, match_phase None = non matché."""
+        stats = matching_stats_from_avis(
+            [
+                {"livre_titre_extrait": "A", "match_phase": 1},
+                {"livre_titre_extrait": "A", "match_phase": 1},
+                {"livre_titre_extrait": "B", "match_phase": None},
+            ],
+            livres_mongo=2,
+        )
+
+        assert stats["livres_summary"] == 2
+        assert stats["match_phase1"] == 1
+        assert stats["unmatched"] == 1
+
+
+class TestReextractAllAvis:
+    """Extraction, écritures groupées et mode dry-run."""
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_delta_without_writing(self, collections_service):
+        """Avis en base non matché, nouvelle extraction matchée : écart reporté."""
+        service, collections = _seeded_service(
+            collections_service,
+            stored_avis=[
+                {
+                    "emission_oid": str(EMISSION),
+                    "livre_titre_extrait": "Un monde à portée de main",
+                    "match_phase": None,
+                }
+            ],
+        )
+
+        events = await _events(service, dry_run=True, max_workers=1)
+
+        result = next(e for e in events if e["type"] == "emission_result")
+        assert result["extracted_count"] == 1
+        assert result["deleted_count"] == 1
+        assert result["matching_delta"]["match_phase1"] == 1
+        assert result["matching_delta"]["unmatched"] == -1
+        assert events[-1]["type"] == "complete"
+        assert events[-1]["matching_delta"]["match_phase1"] == 1
+        service.sync_avis_for_emissions.assert_not_called()
+        collections["livres"].bulk_write.assert_not_called()
+        # Critiques lus une seule fois
+        collections["critiques"].find.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_avis_and_repairs_episodes_in_bulk(self, collections_service):
+        """Un bulk_write pour episodes[], un remplacement groupé des avis."""
+        service, collections = _seeded_service(collections_service)
+
+        events = await _events(service, max_workers=1)
+
+        assert events[-1]["processed"] == 1
+        [repair] = collections["livres"].bulk_write.call_args[0][0]
+        assert repair._filter == {"_id": LIVRE}
+        assert repair._doc == {"$addToSet": {"episodes": str(EPISODE)}}
+        # Livres de l'épisode modifiés : badge recalculé
+        service.refresh_emission_badges_for_episodes.assert_called_once_with(
+            [str(EPISODE)]
+        )
+        avis_by_emission = service.sync_avis_for_emissions.call_args[0][0]
+        [avis] = avis_by_emission[str(EMISSION)]
+        assert avis["livre_oid"] == str(LIVRE)
+        assert avis["critique_oid"] == str(CRITIQUE)
+
+    @pytest.mark.asyncio
+    async def test_process_pool_gives_same_result(self, collections_service):
+        """Le parsing en processus donne les mêmes avis que le mode direct."""
+        service, _ = _seeded_service(collections_service, episodes=[str(EPISODE)])
+
+        events = await _events(service, dry_run=True, max_workers=2)
+
+        result = next(e for e in events if e["type"] == "emission_result")
+        assert result["extracted_count"] == 1
+        assert result["matching_stats"]["match_phase1"] == 1
+
+
+class TestDiffAvis:
+    """Différence par clé stable entre avis en base et extraction."""
+
+    def _avis(self, **fields):
+        return {
+            "emission_oid": "em1",
+            "section": "programme",
+            "livre_titre_extrait": "Combats de filles",
+            "critique_nom_extrait": "Élisabeth Philippe",
+            "note": 8,
+            **fields,
+        }
+
+    def test_one_changed_cell_gives_one_update(self):
+        """Note modifiée → une mise à jour des seuls champs changés."""
+        kept = {"_id": ObjectId(), **self._avis()}
+        changed = {
+            "_id": ObjectId(),
+            **self._avis(livre_titre_extrait="Feu", critique_nom_extrait="Arnaud"),
+        }
+        gone = {"_id": ObjectId(), **self._avis(livre_titre_extrait="Ancien")}
+
+        diff = diff_avis(
+            [kept, changed, gone],
+            [
+                # Clé insensible à la casse et aux accents
+                self._avis(critique_nom_extrait="ELISABETH PHILIPPE"),
+                self._avis(
+                    livre_titre_extrait="Feu", critique_nom_extrait="Arnaud", note=6
+                ),
+                self._avis(livre_titre_extrait="Nouveau"),
+            ],
+        )
+
+        assert [previous["_id"] for previous, _ in diff["update"]] == [
+            kept["_id"],
+            changed["_id"],
+        ]
+        assert diff["update"][1][1] == {"note": 6}
+        assert [a["livre_titre_extrait"] for a in diff["insert"]] == ["Nouveau"]
+        assert diff["delete"] == [gone]
+
+    def test_identical_extraction_is_unchanged(self):
+        """Même extraction → aucune écriture."""
+        stored = {"_id": ObjectId(), **self._avis()}
+
+        diff = diff_avis([stored], [self._avis()])
+
+        assert diff["unchanged"] == [stored]
+        assert not diff["insert"] and not diff["update"] and not diff["delete"]
+
+
+class TestSyncAvisForEmissions:
+    """Écriture par différence en un bulk_write."""
+
+    def _service(self, stored):
+        service = MongoDBService.__new__(MongoDBService)
+        service.db = MagicMock()
+        service.avis_collection = MagicMock()
+        service.avis_collection.find.return_value = stored
+        result = service.avis_collection.bulk_write.return_value
+        result.inserted_count, result.modified_count, result.deleted_count = 1, 0, 1
+        service.refresh_emission_badges = MagicMock()
+        service.refresh_palmares = MagicMock()
+        service.refresh_livre_stats = MagicMock()
+        return service
+
+    def test_only_diff_is_written_and_touched_livres_refreshed(self):
+        """Avis inchangé non réécrit ; livres ajoutés/supprimés recalculés."""
+        same = {
+            "_id": ObjectId(),
+            "emission_oid": "em1",
+            "livre_titre_extrait": "A",
+            "livre_oid": "l1",
+        }
+        gone = {
+            "_id": ObjectId(),
+            "emission_oid": "em1",
+            "livre_titre_extrait": "B",
+            "livre_oid": "l2",
+        }
+        service = self._service([same, gone])
+
+        counts = service.sync_avis_for_emissions(
+            {
+                "em1": [
+                    {
+                        "emission_oid": "em1",
+                        "livre_titre_extrait": "A",
+                        "livre_oid": "l1",
+                    },
+                    {
+                        "emission_oid": "em1",
+                        "livre_titre_extrait": "C",
+                        "livre_oid": "l3",
+                    },
+                ]
+            }
+        )
+
+        assert counts == {"inserted": 1, "updated": 0, "deleted": 1, "unchanged": 1}
+        operations = service.avis_collection.bulk_write.call_args[0][0]
+        assert [type(op) for op in operations] == [InsertOne, DeleteOne]
+        assert operations[1]._filter == {"_id": gone["_id"]}
+        service.refresh_emission_badges.assert_called_once_with(["em1"])
+        assert sorted(service.refresh_palmares.call_args[0][0]) == ["l2", "l3"]
+
+    def test_no_change_means_no_write(self):
+        """Extraction identique : ni bulk_write ni recalcul."""
+        stored = {"_id": ObjectId(), "emission_oid": "em1", "livre_titre_extrait": "A"}
+        service = self._service([stored])
+
+        counts = service.sync_avis_for_emissions(
+            {"em1": [{"emission_oid": "em1", "livre_titre_extrait": "A"}]}
+        )
+
+        assert counts["unchanged"] == 1
+        service.avis_collection.bulk_write.assert_not_called()
+        service.refresh_palmares.assert_not_called()
+
+
+class TestExtractBatchEndpoint:
+    """POST /api/avis/extract-batch diffuse la progression en SSE."""
+
+    def test_streams_events(self, client):
+        """Chaque événement est une ligne data: JSON."""
+
+        async def fake_reextract(service, **kwargs):
+            yield {"type": "start", "total": 1, "dry_run": kwargs["dry_run"]}
+            yield {"type": "complete", "processed": 1}
+
+        with patch("back_office_lmelp.app.reextract_all_avis", fake_reextract):
+            response = client.post("/api/avis/extract-batch", json={"dry_run": True})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert events == [
+            {"type": "start", "total": 1, "dry_run": True},
+            {"type": "complete", "processed": 1},
+        ]
+
+    @pytest.mark.parametrize("max_workers", [0, -1, AVIS_BATCH_MAX_WORKERS + 1])
+    def test_rejects_out_of_range_workers_before_streaming(self, client, max_workers):
+        """max_workers hors de 1..CPU : 422, aucun flux ni processus lancé."""
+        with patch("back_office_lmelp.app.reextract_all_avis") as reextract:
+            response = client.post(
+                "/api/avis/extract-batch", json={"max_workers": max_workers}
+            )
+
+        assert response.status_code == 422
+        reextract.assert_not_called()
+
+
+class TestReextractCommand:
+    """Option --workers de la commande reextract_avis."""
+
+    def test_workers_bounded_by_cpu_count(self):
+        """--workers accepte 1..CPU, refuse 0 et au-delà."""
+        assert workers_count("1") == 1
+        for value in ("0", str(AVIS_BATCH_MAX_WORKERS + 1), "deux"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                workers_count(value)
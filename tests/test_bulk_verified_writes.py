@@ -0,0 +1,201 @@
+"""Tests des écritures groupées des livres verified (auteurs, livres, cache)."""
+
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+from pymongo import ReplaceOne, UpdateOne
+
+from back_office_lmelp.services.livres_auteurs_cache_service import (
+    LivresAuteursCacheService,
+)
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+AUTEUR_EXISTANT = ObjectId()
+AUTEUR_NOUVEAU = ObjectId()
+LIVRE_EXISTANT = ObjectId()
+LIVRE_NOUVEAU = ObjectId()
+EDITEUR = ObjectId()
+
+
+def _service():
+    """MongoDBService avec collections mockées."""
+    service = MongoDBService.__new__(MongoDBService)
+    service.db = None
+    service.auteurs_collection = MagicMock()
+    service.livres_collection = MagicMock()
+    service.editeurs_collection = MagicMock()
+    service.editeurs_collection.find.return_value = [
+        {"_id": EDITEUR, "nom_normalise": "gallimard"}
+    ]
+    service.refresh_emission_badges_for_episodes = MagicMock()
+    return service
+
+
+class TestCreateAuthorsIfNotExist:
+    """Un $in puis un bulk_write d'upserts pour les auteurs manquants."""
+
+    def test_existing_found_missing_upserted(self):
+        """L'auteur existant est réutilisé, le manquant créé par upsert."""
+        service = _service()
+        service.auteurs_collection.find.return_value = [
+            {"_id": AUTEUR_EXISTANT, "nom": "Annie Ernaux"}
+        ]
+        service.auteurs_collection.bulk_write.return_value.upserted_ids = {
+            0: AUTEUR_NOUVEAU
+        }
+
+        authors = service.create_authors_if_not_exist(
+            ["Annie Ernaux", "Maria Pourchet", "Annie Ernaux", ""]
+        )
+
+        assert authors == {
+            "Annie Ernaux": {"author_id": AUTEUR_EXISTANT, "created": False},
+            "Maria Pourchet": {"author_id": AUTEUR_NOUVEAU, "created": True},
+        }
+        service.auteurs_collection.find.assert_called_once_with(
+            {"nom": {"$in": ["Annie Ernaux", "Maria Pourchet"]}}, {"nom": 1}
+        )
+        [operation] = service.auteurs_collection.bulk_write.call_args[0][0]
+        assert operation._filter == {"nom": "Maria Pourchet"}
+        assert operation._upsert is True
+
+    def test_all_existing_means_no_write(self):
+        """Aucun auteur manquant → aucune écriture."""
+        service = _service()
+        service.auteurs_collection.find.return_value = [
+            {"_id": AUTEUR_EXISTANT, "nom": "Annie Ernaux"}
+        ]
+
+        service.create_authors_if_not_exist(["Annie Ernaux"])
+
+        service.auteurs_collection.bulk_write.assert_not_called()
+
+
+class TestCreateBooksIfNotExist:
+    """Un $in puis un bulk_write pour tous les livres du lot."""
+
+    def test_existing_completed_new_upserted_duplicates_merged(self):
+        """Livre existant complété, nouveau livre upserté, doublons du lot fusionnés."""
+        service = _service()
+        service.livres_collection.find.return_value = [
+            {
+                "_id": LIVRE_EXISTANT,
+                "titre": "Les Années",
+                "auteur_id": AUTEUR_EXISTANT,
+                "editeur_id": EDITEUR,
+            }
+        ]
+        service.livres_collection.bulk_write.return_value.upserted_ids = {
+            1: LIVRE_NOUVEAU
+        }
+
+        outcomes = service.create_books_if_not_exist(
+            [
+                {
+                    "titre": "Les Années",
+                    "auteur_id": AUTEUR_EXISTANT,
+                    "editeur": "Gallimard",
+                    "episodes": ["ep1"],
+                },
+                {
+                    "titre": "Tressaillir",
+                    "auteur_id": AUTEUR_NOUVEAU,
+                    "editeur": "Gallimard",
+                    "episodes": ["ep1"],
+                },
+                {
+                    "titre": "Tressaillir",
+                    "auteur_id": AUTEUR_NOUVEAU,
+                    "editeur": "Gallimard",
+                    "episodes": ["ep2"],
+                },
+            ]
+        )
+
+        assert outcomes == [
+            {"book_id": LIVRE_EXISTANT, "created": False},
+            {"book_id": LIVRE_NOUVEAU, "created": True},
+            {"book_id": LIVRE_NOUVEAU, "created": True},
+        ]
+        service.livres_collection.find.assert_called_once()
+        service.livres_collection.bulk_write.assert_called_once()
+        existing_op, new_op = service.livres_collection.bulk_write.call_args[0][0]
+        assert existing_op._filter == {"_id": LIVRE_EXISTANT}
+        assert "$set" not in existing_op._doc  # editeur_id déjà présent
+        assert new_op._upsert is True
+        assert new_op._doc["$addToSet"]["episodes"] == {"$each": ["ep1", "ep2"]}
+        assert new_op._doc["$setOnInsert"]["editeur_id"] == EDITEUR
+        assert "episodes" not in new_op._doc["$setOnInsert"]
+
+        # Références livres[] des auteurs en un bulk_write
+        author_ops = service.auteurs_collection.bulk_write.call_args[0][0]
+        assert {op._filter["_id"] for op in author_ops} == {
+            AUTEUR_EXISTANT,
+            AUTEUR_NOUVEAU,
+        }
+        service.refresh_emission_badges_for_episodes.assert_called_once()
+
+
+class TestCacheBatchWrites:
+    """Entrées de cache créées et marquées traitées en lot."""
+
+    def _cache_service(self, mock_mongodb):
+        collection = MagicMock()
+        mock_mongodb.get_collection.return_value = collection
+        return LivresAuteursCacheService(), collection
+
+    def test_create_cache_entries_single_find_and_bulk_write(self):
+        """Une recherche des entrées existantes puis un seul bulk_write."""
+        avis_critique_id = ObjectId()
+        existing_id, new_id = ObjectId(), ObjectId()
+        books_data = [
+            {"episode_oid": "ep1", "auteur": "A", "titre": "T1", "status": "verified"},
+            {"episode_oid": "ep1", "auteur": "B", "titre": "T2", "status": "suggested"},
+        ]
+
+        with patch(
+            "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
+        ) as mock_mongodb:
+            cache_service, collection = self._cache_service(mock_mongodb)
+            collection.find.return_value = [
+                {"_id": existing_id, "auteur": "A", "titre": "T1"}
+            ]
+            collection.bulk_write.return_value.upserted_ids = {1: new_id}
+
+            ids = cache_service.create_cache_entries(avis_critique_id, books_data)
+
+        assert ids == [existing_id, new_id]
+        collection.find.assert_called_once()
+        operations = collection.bulk_write.call_args[0][0]
+        assert all(isinstance(op, ReplaceOne) for op in operations)
+        assert len(operations) == 2
+
+    def test_mark_batch_as_processed_single_bulk_write(self):
+        """Statut mongo, références et metadata en un seul bulk_write."""
+        cache_id, author_id, book_id = ObjectId(), ObjectId(), ObjectId()
+
+        with patch(
+            "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
+        ) as mock_mongodb:
+            cache_service, collection = self._cache_service(mock_mongodb)
+            collection.bulk_write.return_value.modified_count = 1
+
+            count = cache_service.mark_batch_as_processed(
+                [
+                    {
+                        "cache_id": cache_id,
+                        "author_id": author_id,
+                        "book_id": book_id,
+                        "metadata": {"babelio_publisher": "P.O.L."},
+                    }
+                ]
+            )
+
+        assert count == 1
+        [operation] = collection.bulk_write.call_args[0][0]
+        assert isinstance(operation, UpdateOne)
+        assert operation._filter == {"_id": cache_id}
+        assert operation._doc["$set"]["status"] == "mongo"
+        assert operation._doc["$set"]["book_id"] == book_id
+        assert operation._doc["$set"]["babelio_publisher"] == "P.O.L."
@@ -578,7 +578,7 @@ class TestCalibreMatchingServiceCorrections:
         entry = corrections["missing_lmelp_tags"][0]
         # Should contain the expected lmelp_ tags (what's missing)
         assert entry["expected_lmelp_tags"] == ["lmelp_240922", "lmelp_michel_crement"]
-        # all_tags_to_copy = exactly what _build_calibre_tags() returns (same as livre detail)
+        # all_tags_to_copy = exactly what build_calibre_tags() returns (same as livre detail)
         assert entry["all_tags_to_copy"] == [
             "lmelp_240922",
             "lmelp_michel_crement",
@@ -623,7 +623,7 @@ class TestCalibreMatchingServiceCorrections:
         entry = corrections["missing_lmelp_tags"][0]
         # Only the missing tag
         assert entry["expected_lmelp_tags"] == ["lmelp_michel_crement"]
-        # all_tags_to_copy = exactly what _build_calibre_tags() returns (all expected lmelp_)
+        # all_tags_to_copy = exactly what build_calibre_tags() returns (all expected lmelp_)
         assert entry["all_tags_to_copy"] == [
             "lmelp_240922",
             "lmelp_michel_crement",
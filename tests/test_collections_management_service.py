@@ -89,12 +89,35 @@ class TestCollectionsManagementService:
 
         with patch.object(service, "mongodb_service") as mock_mongodb:
             mock_mongodb.get_books_by_validation_status.return_value = verified_books
-            mock_mongodb.create_author_if_not_exists.return_value = ObjectId(
-                "64f1234567890abcdef11111"  # pragma: allowlist secret
-            )
-            mock_mongodb.create_book_if_not_exists.return_value = ObjectId(
-                "64f1234567890abcdef22222"  # pragma: allowlist secret
-            )
+            mock_mongodb.create_authors_if_not_exist.return_value = {
+                "Michel Houellebecq": {
+                    "author_id": ObjectId(
+                        "64f1234567890abcdef11111"  # pragma: allowlist secret
+                    ),
+                    "created": True,
+                },
+                "Emmanuel Carrère": {
+                    "author_id": ObjectId(
+                        "64f1234567890abcdef11112"  # pragma: allowlist secret
+                    ),
+                    "created": False,
+                },
+            }
+            mock_mongodb.create_books_if_not_exist.return_value = [
+                {
+                    "book_id": ObjectId(
+                        "64f1234567890abcdef22222"  # pragma: allowlist secret
+                    ),
+                    "created": True,
+                },
+                {
+                    "book_id": ObjectId(
+                        "64f1234567890abcdef22223"  # pragma: allowlist secret
+                    ),
+                    "created": True,
+                },
+            ]
+            mock_mongodb.get_critical_reviews_by_episode_oids.return_value = {}
 
             result = service.auto_process_verified_books()
 
@@ -104,10 +127,20 @@ class TestCollectionsManagementService:
             assert "created_authors" in result
             assert "created_books" in result
             assert result["processed_count"] == 2
+            assert result["created_authors"] == 1
+            assert result["created_books"] == 2
+            assert [item["author_created"] for item in result["items"]] == [
+                True,
+                False,
+            ]
 
-            # Vérifier que les méthodes de création ont été appelées
-            assert mock_mongodb.create_author_if_not_exists.call_count == 2
-            assert mock_mongodb.create_book_if_not_exists.call_count == 2
+            # Vérifier que les créations sont groupées (un appel par collection)
+            mock_mongodb.create_authors_if_not_exist.assert_called_once_with(
+                ["Michel Houellebecq", "Emmanuel Carrère"]
+            )
+            mock_mongodb.create_books_if_not_exist.assert_called_once()
+            assert len(mock_mongodb.create_books_if_not_exist.call_args[0][0]) == 2
+            mock_mongodb.create_author_if_not_exists.assert_not_called()
 
     def test_get_books_by_validation_status(self):
         """Test récupération des livres par statut de validation."""
@@ -224,24 +257,34 @@ class TestCollectionsManagementService:
         with patch.object(service, "mongodb_service") as mock_mongodb:
             # Mock des méthodes existantes avec système unifié
             mock_mongodb.get_books_by_validation_status.return_value = verified_books
-            mock_mongodb.create_author_if_not_exists.return_value = ObjectId(
-                "67a79b615b03b52d8c51db29"  # ID existant de Maria Pourchet  # pragma: allowlist secret
-            )
-            mock_mongodb.create_book_if_not_exists.return_value = ObjectId(
-                "68d3eb092f32bb8c43063f76"  # pragma: allowlist secret
-            )
+            mock_mongodb.create_authors_if_not_exist.return_value = {
+                "Maria Pourchet": {
+                    "author_id": ObjectId(
+                        "67a79b615b03b52d8c51db29"  # ID existant de Maria Pourchet  # pragma: allowlist secret
+                    ),
+                    "created": False,
+                }
+            }
+            mock_mongodb.create_books_if_not_exist.return_value = [
+                {
+                    "book_id": ObjectId(
+                        "68d3eb092f32bb8c43063f76"  # pragma: allowlist secret
+                    ),
+                    "created": True,
+                }
+            ]
 
-            # Mock pour récupérer l'avis critique correspondant
-            mock_mongodb.get_critical_review_by_episode_oid.return_value = (
-                mock_critical_review
-            )
+            # Mock pour récupérer les avis critiques des épisodes
+            mock_mongodb.get_critical_reviews_by_episode_oids.return_value = {
+                "68c707ad6e51b9428ab87e9e": mock_critical_review  # pragma: allowlist secret
+            }
 
             # Act
             service.auto_process_verified_books()
 
             # Assert - vérifier que le livre est créé avec la référence à l'avis critique
-            mock_mongodb.create_book_if_not_exists.assert_called_once()
-            call_args = mock_mongodb.create_book_if_not_exists.call_args[0][0]
+            mock_mongodb.create_books_if_not_exist.assert_called_once()
+            call_args = mock_mongodb.create_books_if_not_exist.call_args[0][0][0]
 
             # Le livre doit contenir la référence à l'avis critique
             assert "avis_critiques" in call_args
@@ -249,9 +292,9 @@ class TestCollectionsManagementService:
                 ObjectId("68c718a16e51b9428ab88066")  # pragma: allowlist secret
             ]
 
-            # Vérifier que l'avis critique a été recherché
-            mock_mongodb.get_critical_review_by_episode_oid.assert_called_with(
-                "68c707ad6e51b9428ab87e9e"  # pragma: allowlist secret
+            # Vérifier que les avis critiques ont été recherchés en une requête
+            mock_mongodb.get_critical_reviews_by_episode_oids.assert_called_once_with(
+                ["68c707ad6e51b9428ab87e9e"]  # pragma: allowlist secret
             )
 
     def test_get_statistics_returns_consistent_types(self):
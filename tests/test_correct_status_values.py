@@ -8,6 +8,7 @@ from bson import ObjectId
 from back_office_lmelp.services.livres_auteurs_cache_service import (
     LivresAuteursCacheService,
 )
+from back_office_lmelp.utils.join_keys import typed_join_key
 
 
 class TestCorrectStatusValues:
@@ -95,20 +96,18 @@ class TestCorrectStatusValues:
         with patch(
             "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
         ) as mock_mongodb:
-            # Mock des données de cache avec différents statuts
-            mock_mongodb.get_collection.return_value.aggregate.return_value = [
-                {"_id": "mongo", "count": 5},  # Livres en base
-                {"_id": "verified", "count": 3},  # Livres vérifiés
-                {"_id": "suggested", "count": 2},  # Livres suggérés
-                {"_id": "not_found", "count": 1},  # Livres non trouvés
+            # Mock des agrégations : statuts du cache, avis analysés, épisodes sans émission
+            mock_mongodb.get_collection.return_value.aggregate.side_effect = [
+                [
+                    {"_id": "mongo", "count": 5},  # Livres en base
+                    {"_id": "verified", "count": 3},  # Livres vérifiés
+                    {"_id": "suggested", "count": 2},  # Livres suggérés
+                    {"_id": "not_found", "count": 1},  # Livres non trouvés
+                ],
+                [{"_id": None, "total": 100, "analyzed": 2}],
+                [],
             ]
-
-            # Mock pour untreated count
             mock_mongodb.get_collection.return_value.count_documents.return_value = 100
-            mock_mongodb.get_collection.return_value.distinct.return_value = [
-                "id1",
-                "id2",
-            ]
 
             service = LivresAuteursCacheService()
             stats = service.get_statistics_from_cache()
@@ -146,16 +145,15 @@ class TestCorrectStatusValues:
             "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
         ) as mock_mongodb:
             # Mock des données de cache (sans verified pour simuler notre situation actuelle)
-            mock_mongodb.get_collection.return_value.aggregate.return_value = [
-                {"_id": "mongo", "count": 128},
-                {"_id": "suggested", "count": 86},
-                {"_id": "not_found", "count": 52},
-            ]
-
-            # Mock pour avis critiques analysés (nouvelle stat)
-            mock_mongodb.get_collection.return_value.distinct.side_effect = [
-                ["id1", "id2", "id38"],  # 38 avis_critique_id distincts
-                ["analyzed1", "analyzed2"],  # pour untreated count
+            mock_mongodb.get_collection.return_value.aggregate.side_effect = [
+                [
+                    {"_id": "mongo", "count": 128},
+                    {"_id": "suggested", "count": 86},
+                    {"_id": "not_found", "count": 52},
+                ],
+                # Avis critiques analysés (nouvelle stat)
+                [{"_id": None, "total": 100, "analyzed": 38}],
+                [],
             ]
             mock_mongodb.get_collection.return_value.count_documents.return_value = 100
 
@@ -175,17 +173,17 @@ class TestCorrectStatusValues:
         with patch(
             "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
         ) as mock_mongodb:
-            # Mock des données de cache
-            mock_mongodb.get_collection.return_value.aggregate.return_value = [
-                {"_id": "mongo", "count": 128},
-                {"_id": "suggested", "count": 86},
-                {"_id": "not_found", "count": 52},
-            ]
-
-            # Mock pour avis critiques analysés : distinct retourne les avis_critique_id uniques
-            mock_mongodb.get_collection.return_value.distinct.side_effect = [
-                [ObjectId() for _ in range(42)],  # 42 avis_critique_id distincts
-                ["analyzed1", "analyzed2"],  # pour untreated count
+            # Mock des agrégations : statuts du cache, puis avis critiques
+            # visibles / analysés (anti-jointure avis_critiques → cache)
+            aggregate = mock_mongodb.get_collection.return_value.aggregate
+            aggregate.side_effect = [
+                [
+                    {"_id": "mongo", "count": 128},
+                    {"_id": "suggested", "count": 86},
+                    {"_id": "not_found", "count": 52},
+                ],
+                [{"_id": None, "total": 100, "analyzed": 42}],
+                [],
             ]
             mock_mongodb.get_collection.return_value.count_documents.return_value = 100
 
@@ -196,9 +194,46 @@ class TestCorrectStatusValues:
             assert "avis_critiques_analyses" in stats
             assert stats["avis_critiques_analyses"] == 42
             assert isinstance(stats["avis_critiques_analyses"], int)
+            assert stats["episodes_non_traites"] == 58
+
+            # Épisodes masqués exclus via avis_critiques.episode_masked (pas de $nin)
+            analyzed_pipeline = aggregate.call_args_list[1][0][0]
+            assert analyzed_pipeline[0] == {"$match": {"episode_masked": {"$ne": True}}}
+            mock_mongodb.get_collection.return_value.distinct.assert_not_called()
+
+    def test_analyzed_avis_critiques_match_legacy_string_cache_ids(self):
+        """Les entrées de cache avec avis_critique_id en String restent comptées."""
+        with patch(
+            "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
+        ) as mock_mongodb:
+            aggregate = mock_mongodb.get_collection.return_value.aggregate
+            aggregate.return_value = [{"_id": None, "total": 3, "analyzed": 2}]
 
-            # Vérifier que distinct a été appelé sur 'avis_critique_id' avec le filtre pour exclure les épisodes masqués
-            # Note: masked_episode_oids est vide car episodes_collection.find n'est pas mocké pour retourner des résultats
-            mock_mongodb.get_collection.return_value.distinct.assert_any_call(
-                "avis_critique_id", {"episode_oid": {"$nin": []}}
-            )
+            service = LivresAuteursCacheService()
+            assert service._count_analyzed_avis_critiques() == (3, 2)
+
+            pipeline = aggregate.call_args[0][0]
+            assert pipeline[1] == {
+                "$project": {"cache_keys": ["$_id", {"$toString": "$_id"}]}
+            }
+            lookup = pipeline[2]["$lookup"]
+            assert lookup["localField"] == "cache_keys"
+            assert lookup["foreignField"] == "avis_critique_id"
+
+    def test_episodes_sans_emission_fall_back_to_episode_oid(self):
+        """Avis critiques sans episode_id (pas encore rattrapés) : episode_oid."""
+        with patch(
+            "back_office_lmelp.services.livres_auteurs_cache_service.mongodb_service"
+        ) as mock_mongodb:
+            aggregate = mock_mongodb.get_collection.return_value.aggregate
+            aggregate.return_value = [{"total": 4}]
+
+            service = LivresAuteursCacheService()
+            assert service._count_episodes_sans_emission() == 4
+
+            pipeline = aggregate.call_args[0][0]
+            assert "$type" not in str(pipeline[0])
+            assert pipeline[1] == {
+                "$group": {"_id": typed_join_key("episode_oid", "episode_id")}
+            }
+            assert pipeline[2] == {"$match": {"_id": {"$ne": None}}}
@@ -278,3 +278,76 @@ def test_extract_critiques_hyphenated_name_without_space(service):
         f"'Jean-Louis' devrait être extrait, got: {critiques}"
     )
     assert "Olivia de Lamberterie" in critiques
+
+
+def test_critique_index_keeps_first_match_priority(service):
+    """L'index respecte la priorité du parcours séquentiel (premier trouvé)."""
+    from bson import ObjectId
+
+    existing_critiques = [
+        {
+            "_id": ObjectId("507f1f77bcf86cd799439011"),
+            "nom": "Arnaud Viviant",
+            "variantes": ["Blandine Rinkel"],
+        },
+        {
+            "_id": ObjectId("507f1f77bcf86cd799439012"),
+            "nom": "Blandine Rinkel",
+            "variantes": [],
+        },
+    ]
+
+    index = service.build_critique_index(existing_critiques)
+    match = service.match_critique("BLANDINE RINKEL", index)
+
+    assert match is not None
+    assert match["nom"] == "Arnaud Viviant"
+    assert match["match_type"] == "variante"
+
+
+def test_critique_index_is_cached_until_invalidated(service):
+    """L'index n'est chargé qu'une fois puis rechargé après invalidation."""
+    from unittest.mock import MagicMock
+
+    from bson import ObjectId
+
+    collection = MagicMock()
+    collection.find.return_value = [
+        {"_id": ObjectId(), "nom": "Patricia Martin", "variantes": []}
+    ]
+
+    service.get_critique_index(collection)
+    index = service.get_critique_index(collection)
+    assert collection.find.call_count == 1
+    assert service.match_critique("Patricia Martin", index) is not None
+
+    collection.find.return_value = [
+        {"_id": ObjectId(), "nom": "Patricia Martin", "variantes": ["P. Martin"]}
+    ]
+    service.invalidate_critique_index()
+    index = service.get_critique_index(collection)
+
+    assert collection.find.call_count == 2
+    assert service.match_critique("P. Martin", index)["match_type"] == "variante"
+
+
+def test_merge_critiques_invalidates_index():
+    """merge_critiques invalide l'index (noms et variantes modifiés)."""
+    from unittest.mock import MagicMock, patch
+
+    from bson import ObjectId
+
+    from back_office_lmelp.services.mongodb_service import MongoDBService
+
+    mongodb = MongoDBService()
+    mongodb.critiques_collection = MagicMock()
+    mongodb.avis_collection = MagicMock()
+    mongodb.critiques_collection.find_one.return_value = {"nom": "X", "variantes": []}
+
+    with patch(
+        "back_office_lmelp.services.critiques_extraction_service."
+        "critiques_extraction_service.invalidate_critique_index"
+    ) as mock_invalidate:
+        mongodb.merge_critiques(str(ObjectId()), str(ObjectId()))
+
+    mock_invalidate.assert_called_once()
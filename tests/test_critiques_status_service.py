@@ -0,0 +1,120 @@
+"""Tests du statut "critiques manquants" précalculé par avis critique."""
+
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from back_office_lmelp.services.critiques_extraction_service import (
+    critiques_extraction_service,
+)
+from back_office_lmelp.services.critiques_status_service import (
+    compute_critiques_status,
+    get_critiques_status_by_episode,
+    rematch_critiques_status,
+)
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+def _service(critiques, avis_critiques=()):
+    """MongoDBService avec collections critiques et avis_critiques mockées."""
+    service = MongoDBService()
+    service.critiques_collection = MagicMock()
+    service.critiques_collection.find.return_value = critiques
+    service.avis_critiques_collection = MagicMock()
+    service.avis_critiques_collection.find.return_value = list(avis_critiques)
+    return service
+
+
+class TestComputeCritiquesStatus:
+    """Calcul depuis le summary."""
+
+    def test_counts_new_and_existing(self):
+        """Les noms sans critique en base sont comptés comme "new"."""
+        index = critiques_extraction_service.build_critique_index(
+            [{"_id": ObjectId(), "nom": "Patricia Martin", "variantes": []}]
+        )
+
+        status = compute_critiques_status(
+            "**Patricia Martin**: bien <br> **Bernard Poiret**: moyen", index
+        )
+
+        assert status == {
+            "critiques_detectes": ["Patricia Martin", "Bernard Poiret"],
+            "critiques_new_count": 1,
+            "critiques_existing_count": 1,
+        }
+
+
+class TestGetCritiquesStatusByEpisode:
+    """Lecture des compteurs précalculés."""
+
+    def test_reads_stored_counts_without_summary(self):
+        """Une seule requête projetée, sans le summary."""
+        service = _service(
+            [],
+            [
+                {
+                    "_id": ObjectId(),
+                    "episode_oid": "ep1",
+                    "critiques_new_count": 2,
+                    "critiques_existing_count": 3,
+                }
+            ],
+        )
+
+        statuses = get_critiques_status_by_episode(service, ["ep1"])
+
+        assert statuses == {"ep1": {"new": 2, "existing": 3}}
+        projection = service.avis_critiques_collection.find.call_args[0][1]
+        assert "summary" not in projection
+        service.avis_critiques_collection.bulk_write.assert_not_called()
+
+
+class TestRematchCritiquesStatus:
+    """Re-matching après un changement de la collection critiques."""
+
+    def test_only_updates_changed_statuses(self):
+        """Seuls les avis critiques dont les compteurs changent sont réécrits."""
+        unchanged_id, changed_id = ObjectId(), ObjectId()
+        service = _service(
+            [{"_id": ObjectId(), "nom": "Patricia Martin", "variantes": ["P. M."]}],
+            [
+                {
+                    "_id": unchanged_id,
+                    "critiques_detectes": ["Patricia Martin"],
+                    "critiques_new_count": 0,
+                    "critiques_existing_count": 1,
+                },
+                {
+                    # "P. M." vient d'être ajoutée comme variante
+                    "_id": changed_id,
+                    "critiques_detectes": ["P. M."],
+                    "critiques_new_count": 1,
+                    "critiques_existing_count": 0,
+                },
+            ],
+        )
+
+        assert rematch_critiques_status(service) == 1
+
+        operations = service.avis_critiques_collection.bulk_write.call_args[0][0]
+        assert [op._filter for op in operations] == [{"_id": changed_id}]
+        assert operations[0]._doc["$set"]["critiques_new_count"] == 0
+
+
+class TestSummaryWriteHook:
+    """La sauvegarde d'un summary recalcule le statut."""
+
+    def test_update_avis_critique_stores_status_with_summary(self):
+        """update_avis_critique ajoute les compteurs quand le summary change."""
+        service = _service(
+            [{"_id": ObjectId(), "nom": "Arnaud Viviant", "variantes": []}]
+        )
+
+        service.update_avis_critique(
+            str(ObjectId()), {"summary": "**Arnaud Viviant**: très bien"}
+        )
+
+        update = service.avis_critiques_collection.update_one.call_args[0][1]
+        assert update["$set"]["critiques_existing_count"] == 1
+        assert update["$set"]["critiques_new_count"] == 0
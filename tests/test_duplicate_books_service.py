@@ -592,6 +592,11 @@ class TestMergeShouldUpdateCache:
             "Update should set book_id to primary book ID"
         )
 
+        # Statistiques matérialisées des doublons supprimés
+        mock_mongodb_service.delete_livre_stats.assert_called_once_with(
+            [duplicate_book_id]
+        )
+
     @pytest.mark.asyncio
     async def test_merge_should_report_cache_updates_in_result(
         self, duplicate_books_service, mock_mongodb_service, mock_babelio_service
@@ -6,6 +6,24 @@ from unittest.mock import MagicMock, patch
 from bson import ObjectId
 
 
+def _editeurs_collection(editeurs=(), upserted_id=None):
+    """Collection editeurs mockée.
+
+    find_one filtre sur nom_normalise, update_one simule l'upsert.
+    """
+    collection = MagicMock()
+    collection.find_one.side_effect = lambda query, projection=None: next(
+        (
+            e
+            for e in editeurs
+            if "nom_normalise" in e and e["nom_normalise"] == query.get("nom_normalise")
+        ),
+        None,
+    )
+    collection.update_one.return_value.upserted_id = upserted_id
+    return collection
+
+
 class TestSearchEditeurByName:
     """Tests pour search_editeur_by_name - recherche case/accent insensitive."""
 
@@ -16,11 +34,9 @@ class TestSearchEditeurByName:
 
         service = MongoDBService()
         editeur_oid = ObjectId()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = [
-            {"_id": editeur_oid, "nom": "Gallimard"},
-        ]
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": editeur_oid, "nom": "Gallimard", "nom_normalise": "gallimard"}]
+        )
 
         result = service.search_editeur_by_name("Gallimard")
 
@@ -34,13 +50,16 @@ class TestSearchEditeurByName:
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService()
-        editeur_oid = ObjectId()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = [
-            {"_id": editeur_oid, "nom": "Gallimard"},
-            {"_id": ObjectId(), "nom": "Le Livre de Poche"},
-        ]
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(
+            [
+                {"_id": ObjectId(), "nom": "Gallimard", "nom_normalise": "gallimard"},
+                {
+                    "_id": ObjectId(),
+                    "nom": "Le Livre de Poche",
+                    "nom_normalise": "le livre de poche",
+                },
+            ]
+        )
 
         result = service.search_editeur_by_name("gallimard")
 
@@ -53,29 +72,63 @@ class TestSearchEditeurByName:
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService()
-        editeur_oid = ObjectId()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = [
-            {"_id": editeur_oid, "nom": "Éditions du Seuil"},
-        ]
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(
+            [
+                {
+                    "_id": ObjectId(),
+                    "nom": "Éditions du Seuil",
+                    "nom_normalise": "editions du seuil",
+                }
+            ]
+        )
 
         result = service.search_editeur_by_name("Editions du Seuil")
 
         assert result is not None
         assert result["nom"] == "Éditions du Seuil"
 
+    @patch("back_office_lmelp.services.mongodb_service.mongodb_service")
+    def test_uses_indexed_lookup(self, mock_service):
+        """La recherche porte sur nom_normalise, sans parcourir les éditeurs."""
+        from back_office_lmelp.services.mongodb_service import MongoDBService
+
+        service = MongoDBService()
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": ObjectId(), "nom": "P.O.L", "nom_normalise": "p.o.l"}]
+        )
+
+        service.search_editeur_by_name("P.O.L")
+
+        service.editeurs_collection.find_one.assert_called_once_with(
+            {"nom_normalise": "p.o.l"}
+        )
+        service.editeurs_collection.find.assert_not_called()
+
+    @patch("back_office_lmelp.services.mongodb_service.mongodb_service")
+    def test_miss_does_not_scan_legacy_editeurs(self, mock_service):
+        """Nom absent de l'index : None, sans parcourir les éditeurs."""
+        from back_office_lmelp.services.mongodb_service import MongoDBService
+
+        service = MongoDBService()
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": ObjectId(), "nom": "Éditions du Seuil"}]
+        )
+
+        result = service.search_editeur_by_name("editions du seuil")
+
+        assert result is None
+        service.editeurs_collection.find.assert_not_called()
+        service.editeurs_collection.update_one.assert_not_called()
+
     @patch("back_office_lmelp.services.mongodb_service.mongodb_service")
     def test_returns_none_when_not_found(self, mock_service):
         """search_editeur_by_name('Unknown') retourne None."""
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = [
-            {"_id": ObjectId(), "nom": "Gallimard"},
-        ]
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": ObjectId(), "nom": "Gallimard", "nom_normalise": "gallimard"}]
+        )
 
         result = service.search_editeur_by_name("Unknown Publisher")
 
@@ -87,9 +140,7 @@ class TestSearchEditeurByName:
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = []
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection()
 
         result = service.search_editeur_by_name("Gallimard")
 
@@ -149,17 +200,15 @@ class TestGetOrCreateEditeur:
 
         service = MongoDBService()
         existing_oid = ObjectId()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = [
-            {"_id": existing_oid, "nom": "Gallimard"},
-        ]
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": existing_oid, "nom": "Gallimard", "nom_normalise": "gallimard"}]
+        )
 
         oid, created = service.get_or_create_editeur("Gallimard")
 
         assert oid == existing_oid
         assert created is False
-        mock_collection.insert_one.assert_not_called()
+        service.editeurs_collection.update_one.assert_not_called()
 
     @patch("back_office_lmelp.services.mongodb_service.mongodb_service")
     def test_creates_when_not_found(self, mock_service):
@@ -168,20 +217,38 @@ class TestGetOrCreateEditeur:
 
         service = MongoDBService()
         new_oid = ObjectId()
-        mock_collection = MagicMock()
-        # search returns nothing
-        mock_collection.find.return_value = []
-        # create returns new oid
-        mock_insert_result = MagicMock()
-        mock_insert_result.inserted_id = new_oid
-        mock_collection.insert_one.return_value = mock_insert_result
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(upserted_id=new_oid)
 
         oid, created = service.get_or_create_editeur("P.O.L")
 
         assert oid == new_oid
         assert created is True
-        mock_collection.insert_one.assert_called_once()
+        # Upsert sur le nom normalisé (pas de insert_one sans garde d'unicité)
+        call = service.editeurs_collection.update_one.call_args
+        assert call[0][0] == {"nom_normalise": "p.o.l"}
+        assert call[0][1]["$setOnInsert"]["nom"] == "P.O.L"
+        assert call[1]["upsert"] is True
+        service.editeurs_collection.insert_one.assert_not_called()
+
+    @patch("back_office_lmelp.services.mongodb_service.mongodb_service")
+    def test_concurrent_creation_returns_existing(self, mock_service):
+        """Si un upsert concurrent a créé l'éditeur, son _id est retourné."""
+        from pymongo.errors import DuplicateKeyError
+
+        from back_office_lmelp.services.mongodb_service import MongoDBService
+
+        service = MongoDBService()
+        concurrent_oid = ObjectId()
+        collection = MagicMock()
+        collection.find_one.side_effect = [None, {"_id": concurrent_oid}]
+        collection.find.return_value = []
+        collection.update_one.side_effect = DuplicateKeyError("E11000")
+        service.editeurs_collection = collection
+
+        oid, created = service.get_or_create_editeur("P.O.L")
+
+        assert oid == concurrent_oid
+        assert created is False
 
     @patch("back_office_lmelp.services.mongodb_service.mongodb_service")
     def test_case_insensitive_match(self, mock_service):
@@ -190,11 +257,9 @@ class TestGetOrCreateEditeur:
 
         service = MongoDBService()
         existing_oid = ObjectId()
-        mock_collection = MagicMock()
-        mock_collection.find.return_value = [
-            {"_id": existing_oid, "nom": "Gallimard"},
-        ]
-        service.editeurs_collection = mock_collection
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": existing_oid, "nom": "Gallimard", "nom_normalise": "gallimard"}]
+        )
 
         oid, created = service.get_or_create_editeur("gallimard")
 
@@ -448,11 +513,9 @@ class TestCreateBookUsesEditeurId:
         service.livres_collection = mock_livres
 
         # Mock editeurs_collection - éditeur "Gallimard" existe déjà
-        mock_editeurs = MagicMock()
-        mock_editeurs.find.return_value = [
-            {"_id": editeur_oid, "nom": "Gallimard"},
-        ]
-        service.editeurs_collection = mock_editeurs
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": editeur_oid, "nom": "Gallimard", "nom_normalise": "gallimard"}]
+        )
 
         # Mock auteurs_collection pour _add_book_to_author
         mock_auteurs = MagicMock()
@@ -493,12 +556,8 @@ class TestCreateBookUsesEditeurId:
         mock_livres.insert_one.return_value = mock_insert_result
         service.livres_collection = mock_livres
 
-        # Mock editeurs_collection - éditeur n'existe pas, sera créé
-        mock_editeurs = MagicMock()
-        mock_editeurs.find.return_value = []  # Pas trouvé
-        mock_editeur_insert = MagicMock()
-        mock_editeur_insert.inserted_id = new_editeur_oid
-        mock_editeurs.insert_one.return_value = mock_editeur_insert
+        # Mock editeurs_collection - éditeur n'existe pas, sera créé (upsert)
+        mock_editeurs = _editeurs_collection(upserted_id=new_editeur_oid)
         service.editeurs_collection = mock_editeurs
 
         # Mock auteurs_collection
@@ -517,7 +576,7 @@ class TestCreateBookUsesEditeurId:
 
         assert result == livre_oid
         # L'éditeur a été créé
-        mock_editeurs.insert_one.assert_called_once()
+        mock_editeurs.update_one.assert_called_once()
         # Le livre contient editeur_id
         insert_args = mock_livres.insert_one.call_args[0][0]
         assert insert_args["editeur_id"] == new_editeur_oid
@@ -546,11 +605,9 @@ class TestCreateBookUsesEditeurId:
         service.livres_collection = mock_livres
 
         # Mock editeurs_collection
-        mock_editeurs = MagicMock()
-        mock_editeurs.find.return_value = [
-            {"_id": editeur_oid, "nom": "Gallimard"},
-        ]
-        service.editeurs_collection = mock_editeurs
+        service.editeurs_collection = _editeurs_collection(
+            [{"_id": editeur_oid, "nom": "Gallimard", "nom_normalise": "gallimard"}]
+        )
 
         # Mock auteurs_collection
         mock_auteurs = MagicMock()
@@ -612,8 +669,109 @@ class TestCreateBookUsesEditeurId:
 
         assert result == livre_oid
         # Pas de recherche ni création d'éditeur
+        mock_editeurs.find_one.assert_not_called()
         mock_editeurs.find.assert_not_called()
-        mock_editeurs.insert_one.assert_not_called()
+        mock_editeurs.update_one.assert_not_called()
         # Le document ne doit PAS avoir editeur_id
         insert_args = mock_livres.insert_one.call_args[0][0]
         assert "editeur_id" not in insert_args
+
+
+class TestMigrateEditeursNomNormalise:
+    """Tests de la migration qui complète nom_normalise."""
+
+    def test_backfills_missing_and_merges_duplicates(self):
+        """Migration (merge=True) : complétés, doublons fusionnés."""
+        from back_office_lmelp.utils.migrate_editeurs_nom_normalise import (
+            backfill_nom_normalise,
+        )
+
+        gallimard_oid = ObjectId()
+        pol_oid, seuil_oid, doublon_oid, seuil_doublon_oid = (
+            ObjectId(),
+            ObjectId(),
+            ObjectId(),
+            ObjectId(),
+        )
+        collection = MagicMock()
+        # Éditeurs déjà migrés, puis éditeurs sans nom_normalise
+        migrated = [{"_id": gallimard_oid, "nom_normalise": "gallimard"}]
+        legacy = MagicMock()
+        legacy.sort.return_value = [
+            {"_id": pol_oid, "nom": "P.O.L"},
+            {"_id": seuil_oid, "nom": "Éditions du Seuil"},
+            {"_id": doublon_oid, "nom": "GALLIMARD"},
+            {"_id": seuil_doublon_oid, "nom": "editions du seuil"},
+        ]
+        collection.find.side_effect = [migrated, legacy]
+        service = MagicMock()
+        service.editeurs_collection = collection
+
+        result = backfill_nom_normalise(service, merge=True)
+
+        assert result == {"updated": 2, "duplicates": 2, "merged": 2}
+        operations = collection.bulk_write.call_args[0][0]
+        assert [(op._filter, op._doc) for op in operations] == [
+            ({"_id": pol_oid}, {"$set": {"nom_normalise": "p.o.l"}}),
+            ({"_id": seuil_oid}, {"$set": {"nom_normalise": "editions du seuil"}}),
+        ]
+        # Livres des doublons repointés, puis doublons supprimés
+        repoints = service.livres_collection.bulk_write.call_args[0][0]
+        assert [(op._filter, op._doc) for op in repoints] == [
+            ({"editeur_id": doublon_oid}, {"$set": {"editeur_id": gallimard_oid}}),
+            (
+                {"editeur_id": seuil_doublon_oid},
+                {"$set": {"editeur_id": seuil_oid}},
+            ),
+        ]
+        collection.delete_many.assert_called_once_with(
+            {"_id": {"$in": [doublon_oid, seuil_doublon_oid]}}
+        )
+
+    def _legacy_service(self):
+        """Gallimard migré, puis P.O.L et le doublon GALLIMARD sans nom_normalise."""
+        gallimard_oid, pol_oid, doublon_oid = ObjectId(), ObjectId(), ObjectId()
+        collection = MagicMock()
+        legacy = MagicMock()
+        legacy.sort.return_value = [
+            {"_id": pol_oid, "nom": "P.O.L"},
+            {"_id": doublon_oid, "nom": "GALLIMARD"},
+        ]
+        collection.find.side_effect = [
+            [{"_id": gallimard_oid, "nom_normalise": "gallimard"}],
+            legacy,
+        ]
+        service = MagicMock()
+        service.editeurs_collection = collection
+        return service, pol_oid
+
+    def test_startup_backfill_only_reports_duplicates(self):
+        """Par défaut (démarrage) : complétion seule, aucun doublon fusionné."""
+        from back_office_lmelp.utils.migrate_editeurs_nom_normalise import (
+            backfill_nom_normalise,
+        )
+
+        service, pol_oid = self._legacy_service()
+
+        result = backfill_nom_normalise(service)
+
+        assert result == {"updated": 1, "duplicates": 1, "merged": 0}
+        operations = service.editeurs_collection.bulk_write.call_args[0][0]
+        assert [op._filter for op in operations] == [{"_id": pol_oid}]
+        service.livres_collection.bulk_write.assert_not_called()
+        service.editeurs_collection.delete_many.assert_not_called()
+
+    def test_dry_run_writes_nothing(self):
+        """--dry-run : fusions comptées, aucune écriture."""
+        from back_office_lmelp.utils.migrate_editeurs_nom_normalise import (
+            backfill_nom_normalise,
+        )
+
+        service, _ = self._legacy_service()
+
+        result = backfill_nom_normalise(service, merge=True, dry_run=True)
+
+        assert result == {"updated": 1, "duplicates": 1, "merged": 1}
+        service.editeurs_collection.bulk_write.assert_not_called()
+        service.livres_collection.bulk_write.assert_not_called()
+        service.editeurs_collection.delete_many.assert_not_called()
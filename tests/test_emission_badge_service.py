@@ -0,0 +1,291 @@
+"""Tests pour le moteur de badges des émissions partagé (emission_badge_service)."""
+
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+from back_office_lmelp.services.emission_badge_service import (
+    compute_badge_status,
+    compute_emission_badges,
+    count_livres_by_episode,
+    ensure_emission_badges,
+    get_emission_badges,
+    rebuild_emission_badges,
+    refresh_badges_for_episodes,
+    refresh_emission_badges,
+)
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+def _avis(titre="Livre", livre_oid="oid", note=8, emission_oid=None):
+    """Crée un avis minimal pour le calcul du badge."""
+    return {
+        "emission_oid": emission_oid,
+        "livre_titre_extrait": titre,
+        "livre_oid": livre_oid,
+        "note": note,
+    }
+
+
+class TestComputeBadgeStatus:
+    """Tests de la règle de badge."""
+
+    def test_no_avis(self):
+        """Aucun avis extrait → ⚪ no_avis."""
+        assert compute_badge_status([], 3) == "no_avis"
+
+    def test_perfect(self):
+        """Comptes égaux, tout matché et noté → 🟢 perfect."""
+        avis = [_avis("A"), _avis("B"), _avis("B")]
+        assert compute_badge_status(avis, 2) == "perfect"
+
+    def test_count_mismatch_when_counts_differ(self):
+        """# livres summary ≠ # livres mongo → 🔴 count_mismatch."""
+        assert compute_badge_status([_avis("A")], 2) == "count_mismatch"
+
+    def test_count_mismatch_when_note_missing(self):
+        """Une note manquante → 🔴 count_mismatch."""
+        assert compute_badge_status([_avis("A", note=None)], 1) == "count_mismatch"
+
+    def test_unmatched(self):
+        """Livre non matché, comptes égaux → 🟡 unmatched."""
+        assert compute_badge_status([_avis("A", livre_oid=None)], 1) == "unmatched"
+
+
+class TestComputeEmissionBadges:
+    """Tests du calcul par lots."""
+
+    def _service(self, avis_docs, livres_rows):
+        """Service MongoDB mocké avec collections avis et livres."""
+        avis_collection = MagicMock()
+        avis_collection.find.return_value = avis_docs
+        livres_collection = MagicMock()
+        livres_collection.aggregate.return_value = livres_rows
+        service = MagicMock()
+        service.get_collection.side_effect = lambda name: {
+            "avis": avis_collection,
+            "livres": livres_collection,
+        }[name]
+        return service, avis_collection, livres_collection
+
+    def test_query_count_is_independent_of_emission_count(self):
+        """Une requête avis + une agrégation livres pour N émissions."""
+        emissions = [{"_id": ObjectId(), "episode_id": ObjectId()} for _ in range(50)]
+        avis_docs = [_avis("A", emission_oid=str(e["_id"])) for e in emissions]
+        livres_rows = [{"_id": str(e["episode_id"]), "count": 1} for e in emissions]
+        service, avis_collection, livres_collection = self._service(
+            avis_docs, livres_rows
+        )
+
+        badges = compute_emission_badges(service, emissions)
+
+        assert set(badges.values()) == {"perfect"}
+        assert avis_collection.find.call_count == 1
+        assert livres_collection.aggregate.call_count == 1
+
+    def test_emission_without_avis_is_no_avis(self):
+        """Les émissions sans avis n'entraînent aucun comptage de livres."""
+        emissions = [{"_id": ObjectId(), "episode_id": ObjectId()}]
+        service, _, livres_collection = self._service([], [])
+
+        badges = compute_emission_badges(service, emissions)
+
+        assert badges == {str(emissions[0]["_id"]): "no_avis"}
+        livres_collection.aggregate.assert_not_called()
+
+    def test_large_inputs_are_batched(self):
+        """Les listes $in sont bornées par BADGE_BATCH_SIZE."""
+        emissions = [{"_id": ObjectId(), "episode_id": ObjectId()} for _ in range(5)]
+        service, avis_collection, _ = self._service([], [])
+
+        with patch(
+            "back_office_lmelp.services.emission_badge_service.BADGE_BATCH_SIZE", 2
+        ):
+            compute_emission_badges(service, emissions)
+
+        assert avis_collection.find.call_count == 3
+
+    def test_empty_emissions(self):
+        """Aucune émission → aucune requête."""
+        service, avis_collection, _ = self._service([], [])
+        assert compute_emission_badges(service, []) == {}
+        avis_collection.find.assert_not_called()
+
+
+class TestCountLivresByEpisode:
+    """Tests du comptage des livres par épisode."""
+
+    def test_groups_by_episode(self):
+        """Une agrégation $group compte les livres de chaque épisode."""
+        livres_collection = MagicMock()
+        livres_collection.aggregate.return_value = [
+            {"_id": "ep1", "count": 2},
+            {"_id": "ep2", "count": 1},
+        ]
+
+        counts = count_livres_by_episode(livres_collection, ["ep1", "ep2", "ep1"])
+
+        assert counts == {"ep1": 2, "ep2": 1}
+        pipeline = livres_collection.aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {"episodes": {"$in": ["ep1", "ep2"]}}}
+        assert any("$group" in stage for stage in pipeline)
+
+
+class TestMaterializedBadges:
+    """Tests de la collection matérialisée emission_badges."""
+
+    def test_refresh_upserts_badge_of_touched_emission(self, collections_service):
+        """Le badge recalculé est enregistré par upsert sur l'_id de l'émission."""
+        emission = {"_id": ObjectId(), "episode_id": ObjectId()}
+        service, collections = collections_service()
+        collections["emissions"].find.return_value = [emission]
+        collections["avis"].find.return_value = [
+            _avis("A", emission_oid=str(emission["_id"]))
+        ]
+        collections["livres"].aggregate.return_value = [
+            {"_id": str(emission["episode_id"]), "count": 1}
+        ]
+
+        assert refresh_emission_badges(service, [str(emission["_id"])]) == 1
+
+        operations = collections["emission_badges"].bulk_write.call_args[0][0]
+        assert len(operations) == 1
+        assert operations[0]._filter == {"_id": emission["_id"]}
+        assert operations[0]._doc["$set"]["badge_status"] == "perfect"
+        assert operations[0]._upsert is True
+
+    def test_refresh_removes_badge_of_deleted_emission(self, collections_service):
+        """Le badge d'une émission disparue est supprimé."""
+        emission_oid = ObjectId()
+        service, collections = collections_service()
+        collections["emissions"].find.return_value = []
+
+        refresh_emission_badges(service, [emission_oid])
+
+        operations = collections["emission_badges"].bulk_write.call_args[0][0]
+        assert operations[0]._filter == {"_id": emission_oid}
+
+    def test_refresh_for_episodes_targets_linked_emissions(self, collections_service):
+        """Un changement de livres.episodes recalcule l'émission de l'épisode."""
+        episode_oid = ObjectId()
+        emission = {"_id": ObjectId(), "episode_id": episode_oid}
+        service, collections = collections_service()
+        collections["emissions"].find.side_effect = [
+            [{"_id": emission["_id"]}],
+            [emission],
+        ]
+
+        assert refresh_badges_for_episodes(service, [str(episode_oid)]) == 1
+
+        first_query = collections["emissions"].find.call_args_list[0][0][0]
+        assert first_query == {"episode_id": {"$in": [episode_oid]}}
+
+    def test_get_emission_badges_fills_missing(self, collections_service):
+        """Les badges absents sont calculés et persistés, les autres sont lus."""
+        known = {"_id": ObjectId(), "episode_id": ObjectId()}
+        missing = {"_id": ObjectId(), "episode_id": ObjectId()}
+        service, collections = collections_service()
+        collections["emission_badges"].find.return_value = [
+            {"_id": known["_id"], "badge_status": "unmatched"}
+        ]
+        collections["avis"].find.return_value = []
+
+        badges = get_emission_badges(service, [known, missing])
+
+        assert badges == {
+            str(known["_id"]): "unmatched",
+            str(missing["_id"]): "no_avis",
+        }
+        operations = collections["emission_badges"].bulk_write.call_args[0][0]
+        assert [op._filter for op in operations] == [{"_id": missing["_id"]}]
+
+    def test_ensure_badges_skips_when_none_missing(self, collections_service):
+        """Tous les badges existent : rien n'est calculé ni écrit."""
+        service, collections = collections_service(aggregate={"emissions": []})
+
+        assert ensure_emission_badges(service) == 0
+
+        collections["avis"].find.assert_not_called()
+        collections["emission_badges"].bulk_write.assert_not_called()
+
+    def test_rebuild_recomputes_all_and_removes_orphans(self, collections_service):
+        """La reconstruction recalcule tout et purge les orphelins."""
+        emissions = [{"_id": ObjectId(), "episode_id": ObjectId()} for _ in range(2)]
+        service, collections = collections_service()
+        collections["emissions"].find.return_value = emissions
+        collections["avis"].find.return_value = []
+        collections["emission_badges"].delete_many.return_value.deleted_count = 1
+
+        result = rebuild_emission_badges(service)
+
+        assert result == {"rebuilt": 2, "removed": 1}
+        delete_filter = collections["emission_badges"].delete_many.call_args[0][0]
+        assert delete_filter == {"_id": {"$nin": [e["_id"] for e in emissions]}}
+
+
+class TestMongoDBServiceBadgeHooks:
+    """Les écritures d'avis déclenchent la mise à jour des badges."""
+
+    def _service(self):
+        """Service connecté (db mockée) avec collection avis mockée."""
+        service = MongoDBService()
+        service.db = MagicMock()
+        service.avis_collection = MagicMock()
+        return service
+
+    def test_save_avis_batch_refreshes_emissions(self):
+        """save_avis_batch recalcule le badge des émissions concernées."""
+        service = self._service()
+        with patch(
+            "back_office_lmelp.services.emission_badge_service.refresh_emission_badges"
+        ) as mock_refresh:
+            service.save_avis_batch([{"emission_oid": "e1"}, {"emission_oid": "e1"}])
+
+        mock_refresh.assert_called_once_with(service, ["e1"])
+
+    def test_delete_avis_by_emission_refreshes_emission(self):
+        """delete_avis_by_emission recalcule le badge de l'émission."""
+        service = self._service()
+        service.avis_collection.delete_many.return_value.deleted_count = 3
+        with patch(
+            "back_office_lmelp.services.emission_badge_service.refresh_emission_badges"
+        ) as mock_refresh:
+            service.delete_avis_by_emission("e1")
+
+        mock_refresh.assert_called_once_with(service, ["e1"])
+
+    def test_update_avis_refreshes_emission_of_avis(self):
+        """update_avis recalcule le badge de l'émission de l'avis."""
+        service = self._service()
+        service.avis_collection.update_one.return_value.matched_count = 1
+        service.avis_collection.find_one.return_value = {"emission_oid": "e1"}
+        with patch(
+            "back_office_lmelp.services.emission_badge_service.refresh_emission_badges"
+        ) as mock_refresh:
+            assert service.update_avis(str(ObjectId()), {"note": 8}) is True
+
+        mock_refresh.assert_called_once_with(service, ["e1"])
+
+    def test_delete_avis_refreshes_emission_of_avis(self):
+        """delete_avis recalcule le badge de l'émission de l'avis supprimé."""
+        service = self._service()
+        service.avis_collection.find_one.return_value = {"emission_oid": "e1"}
+        service.avis_collection.delete_one.return_value.deleted_count = 1
+        with patch(
+            "back_office_lmelp.services.emission_badge_service.refresh_emission_badges"
+        ) as mock_refresh:
+            assert service.delete_avis(str(ObjectId())) is True
+
+        mock_refresh.assert_called_once_with(service, ["e1"])
+
+    def test_refresh_failure_does_not_fail_write(self):
+        """Un échec de mise à jour du badge ne fait pas échouer l'écriture."""
+        service = self._service()
+        service.avis_collection.insert_many.return_value.inserted_ids = [ObjectId()]
+        with patch(
+            "back_office_lmelp.services.emission_badge_service.refresh_emission_badges",
+            side_effect=Exception("boom"),
+        ):
+            ids = service.save_avis_batch([{"emission_oid": "e1"}])
+
+        assert len(ids) == 1
@@ -1,38 +1,17 @@
 """Tests pour le calcul du badge_status des émissions."""
 
-from unittest.mock import MagicMock, patch
-
 from bson import ObjectId
 
+from back_office_lmelp.services.emission_badge_service import compute_badge_status
 
-class TestCalculateEmissionBadgeStatus:
-    """Tests pour la fonction _calculate_emission_badge_status."""
-
-    def setup_method(self):
-        """Setup pour chaque test."""
-        # Patcher mongodb_service avant d'importer app
-        self.mock_mongodb = MagicMock()
-        self.patcher = patch("back_office_lmelp.app.mongodb_service", self.mock_mongodb)
-        self.patcher.start()
-
-        # Importer après le patch
-        from back_office_lmelp.app import _calculate_emission_badge_status
 
-        self.calculate_badge = _calculate_emission_badge_status
-
-    def teardown_method(self):
-        """Teardown après chaque test."""
-        self.patcher.stop()
+class TestComputeBadgeStatus:
+    """Tests pour la fonction compute_badge_status."""
 
     def test_count_mismatch_when_counts_differ(self):
         """Test 🔴 count_mismatch quand # livres summary ≠ # livres mongo."""
-        emission_id = str(ObjectId())
-        episode_id = str(ObjectId())
-
-        # Mock avis collection avec 2 livres uniques dans le summary
-        self.mock_mongodb.avis_collection = MagicMock()
-        self.mock_mongodb.avis_collection.count_documents.return_value = 3
-        self.mock_mongodb.avis_collection.find.return_value = [
+        # 2 livres uniques dans le summary
+        avis_list = [
             {
                 "livre_titre_extrait": "Livre 1",
                 "livre_oid": str(ObjectId()),
@@ -50,12 +29,8 @@ class TestCalculateEmissionBadgeStatus:
             },
         ]
 
-        # Mock livres collection avec 3 livres dans mongo
-        self.mock_mongodb.livres_collection = MagicMock()
-        self.mock_mongodb.livres_collection.count_documents.return_value = 3
-
-        # EXECUTE
-        result = self.calculate_badge(emission_id, episode_id, self.mock_mongodb)
+        # EXECUTE: 3 livres dans mongo
+        result = compute_badge_status(avis_list, 3)
 
         # ASSERT: Devrait être count_mismatch (2 summary vs 3 mongo)
         assert result == "count_mismatch"
@@ -66,13 +41,8 @@ class TestCalculateEmissionBadgeStatus:
 
         Nouvelle règle : count_mismatch = écart de comptage OU note manquante
         """
-        emission_id = str(ObjectId())
-        episode_id = str(ObjectId())
-
-        # Mock avis collection avec 2 livres, comptes égaux MAIS une note manquante
-        self.mock_mongodb.avis_collection = MagicMock()
-        self.mock_mongodb.avis_collection.count_documents.return_value = 2
-        self.mock_mongodb.avis_collection.find.return_value = [
+        # 2 livres, comptes égaux MAIS une note manquante
+        avis_list = [
             {
                 "livre_titre_extrait": "Livre 1",
                 "livre_oid": str(ObjectId()),
@@ -85,25 +55,16 @@ class TestCalculateEmissionBadgeStatus:
             },
         ]
 
-        # Mock livres collection avec 2 livres (comptes égaux)
-        self.mock_mongodb.livres_collection = MagicMock()
-        self.mock_mongodb.livres_collection.count_documents.return_value = 2
-
-        # EXECUTE
-        result = self.calculate_badge(emission_id, episode_id, self.mock_mongodb)
+        # EXECUTE: 2 livres dans mongo (comptes égaux)
+        result = compute_badge_status(avis_list, 2)
 
         # ASSERT: Devrait être count_mismatch à cause de la note manquante
         assert result == "count_mismatch"
 
     def test_unmatched_when_counts_equal_but_livre_oid_null(self):
         """Test 🟡 unmatched quand comptes égaux mais livre non matché."""
-        emission_id = str(ObjectId())
-        episode_id = str(ObjectId())
-
-        # Mock avis collection avec 2 livres, comptes égaux, un non matché, notes présentes
-        self.mock_mongodb.avis_collection = MagicMock()
-        self.mock_mongodb.avis_collection.count_documents.return_value = 2
-        self.mock_mongodb.avis_collection.find.return_value = [
+        # 2 livres, comptes égaux, un non matché, notes présentes
+        avis_list = [
             {
                 "livre_titre_extrait": "Livre 1",
                 "livre_oid": str(ObjectId()),
@@ -116,25 +77,15 @@ class TestCalculateEmissionBadgeStatus:
             },
         ]
 
-        # Mock livres collection avec 2 livres
-        self.mock_mongodb.livres_collection = MagicMock()
-        self.mock_mongodb.livres_collection.count_documents.return_value = 2
-
         # EXECUTE
-        result = self.calculate_badge(emission_id, episode_id, self.mock_mongodb)
+        result = compute_badge_status(avis_list, 2)
 
         # ASSERT: Devrait être unmatched (pas count_mismatch car comptes égaux et notes présentes)
         assert result == "unmatched"
 
     def test_perfect_when_all_ok(self):
         """Test 🟢 perfect quand comptes égaux, tous matchés, toutes notes présentes."""
-        emission_id = str(ObjectId())
-        episode_id = str(ObjectId())
-
-        # Mock avis collection avec 2 livres, tous matchés, toutes notes présentes
-        self.mock_mongodb.avis_collection = MagicMock()
-        self.mock_mongodb.avis_collection.count_documents.return_value = 2
-        self.mock_mongodb.avis_collection.find.return_value = [
+        avis_list = [
             {
                 "livre_titre_extrait": "Livre 1",
                 "livre_oid": str(ObjectId()),
@@ -147,27 +98,16 @@ class TestCalculateEmissionBadgeStatus:
             },
         ]
 
-        # Mock livres collection avec 2 livres
-        self.mock_mongodb.livres_collection = MagicMock()
-        self.mock_mongodb.livres_collection.count_documents.return_value = 2
-
         # EXECUTE
-        result = self.calculate_badge(emission_id, episode_id, self.mock_mongodb)
+        result = compute_badge_status(avis_list, 2)
 
         # ASSERT: Devrait être perfect
         assert result == "perfect"
 
     def test_no_avis_when_no_extraction(self):
         """Test ⚪ no_avis quand avis pas encore extraits."""
-        emission_id = str(ObjectId())
-        episode_id = str(ObjectId())
-
-        # Mock avis collection vide
-        self.mock_mongodb.avis_collection = MagicMock()
-        self.mock_mongodb.avis_collection.count_documents.return_value = 0
-
-        # EXECUTE
-        result = self.calculate_badge(emission_id, episode_id, self.mock_mongodb)
+        # EXECUTE: aucun avis extrait
+        result = compute_badge_status([], 0)
 
         # ASSERT: Devrait être no_avis
         assert result == "no_avis"
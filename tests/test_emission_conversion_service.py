@@ -0,0 +1,183 @@
+"""Tests pour la conversion incrémentale épisodes → émissions (watermark)."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from back_office_lmelp.services.emission_conversion_service import (
+    WATERMARK_ID,
+    EmissionConversionService,
+)
+
+
+ANIMATEUR_ID = str(ObjectId())
+
+
+def _cursor(docs):
+    """Faux curseur pymongo supportant .sort()."""
+    cursor = MagicMock()
+    cursor.sort.return_value = docs
+    return cursor
+
+
+@pytest.fixture
+def collections():
+    """Collections mockées routées par get_collection()."""
+    return {
+        "avis_critiques": MagicMock(),
+        "emissions": MagicMock(),
+        "sync_state": MagicMock(),
+    }
+
+
+@pytest.fixture
+def service(collections):
+    """Service de conversion avec MongoDB mocké."""
+    mongodb = MagicMock()
+    mongodb.get_collection.side_effect = lambda name: collections[name]
+    mongodb.get_episode_by_id.return_value = {
+        "_id": "ep",
+        "titre": "Episode",
+        "date": datetime(2025, 1, 5),
+        "duree": 3000,
+        "masked": False,
+    }
+    mongodb.get_critiques_by_episode.return_value = [
+        {"id": str(ObjectId()), "animateur": False},
+        {"id": ANIMATEUR_ID, "animateur": True},
+    ]
+    return EmissionConversionService(mongodb_service=mongodb)
+
+
+class TestConvertNewAvisCritiques:
+    """Tests de la conversion incrémentale."""
+
+    def test_only_processes_avis_after_watermark(self, service, collections):
+        """Le filtre porte sur les _id postérieurs au watermark."""
+        watermark = ObjectId()
+        collections["sync_state"].find_one.return_value = {
+            "_id": WATERMARK_ID,
+            "last_avis_critique_id": watermark,
+        }
+        collections["avis_critiques"].find.return_value = _cursor([])
+
+        result = service.convert_new_avis_critiques()
+
+        query = collections["avis_critiques"].find.call_args[0][0]
+        assert query == {"_id": {"$gt": watermark}}
+        assert result["total_processed"] == 0
+        # Rien de nouveau : ni scan des émissions ni avancée du watermark
+        collections["emissions"].find.assert_not_called()
+        collections["sync_state"].update_one.assert_not_called()
+
+    def test_first_run_processes_everything(self, service, collections):
+        """Sans watermark, tous les avis_critiques sont traités."""
+        collections["sync_state"].find_one.return_value = None
+        collections["avis_critiques"].find.return_value = _cursor([])
+
+        service.convert_new_avis_critiques()
+
+        assert collections["avis_critiques"].find.call_args[0][0] == {}
+
+    def test_creates_emission_and_advances_watermark(self, service, collections):
+        """Crée l'émission manquante puis avance le watermark au dernier _id."""
+        episode_oid = str(ObjectId())
+        existing_episode = ObjectId()
+        avis_ids = [ObjectId(), ObjectId()]
+        collections["sync_state"].find_one.return_value = None
+        collections["avis_critiques"].find.return_value = _cursor(
+            [
+                {"_id": avis_ids[0], "episode_oid": str(existing_episode)},
+                {"_id": avis_ids[1], "episode_oid": episode_oid},
+            ]
+        )
+        collections["emissions"].find.return_value = [{"episode_id": existing_episode}]
+
+        result = service.convert_new_avis_critiques()
+
+        assert result["created"] == 1
+        assert result["skipped"] == 1
+        emission = service.mongodb_service.create_emission.call_args[0][0]
+        assert str(emission["episode_id"]) == episode_oid
+        assert emission["avis_critique_id"] == avis_ids[1]
+        assert str(emission["animateur_id"]) == ANIMATEUR_ID
+        update = collections["sync_state"].update_one.call_args
+        assert update[0][0] == {"_id": WATERMARK_ID}
+        assert update[0][1]["$max"] == {"last_avis_critique_id": avis_ids[1]}
+        assert update[1] == {"upsert": True}
+
+    def test_watermark_stops_before_first_failure(self, service, collections):
+        """Un avis en échec reste après le watermark : il sera retenté."""
+        avis_ids = [ObjectId(), ObjectId(), ObjectId()]
+        collections["sync_state"].find_one.return_value = None
+        collections["avis_critiques"].find.return_value = _cursor(
+            [{"_id": avis_id, "episode_oid": str(ObjectId())} for avis_id in avis_ids]
+        )
+        collections["emissions"].find.return_value = []
+        episode = service.mongodb_service.get_episode_by_id.return_value
+        service.mongodb_service.get_episode_by_id.side_effect = [
+            episode,
+            None,
+            episode,
+        ]
+
+        result = service.convert_new_avis_critiques()
+
+        assert result["created"] == 2
+        assert len(result["errors"]) == 1
+        update = collections["sync_state"].update_one.call_args
+        assert update[0][1]["$max"] == {"last_avis_critique_id": avis_ids[0]}
+
+    def test_first_avis_failing_keeps_watermark(self, service, collections):
+        """Échec dès le premier avis : le watermark n'avance pas."""
+        collections["sync_state"].find_one.return_value = None
+        collections["avis_critiques"].find.return_value = _cursor(
+            [{"_id": ObjectId(), "episode_oid": str(ObjectId())}]
+        )
+        collections["emissions"].find.return_value = []
+        service.mongodb_service.create_emission.side_effect = Exception("boom")
+
+        result = service.convert_new_avis_critiques()
+
+        assert len(result["errors"]) == 1
+        collections["sync_state"].update_one.assert_not_called()
+
+    def test_skips_masked_episode(self, service, collections):
+        """Les épisodes masqués ne sont pas convertis."""
+        collections["sync_state"].find_one.return_value = None
+        collections["avis_critiques"].find.return_value = _cursor(
+            [{"_id": ObjectId(), "episode_oid": str(ObjectId())}]
+        )
+        collections["emissions"].find.return_value = []
+        service.mongodb_service.get_episode_by_id.return_value = {
+            "_id": "ep",
+            "masked": True,
+        }
+
+        result = service.convert_new_avis_critiques()
+
+        assert result["created"] == 0
+        assert result["skipped"] == 1
+        service.mongodb_service.create_emission.assert_not_called()
+
+
+class TestConvertEpisode:
+    """Tests de la conversion ciblée (épisode démasqué)."""
+
+    def test_does_not_move_watermark(self, service, collections):
+        """La conversion d'un épisode ne modifie pas le watermark."""
+        episode_oid = str(ObjectId())
+        collections["avis_critiques"].find.return_value = _cursor(
+            [{"_id": ObjectId(), "episode_oid": episode_oid}]
+        )
+        collections["emissions"].find.return_value = []
+
+        result = service.convert_episode(episode_oid)
+
+        assert result["created"] == 1
+        assert collections["avis_critiques"].find.call_args[0][0] == {
+            "episode_oid": episode_oid
+        }
+        collections["sync_state"].update_one.assert_not_called()
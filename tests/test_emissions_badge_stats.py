@@ -93,10 +93,11 @@ class TestEmissionsBadgeStatistics:
 
     def test_count_emissions_with_problems_should_return_zero_if_all_perfect(self):
         """Test TDD: Retourner 0 si toutes les émissions sont parfaites (🟢)."""
-        # Mock emissions collection retourne une liste vide
-        mock_emissions_col = MagicMock()
-        mock_emissions_col.find.return_value = []
-        self.mock_mongodb.get_collection.return_value = mock_emissions_col
+        # Aucun badge manquant, aucun badge problème
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = []
+        mock_collection.count_documents.return_value = 0
+        self.mock_mongodb.get_collection.return_value = mock_collection
 
         # EXECUTE
         count = self.stats_service._count_emissions_with_problems()
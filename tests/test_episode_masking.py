@@ -100,6 +100,43 @@ class TestEpisodeMasking:
             {"$set": {"masked": False}},
         )
 
+    def test_update_episode_masked_status_copies_flag_to_avis_critiques(
+        self, mongodb_service
+    ):
+        """Le statut est recopié dans avis_critiques.episode_masked."""
+        episode_id = "507f1f77bcf86cd799439011"  # pragma: allowlist secret
+        mongodb_service.episodes_collection.update_one.return_value.matched_count = 1
+        mongodb_service.avis_critiques_collection = MagicMock()
+
+        mongodb_service.update_episode_masked_status(episode_id, True)
+
+        mongodb_service.avis_critiques_collection.update_many.assert_called_once_with(
+            {"episode_oid": episode_id}, {"$set": {"episode_masked": True}}
+        )
+
+    def test_sync_episode_masked_flags(self, mongodb_service):
+        """La resynchronisation marque les avis des épisodes masqués et démasqués."""
+        masked_id, unmasked_id = ObjectId(), ObjectId()
+        stale_avis_id = ObjectId()
+        mongodb_service.episodes_collection.find.return_value = [{"_id": masked_id}]
+        avis = MagicMock()
+        avis.find.return_value = [
+            {"_id": ObjectId(), "episode_oid": str(masked_id)},
+            {"_id": stale_avis_id, "episode_oid": str(unmasked_id)},
+        ]
+        avis.update_many.return_value.modified_count = 1
+        mongodb_service.avis_critiques_collection = avis
+
+        assert mongodb_service.sync_episode_masked_flags() == 2
+
+        masked_call, unmasked_call = avis.update_many.call_args_list
+        assert masked_call[0][0]["episode_oid"] == {"$in": [str(masked_id)]}
+        assert masked_call[0][1] == {"$set": {"episode_masked": True}}
+        assert unmasked_call[0] == (
+            {"_id": {"$in": [stale_avis_id]}},
+            {"$set": {"episode_masked": False}},
+        )
+
     def test_get_all_episodes_excludes_masked_by_default(self, mongodb_service):
         """Test que get_all_episodes exclut les épisodes masqués par défaut."""
         # Arrange - créer des épisodes simulés (un masqué, un non-masqué)
@@ -0,0 +1,255 @@
+"""Tests de l'index inversé positionnel des épisodes (/api/search)."""
+
+import gzip
+import json
+import random
+import tracemalloc
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+from back_office_lmelp.services.episode_search_index import (
+    MEMORY_BUDGET_BYTES_PER_TOKEN,
+    EpisodeSearchIndex,
+    parse_query,
+)
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+EPISODE_1 = ObjectId()
+EPISODE_2 = ObjectId()
+
+
+def _index() -> EpisodeSearchIndex:
+    index = EpisodeSearchIndex()
+    index.index_episode(
+        {
+            "_id": EPISODE_1,
+            "titre": "Camus, L'Étranger",
+            "transcription": "On parle de la peste et de la chute",
+        }
+    )
+    index.index_episode(
+        {
+            "_id": EPISODE_2,
+            "titre": "Les nouveaux romans",
+            "description": "La peste brune, Œuvre au noir",
+        }
+    )
+    index.ready = True
+    return index
+
+
+class TestQueries:
+    """Mots, expressions entre guillemets et préfixe final."""
+
+    def test_parse_query(self):
+        """Mots hors guillemets : une expression chacun, dernier mot préfixe."""
+        assert parse_query('camus "la peste"') == ([["camus"], ["la", "peste"]], False)
+        assert parse_query("l'etr") == ([["l"], ["etr"]], True)
+
+    def test_accent_folded_words_with_positions(self):
+        """Recherche sans accents, positions en rang de mot."""
+        hits = _index().search("etranger")
+
+        assert hits == {str(EPISODE_1): {"titre": [(2, 1)]}}
+
+    def test_words_may_match_different_fields(self):
+        """Mots séparés : chaque mot présent, champs quelconques."""
+        assert set(_index().search("camus peste")) == {str(EPISODE_1)}
+        assert set(_index().search("peste")) == {str(EPISODE_1), str(EPISODE_2)}
+
+    def test_phrase_requires_consecutive_words(self):
+        """Expression : mots consécutifs dans un même champ."""
+        index = _index()
+
+        assert index.search('"la peste"') == {
+            str(EPISODE_1): {"transcription": [(3, 2)]},
+            str(EPISODE_2): {"description": [(0, 2)]},
+        }
+        assert index.search('"peste la"') == {}
+
+    def test_last_word_is_prefix(self):
+        """Saisie en cours : dernier mot préfixe à partir de 3 caractères."""
+        index = _index()
+
+        assert set(index.search("oeuv")) == {str(EPISODE_2)}
+        assert index.search("ro") == {}
+
+    def test_not_ready_returns_none(self):
+        """Index pas encore synchronisé : None (repli regex)."""
+        assert EpisodeSearchIndex().search("camus") is None
+
+
+class TestIncrementalUpdates:
+    """Corrections de titre, suppression et synchronisation."""
+
+    def test_update_fields_replaces_field_tokens(self):
+        """Nouveau titre indexé, ancien titre retiré."""
+        index = _index()
+
+        index.update_fields(str(EPISODE_1), {"titre": "Sisyphe", "masked": True})
+
+        assert index.search("etranger") == {}
+        assert set(index.search("sisyphe")) == {str(EPISODE_1)}
+        assert set(index.search("peste chute")) == {str(EPISODE_1)}
+
+    def test_sync_reindexes_changed_and_removes_deleted(self):
+        """Seuls les épisodes nouveaux ou modifiés sont relus en entier."""
+        index = _index()
+        index.update_fields(str(EPISODE_1), {"titre": "Sisyphe"})
+        collection = MagicMock()
+        collection.find.side_effect = [
+            [{"_id": EPISODE_1, "titre": "Sisyphe", "transcription_len": 35}],
+            [
+                {
+                    "_id": EPISODE_1,
+                    "titre": "Sisyphe",
+                    "transcription": "On parle de la peste et de la chute",
+                }
+            ],
+        ]
+
+        report = index.sync(collection)
+
+        assert report == {"indexed": 1, "removed": 1}
+        assert len(index) == 1
+        assert set(index.search("peste")) == {str(EPISODE_1)}
+        full_read = collection.find.call_args_list[1][0][0]
+        assert full_read == {"_id": {"$in": [EPISODE_1]}}
+
+    def test_sync_reindexes_same_length_transcription_correction(self):
+        """Transcription corrigée à longueur égale : l'empreinte la détecte."""
+        index = EpisodeSearchIndex()
+        transcription = {"_id": EPISODE_1, "transcription": "la peste"}
+        collection = MagicMock()
+        collection.find.side_effect = [
+            [{"_id": EPISODE_1, "transcription_len": 8, "transcription_hash": 1}],
+            [transcription],
+            [{"_id": EPISODE_1, "transcription_len": 8, "transcription_hash": 1}],
+            [{"_id": EPISODE_1, "transcription_len": 8, "transcription_hash": 2}],
+            [{**transcription, "transcription": "la perte"}],
+        ]
+
+        assert index.sync(collection) == {"indexed": 1, "removed": 0}
+        assert index.sync(collection) == {"indexed": 0, "removed": 0}
+        assert index.sync(collection) == {"indexed": 1, "removed": 0}
+
+        assert index.search("peste") == {}
+        assert set(index.search("perte")) == {str(EPISODE_1)}
+        projection = collection.find.call_args_list[0][0][1]
+        assert projection["transcription_hash"] == {
+            "$toHashedIndexKey": "$transcription"
+        }
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Index persisté puis rechargé à l'identique."""
+        path = tmp_path / "index.bin.gz"
+        _index().save(path)
+
+        loaded = EpisodeSearchIndex()
+        assert loaded.load(path)
+        loaded.ready = True
+
+        assert loaded.search('"la peste"') == _index().search('"la peste"')
+        assert len(loaded) == 2
+
+    def test_loaded_index_updates_and_grows(self, tmp_path):
+        """Après rechargement : retrait ciblé et nouveaux numéros d'épisode."""
+        path = tmp_path / "index.bin.gz"
+        _index().save(path)
+        loaded = EpisodeSearchIndex()
+        loaded.load(path)
+        loaded.ready = True
+        episode_3 = ObjectId()
+
+        loaded.update_fields(str(EPISODE_1), {"transcription": "Le mythe"})
+        loaded.index_episode({"_id": episode_3, "titre": "La peste"})
+
+        assert set(loaded.search("peste")) == {str(EPISODE_2), str(episode_3)}
+        assert set(loaded.search("mythe")) == {str(EPISODE_1)}
+
+    def test_previous_format_is_rebuilt(self, tmp_path):
+        """Ancien fichier (JSON gzip) : non chargé, reconstruit par sync."""
+        path = tmp_path / "index.bin.gz"
+        with gzip.open(path, "wb") as f:
+            f.write(json.dumps({"version": 2, "postings": {}}).encode("utf-8"))
+
+        assert not EpisodeSearchIndex().load(path)
+
+
+class _UnscannableVocabulary(dict):
+    """Vocabulaire dont tout parcours fait échouer le test."""
+
+    def __iter__(self):
+        raise AssertionError("vocabulaire parcouru")
+
+    keys = values = items = __iter__
+
+
+class TestMemoryFootprint:
+    """Postings compactés : budget mémoire et retraits ciblés."""
+
+    def test_index_fits_memory_budget(self):
+        """Transcriptions réalistes : sous MEMORY_BUDGET_BYTES_PER_TOKEN."""
+        rng = random.Random(0)
+        vocabulary = [
+            "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 10)))
+            for _ in range(5000)
+        ]
+        weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+        docs = [
+            {
+                "_id": ObjectId(),
+                "titre": f"Episode {i}",
+                "transcription": " ".join(rng.choices(vocabulary, weights, k=5000)),
+            }
+            for i in range(20)
+        ]
+        words = sum(len(doc["transcription"].split()) + 2 for doc in docs)
+
+        tracemalloc.start()
+        try:
+            index = EpisodeSearchIndex()
+            for doc in docs:
+                index.index_episode(doc)
+            used, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert used / words <= MEMORY_BUDGET_BYTES_PER_TOKEN
+
+    def test_removal_does_not_scan_vocabulary(self):
+        """Correction ou suppression : seuls les tokens de l'épisode touchés."""
+        index = _index()
+        index._postings = _UnscannableVocabulary(index._postings)
+
+        index.update_fields(str(EPISODE_1), {"titre": "Sisyphe"})
+        index.remove_episode(str(EPISODE_2))
+
+        index._postings = dict(dict.items(index._postings))
+        assert index.search("peste") == {str(EPISODE_1): {"transcription": [(4, 1)]}}
+        assert index.search("noir") == {}
+        assert len(index) == 1
+
+
+class TestSearchEpisodesUsesIndex:
+    """search_episodes : ids et total depuis l'index, sans count_documents."""
+
+    def test_total_from_index_and_ids_query(self):
+        """Index prêt : filtre $in sur les ids trouvés, pas de regex."""
+        service = MongoDBService.__new__(MongoDBService)
+        service.episodes_collection = MagicMock()
+        service.episodes_collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = []
+        service.emissions_collection = None
+
+        with patch(
+            "back_office_lmelp.services.episode_search_index.episode_search_index",
+            _index(),
+        ):
+            result = service.search_episodes("peste")
+
+        assert result["total_count"] == 2
+        service.episodes_collection.count_documents.assert_not_called()
+        query = service.episodes_collection.find.call_args[0][0]
+        assert set(query["_id"]["$in"]) == {EPISODE_1, EPISODE_2}
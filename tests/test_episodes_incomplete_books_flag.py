@@ -4,7 +4,7 @@ Objectif: Identifier visuellement les épisodes avec livres non validés (status
 """
 
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bson import ObjectId
@@ -13,6 +13,24 @@ from httpx import ASGITransport, AsyncClient
 from back_office_lmelp.app import app
 
 
+def _avis_critique_ids(avis_critiques):
+    """Index episode_oid → avis_critique_id (get_avis_critique_ids_by_episode)."""
+    return {avis["episode_oid"]: str(avis["_id"]) for avis in avis_critiques}
+
+
+def _cache_collection(cached_books):
+    """Collection livresauteurs_cache mockée : $group des statuts par épisode."""
+    statuses = {}
+    for book in cached_books:
+        statuses.setdefault(book["episode_oid"], set()).add(book.get("status"))
+    collection = MagicMock()
+    collection.aggregate.return_value = [
+        {"_id": episode_oid, "statuses": list(values)}
+        for episode_oid, values in statuses.items()
+    ]
+    return collection
+
+
 @pytest.mark.asyncio
 class TestEpisodesIncompleteBooks:
     """Tests pour le flag has_incomplete_books."""
@@ -72,16 +90,16 @@ class TestEpisodesIncompleteBooks:
                     return_value=None,
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                    return_value=mock_avis_critiques,
+                    "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                    return_value=_avis_critique_ids(mock_avis_critiques),
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                    return_value=mock_episode,
+                    "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                    return_value={episode_oid: mock_episode},
                 ),
                 patch(
-                    "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                    return_value=mock_cached_books,
+                    "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                    return_value=_cache_collection(mock_cached_books),
                 ),
             ):
                 response = await client.get("/api/episodes-with-reviews")
@@ -139,16 +157,16 @@ class TestEpisodesIncompleteBooks:
                     return_value=None,
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                    return_value=mock_avis_critiques,
+                    "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                    return_value=_avis_critique_ids(mock_avis_critiques),
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                    return_value=mock_episode,
+                    "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                    return_value={episode_oid: mock_episode},
                 ),
                 patch(
-                    "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                    return_value=mock_cached_books,
+                    "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                    return_value=_cache_collection(mock_cached_books),
                 ),
             ):
                 response = await client.get("/api/episodes-with-reviews")
@@ -191,16 +209,16 @@ class TestEpisodesIncompleteBooks:
                     return_value=None,
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                    return_value=mock_avis_critiques,
+                    "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                    return_value=_avis_critique_ids(mock_avis_critiques),
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                    return_value=mock_episode,
+                    "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                    return_value={episode_oid: mock_episode},
                 ),
                 patch(
-                    "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                    return_value=mock_cached_books,
+                    "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                    return_value=_cache_collection(mock_cached_books),
                 ),
             ):
                 response = await client.get("/api/episodes-with-reviews")
@@ -264,16 +282,16 @@ class TestEpisodesIncompleteBooks:
                     return_value=None,
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                    return_value=mock_avis_critiques,
+                    "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                    return_value=_avis_critique_ids(mock_avis_critiques),
                 ),
                 patch(
-                    "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                    return_value=mock_episode,
+                    "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                    return_value={episode_oid: mock_episode},
                 ),
                 patch(
-                    "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                    return_value=mock_cached_books,
+                    "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                    return_value=_cache_collection(mock_cached_books),
                 ),
             ):
                 response = await client.get("/api/episodes-with-reviews")
@@ -5,12 +5,30 @@ Ce flag indique si un épisode a déjà été affiché (présence dans livresaut
 """
 
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bson import ObjectId
 
 
+def _avis_critique_ids(avis_critiques):
+    """Index episode_oid → avis_critique_id (get_avis_critique_ids_by_episode)."""
+    return {avis["episode_oid"]: str(avis["_id"]) for avis in avis_critiques}
+
+
+def _cache_collection(cached_books):
+    """Collection livresauteurs_cache mockée : $group des statuts par épisode."""
+    statuses = {}
+    for book in cached_books:
+        statuses.setdefault(book["episode_oid"], set()).add(book.get("status"))
+    collection = MagicMock()
+    collection.aggregate.return_value = [
+        {"_id": episode_oid, "statuses": list(values)}
+        for episode_oid, values in statuses.items()
+    ]
+    return collection
+
+
 @pytest.mark.asyncio
 class TestEpisodesWithCachedBooksFlag:
     """Tests du flag has_cached_books pour indiquer les épisodes déjà affichés."""
@@ -55,16 +73,16 @@ class TestEpisodesWithCachedBooksFlag:
                 return_value=None,
             ),
             patch(
-                "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                return_value=mock_avis_critiques,
+                "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                return_value=_avis_critique_ids(mock_avis_critiques),
             ),
             patch(
-                "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                return_value=mock_episode,
+                "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                return_value={episode_oid: mock_episode},
             ),
             patch(
-                "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                return_value=mock_cached_books,
+                "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                return_value=_cache_collection(mock_cached_books),
             ),
         ):
             async with AsyncClient(
@@ -111,16 +129,16 @@ class TestEpisodesWithCachedBooksFlag:
                 return_value=None,
             ),
             patch(
-                "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                return_value=mock_avis_critiques,
+                "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                return_value=_avis_critique_ids(mock_avis_critiques),
             ),
             patch(
-                "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                return_value=mock_episode,
+                "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                return_value={episode_oid: mock_episode},
             ),
             patch(
-                "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                return_value=[],  # Cache vide
+                "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                return_value=_cache_collection([]),  # Cache vide
             ),
         ):
             async with AsyncClient(
@@ -174,11 +192,10 @@ class TestEpisodesWithCachedBooksFlag:
             },
         }
 
-        # Mock pour get_books_by_episode_oid qui retourne différents résultats selon episode_oid
-        def mock_get_cached_books(episode_oid):
-            if episode_oid == episode_oid_1:
-                return [{"auteur": "Test", "titre": "Livre"}]  # A du cache
-            return []  # Pas de cache
+        # Seul le premier épisode a des livres en cache
+        mock_cached_books = [
+            {"episode_oid": episode_oid_1, "auteur": "Test", "titre": "Livre"}
+        ]
 
         with (
             patch(
@@ -186,16 +203,16 @@ class TestEpisodesWithCachedBooksFlag:
                 return_value=None,
             ),
             patch(
-                "back_office_lmelp.app.mongodb_service.get_all_critical_reviews",
-                return_value=mock_avis_critiques,
+                "back_office_lmelp.app.mongodb_service.get_avis_critique_ids_by_episode",
+                return_value=_avis_critique_ids(mock_avis_critiques),
             ),
             patch(
-                "back_office_lmelp.app.mongodb_service.get_episode_by_id",
-                side_effect=lambda oid: mock_episodes.get(oid),
+                "back_office_lmelp.app.mongodb_service.get_episodes_by_ids",
+                return_value=mock_episodes,
             ),
             patch(
-                "back_office_lmelp.app.livres_auteurs_cache_service.get_books_by_episode_oid",
-                side_effect=mock_get_cached_books,
+                "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service.get_collection",
+                return_value=_cache_collection(mock_cached_books),
             ),
         ):
             async with AsyncClient(
@@ -0,0 +1,107 @@
+"""Tests du nombre de requêtes de /api/episodes-with-reviews.
+
+Le nombre de requêtes MongoDB ne doit pas dépendre du nombre d'épisodes
+(plus de get_episode_by_id ni de get_books_by_episode_oid par épisode).
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+from fastapi.testclient import TestClient
+
+from back_office_lmelp.app import app
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+QUERY_METHODS = ("find", "find_one", "aggregate", "count_documents", "distinct")
+
+
+def _build_service(num_episodes):
+    """MongoDBService réel dont les collections sont mockées."""
+    episodes = [
+        {
+            "_id": ObjectId(),
+            "titre": f"Épisode {i}",
+            "date": datetime(2025, 1, 1) + timedelta(days=i),
+            "masked": i % 5 == 0,
+        }
+        for i in range(num_episodes)
+    ]
+    avis_critiques = [
+        {"_id": ObjectId(), "episode_oid": str(episode["_id"])} for episode in episodes
+    ]
+
+    collections = {
+        "avis_critiques": MagicMock(),
+        "episodes": MagicMock(),
+        "livresauteurs_cache": MagicMock(),
+    }
+    collections["avis_critiques"].find.return_value.sort.return_value = avis_critiques
+    collections["episodes"].find.return_value = episodes
+    collections["livresauteurs_cache"].aggregate.return_value = [
+        {"_id": avis["episode_oid"], "statuses": ["mongo", "suggested"]}
+        for avis in avis_critiques[::2]
+    ]
+
+    service = MongoDBService()
+    service.db = MagicMock()
+    service.db.__getitem__.side_effect = lambda name: collections[name]
+    service.avis_critiques_collection = collections["avis_critiques"]
+    service.episodes_collection = collections["episodes"]
+    return service, collections
+
+
+def _count_queries(collections):
+    """Nombre total de requêtes envoyées aux collections mockées."""
+    return sum(
+        getattr(collection, method).call_count
+        for collection in collections.values()
+        for method in QUERY_METHODS
+    )
+
+
+def _call_endpoint(num_episodes):
+    """Appelle l'endpoint et retourne (réponse, nombre de requêtes)."""
+    service, collections = _build_service(num_episodes)
+    with (
+        patch("back_office_lmelp.app.mongodb_service", service),
+        patch(
+            "back_office_lmelp.app.livres_auteurs_cache_service.mongodb_service",
+            service,
+        ),
+        patch(
+            "back_office_lmelp.app.memory_guard.check_memory_limit",
+            return_value=None,
+        ),
+    ):
+        response = TestClient(app).get("/api/episodes-with-reviews")
+    return response, _count_queries(collections)
+
+
+class TestEpisodesWithReviewsQueryCount:
+    """Le nombre de requêtes est constant."""
+
+    def test_query_count_does_not_grow_with_episodes(self):
+        """3 requêtes pour 5 comme pour 200 épisodes."""
+        small_response, small_count = _call_endpoint(5)
+        large_response, large_count = _call_endpoint(200)
+
+        assert small_response.status_code == 200
+        assert large_response.status_code == 200
+        assert small_count == large_count == 3
+
+    def test_flags_and_avis_ids_are_preserved(self):
+        """Épisodes masqués exclus, flags et avis_critique_id renseignés."""
+        response, _ = _call_endpoint(10)
+
+        episodes = response.json()
+        # Épisodes 0 et 5 masqués
+        assert len(episodes) == 8
+        assert all(episode["avis_critique_id"] for episode in episodes)
+        cached = [e for e in episodes if e["has_cached_books"]]
+        assert cached
+        assert all(e["has_incomplete_books"] for e in cached)
+        # Tri par date décroissante
+        dates = [episode["date"] for episode in episodes]
+        assert dates == sorted(dates, reverse=True)
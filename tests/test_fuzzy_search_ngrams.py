@@ -71,7 +71,7 @@ class TestFuzzySearchWithNGrams:
     def mock_episode(self, monkeypatch):
         """Mock d'un épisode avec titre complet dans la description."""
 
-        def mock_get_episode(episode_id):
+        def mock_get_episode(episode_id, profile="full"):
             return {
                 "_id": episode_id,
                 "titre": "Émission du 15/01/2025",
@@ -132,7 +132,7 @@ class TestFuzzySearchWithNGrams:
         Doit trouver "Peau d'ourse" comme bigram.
         """
 
-        def mock_get_episode(episode_id):
+        def mock_get_episode(episode_id, profile="full"):
             return {
                 "_id": episode_id,
                 "titre": "Émission littéraire",
@@ -180,7 +180,7 @@ class TestFuzzySearchWithNGrams:
         score que les fragments.
         """
 
-        def mock_get_episode(episode_id):
+        def mock_get_episode(episode_id, profile="full"):
             return {
                 "_id": episode_id,
                 "titre": "Critiques littéraires",
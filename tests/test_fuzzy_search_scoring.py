@@ -18,7 +18,7 @@ class TestFuzzySearchScoring:
     def mock_episode_adrien_bosc(self, monkeypatch):
         """Mock d'un épisode avec 'Adrien Bosc' dans le titre."""
 
-        def mock_get_episode(episode_id):
+        def mock_get_episode(episode_id, profile="full"):
             return {
                 "_id": episode_id,
                 "titre": "Au menu littéraire : Armistead Maupin, Grégoire Delacourt, Arnaud Cathrine, Sheena Patel, Adrien Bosc",
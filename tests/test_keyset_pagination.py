@@ -0,0 +1,151 @@
+"""Tests de la pagination par curseur (keyset_pagination) et de son usage API."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+
+from back_office_lmelp.utils.keyset_pagination import (
+    InvalidCursorError,
+    cursor_for,
+    decode_cursor,
+    encode_cursor,
+    find_page,
+    keyset_filter,
+)
+
+
+SORT = [("date", -1), ("_id", -1)]
+
+
+class TestCursorToken:
+    """Jeton opaque : aller-retour et rejet des jetons invalides."""
+
+    def test_round_trip_keeps_bson_types(self):
+        """ObjectId et datetime sont restitués avec leur type."""
+        values = [datetime(2025, 12, 7), ObjectId()]
+
+        assert decode_cursor(encode_cursor(values)) == values
+
+    def test_garbage_token_is_rejected(self):
+        """Un jeton illisible lève InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("pas-un-curseur!")
+
+    def test_token_for_another_sort_is_rejected(self):
+        """Le nombre de clés doit correspondre au tri."""
+        with pytest.raises(InvalidCursorError):
+            keyset_filter(SORT, encode_cursor(["Gallimard"]))
+
+
+class TestKeysetFilter:
+    """Filtre « strictement après » dans l'ordre de tri."""
+
+    def test_filter_follows_sort_directions(self):
+        """Tri (date desc, _id desc) : date plus ancienne, ou même date et _id plus petit."""
+        date, oid = datetime(2025, 1, 5), ObjectId()
+
+        assert keyset_filter(SORT, encode_cursor([date, oid])) == {
+            "$or": [
+                {"date": {"$lt": date}},
+                {"date": date, "_id": {"$lt": oid}},
+            ]
+        }
+
+
+class TestFindPage:
+    """Lecture d'une page par curseur ou par offset."""
+
+    def _collection(self, docs):
+        collection = MagicMock()
+        collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = docs
+        return collection
+
+    def test_full_page_returns_cursor_of_last_served_doc(self):
+        """limit + 1 documents lus : le curseur désigne le dernier servi."""
+        docs = [
+            {"_id": ObjectId(), "date": datetime(2025, 1, day)} for day in (3, 2, 1)
+        ]
+        collection = self._collection(docs)
+
+        page, next_cursor = find_page(collection, {"q": 1}, SORT, limit=2, offset=4)
+
+        assert page == docs[:2]
+        assert next_cursor == cursor_for(docs[1], SORT)
+        collection.find.return_value.sort.return_value.skip.assert_called_once_with(4)
+
+    def test_cursor_replaces_offset(self):
+        """Avec un curseur : filtre keyset combiné, pas de skip."""
+        collection = self._collection([])
+        token = encode_cursor([datetime(2025, 1, 2), ObjectId()])
+
+        page, next_cursor = find_page(
+            collection, {"q": 1}, SORT, limit=2, offset=40, cursor=token
+        )
+
+        assert (page, next_cursor) == ([], None)
+        query = collection.find.call_args[0][0]
+        assert query == {"$and": [{"q": 1}, keyset_filter(SORT, token)]}
+        collection.find.return_value.sort.return_value.skip.assert_called_once_with(0)
+
+
+class TestCursorEndpoints:
+    """Curseurs sur /api/advanced-search et /api/palmares."""
+
+    def test_advanced_search_next_cursor_resumes_each_entity(
+        self, client, mock_mongodb_service
+    ):
+        """Le curseur combiné relance chaque entité après sa dernière clé."""
+        mock_mongodb_service.search_auteurs.return_value = {
+            "auteurs": [{"nom": "Albert Camus"}],
+            "total_count": 3,
+            "next_cursor": "auteurs-token",
+        }
+
+        first = client.get("/api/advanced-search?q=Camus&entities=auteurs,livres")
+        next_cursor = first.json()["pagination"]["next_cursor"]
+        assert next_cursor
+
+        mock_mongodb_service.search_auteurs.reset_mock()
+        mock_mongodb_service.search_livres.reset_mock()
+        second = client.get(
+            "/api/advanced-search",
+            params={"q": "Camus", "entities": "auteurs,livres", "cursor": next_cursor},
+        )
+
+        assert second.status_code == 200
+        mock_mongodb_service.search_auteurs.assert_called_once_with(
+            "Camus", 20, 0, "auteurs-token"
+        )
+        # livres était épuisé : pas de nouvelle requête
+        mock_mongodb_service.search_livres.assert_not_called()
+
+    def test_advanced_search_rejects_invalid_cursor(self, client):
+        """Un curseur illisible donne une 400."""
+        response = client.get("/api/advanced-search?q=Camus&cursor=xyz!")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "entry", ["auteurs-token", ["auteurs-token"], ["auteurs-token", "3"], [5, 3]]
+    )
+    def test_advanced_search_rejects_malformed_entity_cursor(self, client, entry):
+        """Une entrée d'entité mal formée dans le curseur donne une 400."""
+        response = client.get(
+            "/api/advanced-search",
+            params={"q": "Camus", "cursor": encode_cursor({"auteurs": entry})},
+        )
+
+        assert response.status_code == 400
+
+    def test_palmares_invalid_cursor_returns_400(self, client, mock_mongodb_service):
+        """Le curseur est transmis au service ; invalide → 400."""
+        mock_mongodb_service.get_palmares.side_effect = InvalidCursorError("bad")
+
+        response = client.get("/api/palmares?cursor=bad")
+
+        assert response.status_code == 400
+        mock_mongodb_service.get_palmares.assert_called_once_with(
+            page=1, limit=30, cursor="bad"
+        )
@@ -14,6 +14,7 @@ from bson import ObjectId
 from fastapi.testclient import TestClient
 
 from back_office_lmelp.app import app
+from back_office_lmelp.services.livre_stats_service import build_calibre_tags
 
 
 @pytest.fixture
@@ -232,14 +233,10 @@ class TestCalibreVirtualLibraryTag:
 
 
 class TestBuildCalibreTags:
-    """Tests for the _build_calibre_tags helper method in MongoDBService."""
+    """Tests for livre_stats_service.build_calibre_tags."""
 
     def test_build_tags_from_programme_avis(self):
         """Test lmelp_yyMMdd tag is generated from emission date for programme avis."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_oid = str(ObjectId())
         all_avis = [
             {
@@ -253,16 +250,12 @@ class TestBuildCalibreTags:
             emission_oid: {"date": datetime(2024, 3, 24)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         assert "lmelp_240324" in tags
 
     def test_build_tags_from_coup_de_coeur_avis(self):
         """Test lmelp_prenom_nom tag is generated for coup de coeur critics."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_oid = str(ObjectId())
         all_avis = [
             {
@@ -276,17 +269,13 @@ class TestBuildCalibreTags:
             emission_oid: {"date": datetime(2024, 3, 24)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         assert "lmelp_240324" in tags
         assert "lmelp_arnaud_viviant" in tags
 
     def test_date_tags_sorted_chronologically(self):
         """Test that lmelp_date tags are sorted chronologically."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         em_oid1 = str(ObjectId())
         em_oid2 = str(ObjectId())
         all_avis = [
@@ -308,17 +297,13 @@ class TestBuildCalibreTags:
             em_oid2: {"date": datetime(2024, 6, 20)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         date_tags = [t for t in tags if t.startswith("lmelp_") and t[6:].isdigit()]
         assert date_tags == ["lmelp_230115", "lmelp_240620"]
 
     def test_critic_tags_sorted_alphabetically(self):
         """Test that lmelp_critic tags are sorted alphabetically."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         em_oid = str(ObjectId())
         all_avis = [
             {
@@ -338,17 +323,13 @@ class TestBuildCalibreTags:
             em_oid: {"date": datetime(2024, 3, 24)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         critic_tags = [t for t in tags if not t[6:].isdigit()]
         assert critic_tags == ["lmelp_arnaud_viviant", "lmelp_patricia_martin"]
 
     def test_date_tags_before_critic_tags(self):
         """Test that date tags come before critic tags."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         em_oid = str(ObjectId())
         all_avis = [
             {
@@ -362,26 +343,18 @@ class TestBuildCalibreTags:
             em_oid: {"date": datetime(2024, 3, 24)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         assert tags == ["lmelp_240324", "lmelp_arnaud_viviant"]
 
     def test_empty_avis_returns_empty_tags(self):
         """Test that empty avis list returns empty tags."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
-        tags = service._build_calibre_tags([], {})
+        tags = build_calibre_tags([], {})
 
         assert tags == []
 
     def test_no_duplicate_date_tags(self):
         """Test that duplicate emission dates produce only one tag."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         em_oid = str(ObjectId())
         # Two avis on same emission (same date)
         all_avis = [
@@ -402,23 +375,19 @@ class TestBuildCalibreTags:
             em_oid: {"date": datetime(2024, 3, 24)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         date_tags = [t for t in tags if t[6:].isdigit()]
         assert date_tags == ["lmelp_240324"]
 
     def test_build_tags_uses_official_critique_name_via_critique_oid(self):
-        """Test that _build_calibre_tags uses the official critique name from
+        """Test that build_calibre_tags uses the official critique name from
         critiques_by_id when critique_oid is present, not critique_nom_extrait.
 
         Real bug: critique_nom_extrait="Raphaël Léris" (LLM error)
         but critique_oid points to "Raphaëlle Leyris" (correct name).
         Expected tag: lmelp_raphaëlle_leyris (not lmelp_raphaël_léris).
         """
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         critique_id = str(ObjectId())
         emission_oid = str(ObjectId())
         all_avis = [
@@ -437,7 +406,7 @@ class TestBuildCalibreTags:
             critique_id: "Raphaëlle Leyris",  # Official name
         }
 
-        tags = service._build_calibre_tags(
+        tags = build_calibre_tags(
             all_avis, emissions_by_id, critiques_by_id=critiques_by_id
         )
 
@@ -446,12 +415,8 @@ class TestBuildCalibreTags:
         assert "lmelp_raphaëlle_leyris" not in tags
 
     def test_build_tags_falls_back_to_critique_nom_extrait_without_oid(self):
-        """Test that _build_calibre_tags falls back to critique_nom_extrait
+        """Test that build_calibre_tags falls back to critique_nom_extrait
         when critique_oid is not present or not in critiques_by_id."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_oid = str(ObjectId())
         all_avis = [
             {
@@ -466,7 +431,7 @@ class TestBuildCalibreTags:
         }
 
         # No critiques_by_id passed (backwards compatible)
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         assert "lmelp_arnaud_viviant" in tags
 
@@ -476,10 +441,6 @@ class TestBuildCalibreTags:
         Real bug: "Nelly Kapriélian" → lmelp_nelly_kapriélian (with accent)
         Expected: lmelp_nelly_kaprielian (without accent, ASCII-safe).
         """
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         critique_id = str(ObjectId())
         emission_oid = str(ObjectId())
         all_avis = [
@@ -498,7 +459,7 @@ class TestBuildCalibreTags:
             critique_id: "Nelly Kapriélian",
         }
 
-        tags = service._build_calibre_tags(
+        tags = build_calibre_tags(
             all_avis, emissions_by_id, critiques_by_id=critiques_by_id
         )
 
@@ -507,10 +468,6 @@ class TestBuildCalibreTags:
 
     def test_build_tags_normalizes_accents_without_critiques_by_id(self):
         """Test that accents are normalized even when using critique_nom_extrait fallback."""
-        from back_office_lmelp.services.mongodb_service import MongoDBService
-
-        service = MongoDBService.__new__(MongoDBService)
-
         emission_oid = str(ObjectId())
         all_avis = [
             {
@@ -524,7 +481,7 @@ class TestBuildCalibreTags:
             emission_oid: {"date": datetime(2024, 3, 24)},
         }
 
-        tags = service._build_calibre_tags(all_avis, emissions_by_id)
+        tags = build_calibre_tags(all_avis, emissions_by_id)
 
         assert "lmelp_leila_slimani" in tags
         assert "lmelp_leïla_slimani" not in tags
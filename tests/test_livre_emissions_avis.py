@@ -29,9 +29,16 @@ def mongodb_service_instance():
     service.auteurs_collection = MagicMock()
     service.avis_collection = MagicMock()
     service.emissions_collection = MagicMock()
+    # Statistiques matérialisées lues via get_collection("livre_stats")
+    service.db = MagicMock()
     return service
 
 
+def _mock_livre_stats(service, livre_id, **stats):
+    """Document livre_stats renvoyé pour le livre."""
+    service.db["livre_stats"].find.return_value = [{"_id": str(livre_id), **stats}]
+
+
 class TestLivreWithEmissionsAndAvis:
     """Tests for get_livre_with_episodes returning emissions with avis ratings."""
 
@@ -71,24 +78,20 @@ class TestLivreWithEmissionsAndAvis:
             }
         ]
 
-        # Mock avis collection: ratings for this book
-        mongodb_service_instance.avis_collection.find.return_value = [
-            {
-                "emission_oid": str(emission1_id),
-                "livre_oid": str(livre_id),
-                "note": 9,
-            },
-            {
-                "emission_oid": str(emission1_id),
-                "livre_oid": str(livre_id),
-                "note": 7,
-            },
-            {
-                "emission_oid": str(emission1_id),
-                "livre_oid": str(livre_id),
-                "note": 3,
-            },
-        ]
+        # Statistiques matérialisées : avis notés 9, 7 et 3
+        _mock_livre_stats(
+            mongodb_service_instance,
+            livre_id,
+            note_moyenne=6.3,
+            nombre_avis=3,
+            emissions=[
+                {
+                    "emission_id": str(emission1_id),
+                    "note_moyenne": 6.3,
+                    "nombre_avis": 3,
+                }
+            ],
+        )
 
         # WHEN: We call get_livre_with_episodes
         result = mongodb_service_instance.get_livre_with_episodes(str(livre_id))
@@ -148,29 +151,25 @@ class TestLivreWithEmissionsAndAvis:
             },
         ]
 
-        # Mock avis: emission1 has notes [9, 9, 3], emission2 has note [9]
-        mongodb_service_instance.avis_collection.find.return_value = [
-            {
-                "emission_oid": str(emission1_id),
-                "livre_oid": str(livre_id),
-                "note": 9,
-            },
-            {
-                "emission_oid": str(emission1_id),
-                "livre_oid": str(livre_id),
-                "note": 9,
-            },
-            {
-                "emission_oid": str(emission1_id),
-                "livre_oid": str(livre_id),
-                "note": 3,
-            },
-            {
-                "emission_oid": str(emission2_id),
-                "livre_oid": str(livre_id),
-                "note": 9,
-            },
-        ]
+        # Statistiques : emission1 has notes [9, 9, 3], emission2 has note [9]
+        _mock_livre_stats(
+            mongodb_service_instance,
+            livre_id,
+            note_moyenne=7.5,
+            nombre_avis=4,
+            emissions=[
+                {
+                    "emission_id": str(emission1_id),
+                    "note_moyenne": 7.0,
+                    "nombre_avis": 3,
+                },
+                {
+                    "emission_id": str(emission2_id),
+                    "note_moyenne": 9.0,
+                    "nombre_avis": 1,
+                },
+            ],
+        )
 
         # WHEN
         result = mongodb_service_instance.get_livre_with_episodes(str(livre_id))
@@ -239,8 +238,8 @@ class TestLivreWithEmissionsAndAvis:
             },
         ]
 
-        # No avis for this book
-        mongodb_service_instance.avis_collection.find.return_value = []
+        # No avis for this book: pas de document livre_stats
+        mongodb_service_instance.db["livre_stats"].find.return_value = []
 
         # WHEN
         result = mongodb_service_instance.get_livre_with_episodes(str(livre_id))
@@ -0,0 +1,196 @@
+"""Tests des statistiques matérialisées par livre (livre_stats_service)."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+
+from back_office_lmelp.services.livre_stats_service import (
+    compute_livre_stats,
+    delete_livre_stats,
+    load_critique_notes,
+    refresh_livre_stats,
+    refresh_livre_stats_for_critiques,
+)
+from back_office_lmelp.services.mongodb_service import MongoDBService
+
+
+LIVRE_A = ObjectId()
+LIVRE_B = ObjectId()
+EMISSION_1 = ObjectId()
+EMISSION_2 = ObjectId()
+CRITIQUE = ObjectId()
+
+
+class TestComputeLivreStats:
+    """Agrégation des avis d'un livre en un document."""
+
+    def test_notes_emissions_critics_and_tags(self, collections_service):
+        """Notes globales et par émission, coups de cœur et tags Calibre."""
+        livre = str(LIVRE_A)
+        service, collections = collections_service(
+            avis=[
+                {
+                    "livre_oid": livre,
+                    "emission_oid": str(EMISSION_1),
+                    "critique_oid": str(CRITIQUE),
+                    "critique_nom_extrait": "Arnaud Viviand",
+                    "section": "coup_de_coeur",
+                    "note": 9,
+                },
+                {
+                    "livre_oid": livre,
+                    "emission_oid": str(EMISSION_1),
+                    "section": "programme",
+                    "note": 6,
+                },
+                {
+                    "livre_oid": livre,
+                    "emission_oid": str(EMISSION_2),
+                    "section": "programme",
+                    "note": None,
+                },
+            ],
+            emissions=[
+                {"_id": EMISSION_1, "date": datetime(2024, 9, 22)},
+                {"_id": EMISSION_2, "date": datetime(2023, 3, 15)},
+            ],
+            critiques=[{"_id": CRITIQUE, "nom": "Arnaud Viviant"}],
+        )
+
+        stats = compute_livre_stats(service, [LIVRE_A])[livre]
+
+        assert stats["note_moyenne"] == 7.5
+        assert stats["nombre_avis"] == 2
+        assert stats["emissions"] == [
+            {
+                "emission_id": str(EMISSION_1),
+                "date": datetime(2024, 9, 22),
+                "note_moyenne": 7.5,
+                "nombre_avis": 2,
+            },
+            {
+                "emission_id": str(EMISSION_2),
+                "date": datetime(2023, 3, 15),
+                "note_moyenne": None,
+                "nombre_avis": 0,
+            },
+        ]
+        assert stats["notes_critiques"] == [{"critique_oid": str(CRITIQUE), "note": 9}]
+        # Nom officiel du critique préféré au nom extrait
+        assert stats["coups_de_coeur"] == ["Arnaud Viviant"]
+        assert stats["calibre_tags"] == [
+            "lmelp_230315",
+            "lmelp_240922",
+            "lmelp_arnaud_viviant",
+        ]
+        assert collections["avis"].find.call_args[0][0] == {
+            "livre_oid": {"$in": [livre]}
+        }
+
+    def test_no_livre_means_no_query(self, collections_service):
+        """Aucun ID valide → aucune requête."""
+        service, collections = collections_service()
+
+        assert compute_livre_stats(service, [None, "pas-un-oid"]) == {}
+        collections["avis"].find.assert_not_called()
+
+
+class TestRefreshLivreStats:
+    """Maintenance incrémentale d'un sous-ensemble de livres."""
+
+    def test_upserts_livres_with_avis_and_deletes_others(self, collections_service):
+        """Un seul bulk_write : upsert des livres avec avis, suppression des autres."""
+        service, collections = collections_service(
+            avis=[{"livre_oid": str(LIVRE_A), "note": 8}]
+        )
+
+        assert refresh_livre_stats(service, [LIVRE_A, LIVRE_B]) == 1
+
+        operations = collections["livre_stats"].bulk_write.call_args[0][0]
+        upserts = [op for op in operations if isinstance(op, UpdateOne)]
+        deletes = [op for op in operations if isinstance(op, DeleteOne)]
+        assert [op._filter for op in upserts] == [{"_id": str(LIVRE_A)}]
+        assert upserts[0]._doc["$set"]["note_moyenne"] == 8.0
+        assert [op._filter for op in deletes] == [{"_id": str(LIVRE_B)}]
+
+    def test_critique_refresh_targets_their_livres(self, collections_service):
+        """La fusion de critiques recalcule les livres de leurs avis."""
+        service, collections = collections_service()
+        collections["avis"].distinct.return_value = [str(LIVRE_B)]
+
+        refresh_livre_stats_for_critiques(service, [CRITIQUE])
+
+        collections["avis"].distinct.assert_called_once_with(
+            "livre_oid", {"critique_oid": {"$in": [str(CRITIQUE)]}}
+        )
+        operations = collections["livre_stats"].bulk_write.call_args[0][0]
+        assert [op._filter for op in operations] == [{"_id": str(LIVRE_B)}]
+
+    def test_deleted_livres_stats_are_removed(self, collections_service):
+        """Doublons fusionnés : statistiques supprimées sans recalcul."""
+        service, collections = collections_service()
+        collections["livre_stats"].delete_many.return_value.deleted_count = 1
+
+        assert delete_livre_stats(service, [LIVRE_B]) == 1
+
+        collections["livre_stats"].delete_many.assert_called_once_with(
+            {"_id": {"$in": [str(LIVRE_B)]}}
+        )
+        collections["avis"].find.assert_not_called()
+
+
+class TestLoadCritiqueNotes:
+    """Matrice critique × livre des recommandations."""
+
+    def test_flattens_notes_critiques(self, collections_service):
+        """Une entrée par note (critique, livre)."""
+        service, collections = collections_service()
+        collections["livre_stats"].find.return_value = [
+            {
+                "_id": str(LIVRE_A),
+                "notes_critiques": [
+                    {"critique_oid": "c1", "note": 8},
+                    {"critique_oid": "c2", "note": 5},
+                ],
+            }
+        ]
+
+        assert load_critique_notes(service) == [
+            {"critique_oid": "c1", "livre_oid": str(LIVRE_A), "note": 8},
+            {"critique_oid": "c2", "livre_oid": str(LIVRE_A), "note": 5},
+        ]
+
+
+class TestAvisWritesRefreshLivreStats:
+    """Les écritures d'avis recalculent les statistiques des livres touchés."""
+
+    def _service(self, previous=None):
+        service = MongoDBService.__new__(MongoDBService)
+        service.db = MagicMock()
+        service.avis_collection = MagicMock()
+        service.avis_collection.find_one.return_value = previous
+        service.refresh_emission_badges = MagicMock()
+        service.refresh_palmares = MagicMock()
+        service.refresh_livre_stats = MagicMock()
+        return service
+
+    def test_update_refreshes_old_and_new_livre(self):
+        """Réaffecter un avis recalcule l'ancien et le nouveau livre."""
+        service = self._service({"emission_oid": "em1", "livre_oid": "old"})
+        service.avis_collection.update_one.return_value.matched_count = 1
+
+        assert service.update_avis(str(ObjectId()), {"livre_oid": "new"})
+
+        service.refresh_livre_stats.assert_called_once_with(["old", "new"])
+
+    def test_delete_by_emission_refreshes_its_livres(self):
+        """La ré-extraction d'une émission recalcule les livres de ses avis."""
+        service = self._service()
+        service.avis_collection.distinct.return_value = ["l1", "l2"]
+        service.avis_collection.delete_many.return_value.deleted_count = 3
+
+        assert service.delete_avis_by_emission("em1") == 3
+
+        service.refresh_livre_stats.assert_called_once_with(["l1", "l2"])
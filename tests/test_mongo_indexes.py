@@ -0,0 +1,210 @@
+"""Tests pour le registre d'index MongoDB et la détection des COLLSCAN."""
+
+from unittest.mock import MagicMock
+
+from back_office_lmelp.utils.mongo_indexes import (
+    REQUIRED_INDEXES,
+    CanonicalQuery,
+    IndexSpec,
+    explain_canonical_queries,
+    reconcile_indexes,
+)
+
+
+def _db_with_collections(collections: dict[str, MagicMock]) -> MagicMock:
+    """Crée une fausse base dont db[nom] retourne la collection mockée."""
+    db = MagicMock()
+    db.__getitem__.side_effect = lambda name: collections[name]
+    return db
+
+
+class TestRequiredIndexes:
+    """Vérifie que les champs des requêtes chaudes sont déclarés."""
+
+    def test_hot_query_fields_are_declared(self):
+        """Chaque champ de jointure chaud a un index déclaré."""
+        declared = {(spec.collection, spec.keys[0][0]) for spec in REQUIRED_INDEXES}
+        for expected in [
+            ("avis", "emission_oid"),
+            ("avis", "livre_oid"),
+            ("avis", "critique_oid"),
+            ("livres", "episodes"),
+            ("livres", "url_babelio"),
+            ("livresauteurs_cache", "episode_oid"),
+            ("emissions", "episode_id"),
+            ("avis_critiques", "episode_oid"),
+            ("episodes", "masked"),
+            ("episodes", "date"),
+        ]:
+            assert expected in declared
+
+    def test_index_names_are_unique_per_collection(self):
+        """Deux index d'une même collection ne partagent pas de nom."""
+        names = [(spec.collection, spec.name) for spec in REQUIRED_INDEXES]
+        assert len(names) == len(set(names))
+
+
+class TestReconcileIndexes:
+    """Tests pour reconcile_indexes()."""
+
+    def test_creates_missing_and_keeps_existing(self):
+        """Crée les index absents, ignore ceux dont les clés existent déjà."""
+        avis = MagicMock()
+        avis.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            # Même clés que la spec, nom différent → satisfaisant
+            "custom_emission": {"key": [("emission_oid", 1)]},
+            "legacy_note": {"key": [("note", 1)]},
+        }
+        db = _db_with_collections({"avis": avis})
+        specs = [
+            IndexSpec("avis", (("emission_oid", 1),), "emission_oid_1"),
+            IndexSpec("avis", (("livre_oid", 1),), "livre_oid_1"),
+        ]
+
+        report = reconcile_indexes(db, specs)
+
+        assert report["created"] == ["avis.livre_oid_1"]
+        assert report["existing"] == ["avis.emission_oid_1"]
+        assert report["unmanaged"] == ["avis.legacy_note"]
+        assert report["errors"] == []
+        avis.create_index.assert_called_once_with(
+            [("livre_oid", 1)], name="livre_oid_1"
+        )
+
+    def test_passes_index_options(self):
+        """Les options unique/sparse sont transmises à create_index()."""
+        livres = MagicMock()
+        livres.index_information.return_value = {"_id_": {"key": [("_id", 1)]}}
+        db = _db_with_collections({"livres": livres})
+        specs = [
+            IndexSpec("livres", (("url_babelio", 1),), "url_babelio_1", sparse=True)
+        ]
+
+        reconcile_indexes(db, specs)
+
+        livres.create_index.assert_called_once_with(
+            [("url_babelio", 1)], name="url_babelio_1", sparse=True
+        )
+
+    def test_same_keys_with_other_options_is_a_conflict(self):
+        """Index non unique existant pour une spec unique : conflit, pas existant."""
+        editeurs = MagicMock()
+        editeurs.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            "nom_normalise_1": {"key": [("nom_normalise", 1)]},
+        }
+        db = _db_with_collections({"editeurs": editeurs})
+        specs = [
+            IndexSpec(
+                "editeurs",
+                (("nom_normalise", 1),),
+                "nom_normalise_1",
+                unique=True,
+                partial_filter={"nom_normalise": {"$type": "string"}},
+            )
+        ]
+
+        report = reconcile_indexes(db, specs)
+
+        assert report["existing"] == []
+        [conflict] = report["conflicts"]
+        assert conflict.startswith("editeurs.nom_normalise_1:")
+        assert "unique=True" in conflict
+        assert "partialFilterExpression" in conflict
+        editeurs.create_index.assert_not_called()
+
+    def test_retired_index_is_dropped(self):
+        """Un index retiré (préfixe redondant) est supprimé s'il existe."""
+        avis = MagicMock()
+        avis.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            "critique_oid_1": {"key": [("critique_oid", 1)]},
+        }
+        db = _db_with_collections({"avis": avis})
+
+        report = reconcile_indexes(db, [], retired=[("avis", "critique_oid_1")])
+
+        assert report["dropped"] == ["avis.critique_oid_1"]
+        avis.drop_index.assert_called_once_with("critique_oid_1")
+
+    def test_no_declared_index_is_a_prefix_of_another(self):
+        """Un index déclaré préfixe d'un composé du registre est redondant."""
+        keys = {(spec.collection, spec.keys) for spec in REQUIRED_INDEXES}
+        for collection, spec_keys in keys:
+            for other_collection, other_keys in keys:
+                assert not (
+                    collection == other_collection
+                    and len(spec_keys) < len(other_keys)
+                    and other_keys[: len(spec_keys)] == spec_keys
+                ), f"{collection}.{spec_keys} préfixe de {other_keys}"
+
+    def test_creation_error_is_reported(self):
+        """Une erreur de création est rapportée sans interrompre les autres."""
+        avis = MagicMock()
+        avis.index_information.return_value = {}
+        avis.create_index.side_effect = [Exception("conflict"), "livre_oid_1"]
+        db = _db_with_collections({"avis": avis})
+        specs = [
+            IndexSpec("avis", (("emission_oid", 1),), "emission_oid_1"),
+            IndexSpec("avis", (("livre_oid", 1),), "livre_oid_1"),
+        ]
+
+        report = reconcile_indexes(db, specs)
+
+        assert report["created"] == ["avis.livre_oid_1"]
+        assert report["errors"] == ["avis.emission_oid_1: conflict"]
+
+
+class TestExplainCanonicalQueries:
+    """Tests pour explain_canonical_queries()."""
+
+    def test_flags_collscan(self):
+        """Un plan gagnant contenant COLLSCAN est signalé."""
+        avis = MagicMock()
+        avis.find.return_value.explain.return_value = {
+            "queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}
+        }
+        db = _db_with_collections({"avis": avis})
+
+        results = explain_canonical_queries(
+            db, [CanonicalQuery("avis par émission", "avis", {"emission_oid": "x"})]
+        )
+
+        assert results[0]["collscan"] is True
+        assert results[0]["stages"] == ["COLLSCAN"]
+
+    def test_nested_ixscan_is_not_flagged(self):
+        """Un plan FETCH > IXSCAN (y compris trié) n'est pas signalé."""
+        episodes = MagicMock()
+        cursor = episodes.find.return_value
+        cursor.sort.return_value = cursor
+        cursor.explain.return_value = {
+            "queryPlanner": {
+                "winningPlan": {
+                    "stage": "FETCH",
+                    "inputStage": {"stage": "IXSCAN", "indexName": "date_-1"},
+                }
+            }
+        }
+        db = _db_with_collections({"episodes": episodes})
+
+        results = explain_canonical_queries(
+            db,
+            [CanonicalQuery("épisodes par date", "episodes", {}, (("date", -1),))],
+        )
+
+        assert results[0]["collscan"] is False
+        assert results[0]["stages"] == ["FETCH", "IXSCAN"]
+        cursor.sort.assert_called_once_with([("date", -1)])
+
+    def test_explain_error_is_reported(self):
+        """Une erreur explain() est remontée dans l'entrée."""
+        avis = MagicMock()
+        avis.find.side_effect = Exception("boom")
+        db = _db_with_collections({"avis": avis})
+
+        results = explain_canonical_queries(db, [CanonicalQuery("q", "avis", {})])
+
+        assert results[0]["error"] == "boom"
+        assert results[0]["collscan"] is False
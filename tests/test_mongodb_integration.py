@@ -165,7 +165,37 @@ class TestMongoDBService:
         assert result is not None
         assert result["_id"] == episode_id
         assert result["titre"] == "Test Episode"
-        mock_collection.find_one.assert_called_once_with({"_id": ObjectId(episode_id)})
+        mock_collection.find_one.assert_called_once_with(
+            {"_id": ObjectId(episode_id)}, None
+        )
+
+    def test_get_episode_by_id_summary_profile(self, mongodb_service):
+        """Le profil summary exclut la transcription."""
+        mock_collection = Mock()
+        mongodb_service.episodes_collection = mock_collection
+        episode_id = "507f1f77bcf86cd799439011"  # pragma: allowlist secret
+        mock_collection.find_one.return_value = {
+            "_id": ObjectId(episode_id),
+            "titre": "Test Episode",
+        }
+
+        mongodb_service.get_episode_by_id(episode_id, profile="summary")
+
+        projection = mock_collection.find_one.call_args[0][1]
+        assert "transcription" not in projection
+        assert projection["titre"] == 1
+
+    def test_get_episode_by_id_detail_profile(self, mongodb_service):
+        """Le profil detail exclut uniquement la transcription."""
+        mock_collection = Mock()
+        mongodb_service.episodes_collection = mock_collection
+        episode_id = "507f1f77bcf86cd799439011"  # pragma: allowlist secret
+        mock_collection.find_one.return_value = None
+
+        mongodb_service.get_episode_by_id(episode_id, profile="detail")
+
+        projection = mock_collection.find_one.call_args[0][1]
+        assert projection == {"transcription": 0}
 
     def test_get_episode_by_id_not_found(self, mongodb_service):
         """Test get episode by ID when episode not found."""
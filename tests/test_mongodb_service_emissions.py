@@ -1,7 +1,7 @@
 """Tests pour les méthodes emissions du MongoDBService (TDD)."""
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from bson import ObjectId
 
@@ -149,10 +149,7 @@ class TestCreateEmission:
 class TestGetCritiquesByEpisode:
     """Tests pour get_critiques_by_episode()."""
 
-    @patch(
-        "back_office_lmelp.services.critiques_extraction_service.critiques_extraction_service"
-    )
-    def test_should_get_critiques_by_episode(self, mock_extraction_service):
+    def test_should_get_critiques_by_episode(self):
         """Doit extraire et matcher critiques depuis summary."""
         # Arrange
         service = MongoDBService()
@@ -174,14 +171,6 @@ class TestGetCritiquesByEpisode:
         service.avis_critiques_collection.find_one.return_value = mock_avis
         service.critiques_collection.find.return_value = [mock_critique]
 
-        mock_extraction_service.extract_critiques_from_summary.return_value = [
-            "Jérôme Garcin"
-        ]
-        mock_extraction_service.find_matching_critique.return_value = {
-            "nom": "Jérôme Garcin",
-            "match_type": "exact",
-        }
-
         # Act
         result = service.get_critiques_by_episode(episode_id)
 
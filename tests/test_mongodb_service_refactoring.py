@@ -173,8 +173,8 @@ class TestMongoDBServiceRefactoring:
         self.service.avis_critiques_collection = Mock()
         self.service.avis_critiques_collection.count_documents.return_value = 50
 
-        # Mock pour aggregate (dernière date de mise à jour)
-        self.mock_collection.aggregate.return_value = [{"date": "2025-09-15"}]
+        # Mock pour find_one (épisode le plus récent : dernière mise à jour)
+        self.mock_collection.find_one.return_value = {"date": "2025-09-15"}
 
         # Mock pour find (récupération des épisodes masqués)
         self.mock_collection.find.return_value = []
@@ -187,6 +187,8 @@ class TestMongoDBServiceRefactoring:
         assert result["masked_episodes_count"] == 5
         assert result["episodes_with_corrected_titles"] == 15
         assert result["episodes_with_corrected_descriptions"] == 25
+        assert result["critical_reviews_count"] == 50
+        assert result["last_update_date"] == "2025-09-15"
 
         # Vérifier que les bonnes requêtes ont été appelées
         expected_calls = [
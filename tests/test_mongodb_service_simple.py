@@ -1,6 +1,5 @@
 """Tests simplifiés pour le service MongoDB synchrone."""
 
-from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -155,78 +154,46 @@ class TestGetExpectedCalibreTags:
 
     @pytest.fixture
     def mongodb_service(self):
-        """Create a MongoDB service instance with mocked collections."""
+        """Create a MongoDB service instance with a mocked livre_stats collection."""
         service = MongoDBService()
+        service.db = MagicMock()
         service.avis_collection = MagicMock()
-        service.emissions_collection = MagicMock()
         return service
 
     def test_returns_expected_lmelp_tags_for_livre(self, mongodb_service):
-        """Retourne les tags lmelp_ attendus pour un livre donné."""
-        em_id = ObjectId("507f1f77bcf86cd799439011")
-
-        # Mock avis for this livre: one regular avis + one coup de coeur
-        mongodb_service.avis_collection.find.return_value = [
-            {
-                "livre_oid": "livre1",
-                "emission_oid": str(em_id),
-                "section": "chronique",
-                "note": 7,
-            },
-            {
-                "livre_oid": "livre1",
-                "emission_oid": str(em_id),
-                "section": "coup_de_coeur",
-                "critique_nom_extrait": "Michel Crement",
-                "note": 9,
-            },
-        ]
-
-        # Mock emission with date
-        mongodb_service.emissions_collection.find.return_value = [
-            {"_id": em_id, "date": datetime(2024, 9, 22)},
+        """Retourne les tags lmelp_ matérialisés, sans relire les avis."""
+        livre_id = "507f1f77bcf86cd799439021"
+        livre_stats = mongodb_service.db["livre_stats"]
+        livre_stats.find.return_value = [
+            {"_id": livre_id, "calibre_tags": ["lmelp_240922", "lmelp_michel_crement"]}
         ]
 
-        result = mongodb_service.get_expected_calibre_tags(["livre1"])
+        result = mongodb_service.get_expected_calibre_tags([livre_id])
 
-        assert "livre1" in result
-        assert "lmelp_240922" in result["livre1"]
-        assert "lmelp_michel_crement" in result["livre1"]
+        assert result == {livre_id: ["lmelp_240922", "lmelp_michel_crement"]}
+        livre_stats.find.assert_called_once_with(
+            {"_id": {"$in": [livre_id]}}, {"calibre_tags": 1}
+        )
+        mongodb_service.avis_collection.find.assert_not_called()
 
     def test_returns_empty_for_livre_without_avis(self, mongodb_service):
         """Retourne une liste vide pour un livre sans avis."""
-        mongodb_service.avis_collection.find.return_value = []
-        mongodb_service.emissions_collection.find.return_value = []
+        mongodb_service.db["livre_stats"].find.return_value = []
 
-        result = mongodb_service.get_expected_calibre_tags(["livre_no_avis"])
+        result = mongodb_service.get_expected_calibre_tags(["507f1f77bcf86cd799439021"])
 
-        assert result.get("livre_no_avis", []) == []
+        assert result == {}
 
     def test_returns_multiple_livres(self, mongodb_service):
         """Retourne les tags pour plusieurs livres en une seule requête."""
-        em_id1 = ObjectId("507f1f77bcf86cd799439011")
-        em_id2 = ObjectId("507f1f77bcf86cd799439012")
-
-        # Avis for 2 different livres
-        mongodb_service.avis_collection.find.return_value = [
-            {
-                "livre_oid": "livre1",
-                "emission_oid": str(em_id1),
-                "section": "chronique",
-            },
-            {
-                "livre_oid": "livre2",
-                "emission_oid": str(em_id2),
-                "section": "chronique",
-            },
-        ]
-
-        mongodb_service.emissions_collection.find.return_value = [
-            {"_id": em_id1, "date": datetime(2024, 9, 22)},
-            {"_id": em_id2, "date": datetime(2023, 3, 15)},
+        livre1, livre2 = "507f1f77bcf86cd799439021", "507f1f77bcf86cd799439022"
+        mongodb_service.db["livre_stats"].find.return_value = [
+            {"_id": livre1, "calibre_tags": ["lmelp_240922"]},
+            {"_id": livre2, "calibre_tags": ["lmelp_230315"]},
+            {"_id": "507f1f77bcf86cd799439023", "calibre_tags": []},
         ]
 
-        result = mongodb_service.get_expected_calibre_tags(["livre1", "livre2"])
+        result = mongodb_service.get_expected_calibre_tags([livre1, livre2])
 
-        assert "lmelp_240922" in result.get("livre1", [])
-        assert "lmelp_230315" in result.get("livre2", [])
+        assert result == {livre1: ["lmelp_240922"], livre2: ["lmelp_230315"]}
+        mongodb_service.db["livre_stats"].find.assert_called_once()
@@ -22,68 +22,70 @@ def client():
 class TestGetNotesForLivres:
     """Tests pour MongoDBService.get_notes_for_livres().
 
-    Les notes sont dans la collection 'avis' (champs: livre_oid String, note Number),
-    PAS dans 'avis_critiques' (qui est la collection des résumés LLM sans notes).
+    Les notes viennent de la collection 'avis' (champs: livre_oid String, note
+    Number), PAS de 'avis_critiques' (résumés LLM sans notes). Elles sont lues
+    matérialisées dans 'livre_stats'.
     """
 
-    def test_uses_avis_collection_not_avis_critiques(self):
-        """Doit interroger avis_collection, pas avis_critiques_collection."""
+    def test_reads_livre_stats_not_avis(self):
+        """Lit les notes matérialisées (livre_stats), sans agréger les avis."""
         from unittest.mock import MagicMock
 
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService.__new__(MongoDBService)
+        service.db = MagicMock()
+        service.avis_collection = MagicMock()
+        service.avis_critiques_collection = MagicMock()
+        livre_stats = service.db["livre_stats"]
+        livre_stats.find.return_value = [
+            {"_id": "507f1f77bcf86cd799439011", "note_moyenne": 8.5}
+        ]
 
-        # avis_collection a les données
-        mock_avis = MagicMock()
-        service.avis_collection = mock_avis
-        mock_avis.aggregate.return_value = iter(
-            [{"_id": "livre_abc", "note_moyenne": 8.5}]
-        )
-
-        # avis_critiques_collection ne doit PAS être appelée
-        mock_avis_critiques = MagicMock()
-        service.avis_critiques_collection = mock_avis_critiques
-
-        result = service.get_notes_for_livres(["livre_abc"])
+        result = service.get_notes_for_livres(["507f1f77bcf86cd799439011"])
 
-        assert result["livre_abc"] == 8.5
-        mock_avis.aggregate.assert_called_once()
-        mock_avis_critiques.aggregate.assert_not_called()
+        assert result == {"507f1f77bcf86cd799439011": 8.5}
+        livre_stats.find.assert_called_once_with(
+            {"_id": {"$in": ["507f1f77bcf86cd799439011"]}}, {"note_moyenne": 1}
+        )
+        service.avis_collection.aggregate.assert_not_called()
+        service.avis_critiques_collection.aggregate.assert_not_called()
 
     def test_returns_dict_by_livre_id(self):
-        """Retourne un dict {livre_id: note_moyenne} pour une liste d'IDs."""
+        """Retourne un dict {livre_id: note_moyenne} (livres sans note exclus)."""
         from unittest.mock import MagicMock
 
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService.__new__(MongoDBService)
+        service.db = MagicMock()
+        service.db["livre_stats"].find.return_value = [
+            {"_id": "507f1f77bcf86cd799439011", "note_moyenne": 8.5},
+            {"_id": "507f1f77bcf86cd799439012", "note_moyenne": 7.0},
+            {"_id": "507f1f77bcf86cd799439013", "note_moyenne": None},
+        ]
 
-        mock_collection = MagicMock()
-        service.avis_collection = mock_collection
-
-        # Simuler le résultat de l'agrégation
-        mock_collection.aggregate.return_value = iter(
+        result = service.get_notes_for_livres(
             [
-                {"_id": "livre_abc", "note_moyenne": 8.5},
-                {"_id": "livre_def", "note_moyenne": 7.0},
+                "507f1f77bcf86cd799439011",
+                "507f1f77bcf86cd799439012",
+                "507f1f77bcf86cd799439013",
             ]
         )
 
-        result = service.get_notes_for_livres(["livre_abc", "livre_def"])
-
-        assert isinstance(result, dict)
-        assert result["livre_abc"] == 8.5
-        assert result["livre_def"] == 7.0
+        assert result == {
+            "507f1f77bcf86cd799439011": 8.5,
+            "507f1f77bcf86cd799439012": 7.0,
+        }
 
-    def test_returns_empty_dict_when_no_collection(self):
-        """Retourne un dict vide si la collection n'est pas disponible."""
+    def test_returns_empty_dict_when_not_connected(self):
+        """Retourne un dict vide sans connexion MongoDB."""
         from back_office_lmelp.services.mongodb_service import MongoDBService
 
         service = MongoDBService.__new__(MongoDBService)
-        service.avis_collection = None
+        service.db = None
 
-        result = service.get_notes_for_livres(["livre_abc"])
+        result = service.get_notes_for_livres(["507f1f77bcf86cd799439011"])
 
         assert result == {}
 
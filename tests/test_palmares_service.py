@@ -0,0 +1,201 @@
+"""Tests du palmarès matérialisé (palmares_service) et de sa maintenance."""
+
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+from pymongo import DeleteOne, UpdateOne
+
+from back_office_lmelp.services.mongodb_service import MongoDBService
+from back_office_lmelp.services.palmares_service import (
+    PALMARES_SORT,
+    compute_palmares_entries,
+    get_palmares_page,
+    rebuild_palmares,
+    refresh_palmares,
+)
+
+
+LIVRE_A = ObjectId()
+LIVRE_B = ObjectId()
+AUTEUR = ObjectId()
+
+
+class TestComputePalmaresEntries:
+    """Calcul des entrées : seuil, arrondi, dénormalisation sans $lookup."""
+
+    def test_entries_are_denormalized_and_thresholded(self, collections_service):
+        """Livres sous 2 avis exclus, titre/auteur/URL recopiés."""
+        service, collections = collections_service(
+            aggregate={
+                "avis": [
+                    {"_id": str(LIVRE_A), "note_moyenne": 8.66666, "nombre_avis": 3},
+                    {"_id": str(LIVRE_B), "note_moyenne": 10.0, "nombre_avis": 1},
+                ]
+            },
+            livres=[
+                {
+                    "_id": LIVRE_A,
+                    "titre": "Feu",
+                    "auteur_id": AUTEUR,
+                    "url_babelio": "https://www.babelio.com/livres/Pourchet-Feu/1",
+                }
+            ],
+            auteurs=[{"_id": AUTEUR, "nom": "Maria Pourchet"}],
+        )
+
+        entries = compute_palmares_entries(service, [LIVRE_A, str(LIVRE_B)])
+
+        assert entries == {
+            str(LIVRE_A): {
+                "note_moyenne": 8.7,
+                "nombre_avis": 3,
+                "titre": "Feu",
+                "auteur_id": str(AUTEUR),
+                "auteur_nom": "Maria Pourchet",
+                "url_babelio": "https://www.babelio.com/livres/Pourchet-Feu/1",
+            }
+        }
+        pipeline = collections["avis"].aggregate.call_args[0][0]
+        assert pipeline[0]["$match"]["livre_oid"] == {
+            "$in": [str(LIVRE_A), str(LIVRE_B)]
+        }
+        assert not any("$lookup" in stage for stage in pipeline)
+        collections["livres"].find.assert_called_once_with(
+            {"_id": {"$in": [LIVRE_A]}}, {"titre": 1, "auteur_id": 1, "url_babelio": 1}
+        )
+
+    def test_no_livre_means_no_query(self, collections_service):
+        """Aucun ID valide → aucune requête."""
+        service, collections = collections_service()
+
+        assert compute_palmares_entries(service, [None, "pas-un-oid"]) == {}
+        collections["avis"].aggregate.assert_not_called()
+
+
+class TestRefreshPalmares:
+    """Maintenance incrémentale d'un sous-ensemble de livres."""
+
+    def test_upserts_ranked_and_deletes_below_threshold(self, collections_service):
+        """Le livre classé est upserté, celui passé sous le seuil supprimé."""
+        service, collections = collections_service(
+            aggregate={
+                "avis": [
+                    {"_id": str(LIVRE_A), "note_moyenne": 9.0, "nombre_avis": 2},
+                    {"_id": str(LIVRE_B), "note_moyenne": 7.0, "nombre_avis": 1},
+                ]
+            },
+            livres=[{"_id": LIVRE_A, "titre": "Feu"}],
+        )
+
+        assert refresh_palmares(service, [str(LIVRE_A), str(LIVRE_B)]) == 1
+
+        operations = collections["palmares"].bulk_write.call_args[0][0]
+        upserts = [op for op in operations if isinstance(op, UpdateOne)]
+        deletes = [op for op in operations if isinstance(op, DeleteOne)]
+        assert [op._filter for op in upserts] == [{"_id": str(LIVRE_A)}]
+        assert upserts[0]._doc["$set"]["note_moyenne"] == 9.0
+        assert [op._filter for op in deletes] == [{"_id": str(LIVRE_B)}]
+
+    def test_rebuild_removes_obsolete_entries(self, collections_service):
+        """La reconstruction groupe tous les avis et purge le reste."""
+        service, collections = collections_service(
+            aggregate={
+                "avis": [{"_id": str(LIVRE_A), "note_moyenne": 9.0, "nombre_avis": 2}]
+            },
+            livres=[{"_id": LIVRE_A, "titre": "Feu"}],
+        )
+        collections["palmares"].delete_many.return_value.deleted_count = 4
+
+        assert rebuild_palmares(service) == {"rebuilt": 1, "removed": 4}
+        collections["palmares"].delete_many.assert_called_once_with(
+            {"_id": {"$nin": [str(LIVRE_A)]}}
+        )
+
+
+class TestGetPalmaresPage:
+    """Lecture paginée sur l'index du palmarès."""
+
+    def test_page_is_sorted_find_with_skip_and_limit(self, collections_service):
+        """find() trié + skip/limit, total par count_documents."""
+        service, collections = collections_service()
+        palmares = collections["palmares"]
+        palmares.count_documents.return_value = 65
+        cursor = palmares.find.return_value.sort.return_value
+        cursor.skip.return_value.limit.return_value = [
+            {
+                "_id": str(LIVRE_A),
+                "note_moyenne": 8.0,
+                "nombre_avis": 3,
+                "titre": "Feu",
+                "auteur_id": str(AUTEUR),
+                "auteur_nom": "Maria Pourchet",
+                "url_babelio": None,
+            }
+        ]
+
+        result = get_palmares_page(service, page=2, limit=30)
+
+        palmares.find.return_value.sort.assert_called_once_with(PALMARES_SORT)
+        cursor.skip.assert_called_once_with(30)
+        # Un document de plus pour savoir s'il existe une page suivante
+        cursor.skip.return_value.limit.assert_called_once_with(31)
+        assert result["total"] == 65
+        assert result["total_pages"] == 3
+        assert result["items"][0]["livre_id"] == str(LIVRE_A)
+        assert result["next_cursor"] is None
+
+    def test_page_beyond_total_skips_find(self, collections_service):
+        """Une page hors limites ne lance pas de find()."""
+        service, collections = collections_service()
+        collections["palmares"].count_documents.return_value = 0
+
+        result = get_palmares_page(service, page=1, limit=30)
+
+        assert result["items"] == []
+        assert result["total_pages"] == 0
+        collections["palmares"].find.assert_not_called()
+
+
+class TestAvisWritesRefreshPalmares:
+    """Les écritures d'avis recalculent les livres touchés."""
+
+    def _service(self, previous=None):
+        service = MongoDBService.__new__(MongoDBService)
+        service.db = MagicMock()
+        service.avis_collection = MagicMock()
+        service.avis_collection.find_one.return_value = previous
+        service.refresh_emission_badges = MagicMock()
+        service.refresh_palmares = MagicMock()
+        return service
+
+    def test_update_refreshes_old_and_new_livre(self):
+        """Réaffecter un avis recalcule l'ancien et le nouveau livre."""
+        service = self._service({"emission_oid": "em1", "livre_oid": "old"})
+        service.avis_collection.update_one.return_value.matched_count = 1
+
+        assert service.update_avis(str(ObjectId()), {"livre_oid": "new"})
+
+        service.refresh_palmares.assert_called_once_with(["old", "new"])
+
+    def test_delete_refreshes_livre(self):
+        """Supprimer un avis recalcule son livre."""
+        service = self._service({"emission_oid": "em1", "livre_oid": "old"})
+        service.avis_collection.delete_one.return_value.deleted_count = 1
+
+        assert service.delete_avis(str(ObjectId()))
+
+        service.refresh_palmares.assert_called_once_with(["old"])
+
+    def test_batch_insert_refreshes_matched_livres(self):
+        """Seuls les livres des avis matchés sont recalculés."""
+        service = self._service()
+        service.avis_collection.insert_many.return_value.inserted_ids = []
+
+        service.save_avis_batch(
+            [
+                {"emission_oid": "em1", "livre_oid": "l1"},
+                {"emission_oid": "em1", "livre_oid": None},
+            ]
+        )
+
+        service.refresh_palmares.assert_called_once_with(["l1"])
@@ -101,8 +101,7 @@ def mock_calibre_service():
 def mock_mongodb_service():
     """Mock du service MongoDB avec collections."""
     mock = MagicMock()
-    mock.avis_collection = MagicMock()
-    mock.avis_collection.aggregate.return_value = iter(MOCK_AVIS_DATA)
+    mock.get_critique_notes.return_value = MOCK_AVIS_DATA
     mock.critiques_collection = MagicMock()
     mock.livres_collection = MagicMock()
     mock.auteurs_collection = MagicMock()
@@ -371,7 +370,7 @@ class TestGetRecommendations:
         svc = RecommendationService(mock_calibre_service, mock_mongodb_service)
 
         # Avec min=2, livre_solo est exclu (1 seul critique)
-        mock_mongodb_service.avis_collection.aggregate.return_value = iter(avis_data)
+        mock_mongodb_service.get_critique_notes.return_value = avis_data
         mock_mongodb_service.livres_collection.find.return_value = iter(livres_docs)
         mock_mongodb_service.auteurs_collection.find.return_value = iter(auteurs_docs)
         mock_mongodb_service.critiques_collection.find.return_value = iter([])
@@ -379,7 +378,7 @@ class TestGetRecommendations:
         livre_solo_in_min2 = any(r["livre_id"] == livre_solo_oid for r in result_min2)
 
         # Avec min=1, livre_solo est inclus
-        mock_mongodb_service.avis_collection.aggregate.return_value = iter(avis_data)
+        mock_mongodb_service.get_critique_notes.return_value = avis_data
         mock_mongodb_service.livres_collection.find.return_value = iter(livres_docs)
         mock_mongodb_service.auteurs_collection.find.return_value = iter(auteurs_docs)
         mock_mongodb_service.critiques_collection.find.return_value = iter([])
@@ -407,7 +406,7 @@ class TestGetRecommendations:
         self, mock_calibre_service, mock_mongodb_service
     ):
         """Retourne une liste vide si la base d'avis est vide."""
-        mock_mongodb_service.avis_collection.aggregate.return_value = iter([])
+        mock_mongodb_service.get_critique_notes.return_value = []
         mock_mongodb_service.critiques_collection.find.return_value = iter([])
         svc = RecommendationService(mock_calibre_service, mock_mongodb_service)
 
@@ -96,9 +96,10 @@ class TestSearchEndpoint:
         assert response.status_code == 200
 
         data = response.json()
-        # Vérifier que chaque catégorie respecte la limite (exclure *_total_count)
+        # Vérifier que chaque catégorie respecte la limite (exclure *_total_count
+        # et *_timed_out)
         for category_name, category in data["results"].items():
-            if not category_name.endswith("_total_count"):
+            if not category_name.endswith(("_total_count", "_timed_out")):
                 assert len(category) <= 5
 
     @patch(
@@ -0,0 +1,186 @@
+"""Tests des champs de recherche normalisés et des requêtes par début de mot."""
+
+from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from back_office_lmelp.models.author import Author
+from back_office_lmelp.models.book import Book
+from back_office_lmelp.services.mongodb_service import MongoDBService
+from back_office_lmelp.utils.migrate_search_fields import backfill_search_fields
+from back_office_lmelp.utils.search_keys import (
+    search_shadow_fields,
+    search_tiers,
+    search_words,
+    word_start_filter,
+)
+
+
+class TestSearchShadowFields:
+    """Champs <champ>_normalise / <champ>_mots produits à l'écriture."""
+
+    def test_search_words_start_at_each_word(self):
+        """Ligatures, accents et apostrophes normalisés ; premier mot exclu."""
+        assert search_words("L'Œuvre au noir") == ["oeuvre au noir", "au noir", "noir"]
+        assert search_words("Carrère") == []
+
+    def test_models_write_shadow_fields(self):
+        """Author et Book produisent les champs de recherche à l'insertion."""
+        author = Author.for_mongodb_insert({"nom": "Emmanuel Carrère"})
+        book = Book.for_mongodb_insert(
+            {"titre": "La Carte et le Territoire", "auteur_id": ObjectId()}
+        )
+
+        assert author["nom_normalise"] == "emmanuel carrere"
+        assert author["nom_mots"] == ["carrere"]
+        assert book["titre_normalise"] == "la carte et le territoire"
+        assert "territoire" in book["titre_mots"]
+        assert book["editeur_mots"] == []
+
+    def test_partial_update_only_touches_present_fields(self):
+        """Un $set sans titre ne produit aucun champ fantôme."""
+        assert search_shadow_fields("livres", {"url_babelio": "x"}) == {}
+
+    def test_word_start_filter_is_anchored(self):
+        """Regex ancrés sans option i : bornes d'index exploitables."""
+        assert word_start_filter("nom", "Carrère") == {
+            "$or": [
+                {"nom_normalise": {"$regex": "^carrere"}},
+                {"nom_mots": {"$regex": "^carrere"}},
+            ]
+        }
+
+
+class TestEntitySearchTiers:
+    """Début de mot indexé d'abord, puis regex au milieu d'un mot."""
+
+    def _service(self, word_start, infix):
+        """Auteurs dont le rang dépend du filtre reçu (word_start / infix)."""
+
+        def tier_docs(query):
+            after = None
+            if "$and" in query:
+                query, after = query["$and"]
+            docs = infix if "nom" in query else word_start
+            if after is not None:
+                last_id = after["$or"][0]["_id"]["$gt"]
+                docs = [doc for doc in docs if doc["_id"] > last_id]
+            return docs
+
+        def find(query):
+            cursor = MagicMock()
+            docs = tier_docs(query)
+            cursor.sort.return_value.skip.side_effect = lambda n: MagicMock(
+                limit=lambda k: [dict(doc) for doc in docs[n : n + k]]
+            )
+            return cursor
+
+        service = MongoDBService.__new__(MongoDBService)
+        service.auteurs_collection = MagicMock()
+        service.auteurs_collection.count_documents.side_effect = lambda query: len(
+            tier_docs(query)
+        )
+        service.auteurs_collection.find.side_effect = find
+        return service
+
+    def test_tiers_are_disjoint(self):
+        """Le rang infixe exclut ($nor) les débuts de mot."""
+        word_start, infix = search_tiers("nom", "ange")
+
+        assert word_start == word_start_filter("nom", "ange")
+        assert infix["$nor"] == [word_start]
+        assert infix["nom"]["$options"] == "i"
+
+    def test_prefix_and_mid_word_hits_both_returned(self):
+        """ "ange" trouve "Angelo" (début de mot) puis "Solange" (milieu)."""
+        angelo = {"_id": ObjectId(), "nom": "Angelo Rinaldi"}
+        solange = {"_id": ObjectId(), "nom": "Solange Bied-Charreton"}
+        service = self._service([angelo], [solange])
+
+        result = service.search_auteurs("ange")
+
+        assert result["total_count"] == 2
+        assert [a["nom"] for a in result["auteurs"]] == [
+            "Angelo Rinaldi",
+            "Solange Bied-Charreton",
+        ]
+        assert result["next_cursor"] is None
+
+    def test_cursor_crosses_from_word_start_to_infix(self):
+        """Pages d'un résultat : le curseur passe du premier au second rang."""
+        angelo = {"_id": ObjectId(), "nom": "Angelo Rinaldi"}
+        solange = {"_id": ObjectId(), "nom": "Solange Bied-Charreton"}
+        service = self._service([angelo], [solange])
+
+        first = service.search_auteurs("ange", limit=1)
+        second = service.search_auteurs("ange", limit=1, cursor=first["next_cursor"])
+
+        assert [a["nom"] for a in first["auteurs"]] == ["Angelo Rinaldi"]
+        assert [a["nom"] for a in second["auteurs"]] == ["Solange Bied-Charreton"]
+        assert second["next_cursor"] is None
+
+    def test_offset_skips_whole_word_start_tier(self):
+        """Un offset au-delà du premier rang reprend dans le second."""
+        angelo = {"_id": ObjectId(), "nom": "Angelo Rinaldi"}
+        solange = {"_id": ObjectId(), "nom": "Solange Bied-Charreton"}
+        service = self._service([angelo], [solange])
+
+        result = service.search_auteurs("ange", limit=1, offset=1)
+
+        assert [a["nom"] for a in result["auteurs"]] == ["Solange Bied-Charreton"]
+
+    def test_full_word_start_page_skips_infix_tier(self):
+        """Page remplie par le premier rang : le regex infixe n'est pas lancé."""
+        angelos = [{"_id": ObjectId(), "nom": f"Angelo {i}"} for i in range(3)]
+        solange = {"_id": ObjectId(), "nom": "Solange Bied-Charreton"}
+        service = self._service(angelos, [solange])
+
+        result = service.search_auteurs("ange", limit=2)
+
+        assert [a["nom"] for a in result["auteurs"]] == ["Angelo 0", "Angelo 1"]
+        assert result["has_more"] is True
+        # Estimation : le premier rang seul, compté sur l'index
+        assert result["total_count"] == 3
+        queried = [c.args[0] for c in service.auteurs_collection.find.call_args_list]
+        queried += [
+            c.args[0] for c in service.auteurs_collection.count_documents.call_args_list
+        ]
+        assert all("$nor" not in query for query in queried)
+
+
+class TestBackfillSearchFields:
+    """Migration reprenable des champs de recherche."""
+
+    def test_missing_fields_backfilled_editeurs_nom_normalise_untouched(self):
+        """Documents sans <champ>_mots complétés ; editeurs.nom_normalise exclu."""
+        collections: dict[str, MagicMock] = {}
+
+        def collection(name):
+            return collections.setdefault(name, MagicMock())
+
+        db = MagicMock()
+        db.__getitem__.side_effect = collection
+        collection("auteurs").find.return_value = [
+            {"_id": ObjectId(), "nom": "Annie Ernaux"}
+        ]
+        collection("editeurs").find.return_value = [
+            {"_id": ObjectId(), "nom": "Éditions de Minuit"}
+        ]
+        collection("livres").find.return_value = []
+        for name in ("auteurs", "editeurs"):
+            collection(name).bulk_write.return_value.modified_count = 1
+
+        report = backfill_search_fields(db)
+
+        assert report["auteurs.nom"] == 1
+        assert report["livres.titre"] == 0
+        collection("auteurs").find.assert_called_once_with(
+            {"nom_mots": {"$exists": False}, "nom": {"$exists": True}}, {"nom": 1}
+        )
+        [auteur_op] = collection("auteurs").bulk_write.call_args[0][0]
+        assert auteur_op._doc["$set"] == {
+            "nom_normalise": "annie ernaux",
+            "nom_mots": ["ernaux"],
+        }
+        [editeur_op] = collection("editeurs").bulk_write.call_args[0][0]
+        assert editeur_op._doc["$set"] == {"nom_mots": ["de minuit", "minuit"]}
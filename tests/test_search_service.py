@@ -3,6 +3,7 @@
 from unittest.mock import Mock
 
 import pytest
+from bson import ObjectId
 
 from back_office_lmelp.services.mongodb_service import mongodb_service
 
@@ -217,7 +218,7 @@ class TestSearchService:
         # Mock du retour de la collection
         mock_cursor = Mock()
         # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = []
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = []
         self.mock_auteurs_collection.find.return_value = mock_cursor
         self.mock_auteurs_collection.count_documents.return_value = 0
 
@@ -229,6 +230,13 @@ class TestSearchService:
         assert isinstance(result["auteurs"], list)
         assert isinstance(result["total_count"], int)
 
+    @staticmethod
+    def _empty_cursor():
+        """Curseur find().sort().skip().limit() sans résultat."""
+        cursor = Mock()
+        cursor.sort.return_value.skip.return_value.limit.return_value = []
+        return cursor
+
     def test_search_auteurs_finds_author_by_name(self):
         """Test que search_auteurs trouve un auteur par son nom."""
         mock_auteurs = [
@@ -236,14 +244,23 @@ class TestSearchService:
         ]
         mock_cursor = Mock()
         # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = mock_auteurs
-        self.mock_auteurs_collection.find.return_value = mock_cursor
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = (
+            mock_auteurs
+        )
+        # Un début de mot (compté), aucun résultat au milieu d'un mot (lu
+        # car la page n'est pas remplie, jamais compté)
+        self.mock_auteurs_collection.find.side_effect = [
+            mock_cursor,
+            self._empty_cursor(),
+        ]
         self.mock_auteurs_collection.count_documents.return_value = 1
 
         result = mongodb_service.search_auteurs("Camus", limit=10)
 
         assert len(result["auteurs"]) > 0
         assert result["total_count"] == 1
+        assert result["has_more"] is False
+        self.mock_auteurs_collection.count_documents.assert_called_once()
         # Vérifier que _id est converti en string
         assert isinstance(result["auteurs"][0]["_id"], str)
 
@@ -257,7 +274,7 @@ class TestSearchService:
         # Mock du retour de la collection
         mock_cursor = Mock()
         # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = []
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = []
         self.mock_livres_collection.find.return_value = mock_cursor
         self.mock_livres_collection.count_documents.return_value = 0
 
@@ -281,8 +298,12 @@ class TestSearchService:
         ]
         mock_cursor = Mock()
         # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = mock_livres
-        self.mock_livres_collection.find.return_value = mock_cursor
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = mock_livres
+        # Un début de mot (compté), aucun résultat au milieu d'un mot
+        self.mock_livres_collection.find.side_effect = [
+            mock_cursor,
+            self._empty_cursor(),
+        ]
         self.mock_livres_collection.count_documents.return_value = 1
 
         result = mongodb_service.search_livres("Étranger", limit=10)
@@ -297,7 +318,7 @@ class TestSearchService:
         mock_livres = []  # Aucun résultat attendu
         mock_cursor = Mock()
         # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = mock_livres
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = mock_livres
         self.mock_livres_collection.find.return_value = mock_cursor
         self.mock_livres_collection.count_documents.return_value = 0
 
@@ -335,8 +356,12 @@ class TestSearchService:
         }
 
         mock_cursor = Mock()
-        mock_cursor.skip.return_value.limit.return_value = mock_livres
-        self.mock_livres_collection.find.return_value = mock_cursor
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = mock_livres
+        # Un début de mot (compté), aucun résultat au milieu d'un mot
+        self.mock_livres_collection.find.side_effect = [
+            mock_cursor,
+            self._empty_cursor(),
+        ]
         self.mock_livres_collection.count_documents.return_value = 1
         self.mock_auteurs_collection.find_one.return_value = mock_auteur
 
@@ -370,8 +395,12 @@ class TestSearchService:
 
         mock_cursor = Mock()
         # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = mock_livres
-        self.mock_livres_collection.find.return_value = mock_cursor
+        mock_cursor.sort.return_value.skip.return_value.limit.return_value = mock_livres
+        # Un début de mot (compté), aucun résultat au milieu d'un mot
+        self.mock_livres_collection.find.side_effect = [
+            mock_cursor,
+            self._empty_cursor(),
+        ]
         self.mock_livres_collection.count_documents.return_value = 1
         self.mock_auteurs_collection.find_one.return_value = mock_auteur
 
@@ -381,19 +410,70 @@ class TestSearchService:
         assert "auteur_nom" in result["livres"][0]
         assert result["livres"][0]["auteur_nom"] == "Albert Camus"
 
+    def test_search_editeurs_serves_word_start_before_mid_word(self):
+        """Éditeurs triés par rang (début de mot puis milieu) puis par nom."""
+        self._mock_editeurs_aggregate(
+            [{"_id": "Angers Éditions", "rang": 0}],
+            infix_rows=[{"_id": "La Grange", "rang": 1}],
+        )
+
+        result = mongodb_service.search_editeurs("ange", limit=10)
+
+        assert result["total_count"] == 2
+        assert result["has_more"] is False
+        assert [e["nom"] for e in result["editeurs"]] == [
+            "Angers Éditions",
+            "La Grange",
+        ]
+        for rang in (0, 1):
+            pipeline = self._editeurs_pipeline(rang)
+            assert {"$set": {"rang": {"$literal": rang}}} in pipeline
+            page_stages = pipeline[-1]["$facet"]["page"]
+            assert page_stages[0] == {"$sort": {"rang": 1, "_id": 1}}
+        # Milieu de mot : regex sur nom, débuts de mot exclus
+        assert "$nor" in self._editeurs_pipeline(1)[0]["$match"]
+
+    def test_search_editeurs_skips_mid_word_when_page_full(self):
+        """Page remplie par les débuts de mot : pas d'agrégation du milieu de mot."""
+        self._mock_editeurs_aggregate(
+            [{"_id": "Gallimard", "rang": 0}, {"_id": "Grasset", "rang": 0}], total=7
+        )
+
+        result = mongodb_service.search_editeurs("g", limit=1)
+
+        assert result["editeurs"] == [{"nom": "Gallimard"}]
+        assert result["total_count"] == 7
+        assert result["has_more"] is True
+        assert mongodb_service.editeurs_collection.aggregate.call_count == 1
+
     def test_search_editeurs_method_exists(self):
         """Test que la méthode search_editeurs existe."""
         assert hasattr(mongodb_service, "search_editeurs")
 
+    def _mock_editeurs_aggregate(self, rows, total=None, infix_rows=()):
+        """Résultats $facet des agrégations editeurs ∪ livres.editeur par rang."""
+        mongodb_service.editeurs_collection = Mock()
+        count = len(rows) if total is None else total
+        mongodb_service.editeurs_collection.aggregate.side_effect = [
+            iter([{"total": [{"count": count}] if count else [], "page": rows}]),
+            iter(
+                [
+                    {
+                        "total": [{"count": len(infix_rows)}] if infix_rows else [],
+                        "page": list(infix_rows),
+                    }
+                ]
+            ),
+        ]
+
+    def _editeurs_pipeline(self, rang=0):
+        """Pipeline d'agrégation du rang donné (0 : début de mot)."""
+        calls = mongodb_service.editeurs_collection.aggregate.call_args_list
+        return calls[rang][0][0]
+
     def test_search_editeurs_returns_dict_with_results_and_count(self):
         """Test que search_editeurs retourne un dict avec editeurs et total_count."""
-        # Mock des éditeurs
-        mongodb_service.editeurs_collection = Mock()
-        mock_cursor = Mock()
-        # Configure le chaînage: find().skip().limit()
-        mock_cursor.skip.return_value.limit.return_value = []
-        mongodb_service.editeurs_collection.find.return_value = mock_cursor
-        mongodb_service.editeurs_collection.count_documents.return_value = 0
+        self._mock_editeurs_aggregate([])
 
         result = mongodb_service.search_editeurs("test", limit=10)
 
@@ -402,30 +482,19 @@ class TestSearchService:
         assert "total_count" in result
         assert isinstance(result["editeurs"], list)
         assert isinstance(result["total_count"], int)
+        assert result["next_cursor"] is None
 
     def test_search_editeurs_finds_publisher_by_name(self):
         """Test que search_editeurs trouve un éditeur par son nom."""
-        # Mock des éditeurs
-        mongodb_service.editeurs_collection = Mock()
-        mock_editeurs = [
-            {"_id": "507f1f77bcf86cd799439020", "nom": "Gallimard", "livres": []}
-        ]
-        mock_cursor_editeurs = Mock()
-        # Configure le chaînage: find().skip().limit()
-        mock_cursor_editeurs.skip.return_value.limit.return_value = mock_editeurs
-        mongodb_service.editeurs_collection.find.return_value = mock_cursor_editeurs
-
-        # Mock de la collection livres (vide)
-        mock_cursor_livres = Mock()
-        mock_cursor_livres.skip.return_value.limit.return_value = []
-        self.mock_livres_collection.find.return_value = mock_cursor_livres
+        editeur_id = ObjectId("507f1f77bcf86cd799439020")
+        self._mock_editeurs_aggregate([{"_id": "Gallimard", "editeur_id": editeur_id}])
 
         result = mongodb_service.search_editeurs("Gallimard", limit=10)
 
         assert len(result["editeurs"]) > 0
         assert result["total_count"] == 1
         # Vérifier que _id est converti en string
-        assert isinstance(result["editeurs"][0]["_id"], str)
+        assert result["editeurs"][0]["_id"] == str(editeur_id)
 
     def test_search_editeurs_handles_empty_query(self):
         """Test que search_editeurs gère les requêtes vides."""
@@ -434,103 +503,62 @@ class TestSearchService:
 
     def test_search_editeurs_finds_publisher_from_livres_collection(self):
         """Test que search_editeurs trouve un éditeur depuis livres.editeur."""
-        # Mock de la collection editeurs (vide)
-        mongodb_service.editeurs_collection = Mock()
-        mock_cursor_editeurs = Mock()
-        mock_cursor_editeurs.skip.return_value.limit.return_value = []
-        mongodb_service.editeurs_collection.find.return_value = mock_cursor_editeurs
-
-        # Mock de la collection livres avec un livre ayant "Seuil" comme éditeur
-        mock_livres = [
-            {
-                "_id": "507f1f77bcf86cd799439030",
-                "titre": "Un livre",
-                "editeur": "Seuil",
-            }
-        ]
-        mock_cursor_livres = Mock()
-        mock_cursor_livres.skip.return_value.limit.return_value = mock_livres
-        self.mock_livres_collection.find.return_value = mock_cursor_livres
+        # Éditeur présent seulement dans livres.editeur : pas d'_id d'éditeur
+        self._mock_editeurs_aggregate([{"_id": "Seuil", "editeur_id": None}])
 
         result = mongodb_service.search_editeurs("Seuil", limit=10)
 
-        # Devrait trouver "Seuil" depuis la collection livres
-        assert len(result["editeurs"]) > 0
         assert result["total_count"] == 1
-        assert result["editeurs"][0]["nom"] == "Seuil"
-
-    def test_search_editeurs_combines_both_collections(self):
-        """Test que search_editeurs combine editeurs.nom et livres.editeur."""
-        # Mock de la collection editeurs avec "Gallimard"
-        mongodb_service.editeurs_collection = Mock()
-        mock_editeurs = [
-            {"_id": "507f1f77bcf86cd799439020", "nom": "Gallimard", "livres": []}
-        ]
-        mock_cursor_editeurs = Mock()
-        mock_cursor_editeurs.skip.return_value.limit.return_value = mock_editeurs
-        mongodb_service.editeurs_collection.find.return_value = mock_cursor_editeurs
-
-        # Mock de la collection livres avec "Gallimard" comme éditeur
-        mock_livres = [
-            {
-                "_id": "507f1f77bcf86cd799439031",
-                "titre": "Un livre Gallimard",
-                "editeur": "Gallimard",
-            }
-        ]
-        mock_cursor_livres = Mock()
-        mock_cursor_livres.skip.return_value.limit.return_value = mock_livres
-        self.mock_livres_collection.find.return_value = mock_cursor_livres
-
-        result = mongodb_service.search_editeurs("Gallimard", limit=10)
-
-        # Devrait combiner les deux sources et dédupliquer
-        assert len(result["editeurs"]) == 1  # Dédupliqué
-        assert (
-            result["total_count"] == 1
-        )  # Nombre d'éditeurs UNIQUES après déduplication
-        assert result["editeurs"][0]["nom"] == "Gallimard"
+        assert result["editeurs"] == [{"nom": "Seuil"}]
+        union = next(
+            stage["$unionWith"]
+            for stage in self._editeurs_pipeline()
+            if "$unionWith" in stage
+            and stage["$unionWith"]["pipeline"][1]["$project"]["nom"] == "$editeur"
+        )
+        # Début de mot sur livres.editeur normalisé (index editeur_mots)
+        assert union["pipeline"][0]["$match"] == {
+            "$or": [
+                {"editeur_normalise": {"$regex": "^seuil"}},
+                {"editeur_mots": {"$regex": "^seuil"}},
+            ]
+        }
 
-    def test_search_editeurs_total_count_matches_unique_publishers(self):
+    def test_search_editeurs_deduplicates_by_name_server_side(self):
         """
         Test que total_count reflète le nombre d'éditeurs UNIQUES, pas la somme brute.
         Bug #93: "gall" trouve 1 résultat mais affiche 3 pages (pagination incorrecte).
         """
-        # Mock de la collection editeurs avec "Gallimard"
-        mongodb_service.editeurs_collection = Mock()
-        mock_editeurs = [
-            {"_id": "507f1f77bcf86cd799439020", "nom": "Gallimard", "livres": []}
-        ]
-        mock_cursor_editeurs = Mock()
-        mock_cursor_editeurs.skip.return_value.limit.return_value = mock_editeurs
-        mongodb_service.editeurs_collection.find.return_value = mock_cursor_editeurs
-
-        # Mock de la collection livres avec 3 livres ayant "Gallimard" comme éditeur
-        mock_livres = [
-            {
-                "_id": "507f1f77bcf86cd799439031",
-                "titre": "Livre 1",
-                "editeur": "Gallimard",
-            },
-            {
-                "_id": "507f1f77bcf86cd799439032",
-                "titre": "Livre 2",
-                "editeur": "Gallimard",
-            },
-            {
-                "_id": "507f1f77bcf86cd799439033",
-                "titre": "Livre 3",
-                "editeur": "Gallimard",
-            },
-        ]
-        mock_cursor_livres = Mock()
-        mock_cursor_livres.skip.return_value.limit.return_value = mock_livres
-        self.mock_livres_collection.find.return_value = mock_cursor_livres
+        self._mock_editeurs_aggregate(
+            [{"_id": "Gallimard", "editeur_id": ObjectId()}], total=1
+        )
 
         result = mongodb_service.search_editeurs("gall", limit=10)
 
-        # Bug: total_count était 1 + 3 = 4, causant 3 pages au lieu de 1
-        # Fix: total_count doit être 1 (nombre d'éditeurs uniques)
         assert len(result["editeurs"]) == 1
-        assert result["total_count"] == 1  # Pas 4 !
-        assert result["editeurs"][0]["nom"] == "Gallimard"
+        assert result["total_count"] == 1
+        group = next(
+            stage["$group"] for stage in self._editeurs_pipeline() if "$group" in stage
+        )
+        assert group["_id"] == "$nom"
+
+    def test_search_editeurs_cursor_pages_after_last_name(self):
+        """Un curseur filtre les noms strictement après le dernier servi."""
+        self._mock_editeurs_aggregate(
+            [{"_id": "Gallimard", "rang": 0}, {"_id": "Grasset", "rang": 0}], total=5
+        )
+
+        first = mongodb_service.search_editeurs("g", limit=1)
+        assert first["editeurs"] == [{"nom": "Gallimard"}]
+        assert first["next_cursor"]
+
+        self._mock_editeurs_aggregate([{"_id": "Grasset", "rang": 0}], total=5)
+        mongodb_service.search_editeurs("g", limit=1, cursor=first["next_cursor"])
+
+        page_stages = self._editeurs_pipeline()[-1]["$facet"]["page"]
+        assert {
+            "$match": {
+                "$or": [{"rang": {"$gt": 0}}, {"rang": 0, "_id": {"$gt": "Gallimard"}}]
+            }
+        } in page_stages
+        assert not any("$skip" in stage for stage in page_stages)
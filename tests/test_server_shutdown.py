@@ -134,9 +134,15 @@ class TestServerShutdown:
 
     def test_server_can_restart_after_clean_shutdown(self):
         """Test qu'on peut redémarrer le serveur après un arrêt propre."""
-        # Mock MongoDB pour éviter les connexions réelles pendant le test
-        with patch("back_office_lmelp.app.mongodb_service") as mock_mongo:
+        # Mock MongoDB (pymongo et Motor) pour éviter les connexions réelles
+        with (
+            patch("back_office_lmelp.app.mongodb_service") as mock_mongo,
+            patch(
+                "back_office_lmelp.app.async_mongodb_service", spec=True
+            ) as mock_async_mongo,
+        ):
             mock_mongo.connect.return_value = True
+            mock_async_mongo.connect.return_value = True
 
             # Utiliser un port dynamique pour éviter les conflits en CI
             import random
@@ -41,10 +41,14 @@ def test_should_not_add_editeur_field_to_avis_critique_when_updating_summary():
     ):
         # Setup mocks
         mock_memory.check_memory_limit.return_value = None
-        mock_cache.create_cache_entry.return_value = ObjectId()
+        mock_cache.create_cache_entries.return_value = [ObjectId()]
 
-        mock_mongodb.create_author_if_not_exists.return_value = ObjectId()
-        mock_mongodb.create_book_if_not_exists.return_value = ObjectId()
+        mock_mongodb.create_authors_if_not_exist.return_value = {
+            "Gilles Legardinier": {"author_id": ObjectId(), "created": True}
+        }
+        mock_mongodb.create_books_if_not_exist.return_value = [
+            {"book_id": ObjectId(), "created": True}
+        ]
         mock_mongodb.get_avis_critique_by_id.return_value = {
             "_id": ObjectId(avis_critique_id),
             "summary": original_summary,
@@ -122,10 +126,14 @@ def test_should_not_add_editeur_even_when_original_publisher_differs():
         patch("back_office_lmelp.app.memory_guard") as mock_memory,
     ):
         mock_memory.check_memory_limit.return_value = None
-        mock_cache.create_cache_entry.return_value = ObjectId()
+        mock_cache.create_cache_entries.return_value = [ObjectId()]
 
-        mock_mongodb.create_author_if_not_exists.return_value = ObjectId()
-        mock_mongodb.create_book_if_not_exists.return_value = ObjectId()
+        mock_mongodb.create_authors_if_not_exist.return_value = {
+            "Hannah Assouline": {"author_id": ObjectId(), "created": True}
+        }
+        mock_mongodb.create_books_if_not_exist.return_value = [
+            {"book_id": ObjectId(), "created": True}
+        ]
         mock_mongodb.get_avis_critique_by_id.return_value = {
             "_id": ObjectId(avis_critique_id),
             "summary": original_summary,
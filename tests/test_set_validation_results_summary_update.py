@@ -50,10 +50,14 @@ def test_red_set_validation_results_should_update_summary_with_babelio_publisher
     ):
         # Setup mocks
         mock_memory.check_memory_limit.return_value = None
-        mock_cache.create_cache_entry.return_value = ObjectId()
+        mock_cache.create_cache_entries.return_value = [ObjectId()]
 
-        mock_mongodb.create_author_if_not_exists.return_value = ObjectId()
-        mock_mongodb.create_book_if_not_exists.return_value = ObjectId()
+        mock_mongodb.create_authors_if_not_exist.return_value = {
+            "Emmanuel Carrère": {"author_id": ObjectId(), "created": True}
+        }
+        mock_mongodb.create_books_if_not_exist.return_value = [
+            {"book_id": ObjectId(), "created": True}
+        ]
 
         # Mock get_avis_critique_by_id to return the original summary
         mock_mongodb.get_avis_critique_by_id.return_value = {
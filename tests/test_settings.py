@@ -51,3 +51,25 @@ class TestSettings:
         finally:
             # Cleanup
             os.environ.pop("ANNAS_ARCHIVE_URL", None)
+
+    def test_palmares_rebuild_on_startup_is_opt_in(self, monkeypatch):
+        """Test que la reconstruction du palmarès au démarrage est désactivée par défaut."""
+        # GIVEN: Env var PALMARES_REBUILD_ON_STARTUP non définie
+        monkeypatch.delenv("PALMARES_REBUILD_ON_STARTUP", raising=False)
+
+        # THEN: Pas de reconstruction complète
+        assert Settings().palmares_rebuild_on_startup is False
+
+        # GIVEN: Reconstruction demandée
+        monkeypatch.setenv("PALMARES_REBUILD_ON_STARTUP", "true")
+
+        # THEN: Reconstruction complète au démarrage
+        assert Settings().palmares_rebuild_on_startup is True
+
+    def test_livre_stats_rebuild_on_startup_is_opt_in(self, monkeypatch):
+        """Test que la reconstruction des statistiques livres est désactivée par défaut."""
+        monkeypatch.delenv("LIVRE_STATS_REBUILD_ON_STARTUP", raising=False)
+        assert Settings().livre_stats_rebuild_on_startup is False
+
+        monkeypatch.setenv("LIVRE_STATS_REBUILD_ON_STARTUP", "1")
+        assert Settings().livre_stats_rebuild_on_startup is True
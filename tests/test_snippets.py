@@ -0,0 +1,123 @@
+"""Tests des extraits de recherche à partir d'offsets caractère."""
+
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+from back_office_lmelp.services.episode_search_index import EpisodeSearchIndex
+from back_office_lmelp.services.mongodb_service import MongoDBService
+from back_office_lmelp.utils.snippets import build_snippet, find_spans
+
+
+def _marked(snippet: str, highlights: list[tuple[int, int]]) -> list[str]:
+    return [snippet[start:end] for start, end in highlights]
+
+
+class TestBuildSnippet:
+    """Contexte, fragments et surlignages."""
+
+    def test_context_words_and_ellipses(self):
+        """10 mots avant et après, "..." quand le document continue."""
+        words = [f"mot{i}" for i in range(50)]
+        words[25] = "Maison"
+        text = " ".join(words)
+        start = text.index("Maison")
+
+        snippet, highlights = build_snippet(text, [(start, start + 6)])
+
+        assert snippet == "..." + " ".join(words[15:36]) + "..."
+        assert _marked(snippet, highlights) == ["Maison"]
+
+    def test_hit_inside_word_keeps_whole_word(self):
+        """Mot de l'occurrence complet (apostrophe, suffixe)."""
+        text = "Camus, L'Étranger et les maisons"
+
+        snippet, highlights = build_snippet(text, [(9, 17), (25, 31)], context_words=0)
+
+        assert snippet == "...L'Étranger...maisons"
+        assert _marked(snippet, highlights) == ["Étranger", "maison"]
+
+    def test_close_hits_share_a_fragment(self):
+        """Occurrences proches : un fragment, plusieurs surlignages."""
+        text = "la peste et la chute de Camus"
+
+        snippet, highlights = build_snippet(text, find_spans(text, "la"))
+
+        assert snippet == text
+        assert _marked(snippet, highlights) == ["la", "la"]
+
+    def test_window_offsets(self):
+        """Fenêtre du document : offsets absolus, "..." selon le document."""
+        window = "début du mot cherché ici"
+        base = 5000
+
+        snippet, highlights = build_snippet(
+            window, [(base + 13, base + 20)], base=base, length=base + len(window)
+        )
+
+        assert snippet == "..." + window
+        assert _marked(snippet, highlights) == ["cherché"]
+
+    def test_find_spans_is_accent_insensitive_and_bounded(self):
+        """Regex insensible aux accents, limité à SNIPPET_SCAN_WINDOW."""
+        text = "L'Étranger " + "x " * 20_000 + "etranger"
+
+        assert find_spans(text, "etranger") == [(2, 10)]
+
+
+class TestIndexedSnippets:
+    """Occurrences de l'index converties en offsets sans relire le texte."""
+
+    def test_char_spans_from_checkpoints(self):
+        """Occurrence au-delà du premier repère retrouvée depuis son repère."""
+        words = [f"mot{i}" for i in range(200)]
+        words[150] = "Étranger"
+        text = " ".join(words)
+        index = EpisodeSearchIndex()
+        episode_id = ObjectId()
+        index.index_episode({"_id": episode_id, "transcription": text})
+        index.ready = True
+        [(position, length)] = index.search("etranger")[str(episode_id)][
+            "transcription"
+        ]
+
+        [(start, end)] = index.char_spans(
+            str(episode_id), "transcription", text, [(position, length)]
+        )
+
+        assert text[start:end] == "Étranger"
+
+    def test_distant_transcription_hit_reads_window_only(self):
+        """Occurrence hors du début lu : seule une fenêtre est relue."""
+        episode_id = ObjectId()
+        words = [f"mot{i}" for i in range(5000)]
+        words[4000] = "Sisyphe"
+        transcription = " ".join(words)
+        index = EpisodeSearchIndex()
+        index.index_episode({"_id": episode_id, "transcription": transcription})
+        index.ready = True
+        hits = index.search("sisyphe")[str(episode_id)]
+
+        service = MongoDBService.__new__(MongoDBService)
+        service.episodes_collection = MagicMock()
+
+        def find_one(_query, projection):
+            _, base, size = projection["extrait"]["$cond"][1]["$substrCP"]
+            return {"extrait": transcription[base : base + size]}
+
+        service.episodes_collection.find_one.side_effect = find_one
+        episode = {
+            "_id": str(episode_id),
+            "transcription": transcription[:1000],
+            "transcription_len": len(transcription),
+        }
+
+        with patch(
+            "back_office_lmelp.services.episode_search_index.episode_search_index",
+            index,
+        ):
+            snippet, highlights = service._episode_snippet("sisyphe", episode, hits)
+
+        assert _marked(snippet, highlights) == ["Sisyphe"]
+        assert snippet.startswith("...mot3990 ")
+        assert snippet.endswith(" mot4010...")
@@ -1,12 +1,12 @@
 """Tests pour l'endpoint de statistiques."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from back_office_lmelp.app import app
-from back_office_lmelp.services.mongodb_service import mongodb_service
+from back_office_lmelp.services.async_mongodb_service import async_mongodb_service
 
 
 @pytest.fixture
@@ -18,7 +18,9 @@ def client():
 @pytest.fixture
 def mock_mongodb_service():
     """Mock du service MongoDB."""
-    with patch.object(mongodb_service, "get_statistics") as mock_stats:
+    with patch.object(
+        async_mongodb_service, "get_statistics", new_callable=AsyncMock
+    ) as mock_stats:
         yield mock_stats
 
 
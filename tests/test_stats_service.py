@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 from bson import ObjectId
 
 from back_office_lmelp.services.stats_service import StatsService
+from back_office_lmelp.utils.join_keys import typed_join_key
 
 
 class TestStatsService:
@@ -381,146 +382,63 @@ Total livres traités : 14"""
             assert "📺 Avis critiques analysés : 38" in result
 
     def test_count_avis_critiques_without_analysis_should_exclude_masked_episodes(self):
-        """Test TDD: Le compteur doit exclure les avis critiques des épisodes masqués (Issue #143)."""
-        # Arrange
-        non_masked_episode_id = ObjectId("678cce5da414f229887780aa")
-        masked_episode_id = ObjectId("678cce5da414f229887780ab")
-
-        # Mock episodes_collection.find() pour retourner épisodes non masqués
-        mock_episodes = [{"_id": non_masked_episode_id}]
-
-        # Mock avis_critiques_collection.distinct() pour épisodes avec avis
-        # 1 épisode NON masqué + 1 épisode masqué = 2 total
-        mock_episodes_with_avis = [non_masked_episode_id, masked_episode_id]
-
-        # Mock cache_collection.distinct() pour épisodes analysés
-        # 0 épisodes analysés
-        mock_episodes_analyzed = []
+        """Test TDD: Le compteur doit exclure les avis critiques des épisodes masqués (Issue #143).
 
+        Exclusion via la copie avis_critiques.episode_masked : plus de liste
+        des épisodes masqués ni de $nin.
+        """
         with patch(
             "back_office_lmelp.services.stats_service.mongodb_service"
         ) as mock_mongodb:
-            # Configuration des mocks pour les 3 collections (SÉPARÉS)
-            mock_episodes_collection = MagicMock()
             mock_avis_critiques_collection = MagicMock()
-            mock_cache_collection = MagicMock()
-
-            # Configurer get_collection pour retourner la bonne collection selon le nom
-            collection_map = {
-                "episodes": mock_episodes_collection,
-                "avis_critiques": mock_avis_critiques_collection,
-                "livresauteurs_cache": mock_cache_collection,
-            }
-
-            def get_collection_side_effect(collection_name):
-                return collection_map.get(collection_name)
-
-            mock_mongodb.get_collection.side_effect = get_collection_side_effect
+            mock_avis_critiques_collection.aggregate.return_value = [{"total": 1}]
+            mock_mongodb.get_collection.side_effect = lambda name: {
+                "avis_critiques": mock_avis_critiques_collection
+            }[name]
 
-            # Configuration des mocks
-            mock_episodes_collection.find.return_value = mock_episodes
-            mock_avis_critiques_collection.distinct.return_value = (
-                mock_episodes_with_avis
-            )
-            mock_cache_collection.distinct.return_value = mock_episodes_analyzed
-
-            # Act
             stats_service = StatsService()
             result = stats_service._count_avis_critiques_without_analysis()
 
-            # Assert
-            # Vérifier que find a été appelé avec le bon filtre (épisodes non masqués)
-            mock_episodes_collection.find.assert_called_once_with(
-                {"$or": [{"masked": False}, {"masked": {"$exists": False}}]},
-                {"_id": 1},
-            )
-
-            # Vérifier que distinct a été appelé sur episode_oid pour avis_critiques
-            mock_avis_critiques_collection.distinct.assert_called_once_with(
-                "episode_oid"
-            )
-
-            # Vérifier que distinct a été appelé sur episode_oid pour cache
-            mock_cache_collection.distinct.assert_called_once_with("episode_oid")
-
-            # Résultat attendu: 1 épisode NON masqué avec avis - 0 analysés = 1
-            # (l'épisode masqué est filtré)
+            pipeline = mock_avis_critiques_collection.aggregate.call_args[0][0]
+            assert pipeline[0]["$match"]["episode_masked"] == {"$ne": True}
+            assert "$nin" not in str(pipeline)
             assert result == 1
 
     def test_count_avis_critiques_should_count_episodes_not_individual_avis(self):
         """Test TDD Issue #148: Le compteur doit compter les ÉPISODES, pas les avis_critiques individuels.
 
-        IMPORTANT: Dans la vraie base MongoDB, episode_oid est stocké comme STRING, pas comme ObjectId!
-        Le code doit gérer cette conversion.
+        L'anti-jointure utilise la clé typée episode_id (ObjectId dans
+        avis_critiques comme dans livresauteurs_cache), avec repli sur
+        episode_oid pour les avis critiques pas encore rattrapés.
         """
-        # Arrange: Simuler le scénario réel de l'issue #148
-        # - 69 épisodes NON masqués ont des avis critiques
-        # - 62 épisodes NON masqués ont été analysés
-        # - 1 épisode masqué a été analysé (ne doit PAS être compté)
-        # - Résultat attendu: 69 - 62 = 7 épisodes
-
-        # IDs d'épisodes NON masqués (simuler 100) - en ObjectId comme dans episodes.find()
-        non_masked_episode_ids = [ObjectId() for _ in range(100)]
-
-        # IDs d'épisodes avec avis - STOCKÉS COMME STRINGS dans avis_critiques (comme dans la vraie base!)
-        episodes_with_avis_str = [
-            str(eid) for eid in non_masked_episode_ids[:69]
-        ]  # 69 NON masqués
-        masked_episode_with_avis_1_str = (
-            "678cce5da414f229887780ab"  # Masqué  # pragma: allowlist secret
-        )
-        masked_episode_with_avis_2_str = (
-            "678cce7fa414f229887780db"  # Masqué  # pragma: allowlist secret
-        )
-
-        # IDs d'épisodes analysés - STOCKÉS COMME STRINGS dans cache (comme dans la vraie base!)
-        episodes_analyzed_str = [
-            str(eid) for eid in non_masked_episode_ids[:62]
-        ]  # 62 NON masqués
-        episodes_analyzed_str_with_masked = episodes_analyzed_str + [
-            masked_episode_with_avis_2_str
-        ]
-
         with patch(
             "back_office_lmelp.services.stats_service.mongodb_service"
         ) as mock_mongodb:
-            # Configuration des mocks pour les 3 collections
-            mock_episodes_collection = type("MockCollection", (), {})()
-            mock_avis_critiques_collection = type("MockCollection", (), {})()
-            mock_cache_collection = type("MockCollection", (), {})()
-
-            # Configurer get_collection pour retourner la bonne collection selon le nom
-            collection_map = {
-                "episodes": mock_episodes_collection,
-                "avis_critiques": mock_avis_critiques_collection,
-                "livresauteurs_cache": mock_cache_collection,
-            }
-
-            def get_collection_side_effect(collection_name):
-                return collection_map.get(collection_name)
-
-            mock_mongodb.get_collection.side_effect = get_collection_side_effect
-
-            # Mock episodes_collection.find() → retourne des ObjectId (comme dans la vraie base)
-            mock_episodes_collection.find = lambda *args, **kwargs: [
-                {"_id": eid} for eid in non_masked_episode_ids
-            ]
-
-            # Mock avis_critiques_collection.distinct() → retourne des STRINGS (comme dans la vraie base!)
-            mock_avis_critiques_collection.distinct = lambda field: (
-                episodes_with_avis_str
-                + [masked_episode_with_avis_1_str, masked_episode_with_avis_2_str]
-            )
-
-            # Mock cache_collection.distinct() → retourne des STRINGS (comme dans la vraie base!)
-            mock_cache_collection.distinct = lambda field: (
-                episodes_analyzed_str_with_masked if field == "episode_oid" else []
-            )
+            mock_avis_critiques_collection = MagicMock()
+            mock_avis_critiques_collection.aggregate.return_value = [{"total": 7}]
+            mock_mongodb.get_collection.return_value = mock_avis_critiques_collection
 
-            # Act
             stats_service = StatsService()
             result = stats_service._count_avis_critiques_without_analysis()
 
-            # Assert
-            # Résultat attendu: 69 épisodes avec avis (NON masqués) - 62 épisodes analysés (NON masqués) = 7
-            assert result == 7, f"Attendu 7 épisodes, obtenu {result}"
+            pipeline = mock_avis_critiques_collection.aggregate.call_args[0][0]
+            # Regroupement par épisode avant l'anti-jointure
+            assert {
+                "$group": {"_id": typed_join_key("episode_oid", "episode_id")}
+            } in pipeline
+            assert {"$match": {"_id": {"$ne": None}}} in pipeline
+            lookup = next(stage["$lookup"] for stage in pipeline if "$lookup" in stage)
+            assert lookup["from"] == "livresauteurs_cache"
+            assert lookup["localField"] == "_id"
+            assert lookup["foreignField"] == "episode_id"
+            assert {"$match": {"cache": {"$size": 0}}} in pipeline
+            assert result == 7
+
+    def test_count_avis_critiques_without_analysis_returns_zero_when_empty(self):
+        """Aucun épisode sans analyse : $count ne renvoie aucun document."""
+        with patch(
+            "back_office_lmelp.services.stats_service.mongodb_service"
+        ) as mock_mongodb:
+            mock_mongodb.get_collection.return_value.aggregate.return_value = []
+
+            assert StatsService()._count_avis_critiques_without_analysis() == 0
@@ -3,7 +3,7 @@ Tests de performance pour les méthodes optimisées de StatsService.
 
 Ces tests vérifient que les optimisations utilisent des stratégies efficaces :
 - Aggregation pipelines pour _count_emissions_sans_avis
-- Batch fetching pour _count_emissions_with_problems
+- Comptage indexé sur emission_badges pour _count_emissions_with_problems
 """
 
 from unittest.mock import MagicMock
@@ -85,10 +85,11 @@ class TestCountEmissionsSansAvisOptimization:
         # Vérifier le lookup des avis
         lookup_stage = lookup_stages[0]
         assert lookup_stage["$lookup"]["from"] == "avis"
-        assert lookup_stage["$lookup"]["localField"] == "emission_id_str"
-        assert lookup_stage["$lookup"]["foreignField"] == "emission_oid"
+        assert lookup_stage["$lookup"]["localField"] == "_id"
+        assert lookup_stage["$lookup"]["foreignField"] == "emission_id"
+        assert "$toString" not in str(pipeline)
 
-        # Vérifier le match pour avis_count == 0
+        # Vérifier le match des émissions sans avis
         match_stages = [stage for stage in pipeline if "$match" in stage]
         assert len(match_stages) > 0, "Should have at least 1 $match stage"
 
@@ -96,217 +97,68 @@ class TestCountEmissionsSansAvisOptimization:
 class TestCountEmissionsWithProblemsOptimization:
     """Tests pour _count_emissions_with_problems optimisé."""
 
-    def test_uses_batch_fetching_not_iteration(self, mock_mongodb_service):
-        """Vérifie que la méthode utilise batch fetching au lieu d'itération."""
-        # Arrange
-        emissions_collection = MagicMock()
-        avis_collection = MagicMock()
-        livres_collection = MagicMock()
-
-        mock_mongodb_service.get_collection.side_effect = lambda name: {
-            "emissions": emissions_collection,
-            "avis": avis_collection,
-            "livres": livres_collection,
-        }[name]
-
-        # Mock emissions data (1 emission)
-        emissions_collection.find.return_value = [
-            {"_id": ObjectId(), "episode_id": "ep1"}
-        ]
-
-        # Mock avis data (pas d'avis pour cette émission)
-        avis_collection.find.return_value = []
-
-        stats_service = StatsService()
-        stats_service.mongodb_service = mock_mongodb_service
-
-        # Act
-        stats_service._count_emissions_with_problems()
-
-        # Assert
-        # Vérifie batch fetching (2 requêtes au total, pas N requêtes)
-        assert emissions_collection.find.call_count == 1, (
-            "Should fetch all emissions in single query"
-        )
-        assert avis_collection.find.call_count == 1, (
-            "Should fetch all avis in single query"
-        )
-
-    def test_counts_unmatched_emissions(self, mock_mongodb_service):
-        """Vérifie le comptage des émissions avec livres non matchés (badge jaune)."""
-        emissions_collection = MagicMock()
-        avis_collection = MagicMock()
-        livres_collection = MagicMock()
-
-        mock_mongodb_service.get_collection.side_effect = lambda name: {
-            "emissions": emissions_collection,
-            "avis": avis_collection,
-            "livres": livres_collection,
-        }[name]
-
-        emission_id = ObjectId()
-        emissions_collection.find.return_value = [
-            {"_id": emission_id, "episode_id": "ep1"}
-        ]
-
-        # Avis avec livre non matché (livre_oid = None)
-        avis_collection.find.return_value = [
-            {
-                "emission_oid": str(emission_id),
-                "livre_titre_extrait": "Book 1",
-                "livre_oid": None,  # Non matché
-                "note": 4,
-            }
-        ]
-
-        # 1 livre dans MongoDB pour cet épisode
-        livres_collection.count_documents.return_value = 1
+    def _collections(self, mock_mongodb_service):
+        """Route get_collection vers des collections mockées par nom."""
+        collections = {
+            name: MagicMock()
+            for name in ("emissions", "avis", "livres", "emission_badges")
+        }
+        mock_mongodb_service.get_collection.side_effect = lambda name: collections[name]
+        return collections
+
+    def test_counts_persisted_badges_with_indexed_query(self, mock_mongodb_service):
+        """Tous les badges existent : un seul count_documents sur badge_status."""
+        collections = self._collections(mock_mongodb_service)
+        collections["emissions"].aggregate.return_value = []  # Aucun badge manquant
+        collections["emission_badges"].count_documents.return_value = 2
 
         stats_service = StatsService()
         stats_service.mongodb_service = mock_mongodb_service
 
         result = stats_service._count_emissions_with_problems()
 
-        # Devrait compter 1 (livre non matché = badge jaune = problème)
-        assert result == 1
-
-    def test_counts_count_mismatch_emissions(self, mock_mongodb_service):
-        """Vérifie le comptage des émissions avec écart de comptage (badge rouge)."""
-        emissions_collection = MagicMock()
-        avis_collection = MagicMock()
-        livres_collection = MagicMock()
-
-        mock_mongodb_service.get_collection.side_effect = lambda name: {
-            "emissions": emissions_collection,
-            "avis": avis_collection,
-            "livres": livres_collection,
-        }[name]
-
+        assert result == 2
+        collections["emission_badges"].count_documents.assert_called_once_with(
+            {"badge_status": {"$in": ["count_mismatch", "unmatched"]}}
+        )
+        # Aucune émission chargée ni badge recalculé
+        collections["emissions"].find.assert_not_called()
+        collections["emission_badges"].find.assert_not_called()
+        collections["avis"].find.assert_not_called()
+        collections["emission_badges"].bulk_write.assert_not_called()
+
+    def test_materializes_missing_badges_before_counting(self, mock_mongodb_service):
+        """Les émissions sans badge sont calculées et persistées avant le comptage."""
+        collections = self._collections(mock_mongodb_service)
         emission_id = ObjectId()
-        emissions_collection.find.return_value = [
+        collections["emissions"].aggregate.return_value = [
             {"_id": emission_id, "episode_id": "ep1"}
         ]
-
-        # 1 avis extrait du summary
-        avis_collection.find.return_value = [
+        # Avis avec livre non matché (badge jaune)
+        collections["avis"].find.return_value = [
             {
                 "emission_oid": str(emission_id),
                 "livre_titre_extrait": "Book 1",
-                "livre_oid": ObjectId(),  # Matché
+                "livre_oid": None,
                 "note": 4,
             }
         ]
-
-        # Mais 2 livres dans MongoDB (écart de comptage)
-        livres_collection.count_documents.return_value = 2
+        collections["livres"].aggregate.return_value = [{"_id": "ep1", "count": 1}]
+        collections["emission_badges"].count_documents.return_value = 1
 
         stats_service = StatsService()
         stats_service.mongodb_service = mock_mongodb_service
 
         result = stats_service._count_emissions_with_problems()
 
-        # Devrait compter 1 (écart de comptage = badge rouge = problème)
         assert result == 1
-
-    def test_counts_missing_notes(self, mock_mongodb_service):
-        """Vérifie le comptage des émissions avec notes manquantes (badge rouge)."""
-        emissions_collection = MagicMock()
-        avis_collection = MagicMock()
-        livres_collection = MagicMock()
-
-        mock_mongodb_service.get_collection.side_effect = lambda name: {
-            "emissions": emissions_collection,
-            "avis": avis_collection,
-            "livres": livres_collection,
-        }[name]
-
-        emission_id = ObjectId()
-        emissions_collection.find.return_value = [
-            {"_id": emission_id, "episode_id": "ep1"}
-        ]
-
-        # 1 avis avec note manquante
-        avis_collection.find.return_value = [
-            {
-                "emission_oid": str(emission_id),
-                "livre_titre_extrait": "Book 1",
-                "livre_oid": ObjectId(),
-                "note": None,  # Note manquante
-            }
-        ]
-
-        # 1 livre dans MongoDB (comptes égaux)
-        livres_collection.count_documents.return_value = 1
-
-        stats_service = StatsService()
-        stats_service.mongodb_service = mock_mongodb_service
-
-        result = stats_service._count_emissions_with_problems()
-
-        # Devrait compter 1 (note manquante = badge rouge = problème)
-        assert result == 1
-
-    def test_ignores_emissions_without_avis(self, mock_mongodb_service):
-        """Vérifie que les émissions sans avis ne sont pas comptées."""
-        emissions_collection = MagicMock()
-        avis_collection = MagicMock()
-        livres_collection = MagicMock()
-
-        mock_mongodb_service.get_collection.side_effect = lambda name: {
-            "emissions": emissions_collection,
-            "avis": avis_collection,
-            "livres": livres_collection,
-        }[name]
-
-        emissions_collection.find.return_value = [
-            {"_id": ObjectId(), "episode_id": "ep1"}
-        ]
-
-        # Aucun avis
-        avis_collection.find.return_value = []
-
-        stats_service = StatsService()
-        stats_service.mongodb_service = mock_mongodb_service
-
-        result = stats_service._count_emissions_with_problems()
-
-        # Devrait retourner 0 (pas d'avis = badge blanc ≠ problème)
-        assert result == 0
-
-    def test_ignores_perfect_emissions(self, mock_mongodb_service):
-        """Vérifie que les émissions parfaites ne sont pas comptées."""
-        emissions_collection = MagicMock()
-        avis_collection = MagicMock()
-        livres_collection = MagicMock()
-
-        mock_mongodb_service.get_collection.side_effect = lambda name: {
-            "emissions": emissions_collection,
-            "avis": avis_collection,
-            "livres": livres_collection,
-        }[name]
-
-        emission_id = ObjectId()
-        emissions_collection.find.return_value = [
-            {"_id": emission_id, "episode_id": "ep1"}
-        ]
-
-        # Avis parfait : matché + note présente
-        avis_collection.find.return_value = [
-            {
-                "emission_oid": str(emission_id),
-                "livre_titre_extrait": "Book 1",
-                "livre_oid": ObjectId(),  # Matché
-                "note": 4,  # Note présente
-            }
-        ]
-
-        # Comptes égaux (1 avis = 1 livre)
-        livres_collection.count_documents.return_value = 1
-
-        stats_service = StatsService()
-        stats_service.mongodb_service = mock_mongodb_service
-
-        result = stats_service._count_emissions_with_problems()
-
-        # Devrait retourner 0 (parfait = badge vert ≠ problème)
-        assert result == 0
+        operations = collections["emission_badges"].bulk_write.call_args[0][0]
+        assert [op._filter for op in operations] == [{"_id": emission_id}]
+        assert operations[0]._doc["$set"]["badge_status"] == "unmatched"
+
+        # Anti-jointure côté serveur vers emission_badges
+        pipeline = collections["emissions"].aggregate.call_args[0][0]
+        lookup = pipeline[0]["$lookup"]
+        assert lookup["from"] == "emission_badges"
+        assert lookup["localField"] == lookup["foreignField"] == "_id"
+        assert {"$match": {"badge": {"$size": 0}}} in pipeline
@@ -0,0 +1,116 @@
+"""Tests du snapshot des statistiques invalidé par les écritures."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from back_office_lmelp.app import app
+from back_office_lmelp.services.stats_snapshot_service import (
+    CollectionVersions,
+    StatsSnapshot,
+    WriteTracker,
+    compute_etag,
+)
+
+
+def _event(command_name, collection, request_id=1):
+    """Événement de commande pymongo minimal."""
+    return SimpleNamespace(
+        command_name=command_name,
+        command={command_name: collection},
+        request_id=request_id,
+    )
+
+
+class TestWriteTracker:
+    """Détection des écritures via pymongo.monitoring."""
+
+    def test_write_bumps_collection_version_on_completion(self):
+        """La version change à la fin de l'écriture, pas à son début."""
+        versions = CollectionVersions()
+        tracker = WriteTracker(versions)
+
+        tracker.started(_event("update", "livres"))
+        assert versions.get(["livres"]) == (0,)
+
+        tracker.succeeded(_event("update", "livres"))
+        assert versions.get(["livres", "auteurs"]) == (1, 0)
+
+    def test_reads_do_not_bump_versions(self):
+        """find/aggregate/count ne modifient aucune version."""
+        versions = CollectionVersions()
+        tracker = WriteTracker(versions)
+
+        for command_name in ("find", "aggregate", "count"):
+            tracker.started(_event(command_name, "livres"))
+            tracker.succeeded(_event(command_name, "livres"))
+
+        assert versions.get(["livres"]) == (0,)
+
+
+class TestStatsSnapshot:
+    """Recalcul des seules sections dont les sources ont changé."""
+
+    def test_section_recomputed_only_when_source_changes(self):
+        """Une écriture sur livres ne recalcule pas une section sur auteurs."""
+        versions = CollectionVersions()
+        snapshot = StatsSnapshot(versions, max_age_sec=3600)
+        compute_livres = MagicMock(side_effect=[10, 11])
+        compute_auteurs = MagicMock(return_value=5)
+
+        def read():
+            return (
+                snapshot.get_section("livres", ("livres",), compute_livres),
+                snapshot.get_section("auteurs", ("auteurs",), compute_auteurs),
+            )
+
+        assert read() == (10, 5)
+        assert read() == (10, 5)
+        versions.bump("livres")
+        assert read() == (11, 5)
+
+        assert compute_livres.call_count == 2
+        assert compute_auteurs.call_count == 1
+
+    def test_section_recomputed_after_max_age(self):
+        """Les écritures externes (non détectées) sont couvertes par l'âge max."""
+        snapshot = StatsSnapshot(CollectionVersions(), max_age_sec=0)
+        compute = MagicMock(side_effect=[1, 2])
+
+        snapshot.get_section("s", ("livres",), compute)
+        assert snapshot.get_section("s", ("livres",), compute) == 2
+
+
+class TestStatisticsEtag:
+    """ETag et 304 sur les endpoints de statistiques."""
+
+    def test_unchanged_stats_return_304(self):
+        """Un polling avec If-None-Match reçoit un 304 sans corps."""
+        stats = {"couples_en_base": 3, "last_episode_date": "2025-01-01"}
+        with patch("back_office_lmelp.app.stats_service") as mock_stats_service:
+            mock_stats_service.get_cache_statistics.return_value = stats
+            client = TestClient(app)
+
+            first = client.get("/api/stats")
+            etag = first.headers["etag"]
+            second = client.get("/api/stats", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.json() == stats
+        assert etag == compute_etag(stats)
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_changed_stats_return_new_body(self):
+        """Un ETag périmé reçoit le nouveau contenu."""
+        with patch("back_office_lmelp.app.stats_service") as mock_stats_service:
+            mock_stats_service.get_cache_statistics.return_value = {"livres": 2}
+            response = TestClient(app).get(
+                "/api/livres-auteurs/statistics",
+                headers={"If-None-Match": compute_etag({"livres": 1})},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"livres": 2}
+        assert response.headers["cache-control"] == "no-cache"
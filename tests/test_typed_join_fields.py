@@ -0,0 +1,168 @@
+"""Tests des clés de jointure typées (ObjectId) à côté des références *_oid."""
+
+import asyncio
+from contextlib import suppress
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bson import ObjectId
+
+from back_office_lmelp import app as app_module
+from back_office_lmelp.models.avis import Avis, diff_avis
+from back_office_lmelp.services.mongodb_service import (
+    MongoDBService,
+    episodes_without_avis_critiques_stages,
+)
+from back_office_lmelp.utils.join_keys import typed_join_fields, typed_join_key
+from back_office_lmelp.utils.migrate_typed_join_fields import (
+    backfill_typed_join_fields,
+)
+
+
+EMISSION = ObjectId()
+LIVRE = ObjectId()
+
+
+class TestTypedJoinFields:
+    """Conversion des références String en champs typés."""
+
+    def test_present_references_converted(self):
+        """Seules les références présentes sont converties, invalides → None."""
+        assert typed_join_fields(
+            "avis", {"livre_oid": str(LIVRE), "critique_oid": "pas-un-id", "note": 7}
+        ) == {"livre_id": LIVRE, "critique_id": None}
+
+    def test_join_key_falls_back_to_string_reference(self):
+        """Clé typée absente (pipeline lmelp) : conversion du champ String."""
+        expr = typed_join_key("episode_oid", "episode_id")
+
+        typed, fallback = expr["$ifNull"]
+        assert typed == "$episode_id"
+        assert fallback["$convert"]["input"] == "$episode_oid"
+        assert fallback["$convert"]["to"] == "objectId"
+        # Référence invalide : null plutôt qu'une erreur d'agrégation
+        assert fallback["$convert"]["onError"] is None
+
+    def test_avis_insert_carries_typed_fields(self):
+        """Avis.for_mongodb_insert écrit les deux versions des références."""
+        avis = Avis.for_mongodb_insert(
+            {
+                "emission_oid": str(EMISSION),
+                "livre_oid": str(LIVRE),
+                "critique_oid": None,
+            }
+        )
+
+        assert avis["emission_id"] == EMISSION
+        assert avis["livre_id"] == LIVRE
+        assert avis["critique_id"] is None
+        assert avis["livre_oid"] == str(LIVRE)
+
+    def test_rematched_livre_updates_typed_field(self):
+        """Ré-extraction : un livre nouvellement matché met à jour livre_id."""
+        stored = {
+            "_id": ObjectId(),
+            **Avis.for_mongodb_insert(
+                {"emission_oid": str(EMISSION), "livre_titre_extrait": "A"}
+            ),
+        }
+        extracted = Avis.for_mongodb_insert(
+            {
+                "emission_oid": str(EMISSION),
+                "livre_titre_extrait": "A",
+                "livre_oid": str(LIVRE),
+            }
+        )
+
+        [(_, changes)] = diff_avis([stored], [extracted])["update"]
+
+        assert changes == {"livre_oid": str(LIVRE), "livre_id": LIVRE}
+
+    def test_update_avis_sets_typed_fields(self):
+        """Résolution manuelle : le $set inclut la clé typée."""
+        service = MongoDBService.__new__(MongoDBService)
+        service.avis_collection = MagicMock()
+        service.avis_collection.find_one.return_value = {}
+        service.avis_collection.update_one.return_value.matched_count = 1
+        service.refresh_emission_badges = MagicMock()
+        service.refresh_palmares = MagicMock()
+        service.refresh_livre_stats = MagicMock()
+        avis_id = str(ObjectId())
+
+        service.update_avis(avis_id, {"livre_oid": str(LIVRE)})
+
+        update = service.avis_collection.update_one.call_args[0][1]
+        assert update["$set"]["livre_id"] == LIVRE
+
+
+class TestBackfillTypedJoinFields:
+    """Migration reprenable : seuls les documents sans champ typé sont traités."""
+
+    def test_missing_fields_backfilled_in_batches(self):
+        """Filtre $exists: false, lots de batch_size, références invalides à null."""
+        collections: dict[str, MagicMock] = {}
+
+        def collection(name):
+            return collections.setdefault(name, MagicMock())
+
+        db = MagicMock()
+        db.__getitem__.side_effect = collection
+        collection("avis").find.side_effect = lambda query, _projection: (
+            [
+                {"_id": ObjectId(), "livre_oid": str(LIVRE)},
+                {"_id": ObjectId(), "livre_oid": None},
+                {"_id": ObjectId(), "livre_oid": str(LIVRE)},
+            ]
+            if "livre_id" in query
+            else []
+        )
+        collection("avis").bulk_write.return_value.modified_count = 2
+
+        report = backfill_typed_join_fields(db, batch_size=2)
+
+        assert report["avis.livre_id"] == 4  # deux lots
+        assert report["avis.emission_id"] == 0
+        assert report["avis_critiques.episode_id"] == 0
+        collection("avis").find.assert_any_call(
+            {"livre_id": {"$exists": False}}, {"livre_oid": 1}
+        )
+        first, second = (
+            call[0][0] for call in collection("avis").bulk_write.call_args_list
+        )
+        assert [op._doc["$set"]["livre_id"] for op in first] == [LIVRE, None]
+        assert len(second) == 1
+
+
+class TestTypedLookups:
+    """Les $lookup utilisent localField/foreignField sur les clés typées."""
+
+    def test_episodes_without_avis_critiques(self):
+        """Anti-jointure episodes → avis_critiques sans $toString."""
+        lookup = episodes_without_avis_critiques_stages()[0]["$lookup"]
+
+        assert lookup["localField"] == "_id"
+        assert lookup["foreignField"] == "episode_id"
+        assert "$toString" not in str(lookup)
+
+
+class TestPeriodicBackfill:
+    """Rattrapage des clés typées à chaque passage périodique."""
+
+    def test_auto_convert_backfills_typed_fields_between_runs(self):
+        """Après chaque attente, les clés typées sont complétées avant conversion."""
+        sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+        with (
+            patch.object(app_module.asyncio, "sleep", sleep),
+            patch.object(app_module, "emission_conversion_service") as conversion,
+            patch.object(app_module, "mongodb_service") as mongodb,
+            patch(
+                "back_office_lmelp.utils.migrate_typed_join_fields."
+                "backfill_typed_join_fields"
+            ) as backfill,
+        ):
+            conversion.convert_new_avis_critiques.return_value = {"errors": []}
+            with suppress(asyncio.CancelledError):
+                asyncio.run(app_module._run_emissions_auto_convert(60))
+
+        # Premier passage : rattrapage déjà fait au démarrage
+        backfill.assert_called_once_with(mongodb.db)
+        assert conversion.convert_new_avis_critiques.call_count == 2
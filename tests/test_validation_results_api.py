@@ -56,7 +56,7 @@ class TestValidationResultsAPI:
             cache_entry_id2 = ObjectId(
                 "68d3eb092f32bb8c43063f92"  # pragma: allowlist secret
             )  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.side_effect = [
+            mock_cache_service.create_cache_entries.return_value = [
                 cache_entry_id1,
                 cache_entry_id2,
             ]
@@ -72,23 +72,30 @@ class TestValidationResultsAPI:
             assert result["success"] is True
             assert result["books_processed"] == 2
 
-            # Vérifier que les livres ont été créés dans le cache avec les statuts du frontend
-            assert mock_cache_service.create_cache_entry.call_count == 2
+            # Vérifier que les livres ont été créés dans le cache en un seul lot
+            mock_cache_service.create_cache_entries.assert_called_once()
+            books_data = mock_cache_service.create_cache_entries.call_args[0][1]
+            assert len(books_data) == 2
 
-            # Premier appel - Laurent Mauvignier (suggested)
-            first_call = mock_cache_service.create_cache_entry.call_args_list[0]
-            laurent_data = first_call[0][1]  # book_data
+            # Premier livre - Laurent Mauvignier (suggested)
+            laurent_data = books_data[0]
             assert laurent_data["auteur"] == "Laurent Mauvignier"
             assert laurent_data["status"] == "suggested"  # Status du frontend
             assert laurent_data["suggested_author"] == "Laurent Mauvignier"
             assert laurent_data["suggested_title"] == "La Maison vide"
 
-            # Deuxième appel - Maria Pourchet (verified)
-            second_call = mock_cache_service.create_cache_entry.call_args_list[1]
-            maria_data = second_call[0][1]  # book_data
+            # Deuxième livre - Maria Pourchet (verified)
+            maria_data = books_data[1]
             assert maria_data["auteur"] == "Maria Pourchet"
             assert maria_data["status"] == "verified"  # Status du frontend
 
+            # Résultat par livre
+            assert [item["status"] for item in result["items"]] == [
+                "suggested",
+                "verified",
+            ]
+            assert result["items"][0]["cache_id"] == str(cache_entry_id1)
+
     def test_set_validation_results_should_trigger_auto_processing_for_verified(self):
         """Test TDD: L'auto-processing doit être déclenché pour les livres verified du frontend."""
         episode_oid = "68c707ad6e51b9428ab87e9e"  # pragma: allowlist secret
@@ -120,11 +127,15 @@ class TestValidationResultsAPI:
             cache_entry_id = ObjectId(
                 "68d3eb092f32bb8c43063f91"  # pragma: allowlist secret
             )  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_entry_id
+            mock_cache_service.create_cache_entries.return_value = [cache_entry_id]
             author_id = ObjectId("67a79b615b03b52d8c51db29")  # pragma: allowlist secret
             book_id = ObjectId("68d3eb092f32bb8c43063f76")  # pragma: allowlist secret
-            mock_mongodb.create_author_if_not_exists.return_value = author_id
-            mock_mongodb.create_book_if_not_exists.return_value = book_id
+            mock_mongodb.create_authors_if_not_exist.return_value = {
+                "Maria Pourchet": {"author_id": author_id, "created": True}
+            }
+            mock_mongodb.create_books_if_not_exist.return_value = [
+                {"book_id": book_id, "created": False}
+            ]
 
             # Act
             response = self.client.post(
@@ -135,17 +146,31 @@ class TestValidationResultsAPI:
             assert response.status_code == 200
 
             # Vérifier que l'auto-processing a été déclenché pour le livre verified
-            mock_mongodb.create_author_if_not_exists.assert_called_once_with(
-                "Maria Pourchet"
+            mock_mongodb.create_authors_if_not_exist.assert_called_once_with(
+                ["Maria Pourchet"]
             )
-            mock_mongodb.create_book_if_not_exists.assert_called_once()
+            mock_mongodb.create_books_if_not_exist.assert_called_once()
 
             # Vérifier que le livre a été marqué comme traité (mongo)
-            # Issue #85: mark_as_processed est appelé avec metadata (peut être vide si pas de babelio_publisher)
-            mock_cache_service.mark_as_processed.assert_called_once_with(
-                cache_entry_id, author_id, book_id, metadata={}
+            # Issue #85: metadata peut être vide si pas de babelio_publisher
+            mock_cache_service.mark_batch_as_processed.assert_called_once_with(
+                [
+                    {
+                        "cache_id": cache_entry_id,
+                        "author_id": author_id,
+                        "book_id": book_id,
+                        "metadata": {},
+                    }
+                ]
             )
 
+            # Résultat par livre : auteur créé, livre existant
+            [item] = response.json()["items"]
+            assert item["author_id"] == str(author_id)
+            assert item["book_id"] == str(book_id)
+            assert item["author_created"] is True
+            assert item["book_created"] is False
+
     def test_set_validation_results_should_not_auto_process_suggested_books(self):
         """Test TDD: L'auto-processing ne doit PAS être déclenché pour les livres suggested."""
         episode_oid = "68c707ad6e51b9428ab87e9e"  # pragma: allowlist secret
@@ -178,7 +203,7 @@ class TestValidationResultsAPI:
             cache_entry_id = ObjectId(
                 "68d3eb092f32bb8c43063f91"  # pragma: allowlist secret
             )  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_entry_id
+            mock_cache_service.create_cache_entries.return_value = [cache_entry_id]
 
             # Act
             response = self.client.post(
@@ -189,13 +214,13 @@ class TestValidationResultsAPI:
             assert response.status_code == 200
 
             # Vérifier qu'AUCUN auto-processing n'a été déclenché
-            mock_mongodb.create_author_if_not_exists.assert_not_called()
-            mock_mongodb.create_book_if_not_exists.assert_not_called()
-            mock_cache_service.mark_as_processed.assert_not_called()
+            mock_mongodb.create_authors_if_not_exist.assert_not_called()
+            mock_mongodb.create_books_if_not_exist.assert_not_called()
+            mock_cache_service.mark_batch_as_processed.assert_not_called()
 
             # Vérifier que le livre reste suggested dans le cache
-            cache_call = mock_cache_service.create_cache_entry.call_args
-            book_data = cache_call[0][1]
+            cache_call = mock_cache_service.create_cache_entries.call_args
+            book_data = cache_call[0][1][0]
             assert book_data["status"] == "suggested"
 
     def test_set_validation_results_should_transmit_babelio_enrichment_to_cache(self):
@@ -233,11 +258,15 @@ class TestValidationResultsAPI:
             cache_entry_id = ObjectId(
                 "68d3eb092f32bb8c43063f91"  # pragma: allowlist secret
             )  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_entry_id
+            mock_cache_service.create_cache_entries.return_value = [cache_entry_id]
             author_id = ObjectId("67a79b615b03b52d8c51db29")  # pragma: allowlist secret
             book_id = ObjectId("68d3eb092f32bb8c43063f76")  # pragma: allowlist secret
-            mock_mongodb.create_author_if_not_exists.return_value = author_id
-            mock_mongodb.create_book_if_not_exists.return_value = book_id
+            mock_mongodb.create_authors_if_not_exist.return_value = {
+                "Carlos Gimenez": {"author_id": author_id, "created": True}
+            }
+            mock_mongodb.create_books_if_not_exist.return_value = [
+                {"book_id": book_id, "created": False}
+            ]
 
             # Act
             response = self.client.post(
@@ -248,8 +277,8 @@ class TestValidationResultsAPI:
             assert response.status_code == 200
 
             # Vérifier que les champs Babelio enrichis ont été transmis au cache (Issue #85)
-            cache_call = mock_cache_service.create_cache_entry.call_args
-            book_data = cache_call[0][1]  # book_data argument
+            cache_call = mock_cache_service.create_cache_entries.call_args
+            book_data = cache_call[0][1][0]  # book_data du premier livre
             assert "babelio_url" in book_data, "babelio_url doit être transmis au cache"
             assert (
                 book_data["babelio_url"]
@@ -297,11 +326,15 @@ class TestValidationResultsAPI:
             cache_entry_id = ObjectId(
                 "68d3eb092f32bb8c43063f91"  # pragma: allowlist secret
             )  # pragma: allowlist secret
-            mock_cache_service.create_cache_entry.return_value = cache_entry_id
+            mock_cache_service.create_cache_entries.return_value = [cache_entry_id]
             author_id = ObjectId("67a79b615b03b52d8c51db29")  # pragma: allowlist secret
             book_id = ObjectId("68d3eb092f32bb8c43063f76")  # pragma: allowlist secret
-            mock_mongodb.create_author_if_not_exists.return_value = author_id
-            mock_mongodb.create_book_if_not_exists.return_value = book_id
+            mock_mongodb.create_authors_if_not_exist.return_value = {
+                "Carlos Gimenez": {"author_id": author_id, "created": True}
+            }
+            mock_mongodb.create_books_if_not_exist.return_value = [
+                {"book_id": book_id, "created": False}
+            ]
 
             # Mock get_avis_critique_by_id pour retourner un avis avec summary
             mock_mongodb.get_avis_critique_by_id.return_value = {